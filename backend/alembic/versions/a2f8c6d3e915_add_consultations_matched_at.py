@@ -0,0 +1,32 @@
+"""add_consultations_matched_at
+
+Revision ID: a2f8c6d3e915
+Revises: e6b2d9f4a137
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'a2f8c6d3e915'
+down_revision: Union[str, None] = 'e6b2d9f4a137'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 전문가 매칭 시각 (예약 전 상담의 일일 부하 집계 기준, 재매칭된 상담은 created_at이 과거)
+    op.add_column(
+        'consultations',
+        sa.Column('matched_at', sa.TIMESTAMP(timezone=True), nullable=True, comment='전문가 매칭 날짜/시간 (예약 전 일일 상담 부하 기준)'),
+    )
+
+    # 기존 배정 상담은 마지막 변경 시각으로 채움
+    op.execute("UPDATE consultations SET matched_at = updated_at WHERE consultant_id IS NOT NULL")
+
+
+def downgrade() -> None:
+    op.drop_column('consultations', 'matched_at')
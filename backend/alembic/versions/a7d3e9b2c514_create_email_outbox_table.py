@@ -0,0 +1,50 @@
+"""create_email_outbox_table
+
+Revision ID: a7d3e9b2c514
+Revises: f1b6d4a8c203
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7d3e9b2c514'
+down_revision: Union[str, None] = 'f1b6d4a8c203'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Create email_outbox table (이메일 발송 대기열)
+    op.create_table(
+        'email_outbox',
+        sa.Column('id', UUID(as_uuid=True), primary_key=True),
+        sa.Column('to_email', sa.String(255), nullable=False),
+        sa.Column('subject', sa.String(500), nullable=False),
+        sa.Column('body_text', sa.Text, nullable=False),
+        sa.Column('body_html', sa.Text, nullable=True),
+        sa.Column('status', sa.String(20), nullable=False, server_default='pending'),
+        sa.Column('attempts', sa.Integer, nullable=False, server_default='0'),
+        sa.Column('next_attempt_at', sa.DateTime, nullable=False, server_default=sa.func.now()),
+        sa.Column('last_error', sa.Text, nullable=True),
+        sa.Column('created_at', sa.DateTime, nullable=False, server_default=sa.func.now()),
+        sa.Column('sent_at', sa.DateTime, nullable=True),
+    )
+
+    # 워커의 발송 대상 조회 (status = 'pending' AND next_attempt_at <= now)
+    op.create_index(
+        'ix_email_outbox_status_next_attempt_at',
+        'email_outbox',
+        ['status', 'next_attempt_at'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_email_outbox_status_next_attempt_at', table_name='email_outbox')
+    op.drop_table('email_outbox')
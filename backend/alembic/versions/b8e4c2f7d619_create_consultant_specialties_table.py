@@ -0,0 +1,72 @@
+"""create_consultant_specialties_table
+
+Revision ID: b8e4c2f7d619
+Revises: a7d3e9b2c514
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+import json
+import logging
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8e4c2f7d619'
+down_revision: Union[str, None] = 'a7d3e9b2c514'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+
+def upgrade() -> None:
+    # Create consultant_specialties table (전문가 전문 분야 정규화 인덱스)
+    consultant_specialties = op.create_table(
+        'consultant_specialties',
+        sa.Column('consultant_id', UUID(as_uuid=True), sa.ForeignKey('consultants.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('specialty', sa.String(50), primary_key=True),
+    )
+
+    # 전문 분야별 후보 전문가 조회
+    op.create_index(
+        'ix_consultant_specialties_specialty',
+        'consultant_specialties',
+        ['specialty', 'consultant_id'],
+        unique=False,
+    )
+
+    # 기존 consultants.specialties로 채우기
+    # JSON 문자열(Text 컬럼)과 리스트(ARRAY 컬럼, a716a520a00a) 모두 지원, 형식이 잘못된 행은 로그 후 건너뜀
+    connection = op.get_bind()
+    rows = []
+    skipped = []
+    for consultant_id, specialties in connection.execute(sa.text("SELECT id, specialties FROM consultants")):
+        if isinstance(specialties, list):
+            values = specialties
+        else:
+            try:
+                values = json.loads(specialties) if specialties else []
+            except (ValueError, TypeError):
+                values = None
+        if not isinstance(values, list):
+            skipped.append(consultant_id)
+            logger.warning(f"Skipping consultant {consultant_id}: invalid specialties {specialties!r}")
+            continue
+        for specialty in dict.fromkeys(v for v in values if isinstance(v, str) and v):
+            rows.append({'consultant_id': consultant_id, 'specialty': specialty})
+
+    if rows:
+        op.bulk_insert(consultant_specialties, rows)
+    logger.info(
+        f"Indexed {len(rows)} consultant specialties"
+        + (f", skipped {len(skipped)} consultants with invalid specialties" if skipped else "")
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_consultant_specialties_specialty', table_name='consultant_specialties')
+    op.drop_table('consultant_specialties')
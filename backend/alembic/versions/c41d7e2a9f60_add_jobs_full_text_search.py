@@ -0,0 +1,48 @@
+"""add_jobs_full_text_search
+
+Revision ID: c41d7e2a9f60
+Revises: 7c4f8e2d1a3b, f9c2d8e4b1a5
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41d7e2a9f60'
+down_revision: Union[str, Sequence[str], None] = ('7c4f8e2d1a3b', 'f9c2d8e4b1a5')
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 전문 검색용 tsvector 생성 컬럼 (한국어 형태소 분석기가 없으므로 'simple' 설정 사용)
+    # 가중치: 직종/회사명(A) > 업무 설명(B) > 요구사항/복리후생(C)
+    op.execute(
+        """
+        ALTER TABLE jobs ADD COLUMN search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('simple', coalesce(position, '')), 'A') ||
+            setweight(to_tsvector('simple', coalesce(company_name, '')), 'A') ||
+            setweight(to_tsvector('simple', coalesce(description, '')), 'B') ||
+            setweight(to_tsvector('simple', coalesce(requirements, '')), 'C') ||
+            setweight(to_tsvector('simple', coalesce(benefits, '')), 'C')
+        ) STORED
+        """
+    )
+
+    # GIN 인덱스
+    op.create_index(
+        'ix_jobs_search_vector',
+        'jobs',
+        ['search_vector'],
+        unique=False,
+        postgresql_using='gin',
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_jobs_search_vector', table_name='jobs')
+    op.drop_column('jobs', 'search_vector')
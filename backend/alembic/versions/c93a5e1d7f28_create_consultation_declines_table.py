@@ -0,0 +1,33 @@
+"""create_consultation_declines_table
+
+Revision ID: c93a5e1d7f28
+Revises: b8e4c2f7d619
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c93a5e1d7f28'
+down_revision: Union[str, None] = 'b8e4c2f7d619'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Create consultation_declines table (상담별 거절한 전문가, 재매칭 시 제외)
+    op.create_table(
+        'consultation_declines',
+        sa.Column('consultation_id', UUID(as_uuid=True), sa.ForeignKey('consultations.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('consultant_id', UUID(as_uuid=True), sa.ForeignKey('consultants.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('declined_at', sa.DateTime, nullable=False, server_default=sa.func.now()),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('consultation_declines')
@@ -0,0 +1,46 @@
+"""add_consultant_rating_sum
+
+Revision ID: d4f7a2c8e913
+Revises: c93a5e1d7f28
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4f7a2c8e913'
+down_revision: Union[str, None] = 'c93a5e1d7f28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 별점 합계 (후기 작성 시 total_reviews와 함께 증분 갱신)
+    op.add_column(
+        'consultants',
+        sa.Column('rating_sum', sa.Integer(), server_default='0', nullable=False),
+    )
+
+    # Backfill: 기존 후기로 합계/개수/평균 재계산
+    op.execute(
+        """
+        UPDATE consultants
+        SET rating_sum = agg.rating_sum,
+            total_reviews = agg.total_reviews,
+            average_rating = ROUND(agg.rating_sum * 1.0 / agg.total_reviews, 2)
+        FROM (
+            SELECT consultant_id, SUM(rating) AS rating_sum, COUNT(*) AS total_reviews
+            FROM reviews
+            GROUP BY consultant_id
+        ) AS agg
+        WHERE consultants.id = agg.consultant_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('consultants', 'rating_sum')
@@ -0,0 +1,32 @@
+"""add_jobs_keyset_pagination_index
+
+Revision ID: d82b4f1c6e37
+Revises: c41d7e2a9f60
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'd82b4f1c6e37'
+down_revision: Union[str, None] = 'c41d7e2a9f60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # GET /api/jobs keyset 페이지네이션용 복합 인덱스
+    # WHERE status = 'active' AND (created_at, id) < (:created_at, :id) ORDER BY created_at DESC, id DESC
+    op.create_index(
+        'ix_jobs_status_created_at_id',
+        'jobs',
+        ['status', 'created_at', 'id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_jobs_status_created_at_id', table_name='jobs')
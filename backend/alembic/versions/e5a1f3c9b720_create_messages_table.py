@@ -0,0 +1,48 @@
+"""create_messages_table
+
+Revision ID: e5a1f3c9b720
+Revises: d82b4f1c6e37
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a1f3c9b720'
+down_revision: Union[str, None] = 'd82b4f1c6e37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Create messages table (상담 채팅 메시지)
+    op.create_table(
+        'messages',
+        sa.Column('id', UUID(as_uuid=True), primary_key=True),
+        sa.Column('consultation_id', UUID(as_uuid=True), sa.ForeignKey('consultations.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('sender_id', UUID(as_uuid=True), sa.ForeignKey('users.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('content', sa.Text, nullable=False),
+        sa.Column('is_read', sa.Boolean, nullable=False, server_default=sa.false()),
+        sa.Column('file_attachment', sa.String, nullable=True),
+        sa.Column('created_at', sa.DateTime, nullable=False, server_default=sa.func.now()),
+    )
+
+    # 상담별 메시지 조회 / since·before 커서 페이지네이션 / 일괄 읽음 처리
+    op.create_index(
+        'ix_messages_consultation_id_created_at',
+        'messages',
+        ['consultation_id', 'created_at'],
+        unique=False,
+    )
+    op.create_index('ix_messages_sender_id', 'messages', ['sender_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_messages_sender_id', table_name='messages')
+    op.drop_index('ix_messages_consultation_id_created_at', table_name='messages')
+    op.drop_table('messages')
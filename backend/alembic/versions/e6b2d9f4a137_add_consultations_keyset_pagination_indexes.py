@@ -0,0 +1,40 @@
+"""add_consultations_keyset_pagination_indexes
+
+Revision ID: e6b2d9f4a137
+Revises: d4f7a2c8e913
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6b2d9f4a137'
+down_revision: Union[str, None] = 'd4f7a2c8e913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # GET /api/consultations keyset 페이지네이션용 복합 인덱스
+    # WHERE user_id = :user_id AND (created_at, id) < (:created_at, :id) ORDER BY created_at DESC, id DESC
+    op.create_index(
+        'ix_consultations_user_id_created_at_id',
+        'consultations',
+        ['user_id', 'created_at', 'id'],
+        unique=False,
+    )
+    # GET /api/consultations/incoming (전문가 수신함, 상태 필터)
+    op.create_index(
+        'ix_consultations_consultant_id_status_created_at_id',
+        'consultations',
+        ['consultant_id', 'status', 'created_at', 'id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_consultations_consultant_id_status_created_at_id', table_name='consultations')
+    op.drop_index('ix_consultations_user_id_created_at_id', table_name='consultations')
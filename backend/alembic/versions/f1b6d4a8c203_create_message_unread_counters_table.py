@@ -0,0 +1,53 @@
+"""create_message_unread_counters_table
+
+Revision ID: f1b6d4a8c203
+Revises: e5a1f3c9b720
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1b6d4a8c203'
+down_revision: Union[str, None] = 'e5a1f3c9b720'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Create message_unread_counters table (사용자별·상담별 읽지 않은 메시지 수)
+    op.create_table(
+        'message_unread_counters',
+        sa.Column('user_id', UUID(as_uuid=True), sa.ForeignKey('users.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('consultation_id', UUID(as_uuid=True), sa.ForeignKey('consultations.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('unread_count', sa.Integer, nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime, nullable=False, server_default=sa.func.now()),
+    )
+
+    # 기존 읽지 않은 메시지로 카운터 채우기 (받는 사람 = 보낸 사람이 아닌 참여자)
+    op.execute(
+        """
+        INSERT INTO message_unread_counters (user_id, consultation_id, unread_count)
+        SELECT recipient_id, consultation_id, COUNT(*)
+        FROM (
+            SELECT
+                m.consultation_id,
+                CASE WHEN m.sender_id = c.user_id THEN ct.user_id ELSE c.user_id END AS recipient_id
+            FROM messages m
+            JOIN consultations c ON c.id = m.consultation_id
+            LEFT JOIN consultants ct ON ct.id = c.consultant_id
+            WHERE m.is_read = false
+        ) unread
+        WHERE recipient_id IS NOT NULL
+        GROUP BY recipient_id, consultation_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('message_unread_counters')
@@ -0,0 +1,5 @@
+"""easyK 성능 벤치마크
+
+- data_generator: 운영 규모의 합성 데이터 대량 생성 (결정적 시드)
+- runner: 엔드포인트/서비스별 지연 시간(p50/p95/p99)과 처리량 측정 (JSON 출력)
+"""
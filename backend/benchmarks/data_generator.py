@@ -0,0 +1,519 @@
+"""Synthetic Data Generator
+
+운영 규모(일자리 100만, 전문가 10만, 메시지 1000만 건 등)의 벤치마크용 데이터를 생성합니다.
+
+- 같은 시드로 실행하면 같은 데이터가 생성됩니다 (테이블별 독립 난수 스트림).
+- 행 ID는 (종류, 순번)에서 결정적으로 만들어지므로 참조 관계를 조회 없이 생성합니다.
+  (버전 비트가 0이라 애플리케이션이 생성하는 uuid4와 겹치지 않음)
+- PostgreSQL(psycopg2)은 COPY, 그 외 DB는 executemany로 배치 단위 삽입합니다.
+- ORM 이벤트를 거치지 않으므로 파생 데이터(consultant_specialties, 전문가 평점 집계)도 함께 생성합니다.
+
+사용법 (backend 디렉토리에서, alembic upgrade head 이후):
+    python -m benchmarks.data_generator --scale small
+    python -m benchmarks.data_generator --scale production --seed 42 --batch-size 50000
+"""
+
+import argparse
+import csv
+import io
+import json
+import random
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import Table, create_engine, func, select, text
+from sqlalchemy.engine import Connection
+
+from src.config import settings
+from src.database import Base
+from src.models import (
+    Consultant,
+    ConsultantSpecialty,
+    Consultation,
+    GovernmentSupport,
+    Job,
+    Message,
+    Review,
+    User,
+)
+from src.utils.auth import hash_password
+
+
+# 규모별 생성 건수 (users: 외국인 사용자, consultants: 전문가 및 전문가 계정,
+# reviews: 완료된 상담 수를 넘지 않음)
+SCALES: Dict[str, Dict[str, int]] = {
+    "tiny": {
+        "users": 200, "consultants": 20, "jobs": 500, "supports": 50,
+        "consultations": 300, "reviews": 100, "messages": 3_000,
+    },
+    "small": {
+        "users": 10_000, "consultants": 1_000, "jobs": 10_000, "supports": 1_000,
+        "consultations": 10_000, "reviews": 3_000, "messages": 100_000,
+    },
+    "medium": {
+        "users": 100_000, "consultants": 10_000, "jobs": 100_000, "supports": 5_000,
+        "consultations": 100_000, "reviews": 30_000, "messages": 1_000_000,
+    },
+    "production": {
+        "users": 1_000_000, "consultants": 100_000, "jobs": 1_000_000, "supports": 10_000,
+        "consultations": 1_000_000, "reviews": 300_000, "messages": 10_000_000,
+    },
+}
+
+# 생성 계정 공통 비밀번호 (벤치마크 러너가 토큰을 직접 발급하므로 로그인에는 사용하지 않음)
+BENCHMARK_PASSWORD = "Benchmark123!"
+BENCHMARK_EMAIL_DOMAIN = "bench.easyk.test"
+ADMIN_EMAIL = f"admin@{BENCHMARK_EMAIL_DOMAIN}"
+
+# 행 ID 종류 코드 (uuid 상위 비트)
+ID_KINDS = {
+    "user": 1,
+    "consultant_user": 2,
+    "admin": 3,
+    "agency": 4,
+    "consultant": 5,
+    "job": 6,
+    "support": 7,
+    "consultation": 8,
+    "message": 9,
+    "review": 10,
+}
+
+SPECIALTIES = ["visa", "labor", "contract", "business", "other"]
+VISA_TYPES = ["E-1", "E-2", "E-7", "E-9", "D-2", "D-4", "D-10", "F-2", "F-4", "F-5", "F-6", "H-2"]
+NATIONALITIES = ["US", "VN", "CN", "PH", "TH", "UZ", "NP", "ID", "MN", "KH", "RU", "IN"]
+LOCATIONS = [
+    "서울시 강남구", "서울시 영등포구", "서울시 구로구", "경기도 수원시", "경기도 안산시",
+    "경기도 고양시", "인천시 남동구", "부산시 해운대구", "대구시 달서구", "광주시 광산구",
+]
+POSITIONS = ["웹 개발자", "생산직", "물류 관리", "통역사", "영어 강사", "요리사", "간호조무사", "용접공", "디자이너", "영업"]
+EMPLOYMENT_TYPES = ["full-time", "contract", "part-time", "temporary"]
+SUPPORT_CATEGORIES = ["subsidy", "education", "training", "visa", "housing"]
+DEPARTMENTS = ["고용노동부", "법무부", "중소벤처기업부", "여성가족부", "국토교통부"]
+CONSULTATION_METHODS = ["email", "document", "call", "video"]
+WEEKDAYS = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
+
+# 상태 분포 (값, 가중치)
+JOB_STATUSES = (["active", "closed", "expired", "draft"], [70, 15, 10, 5])
+SUPPORT_STATUSES = (["active", "inactive", "ended"], [80, 10, 10])
+CONSULTATION_STATUSES = (
+    ["requested", "matched", "scheduled", "in_progress", "completed", "cancelled"],
+    [5, 10, 15, 10, 50, 10],
+)
+
+Row = Dict[str, object]
+
+
+def make_id(kind: str, index: int) -> uuid.UUID:
+    """
+    (종류, 순번)에서 결정적인 UUID 생성
+
+    Args:
+        kind: ID_KINDS의 종류 이름
+        index: 0부터 시작하는 순번
+
+    Returns:
+        uuid.UUID: 결정적 UUID
+    """
+    return uuid.UUID(int=(ID_KINDS[kind] << 96) | index)
+
+
+def _stream(seed: int, name: str) -> random.Random:
+    """테이블별 독립 난수 스트림 (다른 테이블 건수가 바뀌어도 결과 유지)"""
+    return random.Random(f"{seed}:{name}")
+
+
+def _timestamp(rng: random.Random, now: datetime, max_days: int) -> datetime:
+    """최근 max_days일 이내의 시각"""
+    return now - timedelta(seconds=rng.randrange(max_days * 86400))
+
+
+def generate_users(counts: Dict[str, int], seed: int, now: datetime, password_hash: str) -> Iterator[Tuple[Table, Row]]:
+    """사용자 (관리자 1, 기관, 전문가 계정, 외국인 사용자)"""
+    rng = _stream(seed, "users")
+    table = User.__table__
+
+    def user(user_id: uuid.UUID, email: str, role: str, first_name: str) -> Row:
+        created_at = _timestamp(rng, now, 730)
+        return {
+            "id": user_id,
+            "email": email,
+            "password_hash": password_hash,
+            "email_verified": True,
+            "role": role,
+            "first_name": first_name,
+            "last_name": "Bench",
+            "nationality": "KR" if role != "foreign" else rng.choice(NATIONALITIES),
+            "visa_type": rng.choice(VISA_TYPES) if role == "foreign" else None,
+            "preferred_language": "ko" if role != "foreign" else rng.choice(["ko", "en"]),
+            "phone_verified": False,
+            "residential_area": rng.choice(LOCATIONS),
+            "created_at": created_at,
+            "updated_at": created_at,
+        }
+
+    yield table, user(make_id("admin", 0), ADMIN_EMAIL, "admin", "Admin")
+    for index in range(agency_count(counts)):
+        yield table, user(make_id("agency", index), f"agency{index}@{BENCHMARK_EMAIL_DOMAIN}", "agency", f"Agency{index}")
+    for index in range(counts["consultants"]):
+        yield table, user(
+            make_id("consultant_user", index),
+            f"consultant{index}@{BENCHMARK_EMAIL_DOMAIN}",
+            "consultant",
+            f"Consultant{index}",
+        )
+    for index in range(counts["users"]):
+        yield table, user(make_id("user", index), f"user{index}@{BENCHMARK_EMAIL_DOMAIN}", "foreign", f"User{index}")
+
+
+def agency_count(counts: Dict[str, int]) -> int:
+    """일자리 게시 기관 수 (사용자 1만 명당 1개)"""
+    return max(1, counts["users"] // 10_000)
+
+
+def generate_consultants(counts: Dict[str, int], seed: int, now: datetime) -> Iterator[Tuple[Table, Row]]:
+    """전문가와 전문 분야 인덱스 행"""
+    rng = _stream(seed, "consultants")
+    for index in range(counts["consultants"]):
+        consultant_id = make_id("consultant", index)
+        specialties = rng.sample(SPECIALTIES, rng.randint(1, 3))
+        workdays = WEEKDAYS[:5] if rng.random() < 0.8 else rng.sample(WEEKDAYS, rng.randint(2, 6))
+        created_at = _timestamp(rng, now, 730)
+        yield Consultant.__table__, {
+            "id": consultant_id,
+            "user_id": make_id("consultant_user", index),
+            "office_name": f"벤치마크 법률사무소 {index}",
+            "office_phone": "02-0000-0000",
+            "office_address": rng.choice(LOCATIONS),
+            "years_experience": rng.randint(1, 30),
+            "specialties": json.dumps(specialties),
+            "hourly_rate": Decimal(rng.randrange(50_000, 300_000, 10_000)),
+            # 평점 집계는 후기 생성 후 refresh_consultant_ratings()로 계산
+            "total_reviews": 0,
+            "rating_sum": 0,
+            "average_rating": Decimal("0.00"),
+            "availability": json.dumps({day: "09:00-18:00" for day in workdays}),
+            "max_consultations_per_day": rng.randint(3, 10),
+            "is_active": rng.random() < 0.95,
+            "is_verified": rng.random() < 0.9,
+            "created_at": created_at,
+            "updated_at": created_at,
+        }
+        for specialty in specialties:
+            yield ConsultantSpecialty.__table__, {"consultant_id": consultant_id, "specialty": specialty}
+
+
+def generate_jobs(counts: Dict[str, int], seed: int, now: datetime) -> Iterator[Tuple[Table, Row]]:
+    """일자리 (기관/관리자가 게시)"""
+    rng = _stream(seed, "jobs")
+    posters = [make_id("admin", 0)] + [make_id("agency", index) for index in range(agency_count(counts))]
+    statuses, weights = JOB_STATUSES
+    for index in range(counts["jobs"]):
+        position = rng.choice(POSITIONS)
+        created_at = _timestamp(rng, now, 365)
+        yield Job.__table__, {
+            "id": make_id("job", index),
+            "posted_by": rng.choice(posters),
+            "position": position,
+            "company_name": f"벤치마크 기업 {rng.randrange(counts['jobs'] // 10 + 1)}",
+            "location": rng.choice(LOCATIONS),
+            "employment_type": rng.choice(EMPLOYMENT_TYPES),
+            "salary_range": f"{rng.randrange(2500, 6000, 100)}만원",
+            "salary_currency": "KRW",
+            "description": f"{position} 채용 (벤치마크 데이터 {index})",
+            "requirements": "관련 경력 우대",
+            "required_languages": json.dumps(rng.sample(["ko", "en", "zh", "vi"], rng.randint(1, 2))),
+            "status": rng.choices(statuses, weights)[0],
+            "deadline": created_at + timedelta(days=rng.randint(7, 400)),
+            "created_at": created_at,
+            "updated_at": created_at,
+        }
+
+
+def generate_supports(counts: Dict[str, int], seed: int, now: datetime) -> Iterator[Tuple[Table, Row]]:
+    """정부 지원 프로그램"""
+    rng = _stream(seed, "supports")
+    statuses, weights = SUPPORT_STATUSES
+    for index in range(counts["supports"]):
+        category = rng.choice(SUPPORT_CATEGORIES)
+        start = (now - timedelta(days=rng.randint(0, 365))).date()
+        created_at = datetime.combine(start, datetime.min.time()).isoformat()
+        yield GovernmentSupport.__table__, {
+            "id": make_id("support", index),
+            "title": f"벤치마크 {category} 지원 프로그램 {index}",
+            "category": category,
+            "description": f"외국인 대상 {category} 지원 (벤치마크 데이터)",
+            "eligibility": f"체류 {rng.choice([30, 90, 180, 365])}일 이상 외국인",
+            "eligible_visa_types": json.dumps(rng.sample(VISA_TYPES, rng.randint(1, 5))),
+            "support_content": "월 최대 50만원",
+            "department": rng.choice(DEPARTMENTS),
+            "application_period_start": start,
+            "application_period_end": start + timedelta(days=rng.randint(30, 365)) if rng.random() < 0.8 else None,
+            "status": rng.choices(statuses, weights)[0],
+            "created_at": created_at,
+            "updated_at": created_at,
+        }
+
+
+def generate_consultations(counts: Dict[str, int], seed: int, now: datetime) -> Iterator[Tuple[Table, Row]]:
+    """상담과 상담별 메시지/후기 (메시지 수는 상담마다 균등 분배, 후기는 완료된 상담에 순서대로)"""
+    rng = _stream(seed, "consultations")
+    statuses, weights = CONSULTATION_STATUSES
+    per_consultation, remainder = divmod(counts["messages"], max(counts["consultations"], 1))
+    message_index = 0
+    review_index = 0
+    for index in range(counts["consultations"]):
+        consultation_id = make_id("consultation", index)
+        user_id = make_id("user", rng.randrange(counts["users"]))
+        status = rng.choices(statuses, weights)[0]
+        consultant_index = rng.randrange(counts["consultants"]) if status != "requested" else None
+        created_at = _timestamp(rng, now, 365)
+        scheduled_at = (
+            created_at + timedelta(days=rng.randint(1, 14))
+            if status in ("scheduled", "in_progress", "completed") else None
+        )
+        yield Consultation.__table__, {
+            "id": consultation_id,
+            "user_id": user_id,
+            "consultant_id": make_id("consultant", consultant_index) if consultant_index is not None else None,
+            "consultation_type": rng.choice(SPECIALTIES),
+            "content": f"벤치마크 상담 요청 {index}",
+            "status": status,
+            "matched_at": created_at if consultant_index is not None else None,
+            "scheduled_at": scheduled_at,
+            "completed_at": scheduled_at + timedelta(hours=1) if status == "completed" else None,
+            "consultation_method": rng.choice(CONSULTATION_METHODS),
+            "amount": Decimal(rng.randrange(50_000, 300_000, 10_000)),
+            "payment_status": "completed" if status in ("scheduled", "in_progress", "completed") else "pending",
+            "created_at": created_at,
+            "updated_at": created_at,
+        }
+
+        if status == "completed" and review_index < counts.get("reviews", 0):
+            yield Review.__table__, {
+                "id": make_id("review", review_index),
+                "consultation_id": consultation_id,
+                "reviewer_id": user_id,
+                "consultant_id": make_id("consultant", consultant_index),
+                "rating": rng.choices([1, 2, 3, 4, 5], [2, 3, 10, 35, 50])[0],
+                "comment": "벤치마크 후기",
+                "is_anonymous": rng.random() < 0.2,
+                "helpful_count": 0,
+                "created_at": scheduled_at + timedelta(days=1),
+                "updated_at": scheduled_at + timedelta(days=1),
+            }
+            review_index += 1
+
+        # 메시지는 매칭된 상담에만 (모두 읽음 처리하여 읽지 않은 메시지 카운터와 일치)
+        message_count = per_consultation + (1 if index < remainder else 0)
+        if consultant_index is None:
+            message_count = 0
+        participants = (user_id, make_id("consultant_user", consultant_index) if consultant_index is not None else None)
+        for offset in range(message_count):
+            yield Message.__table__, {
+                "id": make_id("message", message_index),
+                "consultation_id": consultation_id,
+                "sender_id": participants[offset % 2],
+                "content": f"벤치마크 메시지 {offset}",
+                "is_read": True,
+                "file_attachment": None,
+                "created_at": (created_at + timedelta(minutes=offset)).replace(tzinfo=None),
+            }
+            message_index += 1
+
+
+class BulkWriter:
+    """테이블별 버퍼에 행을 모아 배치 단위로 삽입
+
+    버퍼가 batch_size에 도달하면 모든 테이블의 버퍼를 외래 키 순서(metadata.sorted_tables)로
+    함께 삽입하므로, 자식 행이 부모 행보다 먼저 삽입되지 않습니다.
+    """
+
+    def __init__(self, connection: Connection, batch_size: int = 10_000, use_copy: Optional[bool] = None):
+        """
+        Args:
+            connection: 삽입에 사용할 연결 (트랜잭션은 호출자가 관리)
+            batch_size: 테이블별 배치 크기
+            use_copy: COPY 사용 여부 (기본값: PostgreSQL + psycopg2이면 사용)
+        """
+        self.connection = connection
+        self.batch_size = batch_size
+        if use_copy is None:
+            use_copy = connection.dialect.name == "postgresql" and connection.dialect.driver == "psycopg2"
+        self.use_copy = use_copy
+        self.counts: Dict[str, int] = {}
+        self.seconds: Dict[str, float] = {}  # 테이블별 삽입 시간 (행 생성 시간 제외)
+        self._buffers: Dict[Table, List[Row]] = {}
+        self._order = {table: position for position, table in enumerate(Base.metadata.sorted_tables)}
+
+    def add(self, table: Table, row: Row) -> None:
+        """행 추가 (버퍼가 가득 차면 삽입)"""
+        buffer = self._buffers.setdefault(table, [])
+        buffer.append(row)
+        if len(buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """모든 버퍼 삽입 (외래 키 순서)"""
+        for table in sorted(self._buffers, key=self._order.__getitem__):
+            rows = self._buffers[table]
+            if not rows:
+                continue
+            started_at = time.perf_counter()
+            if self.use_copy:
+                self._copy(table, rows)
+            else:
+                self.connection.execute(table.insert(), rows)
+            self.counts[table.name] = self.counts.get(table.name, 0) + len(rows)
+            self.seconds[table.name] = self.seconds.get(table.name, 0.0) + time.perf_counter() - started_at
+            self._buffers[table] = []
+
+    def _copy(self, table: Table, rows: List[Row]) -> None:
+        """PostgreSQL COPY FROM STDIN (CSV, NULL은 따옴표 없는 빈 값)"""
+        columns = list(rows[0])
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in rows:
+            writer.writerow(["" if row[column] is None else row[column] for column in columns])
+        buffer.seek(0)
+        cursor = self.connection.connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY {table.name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)",
+                buffer,
+            )
+        finally:
+            cursor.close()
+
+
+def refresh_consultant_ratings(connection: Connection) -> None:
+    """
+    후기 기준으로 전문가 평점 집계(total_reviews, rating_sum, average_rating) 일괄 계산
+
+    Args:
+        connection: 대상 연결
+    """
+    connection.execute(text(
+        """
+        UPDATE consultants
+        SET rating_sum = agg.rating_sum,
+            total_reviews = agg.total_reviews,
+            average_rating = ROUND(agg.rating_sum * 1.0 / agg.total_reviews, 2)
+        FROM (
+            SELECT consultant_id, SUM(rating) AS rating_sum, COUNT(*) AS total_reviews
+            FROM reviews
+            GROUP BY consultant_id
+        ) AS agg
+        WHERE consultants.id = agg.consultant_id
+        """
+    ))
+
+
+def reset_tables(connection: Connection) -> None:
+    """
+    모든 애플리케이션 테이블의 데이터 삭제 (스테이징 초기화용)
+
+    PostgreSQL은 TRUNCATE 한 번으로, 그 외 DB는 외래 키 역순 DELETE로 삭제합니다.
+
+    Args:
+        connection: 대상 연결
+    """
+    tables = list(reversed(Base.metadata.sorted_tables))
+    if connection.dialect.name == "postgresql":
+        connection.exec_driver_sql(f"TRUNCATE {', '.join(table.name for table in tables)} CASCADE")
+        return
+    for table in tables:
+        connection.execute(table.delete())
+
+
+def generate(
+    connection: Connection,
+    counts: Dict[str, int],
+    seed: int = 42,
+    batch_size: int = 10_000,
+    now: Optional[datetime] = None,
+    progress: bool = False,
+    writer: Optional[BulkWriter] = None,
+) -> Dict[str, int]:
+    """
+    벤치마크 데이터 생성
+
+    Args:
+        connection: 삽입에 사용할 연결 (호출자가 커밋)
+        counts: 생성 건수 (SCALES 형식)
+        seed: 난수 시드
+        batch_size: 테이블별 배치 크기
+        now: 기준 시각 (기본값: 오늘 0시 UTC, 같은 날 실행하면 같은 데이터)
+        progress: 테이블 그룹별 진행 상황 출력 여부
+        writer: 삽입에 사용할 BulkWriter (테이블별 삽입 시간이 필요할 때 전달)
+
+    Returns:
+        Dict[str, int]: 테이블별 삽입 건수
+    """
+    now = now or datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    writer = writer or BulkWriter(connection, batch_size=batch_size)
+    # bcrypt는 느리므로 모든 계정이 같은 해시 사용
+    password_hash = hash_password(BENCHMARK_PASSWORD)
+
+    groups = [
+        ("users", generate_users(counts, seed, now, password_hash)),
+        ("consultants", generate_consultants(counts, seed, now)),
+        ("jobs", generate_jobs(counts, seed, now)),
+        ("supports", generate_supports(counts, seed, now)),
+        ("consultations/reviews/messages", generate_consultations(counts, seed, now)),
+    ]
+    for name, rows in groups:
+        started_at = time.perf_counter()
+        for table, row in rows:
+            writer.add(table, row)
+        writer.flush()
+        if progress:
+            print(f"✅ {name}: {time.perf_counter() - started_at:.1f}s", file=sys.stderr)
+
+    if writer.counts.get(Review.__tablename__):
+        refresh_consultant_ratings(connection)
+    return writer.counts
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="벤치마크용 합성 데이터 생성")
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small", help="생성 규모")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    parser.add_argument("--batch-size", type=int, default=10_000, help="테이블별 배치 크기")
+    parser.add_argument("--database-url", default=settings.DATABASE_URL, help="대상 DB (기본값: DATABASE_URL)")
+    parser.add_argument("--create-schema", action="store_true", help="테이블이 없으면 생성 (SQLite 등 마이그레이션 없이 실행 시)")
+    args = parser.parse_args(argv)
+
+    engine = create_engine(args.database_url)
+    if args.create_schema:
+        Base.metadata.create_all(engine)
+
+    with engine.connect() as connection:
+        existing = connection.execute(select(func.count()).select_from(User).where(User.email == ADMIN_EMAIL)).scalar()
+    if existing:
+        print("ℹ️  Benchmark data already exists. Use a fresh database.", file=sys.stderr)
+        return 1
+
+    started_at = time.perf_counter()
+    with engine.begin() as connection:
+        counts = generate(connection, SCALES[args.scale], seed=args.seed, batch_size=args.batch_size, progress=True)
+    # 대량 삽입 후 통계 갱신 (실행 계획이 실제 분포를 반영하도록)
+    with engine.begin() as connection:
+        connection.exec_driver_sql("ANALYZE")
+    engine.dispose()
+
+    print(json.dumps({
+        "scale": args.scale,
+        "seed": args.seed,
+        "rows": counts,
+        "seconds": round(time.perf_counter() - started_at, 1),
+    }, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,466 @@
+"""Benchmark Runner
+
+data_generator로 생성한 데이터가 있는 서버에 요청을 보내 엔드포인트별
+지연 시간(p50/p95/p99)과 처리량을 측정하고 결과를 JSON으로 출력합니다.
+서비스 함수(find_matching_consultant)는 같은 DB에 직접 연결해 측정합니다.
+
+- 인증 토큰은 서버와 같은 SECRET_KEY로 직접 발급합니다 (.env 공유).
+- 요청 파라미터는 시드 기반으로 다양하게 생성되어 응답 캐시에만 의존하지 않습니다.
+- 서버가 Server-Timing 헤더를 반환하면 요청당 DB 시간/SQL 수도 함께 집계합니다.
+- --baseline으로 이전 결과 JSON을 주면 p95 변화율을 함께 출력합니다 (릴리스 간 비교).
+
+사용법 (backend 디렉토리에서):
+    python -m benchmarks.runner --base-url http://localhost:8000 --output results.json
+    python -m benchmarks.runner --endpoints jobs_list,job_detail --requests 2000 --concurrency 32
+    python -m benchmarks.runner --baseline results-v0.1.json --output results-v0.2.json
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import platform
+import random
+import re
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from statistics import mean
+from typing import Callable, Dict, List, Optional
+
+import httpx
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from src.config import settings
+from src.models import Consultation, Job, Message, User
+from src.services.matching_service import find_matching_consultant
+from src.utils.auth import create_access_token
+
+from .data_generator import ADMIN_EMAIL, LOCATIONS, POSITIONS, SPECIALTIES, SUPPORT_CATEGORIES
+
+
+_SERVER_TIMING_DB = re.compile(r'db;dur=([\d.]+);desc="(\d+) queries')
+
+
+class Fixtures:
+    """요청 파라미터에 사용할 실제 데이터 표본"""
+
+    def __init__(self, job_ids: List[str], consultations: List[tuple], row_counts: Dict[str, int]):
+        """
+        Args:
+            job_ids: 일자리 ID 표본
+            consultations: (상담 ID, 신청자 이메일) 표본
+            row_counts: 테이블별 행 수 (결과 메타데이터)
+        """
+        self.job_ids = job_ids
+        self.consultations = consultations
+        self.row_counts = row_counts
+        self._tokens: Dict[str, str] = {}
+
+    def auth_headers(self, email: str) -> Dict[str, str]:
+        """이메일 사용자의 Authorization 헤더 (토큰 재사용)"""
+        if email not in self._tokens:
+            self._tokens[email] = create_access_token({"sub": email})
+        return {"Authorization": f"Bearer {self._tokens[email]}"}
+
+
+def load_fixtures(db: Session, sample_size: int = 1000) -> Fixtures:
+    """
+    DB에서 요청 파라미터용 표본 조회
+
+    Args:
+        db: 데이터베이스 세션
+        sample_size: 테이블별 표본 크기
+
+    Returns:
+        Fixtures: 표본 데이터
+
+    Raises:
+        RuntimeError: 벤치마크 데이터가 없을 때
+    """
+    job_ids = [str(job_id) for job_id in db.execute(
+        select(Job.id).where(Job.status == "active").order_by(Job.created_at.desc()).limit(sample_size)
+    ).scalars()]
+    consultations = [
+        (str(consultation_id), email)
+        for consultation_id, email in db.execute(
+            select(Consultation.id, User.email)
+            .join(User, User.id == Consultation.user_id)
+            .where(Consultation.consultant_id.isnot(None))
+            .order_by(Consultation.id)
+            .limit(sample_size)
+        )
+    ]
+    if not job_ids or not consultations:
+        raise RuntimeError("Benchmark data not found. Run `python -m benchmarks.data_generator` first.")
+
+    row_counts = {
+        model.__tablename__: db.execute(select(func.count()).select_from(model)).scalar()
+        for model in (User, Job, Consultation, Message)
+    }
+    return Fixtures(job_ids, consultations, row_counts)
+
+
+# 엔드포인트별 요청 생성기: (난수, 표본) -> httpx 요청 인자
+RequestBuilder = Callable[[random.Random, Fixtures], dict]
+
+
+def _jobs_list(rng: random.Random, fixtures: Fixtures) -> dict:
+    params = {"limit": 20, "offset": rng.choice([0, 0, 0, 20, 40, 100])}
+    if rng.random() < 0.5:
+        params["location"] = rng.choice(LOCATIONS)
+    return {"method": "GET", "url": "/api/jobs", "params": params}
+
+
+def _jobs_list_authenticated(rng: random.Random, fixtures: Fixtures) -> dict:
+    _, email = rng.choice(fixtures.consultations)
+    return {**_jobs_list(rng, fixtures), "headers": fixtures.auth_headers(email)}
+
+
+def _jobs_search(rng: random.Random, fixtures: Fixtures) -> dict:
+    return {"method": "GET", "url": "/api/jobs", "params": {"keyword": rng.choice(POSITIONS), "limit": 20}}
+
+
+def _job_detail(rng: random.Random, fixtures: Fixtures) -> dict:
+    return {"method": "GET", "url": f"/api/jobs/{rng.choice(fixtures.job_ids)}"}
+
+
+def _supports_list(rng: random.Random, fixtures: Fixtures) -> dict:
+    _, email = rng.choice(fixtures.consultations)
+    params = {"category": rng.choice(SUPPORT_CATEGORIES), "limit": 20, "offset": rng.choice([0, 20, 40])}
+    return {"method": "GET", "url": "/api/supports", "params": params, "headers": fixtures.auth_headers(email)}
+
+
+def _consultations_list(rng: random.Random, fixtures: Fixtures) -> dict:
+    _, email = rng.choice(fixtures.consultations)
+    return {"method": "GET", "url": "/api/consultations", "headers": fixtures.auth_headers(email)}
+
+
+def _messages_list(rng: random.Random, fixtures: Fixtures) -> dict:
+    consultation_id, email = rng.choice(fixtures.consultations)
+    return {
+        "method": "GET",
+        "url": f"/api/messages/consultations/{consultation_id}",
+        "headers": fixtures.auth_headers(email),
+    }
+
+
+def _stats_dashboard(rng: random.Random, fixtures: Fixtures) -> dict:
+    return {"method": "GET", "url": "/api/stats/dashboard", "headers": fixtures.auth_headers(ADMIN_EMAIL)}
+
+
+def _stats_overview(rng: random.Random, fixtures: Fixtures) -> dict:
+    return {"method": "GET", "url": "/api/stats/overview", "headers": fixtures.auth_headers(ADMIN_EMAIL)}
+
+
+ENDPOINTS: Dict[str, RequestBuilder] = {
+    "jobs_list": _jobs_list,
+    "jobs_list_authenticated": _jobs_list_authenticated,
+    "jobs_search": _jobs_search,
+    "job_detail": _job_detail,
+    "supports_list": _supports_list,
+    "consultations_list": _consultations_list,
+    "messages_list": _messages_list,
+    "stats_dashboard": _stats_dashboard,
+    "stats_overview": _stats_overview,
+}
+
+# 서비스 함수 벤치마크: (난수, 세션) -> None
+SERVICES: Dict[str, Callable[[random.Random, Session], None]] = {
+    "find_matching_consultant": lambda rng, db: find_matching_consultant(db, rng.choice(SPECIALTIES)),
+}
+
+
+def percentile(sorted_values: List[float], pct: float) -> Optional[float]:
+    """
+    백분위수 (nearest-rank)
+
+    Args:
+        sorted_values: 오름차순 정렬된 값
+        pct: 백분위 (0-100)
+
+    Returns:
+        Optional[float]: 백분위수 (값이 없으면 None)
+    """
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize(
+    name: str,
+    latencies: List[float],
+    elapsed_seconds: float,
+    errors: int = 0,
+    statuses: Optional[Dict[str, int]] = None,
+    db_latencies: Optional[List[float]] = None,
+    statement_counts: Optional[List[int]] = None,
+) -> dict:
+    """
+    측정 결과 요약
+
+    Args:
+        name: 벤치마크 이름
+        latencies: 성공한 요청의 지연 시간 (초)
+        elapsed_seconds: 전체 측정 시간 (초)
+        errors: 실패(연결 오류, 5xx 등) 수
+        statuses: 상태 코드별 응답 수
+        db_latencies: 요청별 DB 시간 (초, Server-Timing)
+        statement_counts: 요청별 SQL 수 (Server-Timing)
+
+    Returns:
+        dict: 결과 (지연 시간은 ms)
+    """
+    ordered = sorted(latencies)
+
+    def ms(value: Optional[float]) -> Optional[float]:
+        return round(value * 1000, 3) if value is not None else None
+
+    result = {
+        "name": name,
+        "requests": len(latencies) + errors,
+        "errors": errors,
+        "statuses": statuses or {},
+        "p50_ms": ms(percentile(ordered, 50)),
+        "p95_ms": ms(percentile(ordered, 95)),
+        "p99_ms": ms(percentile(ordered, 99)),
+        "mean_ms": ms(mean(ordered)) if ordered else None,
+        "max_ms": ms(ordered[-1]) if ordered else None,
+        "throughput_rps": round(len(latencies) / elapsed_seconds, 2) if elapsed_seconds > 0 else None,
+    }
+    if db_latencies:
+        result["db_p50_ms"] = ms(percentile(sorted(db_latencies), 50))
+    if statement_counts:
+        result["queries_mean"] = round(mean(statement_counts), 2)
+        result["queries_max"] = max(statement_counts)
+    return result
+
+
+async def run_endpoint(
+    client: httpx.AsyncClient,
+    name: str,
+    fixtures: Fixtures,
+    requests: int,
+    concurrency: int,
+    warmup: int = 0,
+    seed: int = 42,
+) -> dict:
+    """
+    엔드포인트 하나를 동시 요청으로 측정
+
+    Args:
+        client: 서버 주소가 설정된 HTTP 클라이언트
+        name: ENDPOINTS 이름
+        fixtures: 요청 파라미터 표본
+        requests: 측정할 요청 수
+        concurrency: 동시 요청 수
+        warmup: 측정 전 워밍업 요청 수 (결과 제외)
+        seed: 요청 파라미터 난수 시드
+
+    Returns:
+        dict: summarize() 결과
+    """
+    build = ENDPOINTS[name]
+    rng = random.Random(f"{seed}:{name}")
+    warmup_requests = [build(rng, fixtures) for _ in range(warmup)]
+    planned = iter([build(rng, fixtures) for _ in range(requests)])
+    latencies: List[float] = []
+    db_latencies: List[float] = []
+    statement_counts: List[int] = []
+    statuses: Dict[str, int] = {}
+    errors = 0
+
+    # 워밍업 (순차 실행, 커넥션 풀/캐시 준비, 결과 제외)
+    for request in warmup_requests:
+        try:
+            await client.request(**request)
+        except httpx.HTTPError:
+            pass
+
+    async def worker() -> None:
+        nonlocal errors
+        # 이벤트 루프 하나에서 실행되므로 공유 iterator를 잠금 없이 사용
+        for request in planned:
+            started_at = time.perf_counter()
+            try:
+                response = await client.request(**request)
+            except httpx.HTTPError:
+                errors += 1
+                continue
+            latency = time.perf_counter() - started_at
+            statuses[str(response.status_code)] = statuses.get(str(response.status_code), 0) + 1
+            if response.status_code >= 500:
+                errors += 1
+                continue
+            latencies.append(latency)
+            timing = _SERVER_TIMING_DB.search(response.headers.get("server-timing", ""))
+            if timing:
+                db_latencies.append(float(timing.group(1)) / 1000)
+                statement_counts.append(int(timing.group(2)))
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started_at
+    return summarize(name, latencies, elapsed, errors, statuses, db_latencies, statement_counts)
+
+
+def run_service(name: str, session_factory: Callable[[], Session], iterations: int, seed: int = 42) -> dict:
+    """
+    서비스 함수를 순차 실행하여 측정 (매 호출 후 롤백)
+
+    Args:
+        name: SERVICES 이름
+        session_factory: 세션 생성 함수
+        iterations: 호출 횟수
+        seed: 난수 시드
+
+    Returns:
+        dict: summarize() 결과
+    """
+    call = SERVICES[name]
+    rng = random.Random(f"{seed}:{name}")
+    latencies: List[float] = []
+    errors = 0
+    db = session_factory()
+    try:
+        started_at = time.perf_counter()
+        for _ in range(iterations):
+            call_started_at = time.perf_counter()
+            try:
+                call(rng, db)
+                latencies.append(time.perf_counter() - call_started_at)
+            except Exception:
+                errors += 1
+            finally:
+                db.rollback()
+        elapsed = time.perf_counter() - started_at
+    finally:
+        db.close()
+    return summarize(name, latencies, elapsed, errors)
+
+
+def compare_reports(baseline: dict, current: dict) -> List[dict]:
+    """
+    이전 결과와 p95/처리량 비교
+
+    Args:
+        baseline: 이전 결과 JSON
+        current: 현재 결과 JSON
+
+    Returns:
+        List[dict]: 벤치마크별 p95 변화율(%)과 처리량 변화율(%)
+    """
+    previous = {result["name"]: result for result in baseline.get("results", [])}
+    comparison = []
+    for result in current["results"]:
+        before = previous.get(result["name"])
+        if not before:
+            continue
+
+        def change(key: str) -> Optional[float]:
+            if not before.get(key) or result.get(key) is None:
+                return None
+            return round((result[key] - before[key]) / before[key] * 100, 1)
+
+        comparison.append({
+            "name": result["name"],
+            "p95_ms": result["p95_ms"],
+            "baseline_p95_ms": before["p95_ms"],
+            "p95_change_pct": change("p95_ms"),
+            "throughput_change_pct": change("throughput_rps"),
+        })
+    return comparison
+
+
+def _git_revision() -> Optional[str]:
+    """현재 git 커밋 (git이 없으면 None)"""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run(args: argparse.Namespace) -> dict:
+    """CLI 인자로 벤치마크 실행 후 결과 JSON 생성"""
+    engine = create_engine(args.database_url)
+    session_factory = sessionmaker(bind=engine)
+    with session_factory() as db:
+        fixtures = load_fixtures(db)
+
+    endpoints = [name for name in args.endpoints.split(",") if name] if args.endpoints else list(ENDPOINTS)
+    services = [name for name in args.services.split(",") if name] if args.services else list(SERVICES)
+    results = []
+
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout, limits=limits) as client:
+        for name in endpoints:
+            print(f"▶ {name}", file=sys.stderr)
+            results.append(await run_endpoint(
+                client, name, fixtures, args.requests, args.concurrency, args.warmup, args.seed
+            ))
+    for name in services:
+        print(f"▶ {name}", file=sys.stderr)
+        results.append(run_service(name, session_factory, args.service_iterations, args.seed))
+    engine.dispose()
+
+    return {
+        "meta": {
+            "started_at": datetime.now(timezone.utc).isoformat(),
+            "label": args.label,
+            "git_revision": _git_revision(),
+            "base_url": args.base_url,
+            "database": engine.url.render_as_string(hide_password=True),
+            "row_counts": fixtures.row_counts,
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "warmup": args.warmup,
+            "seed": args.seed,
+            "python": platform.python_version(),
+        },
+        "results": results,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="엔드포인트 지연 시간/처리량 벤치마크")
+    parser.add_argument("--base-url", default="http://localhost:8000", help="서버 주소")
+    parser.add_argument("--database-url", default=settings.DATABASE_URL, help="표본 조회/서비스 측정용 DB (기본값: DATABASE_URL)")
+    parser.add_argument("--endpoints", default="", help=f"측정할 엔드포인트 (쉼표 구분, 기본값: 전체) {', '.join(ENDPOINTS)}")
+    parser.add_argument("--services", default="", help=f"측정할 서비스 함수 (쉼표 구분, 기본값: 전체) {', '.join(SERVICES)}")
+    parser.add_argument("--requests", type=int, default=1000, help="엔드포인트별 요청 수")
+    parser.add_argument("--concurrency", type=int, default=16, help="동시 요청 수")
+    parser.add_argument("--warmup", type=int, default=20, help="엔드포인트별 워밍업 요청 수")
+    parser.add_argument("--service-iterations", type=int, default=200, help="서비스 함수 호출 횟수")
+    parser.add_argument("--timeout", type=float, default=30.0, help="요청 타임아웃 (초)")
+    parser.add_argument("--seed", type=int, default=42, help="요청 파라미터 난수 시드")
+    parser.add_argument("--label", default=None, help="결과에 기록할 이름 (예: 릴리스 버전)")
+    parser.add_argument("--output", default=None, help="결과 JSON 파일 (기본값: stdout)")
+    parser.add_argument("--baseline", default=None, help="비교할 이전 결과 JSON 파일")
+    args = parser.parse_args(argv)
+
+    unknown = set(filter(None, args.endpoints.split(","))) - set(ENDPOINTS)
+    unknown |= set(filter(None, args.services.split(","))) - set(SERVICES)
+    if unknown:
+        parser.error(f"Unknown benchmarks: {', '.join(sorted(unknown))}")
+
+    report = asyncio.run(run(args))
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            report["comparison"] = compare_reports(json.load(f), report)
+
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,15 @@
-"""Initial data seeding script for easyK"""
+"""Initial data seeding script for easyK
 
+사용법:
+    python seed_data.py                      # 샘플 데이터 (전문가 5명, 일자리, 정부 지원)
+    python seed_data.py --bulk --scale medium --reset
+    python seed_data.py --bulk --users 2000000 --jobs 1000000 --messages 10000000
+"""
+
+import argparse
 import asyncio
+import sys
+import time
 from datetime import datetime, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
@@ -13,6 +22,8 @@ from src.models import User, Consultant, Job, GovernmentSupport
 from src.config import settings
 from src.utils.auth import hash_password
 
+from benchmarks.data_generator import SCALES, BulkWriter, generate, reset_tables
+
 
 @asynccontextmanager
 async def get_db_session():
@@ -578,6 +589,103 @@ async def seed_all_data():
             raise
 
 
+BULK_COUNT_OPTIONS = ("users", "consultants", "jobs", "supports", "consultations", "reviews", "messages")
+
+
+def seed_bulk(
+    database_url: str,
+    counts: dict,
+    seed: int = 42,
+    batch_size: int = 10_000,
+    reset: bool = False,
+) -> dict:
+    """
+    대량 시딩 (PostgreSQL COPY / 그 외 executemany)
+
+    참조 관계가 일관된 사용자, 전문가, 일자리, 정부 지원, 상담, 후기, 메시지를
+    배치 단위로 삽입합니다. 모든 계정은 미리 계산한 비밀번호 해시 하나를 공유합니다
+    (비밀번호: benchmarks.data_generator.BENCHMARK_PASSWORD).
+
+    Args:
+        database_url: 대상 DB (동기 드라이버 URL)
+        counts: 엔티티별 생성 건수 (SCALES 형식)
+        seed: 난수 시드 (같은 시드는 같은 데이터)
+        batch_size: 테이블별 배치 크기
+        reset: 시딩 전에 모든 테이블 데이터 삭제 여부
+
+    Returns:
+        dict: 테이블별 행 수와 초당 삽입 행 수, 전체 소요 시간
+    """
+    from sqlalchemy import create_engine
+
+    engine = create_engine(database_url)
+    started_at = time.perf_counter()
+    try:
+        # 삭제와 삽입을 한 트랜잭션으로 (실패 시 기존 데이터 유지)
+        with engine.begin() as connection:
+            if reset:
+                reset_tables(connection)
+                print("🗑️  Existing data deleted")
+            writer = BulkWriter(connection, batch_size=batch_size)
+            generate(connection, counts, seed=seed, progress=True, writer=writer)
+        with engine.begin() as connection:
+            connection.exec_driver_sql("ANALYZE")
+    finally:
+        engine.dispose()
+    elapsed = time.perf_counter() - started_at
+
+    total_rows = sum(writer.counts.values())
+    return {
+        "tables": {
+            name: {
+                "rows": rows,
+                "rows_per_second": round(rows / writer.seconds[name]) if writer.seconds.get(name) else None,
+            }
+            for name, rows in writer.counts.items()
+        },
+        "total_rows": total_rows,
+        "seconds": round(elapsed, 1),
+        "rows_per_second": round(total_rows / elapsed) if elapsed > 0 else None,
+        "method": "COPY" if writer.use_copy else "executemany",
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="easyK 데이터 시딩")
+    parser.add_argument("--bulk", action="store_true", help="대량 시딩 모드")
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small", help="대량 시딩 기본 규모")
+    for name in BULK_COUNT_OPTIONS:
+        parser.add_argument(f"--{name}", type=int, default=None, help=f"{name} 생성 건수 (기본값: --scale)")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    parser.add_argument("--batch-size", type=int, default=10_000, help="테이블별 배치 크기")
+    parser.add_argument("--reset", action="store_true", help="시딩 전에 모든 테이블 데이터 삭제 (스테이징 초기화)")
+    parser.add_argument("--database-url", default=settings.DATABASE_URL, help="대상 DB (기본값: DATABASE_URL)")
+    args = parser.parse_args(argv)
+
+    if not args.bulk:
+        asyncio.run(seed_all_data())
+        return 0
+
+    counts = dict(SCALES[args.scale])
+    for name in BULK_COUNT_OPTIONS:
+        if getattr(args, name) is not None:
+            counts[name] = getattr(args, name)
+
+    print("=" * 60)
+    print(f"🌱 Bulk seeding: {json.dumps(counts)}")
+    print("=" * 60)
+    report = seed_bulk(args.database_url, counts, args.seed, args.batch_size, args.reset)
+
+    for name, table in report["tables"].items():
+        print(f"  {name:<24} {table['rows']:>12,} rows  {table['rows_per_second'] or 0:>10,} rows/s")
+    print("=" * 60)
+    print(
+        f"✅ {report['total_rows']:,} rows in {report['seconds']}s "
+        f"({report['rows_per_second'] or 0:,} rows/s, {report['method']})"
+    )
+    return 0
+
+
 if __name__ == "__main__":
-    asyncio.run(seed_all_data())
+    sys.exit(main())
 
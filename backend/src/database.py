@@ -1,5 +1,7 @@
 from sqlalchemy import create_engine, TypeDecorator, CHAR
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 import uuid
@@ -63,6 +65,54 @@ SessionLocal = sessionmaker(
     expire_on_commit=False,  # 커밋 후 객체 만료 방지
 )
 
+
+
+def get_async_database_url(database_url: str) -> str:
+    """동기 DATABASE_URL을 비동기 드라이버 URL로 변환
+
+    - postgresql(+psycopg2) -> postgresql+asyncpg (sslmode -> ssl)
+    - sqlite -> sqlite+aiosqlite
+
+    Args:
+        database_url: 동기 드라이버 데이터베이스 URL
+
+    Returns:
+        str: 비동기 드라이버 데이터베이스 URL
+    """
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+
+    if backend == "postgresql":
+        query = dict(url.query)
+        # asyncpg는 libpq의 sslmode 대신 ssl 파라미터 사용
+        sslmode = query.pop("sslmode", None)
+        if sslmode:
+            query["ssl"] = sslmode
+        url = url.set(drivername="postgresql+asyncpg", query=query)
+    elif backend == "sqlite":
+        url = url.set(drivername="sqlite+aiosqlite")
+
+    return url.render_as_string(hide_password=False)
+
+
+# 비동기 데이터베이스 엔진 (읽기 위주 엔드포인트용)
+async_engine = create_async_engine(
+    settings.ASYNC_DATABASE_URL or get_async_database_url(settings.DATABASE_URL),
+    echo=settings.DEBUG,
+    pool_pre_ping=True,
+    pool_size=10,
+    max_overflow=20,
+    pool_recycle=3600,
+)
+
+# 비동기 세션 팩토리
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
 # Base 클래스 (모든 모델의 부모)
 Base = declarative_base()
 
@@ -85,3 +135,20 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+# 의존성 주입용 비동기 DB 세션
+async def get_async_db():
+    """
+    FastAPI 의존성으로 사용할 비동기 DB 세션 생성
+
+    DB 응답을 기다리는 동안 스레드풀 스레드를 점유하지 않으므로
+    읽기 위주 엔드포인트에서 사용합니다.
+
+    Usage:
+        @app.get("/items/")
+        async def read_items(db: AsyncSession = Depends(get_async_db)):
+            ...
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -1,11 +1,20 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 import os
 
 from .config import settings
+from .middleware.metrics import MetricsMiddleware, QueryDiagnosticsMiddleware
 from .middleware.security import rate_limiter, rate_limit_exceeded_handler, validate_environment_variables
-from .routers import auth, users, consultations, payments, reviews, consultants, jobs, support_keywords, government_supports, uploads, document_templates, stats
+from .utils.pagination import NEXT_CURSOR_HEADER
+from .utils.auth import password_hash_pool
+from .utils.toss_payments import toss_payments_client
+from .utils.message_broker import message_broker
+from .services.email_outbox_worker import email_outbox_worker
+from .services.rematch_service import rematch_worker
+from .services.review_service import rating_reconciliation_worker
+from .routers import auth, users, consultations, payments, reviews, consultants, jobs, support_keywords, government_supports, uploads, document_templates, stats, messages, metrics
 
 # 환경 변수 검증 (실행 시)
 try:
@@ -14,11 +23,37 @@ except ValueError as e:
     print(f"⚠️  Configuration Error: {e}")
     print("Please set the required environment variables in .env file")
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """애플리케이션 시작/종료 시 리소스 관리"""
+    # 토스페이먼츠 API 연결 풀 생성
+    await toss_payments_client.startup()
+    # 상담 메시지 실시간 브로커 시작
+    await message_broker.start()
+    # 이메일 발송 대기열 워커 시작
+    if settings.EMAIL_ENABLED:
+        await email_outbox_worker.start()
+    # 매칭 대기 상담 재매칭 워커 시작
+    await rematch_worker.start()
+    # 전문가 평점 주기적 재집계 워커 시작
+    await rating_reconciliation_worker.start()
+    yield
+    await rating_reconciliation_worker.stop()
+    await rematch_worker.stop()
+    await email_outbox_worker.stop()
+    await message_broker.stop()
+    await toss_payments_client.aclose()
+    # 비밀번호 해싱 워커 풀 종료
+    password_hash_pool.shutdown()
+
+
 # FastAPI 앱 생성
 app = FastAPI(
     title="easyK API",
     description="외국인 맞춤형 정착 지원 플랫폼 API",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # CORS 설정 (보안 강화)
@@ -28,8 +63,18 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # keyset 페이지네이션 커서, 요청 처리 시간 (Server-Timing은 DEBUG 또는 명시적 설정 시에만)
+    expose_headers=[NEXT_CURSOR_HEADER] + (["Server-Timing"] if settings.server_timing_enabled else []),
 )
 
+# 요청별 처리 시간/SQL 통계 계측 (Server-Timing 헤더, /metrics)
+if settings.METRICS_ENABLED or settings.server_timing_enabled:
+    app.add_middleware(MetricsMiddleware, server_timing=settings.server_timing_enabled)
+
+# 요청별 N+1 의심 SQL / 느린 쿼리 로그 (개발/스테이징 전용)
+if settings.QUERY_DIAGNOSTICS_ENABLED:
+    app.add_middleware(QueryDiagnosticsMiddleware, threshold=settings.N_PLUS_ONE_THRESHOLD)
+
 # Rate Limiting 미들웨어 (개발 환경에서 비활성화)
 # 프로덕션에서 필요시 주석 해제
 # app.state.limiter = rate_limiter
@@ -48,6 +93,9 @@ app.include_router(government_supports.router)
 app.include_router(uploads.router)
 app.include_router(document_templates.router)
 app.include_router(stats.router)
+app.include_router(messages.router)
+if settings.METRICS_ENABLED:
+    app.include_router(metrics.router)
 
 # Static files for uploaded resumes
 upload_dir = os.path.join("uploads")
@@ -73,6 +121,7 @@ async def health_check():
     return {"status": "healthy"}
 
 
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
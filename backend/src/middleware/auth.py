@@ -1,17 +1,79 @@
 """Authentication Middleware"""
 
-from typing import Optional
+from typing import Optional, Tuple
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy import event, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, make_transient_to_detached
 
-from ..database import get_db
+from ..config import settings
+from ..database import get_db, get_async_db
 from ..models.user import User
+from ..schemas.user import Principal
 from ..utils.auth import verify_access_token
+from ..utils.cache import TTLCache
 
 
 security = HTTPBearer()
 
+# 토큰 subject(이메일) -> 사용자 컬럼 값 캐시
+# 인증이 필요한 모든 요청마다 반복되는 사용자 조회 쿼리를 줄이기 위해 사용
+_user_cache = TTLCache(
+    max_size=settings.USER_CACHE_MAX_SIZE,
+    ttl_seconds=settings.USER_CACHE_TTL_SECONDS,
+)
+
+
+def _snapshot_user(user: User) -> dict:
+    """캐시에 저장할 사용자 컬럼 값 추출"""
+    return {attr.key: getattr(user, attr.key) for attr in inspect(User).column_attrs}
+
+
+def get_user_by_subject(email: str, db: Session) -> Optional[User]:
+    """토큰 subject(이메일)로 사용자 조회 (캐시 사용)
+
+    캐시 적중 시 저장된 컬럼 값으로 User 객체를 만들어 SELECT 없이
+    현재 세션에 연결하므로, 이후 수정/커밋과 관계 로딩이 그대로 동작합니다.
+
+    Args:
+        email: 토큰 subject (이메일)
+        db: 데이터베이스 세션
+
+    Returns:
+        Optional[User]: 사용자 객체 또는 None
+    """
+    cached = _user_cache.get(email)
+    if cached is not None:
+        user = User(**cached)
+        make_transient_to_detached(user)
+        return db.merge(user, load=False)
+
+    user = db.query(User).filter(User.email == email).first()
+    if user is not None:
+        _user_cache.set(email, _snapshot_user(user))
+    return user
+
+
+def invalidate_user_cache(email: str) -> None:
+    """
+    사용자 캐시 무효화
+
+    Args:
+        email: 사용자 이메일 (토큰 subject)
+    """
+    _user_cache.delete(email)
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_user_on_change(mapper, connection, target: User) -> None:
+    """사용자 정보(역할 포함) 변경/삭제 시 캐시 무효화"""
+    history = inspect(target).attrs.email.history
+    for email in (*history.deleted, target.email):
+        if email:
+            invalidate_user_cache(email)
+
 
 def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
@@ -48,7 +110,7 @@ def get_current_user(
         )
 
     # 사용자 조회
-    user = db.query(User).filter(User.email == email).first()
+    user = get_user_by_subject(email, db)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -59,6 +121,97 @@ def get_current_user(
     return user
 
 
+def _decode_principal_claims(token: str) -> Tuple[Optional[str], Optional[Principal]]:
+    """
+    토큰에서 subject와 클레임 기반 Principal 추출
+
+    Args:
+        token: JWT 토큰
+
+    Returns:
+        Tuple[Optional[str], Optional[Principal]]: (subject, Principal)
+            토큰이 유효하지 않으면 (None, None),
+            user_id/role 클레임이 없으면 (subject, None)
+    """
+    payload = verify_access_token(token)
+    email: Optional[str] = payload.get("sub") if payload else None
+    if not email:
+        return None, None
+
+    user_id = payload.get("user_id")
+    role = payload.get("role")
+    if not (user_id and role):
+        return email, None
+
+    try:
+        return email, Principal(id=user_id, email=email, role=role)
+    except ValueError:
+        return None, None
+
+
+def get_current_principal(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: Session = Depends(get_db)
+) -> Principal:
+    """현재 인증 주체 조회 (권한 확인 전용)
+
+    토큰에 user_id/role 클레임이 있으면 DB 조회 없이 Principal을 만들고,
+    이전에 발급된 토큰처럼 클레임이 없으면 사용자 조회(캐시 사용)로 대체합니다.
+
+    Args:
+        credentials: HTTP Bearer 토큰
+        db: 데이터베이스 세션
+
+    Returns:
+        Principal: 현재 인증 주체 (id, email, role)
+
+    Raises:
+        HTTPException: 인증 실패 시 401 에러
+    """
+    email, principal = _decode_principal_claims(credentials.credentials)
+    if not email:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    if principal:
+        return principal
+
+    user = get_user_by_subject(email, db)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    return Principal(id=user.id, email=user.email, role=user.role)
+
+
+def get_principal_from_token(token: Optional[str], db: Session) -> Optional[Principal]:
+    """토큰 문자열로 인증 주체 조회 (WebSocket/SSE처럼 Bearer 헤더를 쓸 수 없는 경우)
+
+    Args:
+        token: JWT 토큰 (optional)
+        db: 데이터베이스 세션
+
+    Returns:
+        Optional[Principal]: 인증 주체 또는 None (토큰이 없거나 유효하지 않은 경우)
+    """
+    if not token:
+        return None
+
+    email, principal = _decode_principal_claims(token)
+    if not email or principal:
+        return principal
+
+    user = get_user_by_subject(email, db)
+    if not user:
+        return None
+    return Principal(id=user.id, email=user.email, role=user.role)
+
+
 def get_current_admin_user(
     current_user: User = Depends(get_current_user)
 ) -> User:
@@ -119,5 +272,91 @@ def get_current_user_optional(
         return None
 
     # 사용자 조회
-    user = db.query(User).filter(User.email == email).first()
-    return user
+    return get_user_by_subject(email, db)
+
+
+async def _get_principal_by_subject_async(email: str, db: AsyncSession) -> Optional[Principal]:
+    """토큰 subject(이메일)로 Principal 조회 (비동기, 캐시 사용)
+
+    Args:
+        email: 토큰 subject (이메일)
+        db: 비동기 데이터베이스 세션
+
+    Returns:
+        Optional[Principal]: 인증 주체 또는 None
+    """
+    cached = _user_cache.get(email)
+    if cached is None:
+        result = await db.execute(select(User).where(User.email == email))
+        user = result.scalar_one_or_none()
+        if user is None:
+            return None
+        cached = _snapshot_user(user)
+        _user_cache.set(email, cached)
+
+    return Principal(id=cached["id"], email=cached["email"], role=cached["role"])
+
+
+async def get_current_principal_async(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_async_db)
+) -> Principal:
+    """현재 인증 주체 조회 (비동기 엔드포인트용)
+
+    get_current_principal과 동일하게 동작하며, 클레임이 없는 토큰의
+    사용자 조회는 비동기 세션으로 수행합니다.
+
+    Args:
+        credentials: HTTP Bearer 토큰
+        db: 비동기 데이터베이스 세션
+
+    Returns:
+        Principal: 현재 인증 주체 (id, email, role)
+
+    Raises:
+        HTTPException: 인증 실패 시 401 에러
+    """
+    email, principal = _decode_principal_claims(credentials.credentials)
+    if not email:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    if principal:
+        return principal
+
+    principal = await _get_principal_by_subject_async(email, db)
+    if not principal:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    return principal
+
+
+async def get_current_principal_optional_async(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security),
+    db: AsyncSession = Depends(get_async_db)
+) -> Optional[Principal]:
+    """현재 인증 주체 조회 (비동기, 선택적)
+
+    토큰이 없거나 유효하지 않으면 None을 반환합니다.
+
+    Args:
+        credentials: HTTP Bearer 토큰 (optional)
+        db: 비동기 데이터베이스 세션
+
+    Returns:
+        Optional[Principal]: 현재 인증 주체 또는 None
+    """
+    if not credentials:
+        return None
+
+    email, principal = _decode_principal_claims(credentials.credentials)
+    if not email or principal:
+        return principal
+
+    return await _get_principal_by_subject_async(email, db)
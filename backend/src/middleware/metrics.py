@@ -0,0 +1,113 @@
+"""요청 성능 계측 미들웨어"""
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..utils.metrics import RequestMetrics, RequestStats, current_request_stats, request_metrics
+from ..utils.query_diagnostics import QueryCapture, current_query_capture, report_repeated_queries
+
+
+# 라우트에 매칭되지 않은 요청의 라벨 (경로별 라벨 폭증 방지)
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def get_route_template(scope: Scope) -> str:
+    """
+    요청이 매칭된 라우트 템플릿 조회
+
+    Args:
+        scope: ASGI scope (라우팅 후 FastAPI가 scope["route"]를 설정)
+
+    Returns:
+        str: 라우트 템플릿 (예: /api/jobs/{job_id}) 또는 UNMATCHED_ROUTE
+    """
+    route = scope.get("route")
+    return getattr(route, "path", None) or UNMATCHED_ROUTE
+
+
+def format_server_timing(stats: RequestStats) -> str:
+    """
+    Server-Timing 헤더 값 생성
+
+    Args:
+        stats: 요청 통계
+
+    Returns:
+        str: 예) app;dur=12.3, db;dur=4.5;desc="3 queries, 20 rows"
+    """
+    return (
+        f"app;dur={stats.elapsed_seconds * 1000:.1f}, "
+        f'db;dur={stats.db_seconds * 1000:.1f};desc="{stats.statements} queries, {stats.rows} rows"'
+    )
+
+
+class MetricsMiddleware:
+    """요청별 처리 시간과 SQL 실행 통계를 기록하는 ASGI 미들웨어
+
+    - 응답에 Server-Timing 헤더(app, db)를 추가합니다 (헤더 전송 시점 기준).
+    - 요청 완료 시 라우트 템플릿별 지표를 RequestMetrics에 기록합니다 (/metrics로 노출).
+    """
+
+    def __init__(self, app: ASGIApp, metrics: RequestMetrics = request_metrics, server_timing: bool = True):
+        """
+        Args:
+            app: 감싸는 ASGI 앱
+            metrics: 지표 저장소 (기본값: 싱글톤)
+            server_timing: Server-Timing 헤더 추가 여부
+        """
+        self.app = app
+        self.metrics = metrics
+        self.server_timing = server_timing
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = current_request_stats.set(stats)
+        status_code = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if self.server_timing:
+                    headers = MutableHeaders(scope=message)
+                    headers.append("Server-Timing", format_server_timing(stats))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            current_request_stats.reset(token)
+            self.metrics.observe(scope["method"], get_route_template(scope), status_code, stats)
+
+
+class QueryDiagnosticsMiddleware:
+    """요청별 SQL을 수집해 N+1 의심 SQL을 경고 로그로 남기는 ASGI 미들웨어 (개발/스테이징 전용)
+
+    느린 쿼리는 실행 시점에 실행 계획과 함께 기록됩니다 (utils.query_diagnostics 참고).
+    """
+
+    def __init__(self, app: ASGIApp, threshold: int = 5):
+        """
+        Args:
+            app: 감싸는 ASGI 앱
+            threshold: 같은 형태의 SQL 반복 횟수 경고 임계값
+        """
+        self.app = app
+        self.threshold = threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        capture = QueryCapture()
+        token = current_query_capture.set(capture)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            current_query_capture.reset(token)
+            report_repeated_queries(capture, scope["method"], get_route_template(scope), self.threshold)
@@ -2,31 +2,39 @@
 
 from .user import User
 from .consultant import Consultant
+from .consultant_specialty import ConsultantSpecialty
 from .consultation import Consultation
+from .consultation_decline import ConsultationDecline
 from .payment import Payment
 from .review import Review
 from .job import Job
 from .job_application import JobApplication
 from .government_support import GovernmentSupport
 from .message import Message
+from .message_unread_counter import MessageUnreadCounter
 from .support_keyword import SupportKeyword
 from .saved_job import SavedJob
 from .upload import Upload
 from .document_template import DocumentTemplate
+from .email_outbox import EmailOutbox
 
 __all__ = [
     "User",
     "Consultant",
+    "ConsultantSpecialty",
     "Consultation", 
+    "ConsultationDecline",
     "Payment",
     "Review",
     "Job",
     "JobApplication",
     "GovernmentSupport",
     "Message",
+    "MessageUnreadCounter",
     "SupportKeyword",
     "SavedJob",
     "Upload",
     "DocumentTemplate",
+    "EmailOutbox",
 ]
 
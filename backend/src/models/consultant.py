@@ -64,6 +64,13 @@ class Consultant(Base):
 
     # 평가
     total_reviews = Column(Integer, default=0)
+    rating_sum = Column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+        comment="별점 합계 (후기 작성 시 증분 갱신)",
+    )
     average_rating = Column(
         Numeric(3, 2),
         server_default="0.00",
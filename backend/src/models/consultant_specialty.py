@@ -0,0 +1,86 @@
+"""Consultant Specialty Model"""
+
+import json
+import logging
+from typing import List, Union
+from sqlalchemy import Column, ForeignKey, Index, String, event, inspect
+
+try:
+    from ..database import Base, UUID
+    from .consultant import Consultant
+except ImportError:
+    from database import Base, UUID
+    from models.consultant import Consultant
+
+
+logger = logging.getLogger(__name__)
+
+
+class ConsultantSpecialty(Base):
+    """전문가 전문 분야 (consultants.specialties JSON의 정규화 인덱스)
+
+    매칭 시 specialty로 후보 전문가를 인덱스 조회하기 위해 사용합니다.
+    Consultant.specialties가 ORM으로 변경되면 자동으로 동기화됩니다.
+    """
+    __tablename__ = "consultant_specialties"
+
+    consultant_id = Column(
+        UUID, ForeignKey("consultants.id", ondelete="CASCADE"), primary_key=True
+    )  # 전문가 ID
+    specialty = Column(String(50), primary_key=True)  # 전문 분야 (visa, labor, contract, business, other)
+
+    # 인덱스
+    __table_args__ = (
+        # 전문 분야별 후보 전문가 조회
+        Index("ix_consultant_specialties_specialty", "specialty", "consultant_id"),
+    )
+
+
+def parse_specialties(specialties: Union[str, List, None]) -> List[str]:
+    """
+    specialties 파싱 (JSON 배열 문자열 또는 ARRAY 컬럼에서 읽은 리스트)
+
+    Args:
+        specialties: JSON 배열 문자열 (예: '["visa", "labor"]') 또는 리스트
+
+    Returns:
+        List[str]: 중복 없는 전문 분야 목록 (형식이 잘못되면 빈 목록)
+    """
+    if isinstance(specialties, list):
+        values = specialties
+    else:
+        try:
+            values = json.loads(specialties) if specialties else []
+        except (json.JSONDecodeError, TypeError):
+            logger.warning(f"Invalid consultant specialties: {specialties!r}")
+            return []
+    if not isinstance(values, list):
+        logger.warning(f"Invalid consultant specialties: {specialties!r}")
+        return []
+    return list(dict.fromkeys(value for value in values if isinstance(value, str) and value))
+
+
+def _replace_specialties(connection, consultant: Consultant) -> None:
+    """전문가의 전문 분야 행 교체 (flush와 같은 트랜잭션)"""
+    table = ConsultantSpecialty.__table__
+    connection.execute(table.delete().where(table.c.consultant_id == consultant.id))
+
+    specialties = parse_specialties(consultant.specialties)
+    if specialties:
+        connection.execute(
+            table.insert(),
+            [{"consultant_id": consultant.id, "specialty": specialty} for specialty in specialties],
+        )
+
+
+@event.listens_for(Consultant, "after_insert")
+def _sync_specialties_on_insert(mapper, connection, target: Consultant) -> None:
+    """전문가 생성 시 전문 분야 인덱스 생성"""
+    _replace_specialties(connection, target)
+
+
+@event.listens_for(Consultant, "after_update")
+def _sync_specialties_on_update(mapper, connection, target: Consultant) -> None:
+    """전문 분야 변경 시 인덱스 갱신"""
+    if inspect(target).attrs.specialties.history.has_changes():
+        _replace_specialties(connection, target)
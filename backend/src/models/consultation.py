@@ -9,6 +9,7 @@ from sqlalchemy import (
     func,
     CheckConstraint,
     ForeignKey,
+    Index,
 )
 from sqlalchemy.orm import relationship
 import uuid
@@ -60,7 +61,10 @@ class Consultation(Base):
         comment="상태: requested, matched, scheduled, in_progress, completed, cancelled",
     )
 
-    # 예약 정보
+    # 매칭/예약 정보
+    matched_at = Column(
+        TIMESTAMP(timezone=True), nullable=True, comment="전문가 매칭 날짜/시간 (예약 전 일일 상담 부하 기준)"
+    )
     scheduled_at = Column(TIMESTAMP(timezone=True), nullable=True, comment="예약된 상담 날짜/시간")
     completed_at = Column(TIMESTAMP(timezone=True), nullable=True, comment="상담 완료 날짜/시간")
     consultation_method = Column(
@@ -119,6 +123,12 @@ class Consultation(Base):
             "scheduled_at > created_at OR scheduled_at IS NULL",
             name="valid_dates",
         ),
+        # 상담 목록 keyset 페이지네이션용 복합 인덱스 (신청자 / 전문가 수신함)
+        Index("ix_consultations_user_id_created_at_id", "user_id", "created_at", "id"),
+        Index(
+            "ix_consultations_consultant_id_status_created_at_id",
+            "consultant_id", "status", "created_at", "id",
+        ),
     )
 
     # Relationships
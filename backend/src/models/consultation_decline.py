@@ -0,0 +1,22 @@
+"""Consultation Decline Model"""
+
+from datetime import datetime
+from sqlalchemy import Column, DateTime, ForeignKey
+
+try:
+    from ..database import Base, UUID
+except ImportError:
+    from database import Base, UUID
+
+
+class ConsultationDecline(Base):
+    """상담별 거절한 전문가 기록 (재매칭 시 제외)"""
+    __tablename__ = "consultation_declines"
+
+    consultation_id = Column(
+        UUID, ForeignKey("consultations.id", ondelete="CASCADE"), primary_key=True
+    )  # 상담 ID
+    consultant_id = Column(
+        UUID, ForeignKey("consultants.id", ondelete="CASCADE"), primary_key=True
+    )  # 거절한 전문가 ID
+    declined_at = Column(DateTime, nullable=False, default=lambda: datetime.utcnow())
@@ -0,0 +1,37 @@
+"""Email Outbox Model"""
+
+from datetime import datetime
+from sqlalchemy import Column, DateTime, Index, Integer, String, Text
+import uuid
+
+try:
+    from ..database import Base, UUID
+except ImportError:
+    from database import Base, UUID
+
+
+class EmailOutbox(Base):
+    """이메일 발송 대기열 (트랜잭셔널 아웃박스)
+
+    요청 처리 중에는 행만 추가하고, 실제 SMTP 발송은
+    백그라운드 워커(EmailOutboxWorker)가 수행합니다.
+    """
+    __tablename__ = "email_outbox"
+
+    id = Column(UUID, primary_key=True, default=uuid.uuid4)
+    to_email = Column(String(255), nullable=False)  # 수신자 이메일
+    subject = Column(String(500), nullable=False)  # 제목
+    body_text = Column(Text, nullable=False)  # 본문 (텍스트)
+    body_html = Column(Text, nullable=True)  # 본문 (HTML)
+    status = Column(String(20), nullable=False, default="pending")  # pending, sent, failed
+    attempts = Column(Integer, nullable=False, default=0)  # 발송 시도 횟수
+    next_attempt_at = Column(DateTime, nullable=False, default=lambda: datetime.utcnow())  # 다음 발송 시도 시각
+    last_error = Column(Text, nullable=True)  # 마지막 발송 오류
+    created_at = Column(DateTime, nullable=False, default=lambda: datetime.utcnow())
+    sent_at = Column(DateTime, nullable=True)  # 발송 완료 시각
+
+    # 인덱스
+    __table_args__ = (
+        # 워커의 발송 대상 조회 (status = 'pending' AND next_attempt_at <= now)
+        Index("ix_email_outbox_status_next_attempt_at", "status", "next_attempt_at"),
+    )
@@ -7,6 +7,9 @@ from sqlalchemy import (
     TIMESTAMP,
     CheckConstraint,
     ForeignKey,
+    Index,
+    DDL,
+    event,
     func,
 )
 
@@ -138,6 +141,8 @@ class Job(Base):
             "deadline > created_at",
             name="valid_deadline",
         ),
+        # 목록 조회 keyset 페이지네이션용 복합 인덱스 (status 필터 + 최신순)
+        Index("ix_jobs_status_created_at_id", "status", "created_at", "id"),
     )
 
     # Relationships
@@ -146,3 +151,30 @@ class Job(Base):
 
     def __repr__(self):
         return f"<Job(id={self.id}, position={self.position}, company_name={self.company_name}, status={self.status})>"
+
+
+# 전문 검색 대상 컬럼 (PostgreSQL tsvector / SQLite FTS5 공통)
+JOB_SEARCH_COLUMNS = ("position", "company_name", "description", "requirements", "benefits")
+
+# SQLite(테스트 환경) 전문 검색: FTS5 가상 테이블 + 동기화 트리거
+# PostgreSQL은 Alembic 마이그레이션에서 search_vector(tsvector) 컬럼과 GIN 인덱스를 생성
+_fts_columns = ", ".join(JOB_SEARCH_COLUMNS)
+_fts_new_values = ", ".join(f"new.{column}" for column in JOB_SEARCH_COLUMNS)
+
+for _statement in (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(job_id UNINDEXED, {_fts_columns}, tokenize='unicode61')",
+    f"CREATE TRIGGER IF NOT EXISTS jobs_fts_ai AFTER INSERT ON jobs BEGIN "
+    f"INSERT INTO jobs_fts(job_id, {_fts_columns}) VALUES (new.id, {_fts_new_values}); END",
+    "CREATE TRIGGER IF NOT EXISTS jobs_fts_ad AFTER DELETE ON jobs BEGIN "
+    "DELETE FROM jobs_fts WHERE job_id = old.id; END",
+    f"CREATE TRIGGER IF NOT EXISTS jobs_fts_au AFTER UPDATE ON jobs BEGIN "
+    f"DELETE FROM jobs_fts WHERE job_id = old.id; "
+    f"INSERT INTO jobs_fts(job_id, {_fts_columns}) VALUES (new.id, {_fts_new_values}); END",
+):
+    event.listen(Job.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+
+event.listen(
+    Job.__table__,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS jobs_fts").execute_if(dialect="sqlite"),
+)
@@ -1,32 +1,38 @@
 """Message Model"""
 
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, Text, ForeignKey, Boolean
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, DateTime, Text, ForeignKey, Boolean, Index
 from sqlalchemy.orm import relationship
+import uuid
 
 try:
-    from ..database import Base
+    from ..database import Base, UUID
 except ImportError:
-    from database import Base
+    from database import Base, UUID
 
 
 class Message(Base):
     """메시지 모델"""
     __tablename__ = "messages"
 
-    id = Column(UUID, primary_key=True)
-    consultation_id = Column(UUID, ForeignKey("consultations.id"), nullable=False)  # 상담 ID
-    sender_id = Column(UUID, ForeignKey("users.id"), nullable=False)  # 보내는 사람 ID
+    id = Column(UUID, primary_key=True, default=uuid.uuid4)
+    consultation_id = Column(
+        UUID, ForeignKey("consultations.id", ondelete="CASCADE"), nullable=False
+    )  # 상담 ID
+    sender_id = Column(
+        UUID, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
+    )  # 보내는 사람 ID
     content = Column(Text, nullable=False)  # 메시지 내용
-    is_read = Column(Boolean, default=False)  # 읽음 여부
+    is_read = Column(Boolean, nullable=False, default=False)  # 읽음 여부
     file_attachment = Column(String, nullable=True)  # 첨부 파일 URL
-    created_at = Column(DateTime, default=lambda: datetime.utcnow())
+    created_at = Column(DateTime, nullable=False, default=lambda: datetime.utcnow())
+
+    # 인덱스
+    __table_args__ = (
+        # 상담별 메시지 조회 / since·before 커서 페이지네이션 / 일괄 읽음 처리
+        Index("ix_messages_consultation_id_created_at", "consultation_id", "created_at"),
+    )
 
     # Relationships
     sender = relationship("User", back_populates="sent_messages")
     consultation = relationship("Consultation", back_populates="messages")
-
-
-
-
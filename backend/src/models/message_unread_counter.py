@@ -0,0 +1,29 @@
+"""Message Unread Counter Model"""
+
+from datetime import datetime
+from sqlalchemy import Column, DateTime, ForeignKey, Integer
+
+try:
+    from ..database import Base, UUID
+except ImportError:
+    from database import Base, UUID
+
+
+class MessageUnreadCounter(Base):
+    """사용자별·상담별 읽지 않은 메시지 수 (비정규화 카운터)
+
+    메시지 전송/읽음 처리와 같은 트랜잭션에서 갱신되므로
+    읽지 않은 메시지 수 조회 시 messages 테이블을 스캔하지 않습니다.
+    """
+    __tablename__ = "message_unread_counters"
+
+    user_id = Column(
+        UUID, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )  # 메시지를 받는 사용자 ID
+    consultation_id = Column(
+        UUID, ForeignKey("consultations.id", ondelete="CASCADE"), primary_key=True
+    )  # 상담 ID
+    unread_count = Column(Integer, nullable=False, default=0)  # 읽지 않은 메시지 수
+    updated_at = Column(
+        DateTime, nullable=False, default=lambda: datetime.utcnow(), onupdate=lambda: datetime.utcnow()
+    )
@@ -13,7 +13,7 @@ router = APIRouter(prefix="/api/auth", tags=["auth"])
 
 
 @router.post("/signup", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-def signup(user_data: UserCreate, db: Session = Depends(get_db), request: Request = None):
+async def signup(user_data: UserCreate, db: Session = Depends(get_db), request: Request = None):
     """
     회원가입 엔드포인트
 
@@ -26,9 +26,9 @@ def signup(user_data: UserCreate, db: Session = Depends(get_db), request: Reques
         UserResponse: 생성된 사용자 정보
 
     Raises:
-        HTTPException: 이메일 중복 시 400 에러
+        HTTPException: 이메일 중복 시 400 에러, 요청 폭주 시 503 에러
     """
-    return create_user(user_data, db, request)
+    return await create_user(user_data, db, request)
 
 
 @router.get("/check-email")
@@ -78,7 +78,7 @@ def check_email_availability(
 
 
 @router.post("/login", response_model=TokenResponse)
-def login(login_data: LoginRequest, db: Session = Depends(get_db), request: Request = None):
+async def login(login_data: LoginRequest, db: Session = Depends(get_db), request: Request = None):
     """
     로그인 엔드포인트
 
@@ -91,12 +91,12 @@ def login(login_data: LoginRequest, db: Session = Depends(get_db), request: Requ
         TokenResponse: JWT 액세스 토큰
 
     Raises:
-        HTTPException: 인증 실패 시 401 에러
+        HTTPException: 인증 실패 시 401 에러, 요청 폭주 시 503 에러
     """
     # 언어 추출
     language = request.headers.get("Accept-Language", "ko").split("-")[0].lower() if request else "ko"
     
-    token = authenticate_user(login_data.email, login_data.password, db, request)
+    token = await authenticate_user(login_data.email, login_data.password, db, request)
     if not token:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
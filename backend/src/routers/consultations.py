@@ -1,19 +1,21 @@
 """Consultations Router"""
 
 from typing import List, Optional
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlalchemy.orm import Session
 
 from ..database import get_db
 from ..models.user import User
 from ..schemas.consultation import ConsultationCreate, ConsultationResponse
 from ..middleware.auth import get_current_user
+from ..utils.pagination import NEXT_CURSOR_HEADER, build_next_cursor
 from ..services.consultation_service import (
     create_consultation as create_consultation_service,
     get_incoming_consultations as get_incoming_consultations_service,
     get_user_consultations as get_user_consultations_service,
     accept_consultation as accept_consultation_service,
     reject_consultation as reject_consultation_service,
+    get_consultant_dashboard_stats as get_consultant_dashboard_stats_service,
 )
 
 
@@ -43,41 +45,69 @@ def create_consultation(
 @router.get("", response_model=List[ConsultationResponse])
 def get_user_consultations(
     status: Optional[str] = Query(None, description="상태 필터 (requested, matched, scheduled, completed 등)"),
+    limit: int = Query(20, ge=1, le=100, description="조회할 최대 개수"),
+    cursor: Optional[str] = Query(None, max_length=200, description="다음 페이지 커서 (X-Next-Cursor 응답 헤더 값)"),
+    response: Response = None,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """
     사용자가 신청한 상담 목록 조회
 
+    페이지가 가득 차면 다음 페이지 커서를 X-Next-Cursor 응답 헤더로 반환합니다.
+
     Args:
         status: 상태 필터 (optional)
+        limit: 조회할 최대 개수 (기본값: 20, 최대: 100)
+        cursor: 다음 페이지 커서 (optional)
+        response: FastAPI Response 객체 (커서 헤더 설정용)
         current_user: 현재 인증된 사용자
         db: 데이터베이스 세션
 
     Returns:
-        List[ConsultationResponse]: 상담 목록
+        List[ConsultationResponse]: 상담 목록 (최신순)
     """
-    return get_user_consultations_service(current_user, db, status)
+    consultations = get_user_consultations_service(current_user, db, status, limit, cursor)
+
+    next_cursor = build_next_cursor(consultations, limit)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+
+    return consultations
 
 
 @router.get("/incoming", response_model=List[ConsultationResponse])
 def get_incoming_consultations(
     status: Optional[str] = Query(None, description="상태 필터 (matched, scheduled, completed 등)"),
+    limit: int = Query(20, ge=1, le=100, description="조회할 최대 개수"),
+    cursor: Optional[str] = Query(None, max_length=200, description="다음 페이지 커서 (X-Next-Cursor 응답 헤더 값)"),
+    response: Response = None,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """
     전문가에게 들어온 상담 요청 목록 조회
 
+    페이지가 가득 차면 다음 페이지 커서를 X-Next-Cursor 응답 헤더로 반환합니다.
+
     Args:
         status: 상태 필터 (optional)
+        limit: 조회할 최대 개수 (기본값: 20, 최대: 100)
+        cursor: 다음 페이지 커서 (optional)
+        response: FastAPI Response 객체 (커서 헤더 설정용)
         current_user: 현재 인증된 사용자
         db: 데이터베이스 세션
 
     Returns:
-        List[ConsultationResponse]: 상담 목록
+        List[ConsultationResponse]: 상담 목록 (최신순)
     """
-    return get_incoming_consultations_service(current_user, db, status)
+    consultations = get_incoming_consultations_service(current_user, db, status, limit, cursor)
+
+    next_cursor = build_next_cursor(consultations, limit)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+
+    return consultations
 
 
 @router.get("/dashboard/stats", response_model=dict)
@@ -95,92 +125,7 @@ def get_dashboard_stats(
     Returns:
         dict: 통계 데이터 (상담 수, 수익, 평점 등)
     """
-    from ..models.consultation import Consultation
-    from ..models.consultant import Consultant
-    from ..models.review import Review
-    from sqlalchemy import func
-
-    # 전문가 정보 조회
-    consultant = db.query(Consultant).filter(
-        Consultant.user_id == current_user.id
-    ).first()
-
-    if not consultant:
-        return {
-            "total_consultations": 0,
-            "requested": 0,
-            "matched": 0,
-            "scheduled": 0,
-            "completed": 0,
-            "cancelled": 0,
-            "total_revenue": 0,
-            "average_rating": 0,
-            "total_reviews": 0,
-        }
-
-    # 전체 상담 수
-    total_consultations = db.query(func.count(Consultation.id)).filter(
-        Consultation.consultant_id == consultant.id
-    ).scalar()
-
-    # 상태별 수
-    requested = db.query(func.count(Consultation.id)).filter(
-        Consultation.consultant_id == consultant.id,
-        Consultation.status == "requested"
-    ).scalar()
-
-    matched = db.query(func.count(Consultation.id)).filter(
-        Consultation.consultant_id == consultant.id,
-        Consultation.status == "matched"
-    ).scalar()
-
-    scheduled = db.query(func.count(Consultation.id)).filter(
-        Consultation.consultant_id == consultant.id,
-        Consultation.status == "scheduled"
-    ).scalar()
-
-    completed = db.query(func.count(Consultation.id)).filter(
-        Consultation.consultant_id == consultant.id,
-        Consultation.status == "completed"
-    ).scalar()
-
-    cancelled = db.query(func.count(Consultation.id)).filter(
-        Consultation.consultant_id == consultant.id,
-        Consultation.status == "cancelled"
-    ).scalar()
-
-    # 총 수익 (완료 상담 중 결제 완료된 것만)
-    total_revenue = db.query(func.sum(Consultation.amount)).filter(
-        Consultation.consultant_id == consultant.id,
-        Consultation.status == "completed",
-        Consultation.payment_status == "completed"
-    ).scalar() or 0
-
-    # 평균 평점
-    avg_rating = db.query(func.avg(Review.rating)).join(
-        Consultation, Review.consultation_id == Consultation.id
-    ).filter(
-        Consultation.consultant_id == consultant.id
-    ).scalar() or 0
-
-    # 총 리뷰 수
-    total_reviews = db.query(func.count(Review.id)).join(
-        Consultation, Review.consultation_id == Consultation.id
-    ).filter(
-        Consultation.consultant_id == consultant.id
-    ).scalar() or 0
-
-    return {
-        "total_consultations": total_consultations,
-        "requested": requested,
-        "matched": matched,
-        "scheduled": scheduled,
-        "completed": completed,
-        "cancelled": cancelled,
-        "total_revenue": float(total_revenue),
-        "average_rating": round(avg_rating, 1),
-        "total_reviews": total_reviews,
-    }
+    return get_consultant_dashboard_stats_service(current_user, db)
 
 
 @router.get("/{consultation_id}", response_model=ConsultationResponse)
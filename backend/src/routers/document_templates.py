@@ -1,65 +1,82 @@
 """Document Templates Router"""
 
 from typing import List, Optional
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from uuid import UUID
 
-from ..database import get_db
+from ..database import get_db, get_async_db
 from ..models.user import User
+from ..schemas.user import Principal
 from ..schemas.document_template import (
     DocumentTemplateCreate,
     DocumentTemplateUpdate,
     DocumentTemplateResponse,
 )
 from ..services.document_template_service import (
-    get_document_templates as get_document_templates_service,
-    get_document_template_by_id as get_document_template_by_id_service,
+    get_document_templates_async as get_document_templates_service,
+    get_document_template_by_id_async as get_document_template_by_id_service,
     create_document_template as create_document_template_service,
     update_document_template as update_document_template_service,
     delete_document_template as delete_document_template_service,
 )
-from ..middleware.auth import get_current_user, get_current_admin_user
+from ..middleware.auth import get_current_admin_user, get_current_principal_async
+from ..utils.response_cache import DOCUMENT_TEMPLATES_CACHE, build_cached_response, catalog_cache, serialize_body
 
 
 router = APIRouter(prefix="/api/document-templates", tags=["document-templates"])
 
 
 @router.get("", response_model=List[DocumentTemplateResponse])
-def get_document_templates(
+async def get_document_templates(
     category: Optional[str] = Query(None, description="카테고리 필터 (job_application, support_application)"),
     language: str = Query("ko", description="언어 필터 (ko, en, vi, mn, zh)"),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    request: Request = None,
+    db: AsyncSession = Depends(get_async_db),
+    principal: Principal = Depends(get_current_principal_async),
 ):
     """
     서류 템플릿 목록 조회 엔드포인트
 
+    목록은 정규화된 쿼리 파라미터별로 캐시되며(템플릿 생성/수정/삭제 시 무효화),
+    ETag가 일치하는 If-None-Match 요청에는 304를 반환합니다.
+
     Args:
         category: 카테고리 필터 (optional)
         language: 언어 필터 (기본값: ko)
-        current_user: 현재 인증된 사용자
-        db: 데이터베이스 세션
+        request: 요청 객체 (If-None-Match 확인용)
+        principal: 현재 인증 주체
+        db: 비동기 데이터베이스 세션
 
     Returns:
         List[DocumentTemplateResponse]: 템플릿 목록
     """
-    return get_document_templates_service(db, category, language)
+    params = {"category": category, "language": language}
+    cache_key = await catalog_cache.akey(DOCUMENT_TEMPLATES_CACHE, params)
+    cached = await catalog_cache.aget(cache_key)
+
+    if cached is None:
+        templates = await get_document_templates_service(db, category, language)
+        body = serialize_body([DocumentTemplateResponse.model_validate(t) for t in templates])
+        cached = await catalog_cache.aset(cache_key, body)
+
+    return build_cached_response(request, cached)
 
 
 @router.get("/{template_id}", response_model=DocumentTemplateResponse)
-def get_document_template(
+async def get_document_template(
     template_id: UUID,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    principal: Principal = Depends(get_current_principal_async),
 ):
     """
     서류 템플릿 상세 조회
 
     Args:
         template_id: 템플릿 ID
-        current_user: 현재 인증된 사용자
-        db: 데이터베이스 세션
+        principal: 현재 인증 주체
+        db: 비동기 데이터베이스 세션
 
     Returns:
         DocumentTemplateResponse: 템플릿 정보
@@ -67,10 +84,10 @@ def get_document_template(
     Raises:
         HTTPException: 템플릿을 찾을 수 없는 경우
     """
-    template = get_document_template_by_id_service(template_id, db)
+    template = await get_document_template_by_id_service(template_id, db)
     if not template:
-        raise status.HTTPException(
-            status_code=404,
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
             detail="Document template not found"
         )
     return template
@@ -2,11 +2,13 @@
 
 from typing import List, Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from ..database import get_db
+from ..database import get_db, get_async_db
 from ..models.user import User
+from ..schemas.user import Principal
 from ..schemas.government_support import (
     GovernmentSupportResponse,
     GovernmentSupportList,
@@ -14,66 +16,82 @@ from ..schemas.government_support import (
     GovernmentSupportUpdate,
     EligibilityCheckRequest,
     EligibilityCheckResponse,
+    EligibilityBatchRequest,
+    EligibilityBatchResponse,
 )
-from ..middleware.auth import get_current_user, require_admin
+from ..middleware.auth import get_current_user, get_current_principal_async, require_admin
 from ..services.government_support_service import (
-    get_supports as get_supports_service,
-    get_support_by_id,
+    get_supports_async as get_supports_service,
+    get_support_by_id_async,
     create_support,
     update_support,
     delete_support,
     check_eligibility as check_eligibility_service,
+    check_eligibility_batch as check_eligibility_batch_service,
 )
+from ..utils.response_cache import SUPPORTS_CACHE, build_cached_response, catalog_cache, serialize_body
 
 router = APIRouter(prefix="/api/supports", tags=["government-supports"])
 
 
 @router.get("", response_model=GovernmentSupportList)
-def get_supports(
+async def get_supports(
     category: Optional[str] = Query(None, description="카테고리 필터 (subsidy, education, training, visa, housing)"),
     keyword: Optional[str] = Query(None, description="검색 키워드"),
     limit: int = Query(20, ge=1, le=100, description="조회할 최대 개수"),
     offset: int = Query(0, ge=0, description="조회 시작 위치"),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    request: Request = None,
+    principal: Principal = Depends(get_current_principal_async),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     정부 지원 프로그램 목록 조회
 
+    목록은 정규화된 쿼리 파라미터별로 캐시되며(지원 프로그램 생성/수정/삭제 시 무효화),
+    ETag가 일치하는 If-None-Match 요청에는 304를 반환합니다.
+
     Args:
         category: 카테고리 필터 (optional)
         keyword: 검색 키워드 (optional)
         limit: 조회할 최대 개수
         offset: 조회 시작 위치 (pagination)
-        current_user: 현재 인증된 사용자
-        db: 데이터베이스 세션
+        request: 요청 객체 (If-None-Match 확인용)
+        principal: 현재 인증 주체
+        db: 비동기 데이터베이스 세션
 
     Returns:
         GovernmentSupportList: 지원 프로그램 목록
     """
-    supports, total = get_supports_service(db, category, keyword, limit, offset)
+    params = {"category": category, "keyword": keyword, "limit": limit, "offset": offset}
+    cache_key = await catalog_cache.akey(SUPPORTS_CACHE, params)
+    cached = await catalog_cache.aget(cache_key)
+
+    if cached is None:
+        supports, total = await get_supports_service(db, category, keyword, limit, offset)
+        body = serialize_body(GovernmentSupportList(supports=supports, total=total))
+        cached = await catalog_cache.aset(cache_key, body)
 
-    return GovernmentSupportList(supports=supports, total=total)
+    return build_cached_response(request, cached)
 
 
 @router.get("/{support_id}", response_model=GovernmentSupportResponse)
-def get_support_detail(
+async def get_support_detail(
     support_id: UUID,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    principal: Principal = Depends(get_current_principal_async),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     정부 지원 프로그램 상세 조회
 
     Args:
         support_id: 지원 프로그램 ID
-        current_user: 현재 인증된 사용자
-        db: 데이터베이스 세션
+        principal: 현재 인증 주체
+        db: 비동기 데이터베이스 세션
 
     Returns:
         GovernmentSupportResponse: 지원 프로그램 상세 정보
     """
-    support = get_support_by_id(db, support_id)
+    support = await get_support_by_id_async(db, support_id)
 
     if not support:
         raise HTTPException(
@@ -197,3 +215,35 @@ def check_support_eligibility(
     return EligibilityCheckResponse(**result)
 
 
+
+
+@router.post("/eligibility-check/batch", response_model=EligibilityBatchResponse)
+def check_support_eligibility_batch(
+    eligibility_request: EligibilityBatchRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """
+    모든 활성 정부 지원 프로그램 자격 일괄 확인 엔드포인트
+
+    미리 구성된 자격 매트릭스로 확인하므로 프로그램 수와 무관하게 DB 조회 없이 응답합니다
+    (지원 프로그램 변경 후 첫 요청에서만 매트릭스를 재구성).
+
+    Args:
+        eligibility_request: 일괄 자격 확인 요청 데이터
+        current_user: 현재 인증된 사용자
+        db: 데이터베이스 세션
+
+    Returns:
+        EligibilityBatchResponse: 프로그램별 자격 확인 결과 (신청 가능한 프로그램 먼저)
+    """
+    result = check_eligibility_batch_service(
+        eligibility_request.visa_type,
+        eligibility_request.age,
+        eligibility_request.residence_location,
+        eligibility_request.employment_status,
+        db,
+        eligible_only=eligibility_request.eligible_only,
+    )
+
+    return EligibilityBatchResponse(**result)
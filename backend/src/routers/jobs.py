@@ -1,17 +1,33 @@
 """Jobs Router"""
 
+import json
 from typing import List, Optional
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from uuid import UUID
 
-from ..database import get_db
+from ..database import get_db, get_async_db
 from ..models.user import User
-from ..schemas.job import JobResponse, JobDetailResponse, JobCreate, JobUpdate
-from ..middleware.auth import get_current_user, get_current_user_optional
+from ..schemas.user import Principal
+from ..schemas.job import JobResponse, JobListItemResponse, JobDetailResponse, JobCreate, JobUpdate
+from ..middleware.auth import (
+    get_current_user,
+    get_current_principal,
+    get_current_principal_optional_async,
+)
+from ..utils.pagination import NEXT_CURSOR_HEADER, build_next_cursor
+from ..utils.response_cache import (
+    JOBS_CACHE,
+    CachedResponse,
+    build_cached_response,
+    catalog_cache,
+    serialize_body,
+)
 from ..services.job_service import (
-    get_jobs as get_jobs_service,
-    get_job_detail as get_job_detail_service,
+    get_jobs_async as get_jobs_service,
+    get_job_user_flags_async as get_job_user_flags_service,
+    get_job_detail_async as get_job_detail_service,
     apply_to_job as apply_to_job_service,
     create_job as create_job_service,
     update_job as update_job_service,
@@ -38,51 +54,99 @@ from ..schemas.job_application import (
 router = APIRouter(prefix="/api/jobs", tags=["jobs"])
 
 
-@router.get("", response_model=List[JobResponse])
-def get_jobs(
+@router.get("", response_model=List[JobListItemResponse])
+async def get_jobs(
     location: Optional[str] = Query(None, description="지역 필터 (예: 서울시 강남구)"),
     employment_type: Optional[str] = Query(None, description="고용 형태 필터 (full-time, contract, part-time, temporary)"),
-    keyword: Optional[str] = Query(None, description="키워드 검색 (직종, 회사명)"),
+    keyword: Optional[str] = Query(None, description="키워드 전문 검색 (직종, 회사명, 업무 설명, 요구사항, 복리후생 / 관련도순 정렬)"),
     limit: int = Query(20, ge=1, le=100, description="조회할 최대 개수"),
     offset: int = Query(0, ge=0, description="건너뛸 개수"),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(None, max_length=200, description="다음 페이지 커서 (X-Next-Cursor 응답 헤더 값, offset 대신 사용)"),
+    request: Request = None,
+    principal: Optional[Principal] = Depends(get_current_principal_optional_async),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     일자리 목록 조회 엔드포인트 (비로그인 접근 가능)
 
+    키워드 검색이 아닌 경우, 페이지가 가득 차면 다음 페이지 커서를
+    X-Next-Cursor 응답 헤더로 반환합니다 (무한 스크롤용 keyset 페이지네이션).
+    로그인 사용자에게는 일자리별 저장/지원 여부(is_saved, has_applied)를
+    페이지 단위 IN 쿼리 2회로 함께 반환합니다.
+
+    목록은 정규화된 쿼리 파라미터별로 캐시되며(일자리 생성/수정/삭제 시 무효화),
+    ETag가 일치하는 If-None-Match 요청에는 304를 반환합니다.
+
     Args:
         location: 지역 필터 (optional)
         employment_type: 고용 형태 필터 (optional)
-        keyword: 키워드 검색 (position, company_name) (optional)
+        keyword: 키워드 전문 검색 (position, company_name, description, requirements, benefits) (optional)
         limit: 조회할 최대 개수 (기본값: 20, 최대: 100)
         offset: 건너뛸 개수 (기본값: 0)
-        db: 데이터베이스 세션
+        cursor: 다음 페이지 커서 (optional)
+        request: 요청 객체 (If-None-Match 확인용)
+        principal: 현재 인증 주체 (optional)
+        db: 비동기 데이터베이스 세션
 
     Returns:
-        List[JobResponse]: 일자리 목록 (active 상태만, 최신순 정렬)
+        List[JobListItemResponse]: 일자리 목록 (active 상태만, 키워드 검색 시 관련도순, 그 외 최신순 정렬)
     """
-    return get_jobs_service(db, location, employment_type, keyword, limit, offset)
+    params = {
+        "location": location,
+        "employment_type": employment_type,
+        "keyword": keyword,
+        "limit": limit,
+        "offset": None if cursor else offset,
+        "cursor": cursor,
+    }
+    cache_key = await catalog_cache.akey(JOBS_CACHE, params)
+    cached = await catalog_cache.aget(cache_key)
+
+    if cached is None:
+        jobs = await get_jobs_service(db, location, employment_type, keyword, limit, offset, cursor)
+
+        # 다음 페이지 커서 (키워드 검색은 관련도순이므로 제외)
+        next_cursor = None if keyword and keyword.strip() else build_next_cursor(jobs, limit)
+        headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else {}
+
+        # 저장/지원 여부가 없는(비로그인) 응답을 캐시
+        items = [JobListItemResponse.model_validate(job) for job in jobs]
+        cached = await catalog_cache.aset(cache_key, serialize_body(items), {"Vary": "Authorization", **headers})
+
+    # 로그인 사용자: 캐시된 목록에 저장/지원 여부를 일괄 조회하여 반영
+    if principal:
+        items = json.loads(cached.body)
+        if items:
+            saved_ids, applied_ids = await get_job_user_flags_service(
+                [UUID(item["id"]) for item in items], principal.id, db
+            )
+            for item in items:
+                item["is_saved"] = UUID(item["id"]) in saved_ids
+                item["has_applied"] = UUID(item["id"]) in applied_ids
+            cached = CachedResponse(serialize_body(items), cached.headers)
+
+    return build_cached_response(request, cached)
 
 
 @router.get("/{job_id}", response_model=JobDetailResponse)
-def get_job_detail(
+async def get_job_detail(
     job_id: UUID,
-    current_user: Optional[User] = Depends(get_current_user_optional),
-    db: Session = Depends(get_db),
+    principal: Optional[Principal] = Depends(get_current_principal_optional_async),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     일자리 상세 조회 엔드포인트 (비로그인 접근 가능)
 
     Args:
         job_id: 일자리 ID
-        current_user: 현재 인증된 사용자 (optional)
-        db: 데이터베이스 세션
+        principal: 현재 인증 주체 (optional)
+        db: 비동기 데이터베이스 세션
 
     Returns:
         JobDetailResponse: 일자리 상세 정보 (지원 여부 포함)
     """
-    user_id = current_user.id if current_user else None
-    job, has_applied = get_job_detail_service(job_id, user_id, db)
+    user_id = principal.id if principal else None
+    job, has_applied = await get_job_detail_service(job_id, user_id, db)
 
     # JobDetailResponse로 변환
     job_response = JobResponse.model_validate(job)
@@ -92,7 +156,7 @@ def get_job_detail(
 @router.post("", response_model=JobResponse, status_code=status.HTTP_201_CREATED)
 def create_job(
     job_data: JobCreate,
-    current_user: User = Depends(get_current_user),
+    principal: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db),
 ):
     """
@@ -100,7 +164,7 @@ def create_job(
 
     Args:
         job_data: 일자리 생성 데이터
-        current_user: 현재 인증된 사용자 (admin)
+        principal: 현재 인증 주체 (admin/agency)
         db: 데이터베이스 세션
 
     Returns:
@@ -109,14 +173,14 @@ def create_job(
     Raises:
         HTTPException: 권한이 없을 때 403 에러
     """
-    return create_job_service(job_data, current_user.id, db)
+    return create_job_service(job_data, principal, db)
 
 
 @router.put("/{job_id}", response_model=JobResponse)
 def update_job(
     job_id: UUID,
     job_data: JobUpdate,
-    current_user: User = Depends(get_current_user),
+    principal: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db),
 ):
     """
@@ -125,7 +189,7 @@ def update_job(
     Args:
         job_id: 일자리 ID
         job_data: 수정할 데이터
-        current_user: 현재 인증된 사용자 (admin)
+        principal: 현재 인증 주체 (admin/agency)
         db: 데이터베이스 세션
 
     Returns:
@@ -134,13 +198,13 @@ def update_job(
     Raises:
         HTTPException: 일자리를 찾을 수 없거나 권한이 없을 때 에러
     """
-    return update_job_service(job_id, job_data, current_user.id, db)
+    return update_job_service(job_id, job_data, principal, db)
 
 
 @router.delete("/{job_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_job(
     job_id: UUID,
-    current_user: User = Depends(get_current_user),
+    principal: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db),
 ):
     """
@@ -148,20 +212,20 @@ def delete_job(
 
     Args:
         job_id: 일자리 ID
-        current_user: 현재 인증된 사용자 (admin)
+        principal: 현재 인증 주체 (admin/agency)
         db: 데이터베이스 세션
 
     Raises:
         HTTPException: 일자리를 찾을 수 없거나 권한이 없을 때 에러
     """
-    delete_job_service(job_id, current_user.id, db)
+    delete_job_service(job_id, principal, db)
 
 
 @router.get("/{job_id}/applications", response_model=List[JobApplicationWithApplicant])
 def get_job_applications(
     job_id: UUID,
     status_filter: Optional[str] = Query(None, alias="status", description="지원 상태 필터 (applied, in_review, accepted, rejected)"),
-    current_user: User = Depends(get_current_user),
+    principal: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db),
 ):
     """
@@ -170,7 +234,7 @@ def get_job_applications(
     Args:
         job_id: 일자리 ID
         status_filter: 지원 상태 필터 (optional)
-        current_user: 현재 인증된 사용자 (admin)
+        principal: 현재 인증 주체 (admin/agency)
         db: 데이터베이스 세션
 
     Returns:
@@ -179,7 +243,7 @@ def get_job_applications(
     Raises:
         HTTPException: 일자리를 찾을 수 없거나 권한이 없을 때 에러
     """
-    applications = get_job_applications_service(job_id, current_user.id, status_filter, db)
+    applications = get_job_applications_service(job_id, principal, status_filter, db)
 
     # 응답 포맷 변환
     result = []
@@ -229,7 +293,7 @@ def apply_to_job(
 def update_application_status(
     application_id: UUID,
     status_update: JobApplicationStatusUpdate,
-    current_user: User = Depends(get_current_user),
+    principal: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db),
 ):
     """
@@ -238,7 +302,7 @@ def update_application_status(
     Args:
         application_id: 지원 내역 ID
         status_update: 상태 업데이트 데이터
-        current_user: 현재 인증된 사용자 (admin)
+        principal: 현재 인증 주체 (admin/agency)
         db: 데이터베이스 세션
 
     Returns:
@@ -250,7 +314,7 @@ def update_application_status(
     return update_job_application_status_service(
         application_id,
         status_update,
-        current_user.id,
+        principal,
         db,
     )
 
@@ -1,48 +1,271 @@
 """Messages Router"""
 
-from typing import List
-from fastapi import APIRouter, Depends, status
+import asyncio
+import json
+from datetime import datetime, timezone
+from typing import AsyncIterator, List, Optional, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, WebSocket, WebSocketDisconnect, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from uuid import UUID
 
+from ..config import settings
 from ..database import get_db
 from ..models.user import User
-from ..models.message import Message
 from ..schemas.message import (
+    ConsultationUnreadCount,
     MessageCreate,
-    MessageUpdate,
     MessageResponse,
+    UnreadCountsResponse,
 )
+from ..schemas.user import Principal
 from ..services.message_service import (
+    get_consultation_for_participant,
     get_consultation_messages as get_consultation_messages_service,
     send_message as send_message_service,
     mark_message_as_read as mark_message_as_read_service,
     get_unread_message_count as get_unread_message_count_service,
+    get_unread_counts_by_consultation as get_unread_counts_by_consultation_service,
 )
-from ..middleware.auth import get_current_user
+from ..middleware.auth import get_current_user, get_principal_from_token
+from ..utils.auth import verify_access_token
+from ..utils.message_broker import PARTICIPANT_REMOVED_EVENT_TYPE, Subscription, message_broker
 
 
 router = APIRouter(prefix="/api/messages", tags=["messages"])
 
 
+def _extract_token(token: Optional[str], authorization: Optional[str]) -> Optional[str]:
+    """쿼리 파라미터(token) 또는 Authorization 헤더에서 토큰 추출
+
+    브라우저 WebSocket/EventSource는 헤더를 설정할 수 없으므로 쿼리 파라미터도 허용합니다.
+    """
+    if token:
+        return token
+    if authorization and authorization.lower().startswith("bearer "):
+        return authorization[7:].strip()
+    return None
+
+
+def _authorize_subscriber(
+    consultation_id: UUID, token: Optional[str], db: Session
+) -> Tuple[Principal, Optional[datetime]]:
+    """
+    실시간 채널 구독 권한 확인 (상담 참여자만 허용)
+
+    구독 연결은 오래 유지되므로 확인이 끝나면 세션을 닫아 DB 연결을 반환합니다.
+
+    Args:
+        consultation_id: 상담 ID
+        token: JWT 토큰
+        db: 데이터베이스 세션
+
+    Returns:
+        Tuple[Principal, Optional[datetime]]: (인증 주체, 토큰 만료 시각)
+
+    Raises:
+        HTTPException: 인증 실패 시 401, 상담이 없으면 404, 참여자가 아니면 403 에러
+    """
+    try:
+        principal = get_principal_from_token(token, db)
+        if not principal:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Could not validate credentials",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        get_consultation_for_participant(consultation_id, principal.id, db)
+        exp = verify_access_token(token).get("exp")
+        expires_at = datetime.fromtimestamp(exp, timezone.utc) if exp is not None else None
+        return principal, expires_at
+    finally:
+        db.close()
+
+
+def _close_reason(
+    event: Optional[dict],
+    principal: Optional[Principal],
+    expires_at: Optional[datetime],
+) -> Optional[str]:
+    """
+    구독 종료 사유 확인 (이벤트 전달/하트비트마다 호출)
+
+    Args:
+        event: 전달할 이벤트 (하트비트면 None)
+        principal: 구독한 인증 주체
+        expires_at: 토큰 만료 시각
+
+    Returns:
+        Optional[str]: 종료 사유 (계속 전달하면 None)
+    """
+    if expires_at is not None and datetime.now(timezone.utc) >= expires_at:
+        return "Token expired"
+    if (
+        event is not None
+        and principal is not None
+        and event.get("type") == PARTICIPANT_REMOVED_EVENT_TYPE
+        and event.get("user_id") == str(principal.id)
+    ):
+        return "No longer a participant"
+    return None
+
+
+async def _next_event(subscription: Subscription) -> Optional[dict]:
+    """다음 이벤트 대기 (하트비트 간격 동안 이벤트가 없으면 None)"""
+    try:
+        return await asyncio.wait_for(subscription.get(), timeout=settings.REALTIME_HEARTBEAT_SECONDS)
+    except asyncio.TimeoutError:
+        return None
+
+
+async def _forward_events(
+    websocket: WebSocket,
+    subscription: Subscription,
+    principal: Principal,
+    expires_at: Optional[datetime],
+) -> None:
+    """구독 이벤트를 WebSocket으로 전달 (유휴 시 ping 전송, 토큰 만료/참여자 제외 시 연결 종료)"""
+    while True:
+        event = await _next_event(subscription)
+        reason = _close_reason(event, principal, expires_at)
+        if reason:
+            await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason=reason)
+            return
+        await websocket.send_json(event if event is not None else {"type": "ping"})
+
+
+async def _sse_events(
+    subscription: Subscription,
+    request: Request,
+    principal: Optional[Principal] = None,
+    expires_at: Optional[datetime] = None,
+) -> AsyncIterator[str]:
+    """
+    구독 이벤트를 SSE 형식으로 변환
+
+    Args:
+        subscription: 상담 채널 구독
+        request: HTTP 요청 (연결 종료 확인용)
+        principal: 구독한 인증 주체 (참여자에서 제외되면 스트림 종료)
+        expires_at: 토큰 만료 시각 (지나면 스트림 종료)
+
+    Yields:
+        str: SSE 이벤트 (유휴 시 주석 형태의 하트비트)
+    """
+    try:
+        yield "retry: 3000\n\n"
+        while not await request.is_disconnected():
+            event = await _next_event(subscription)
+            if _close_reason(event, principal, expires_at):
+                break
+            if event is None:
+                yield ": ping\n\n"
+                continue
+            yield f"event: {event['type']}\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
+    finally:
+        subscription.close()
+
+
+@router.websocket("/consultations/{consultation_id}/ws")
+async def message_websocket(
+    websocket: WebSocket,
+    consultation_id: UUID,
+    token: Optional[str] = Query(None),
+    db: Session = Depends(get_db),
+):
+    """
+    상담 메시지 실시간 수신 (WebSocket)
+
+    새 메시지(message.created)와 읽음 처리(messages.read) 이벤트를 JSON으로 전달합니다.
+    resync 이벤트를 받으면 since 조회로 누락된 메시지를 다시 불러와야 합니다.
+
+    Args:
+        websocket: WebSocket 연결
+        consultation_id: 상담 ID
+        token: JWT 토큰 (Authorization 헤더 대신 사용 가능)
+        db: 데이터베이스 세션 (권한 확인에만 사용)
+    """
+    token = _extract_token(token, websocket.headers.get("authorization"))
+    try:
+        principal, expires_at = await run_in_threadpool(_authorize_subscriber, consultation_id, token, db)
+    except HTTPException as e:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason=str(e.detail))
+        return
+
+    # accept 전에 구독하여 연결 직후 발행된 이벤트도 누락되지 않도록 함
+    with message_broker.subscribe(str(consultation_id)) as subscription:
+        await websocket.accept()
+        sender = asyncio.create_task(_forward_events(websocket, subscription, principal, expires_at))
+        try:
+            while True:
+                # 클라이언트 메시지는 사용하지 않음 (연결 종료 감지용)
+                await websocket.receive_text()
+        except WebSocketDisconnect:
+            pass
+        finally:
+            sender.cancel()
+
+
+@router.get("/consultations/{consultation_id}/stream")
+async def stream_messages(
+    consultation_id: UUID,
+    request: Request,
+    token: Optional[str] = Query(None),
+    db: Session = Depends(get_db),
+):
+    """
+    상담 메시지 실시간 수신 (SSE, WebSocket을 쓸 수 없는 환경용)
+
+    Args:
+        consultation_id: 상담 ID
+        request: HTTP 요청
+        token: JWT 토큰 (Authorization 헤더 대신 사용 가능)
+        db: 데이터베이스 세션 (권한 확인에만 사용)
+
+    Returns:
+        StreamingResponse: text/event-stream 응답
+
+    Raises:
+        HTTPException: 인증 실패 또는 상담 참여자가 아닌 경우
+    """
+    token = _extract_token(token, request.headers.get("authorization"))
+    principal, expires_at = await run_in_threadpool(_authorize_subscriber, consultation_id, token, db)
+
+    subscription = message_broker.subscribe(str(consultation_id))
+    return StreamingResponse(
+        _sse_events(subscription, request, principal, expires_at),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/consultations/{consultation_id}", response_model=List[MessageResponse])
 def get_messages(
     consultation_id: UUID,
+    since: Optional[datetime] = Query(None, description="이 시각 이후 메시지만 조회 (폴링용)"),
+    before: Optional[datetime] = Query(None, description="이 시각 이전 메시지만 조회 (이전 대화 불러오기)"),
+    limit: int = Query(100, ge=1, le=200, description="조회할 최대 개수"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """
-    상담 메시지 목록 조회
+    상담 메시지 목록 조회 (상대방 메시지는 읽음 처리)
 
     Args:
         consultation_id: 상담 ID
+        since: 이 시각 이후 메시지만 조회 (optional)
+        before: 이 시각 이전 메시지만 조회 (optional)
+        limit: 조회할 최대 개수
         current_user: 현재 인증된 사용자
         db: 데이터베이스 세션
 
     Returns:
-        List[MessageResponse]: 메시지 목록 (최신순)
+        List[MessageResponse]: 메시지 목록 (오래된 순)
     """
-    return get_consultation_messages_service(consultation_id, db)
+    return get_consultation_messages_service(
+        consultation_id, current_user.id, db, since=since, before=before, limit=limit
+    )
 
 
 @router.post("/consultations/{consultation_id}", response_model=MessageResponse, status_code=status.HTTP_201_CREATED)
@@ -95,8 +318,8 @@ def mark_message_as_read(
     """
     message = mark_message_as_read_service(message_id, current_user.id, db)
     if not message:
-        raise status.HTTPException(
-            status_code=404,
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
             detail="Message not found"
         )
     return message
@@ -121,5 +344,27 @@ def get_unread_count(
     return {"count": count}
 
 
+@router.get("/unread/by-consultation", response_model=UnreadCountsResponse)
+def get_unread_counts_by_consultation(
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """
+    상담별 읽지 않은 메시지 수 조회 (목록 배지용, 한 번의 호출)
 
+    Args:
+        current_user: 현재 인증된 사용자
+        db: 데이터베이스 세션
 
+    Returns:
+        UnreadCountsResponse: { total, consultations: [{ consultation_id, count }] }
+            읽지 않은 메시지가 없는 상담은 제외
+    """
+    counts = get_unread_counts_by_consultation_service(current_user.id, db)
+    return UnreadCountsResponse(
+        total=sum(counts.values()),
+        consultations=[
+            ConsultationUnreadCount(consultation_id=consultation_id, count=count)
+            for consultation_id, count in counts.items()
+        ],
+    )
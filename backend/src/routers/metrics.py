@@ -0,0 +1,49 @@
+"""Metrics Router"""
+
+import secrets
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import PlainTextResponse
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+
+from ..config import settings
+from ..utils.metrics import request_metrics
+
+# METRICS_ENABLED일 때만 등록됨 (main.py)
+router = APIRouter(tags=["metrics"], include_in_schema=False)
+
+metrics_security = HTTPBearer(auto_error=False)
+
+
+def verify_metrics_token(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(metrics_security),
+) -> None:
+    """
+    /metrics 접근 토큰 확인 (METRICS_TOKEN이 설정된 경우)
+
+    Args:
+        credentials: HTTP Bearer 토큰 (optional)
+
+    Raises:
+        HTTPException: 토큰이 없거나 일치하지 않을 때 401 에러
+    """
+    if not settings.METRICS_TOKEN:
+        return
+    if credentials is None or not secrets.compare_digest(credentials.credentials, settings.METRICS_TOKEN):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid metrics token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+@router.get("/metrics", dependencies=[Depends(verify_metrics_token)])
+async def metrics():
+    """
+    Prometheus 지표 (라우트 템플릿별 지연 시간/SQL 통계)
+
+    Returns:
+        PlainTextResponse: Prometheus 텍스트 형식 지표
+    """
+    return PlainTextResponse(request_metrics.render(), media_type="text/plain; version=0.0.4")
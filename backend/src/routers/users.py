@@ -5,7 +5,7 @@ from sqlalchemy.orm import Session
 
 from ..models.user import User
 from ..schemas.user import UserResponse, UserUpdate
-from ..middleware.auth import get_current_user
+from ..middleware.auth import get_current_user, invalidate_user_cache
 from ..database import get_db
 
 
@@ -57,5 +57,6 @@ def update_current_user_profile(
 
     db.commit()
     db.refresh(current_user)
+    invalidate_user_cache(current_user.email)
 
     return current_user
@@ -176,6 +176,11 @@ class GovernmentSupportList(BaseModel):
         from_attributes = True
 
 
+def _strip_visa_type(v):
+    """비자 값 앞뒤 공백 제거 (단건/일괄 자격 확인이 같은 값으로 비교하도록 길이 검증 전에 적용)"""
+    return v.strip() if isinstance(v, str) else v
+
+
 class EligibilityCheckRequest(BaseModel):
     """자격 확인 요청 스키마"""
 
@@ -185,6 +190,11 @@ class EligibilityCheckRequest(BaseModel):
     residence_location: Optional[str] = Field(None, max_length=100, description="거주 지역")
     employment_status: Optional[str] = Field(None, max_length=50, description="고용 상태")
 
+    @field_validator("visa_type", mode="before")
+    @classmethod
+    def strip_visa_type(cls, v):
+        return _strip_visa_type(v)
+
     class Config:
         json_schema_extra = {
             "example": {
@@ -216,3 +226,47 @@ class EligibilityCheckResponse(BaseModel):
         }
 
 
+
+
+class EligibilityBatchRequest(BaseModel):
+    """전체 지원 프로그램 일괄 자격 확인 요청 스키마"""
+
+    visa_type: str = Field(..., min_length=1, max_length=10, description="비자 종류 (예: E-1, F-2)")
+    age: Optional[int] = Field(None, ge=0, le=150, description="나이")
+    residence_location: Optional[str] = Field(None, max_length=100, description="거주 지역")
+    employment_status: Optional[str] = Field(None, max_length=50, description="고용 상태")
+    eligible_only: bool = Field(False, description="신청 가능한 프로그램만 반환")
+
+    @field_validator("visa_type", mode="before")
+    @classmethod
+    def strip_visa_type(cls, v):
+        return _strip_visa_type(v)
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "visa_type": "E-7",
+                "age": 30,
+                "residence_location": "서울시 강남구",
+                "employment_status": "employed",
+                "eligible_only": True,
+            }
+        }
+
+
+class EligibilityBatchItem(BaseModel):
+    """프로그램별 자격 확인 결과"""
+
+    support: GovernmentSupportResponse = Field(..., description="지원 프로그램 정보")
+    eligible: bool = Field(..., description="자격 충족 여부")
+    reasons: List[str] = Field(default_factory=list, description="자격 충족/미충족 이유")
+
+
+class EligibilityBatchResponse(BaseModel):
+    """전체 지원 프로그램 일괄 자격 확인 응답 스키마"""
+
+    total: int = Field(..., description="확인한 활성 프로그램 수")
+    eligible_count: int = Field(..., description="신청 가능한 프로그램 수")
+    results: List[EligibilityBatchItem] = Field(
+        default_factory=list, description="프로그램별 결과 (신청 가능한 프로그램 먼저, 최신순)"
+    )
@@ -51,6 +51,13 @@ class JobResponse(BaseModel):
         from_attributes = True  # Pydantic v2: ORM 모드 활성화
 
 
+class JobListItemResponse(JobResponse):
+    """일자리 목록 응답 스키마 (로그인 사용자의 저장/지원 여부 포함)"""
+
+    is_saved: bool = Field(default=False, description="현재 사용자가 저장한 일자리인지 여부 (비로그인 시 False)")
+    has_applied: bool = Field(default=False, description="현재 사용자가 이미 지원했는지 여부 (비로그인 시 False)")
+
+
 class JobDetailResponse(JobResponse):
     """일자리 상세 응답 스키마 (지원 여부 포함)"""
 
@@ -1,21 +1,15 @@
 """Message Schemas"""
 
 from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel
+from typing import List, Optional
+from uuid import UUID
+from pydantic import BaseModel, Field
 
 
-class MessageBase(BaseModel):
-    """메시지 베이스 스키마"""
-    sender_id: str
-    content: str
-    file_attachment: Optional[str] = None
-    is_read: bool = False
-
-
-class MessageCreate(MessageBase):
-    """메시지 생성 스키마"""
-    pass
+class MessageCreate(BaseModel):
+    """메시지 생성 스키마 (보내는 사람은 인증 정보에서 결정)"""
+    content: str = Field(..., min_length=1, max_length=5000)
+    file_attachment: Optional[str] = Field(None, max_length=500)
 
 
 class MessageUpdate(BaseModel):
@@ -24,15 +18,27 @@ class MessageUpdate(BaseModel):
     is_read: Optional[bool] = None
 
 
-class MessageResponse(MessageBase):
+class MessageResponse(BaseModel):
     """메시지 응답 스키마"""
-    id: str
-    consultation_id: str
+    id: UUID
+    consultation_id: UUID
+    sender_id: UUID
+    content: str
+    file_attachment: Optional[str] = None
+    is_read: bool = False
     created_at: datetime
 
     class Config:
         from_attributes = True
 
 
+class ConsultationUnreadCount(BaseModel):
+    """상담별 읽지 않은 메시지 수"""
+    consultation_id: UUID
+    count: int
 
 
+class UnreadCountsResponse(BaseModel):
+    """상담별 읽지 않은 메시지 수 응답 스키마"""
+    total: int
+    consultations: List[ConsultationUnreadCount]
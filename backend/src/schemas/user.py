@@ -55,6 +55,17 @@ class UserResponse(BaseModel):
         from_attributes = True  # Pydantic v2: ORM 모드 활성화
 
 
+class Principal(BaseModel):
+    """인증 주체 (JWT 클레임에서 추출한 최소 사용자 정보)
+
+    권한 확인만 필요한 경로에서 User 조회 없이 사용합니다.
+    """
+
+    id: UUID
+    email: str
+    role: str
+
+
 class LoginRequest(BaseModel):
     """로그인 요청 스키마"""
 
@@ -1,5 +1,5 @@
 """Business Logic Services"""
 
-from . import auth_service, consultation_service, matching_service, payment_service, review_service, job_service, support_keyword_service, government_support_service
+from . import auth_service, consultation_service, matching_service, payment_service, review_service, job_service, support_keyword_service, government_support_service, stats_service
 
-__all__ = ["auth_service", "consultation_service", "matching_service", "payment_service", "review_service", "job_service", "support_keyword_service", "government_support_service"]
+__all__ = ["auth_service", "consultation_service", "matching_service", "payment_service", "review_service", "job_service", "support_keyword_service", "government_support_service", "stats_service"]
@@ -4,16 +4,34 @@ from typing import Optional
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException, status, Request
+from starlette.concurrency import run_in_threadpool
 
+from ..config import settings
 from ..models.user import User
 from ..schemas.user import UserCreate, TokenResponse
-from ..utils.auth import hash_password, verify_password, create_access_token
+from ..utils.auth import (
+    hash_password_async,
+    verify_password_async,
+    create_access_token,
+    PasswordHashBusyError,
+)
 from ..utils.i18n import get_error_message
 
 
-def create_user(user_data: UserCreate, db: Session, request: Optional[Request] = None) -> User:
+def _server_busy_error(language: str) -> HTTPException:
+    """비밀번호 해싱 대기열 포화 시 503 에러 생성"""
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=get_error_message("server_busy", language),
+        headers={"Retry-After": str(settings.PASSWORD_HASH_RETRY_AFTER_SECONDS)},
+    )
+
+
+async def create_user(user_data: UserCreate, db: Session, request: Optional[Request] = None) -> User:
     """사용자 생성
 
+    비밀번호 해싱은 전용 워커 풀에서, DB 작업은 스레드풀에서 실행합니다.
+
     Args:
         user_data: 회원가입 데이터
         db: 데이터베이스 세션
@@ -23,13 +41,16 @@ def create_user(user_data: UserCreate, db: Session, request: Optional[Request] =
         User: 생성된 사용자 객체
 
     Raises:
-        HTTPException: 이메일 중복 시 400 에러
+        HTTPException: 이메일 중복 시 400 에러, 해싱 대기열 포화 시 503 에러
     """
     # 언어 추출
     language = request.headers.get("Accept-Language", "ko").split("-")[0].lower() if request else "ko"
     
     # 비밀번호 해싱
-    hashed_password = hash_password(user_data.password)
+    try:
+        hashed_password = await hash_password_async(user_data.password)
+    except PasswordHashBusyError:
+        raise _server_busy_error(language)
 
     # User 모델 생성
     db_user = User(
@@ -41,23 +62,28 @@ def create_user(user_data: UserCreate, db: Session, request: Optional[Request] =
         role=user_data.role,
     )
 
-    try:
-        db.add(db_user)
-        db.commit()
-        db.refresh(db_user)
-    except IntegrityError:
-        db.rollback()
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=get_error_message("user_already_exists", language),
-        )
+    def _save() -> None:
+        try:
+            db.add(db_user)
+            db.commit()
+            db.refresh(db_user)
+        except IntegrityError:
+            db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=get_error_message("user_already_exists", language),
+            )
+
+    await run_in_threadpool(_save)
 
     return db_user
 
 
-def authenticate_user(email: str, password: str, db: Session, request: Optional[Request] = None) -> Optional[TokenResponse]:
+async def authenticate_user(email: str, password: str, db: Session, request: Optional[Request] = None) -> Optional[TokenResponse]:
     """사용자 인증 및 토큰 생성
 
+    비밀번호 검증은 전용 워커 풀에서, DB 조회는 스레드풀에서 실행합니다.
+
     Args:
         email: 사용자 이메일
         password: 비밀번호
@@ -66,20 +92,32 @@ def authenticate_user(email: str, password: str, db: Session, request: Optional[
 
     Returns:
         TokenResponse: JWT 토큰 및 사용자 정보 또는 None (인증 실패 시)
+
+    Raises:
+        HTTPException: 해싱 대기열 포화 시 503 에러
     """
     # 언어 추출
     language = request.headers.get("Accept-Language", "ko").split("-")[0].lower() if request else "ko"
 
     # 사용자 조회
-    user = db.query(User).filter(User.email == email).first()
+    user = await run_in_threadpool(
+        lambda: db.query(User).filter(User.email == email).first()
+    )
     if not user:
         return None
 
     # 비밀번호 검증
-    if not verify_password(password, user.password_hash):
+    try:
+        is_valid = await verify_password_async(password, user.password_hash)
+    except PasswordHashBusyError:
+        raise _server_busy_error(language)
+
+    if not is_valid:
         return None
 
     # JWT 토큰 생성
-    access_token = create_access_token(data={"sub": user.email, "user_id": str(user.id)})
+    access_token = create_access_token(
+        data={"sub": user.email, "user_id": str(user.id), "role": user.role}
+    )
 
     return TokenResponse(access_token=access_token, token_type="bearer", user=user)
@@ -1,14 +1,20 @@
 """Consultation Service"""
 
+from datetime import datetime, timezone
 from typing import List, Optional
 from uuid import UUID
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import and_, case, func, tuple_
+from sqlalchemy.orm import Query, Session, selectinload
 
 from ..models.user import User
 from ..models.consultation import Consultation
 from ..models.consultant import Consultant
+from ..models.consultation_decline import ConsultationDecline
 from ..schemas.consultation import ConsultationCreate
+from ..utils.message_broker import PARTICIPANT_REMOVED_EVENT_TYPE, message_broker
 from .matching_service import find_matching_consultant
+from .message_service import delete_unread_counter
+from .rematch_service import request_rematch
 
 
 def create_consultation(
@@ -33,9 +39,11 @@ def create_consultation(
     if matched_consultant:
         consultant_id = matched_consultant.id
         status = "matched"
+        matched_at = datetime.now(timezone.utc)
     else:
         consultant_id = None
         status = "requested"
+        matched_at = None
 
     # 새 상담 신청 생성
     new_consultation = Consultation(
@@ -46,35 +54,76 @@ def create_consultation(
         consultation_method=consultation_data.consultation_method,
         amount=consultation_data.amount,
         status=status,
+        matched_at=matched_at,
         payment_status="pending",
     )
 
     db.add(new_consultation)
-    db.commit()
-    db.refresh(new_consultation)
 
-    # 이메일 알림 발송 (매칭 완료 시)
+    # 이메일 알림 발송 대기열 추가 (매칭 완료 시, 상담 신청과 같은 트랜잭션)
     if matched_consultant and user.email:
         from .email_service import send_consultation_matched_email
+        send_consultation_matched_email(
+            user.email,
+            matched_consultant.office_name,
+            consultation_data.consultation_type,
+            db,
+        )
+
+    db.commit()
+    db.refresh(new_consultation)
+
+    return new_consultation
+
+
+def _paginate_consultations(
+    query: Query,
+    limit: int,
+    cursor: Optional[str] = None,
+) -> List[Consultation]:
+    """상담 목록 최신순 keyset 페이지네이션 (의뢰인 정보 selectinload)
+
+    Args:
+        query: 필터가 적용된 상담 조회 쿼리
+        limit: 조회할 최대 개수
+        cursor: 이전 페이지의 다음 페이지 커서 (optional)
+
+    Returns:
+        List[Consultation]: 상담 목록 (created_at, id 내림차순)
+
+    Raises:
+        HTTPException: 커서가 유효하지 않은 경우 400 에러
+    """
+    from fastapi import HTTPException, status
+    from ..utils.pagination import decode_cursor
+
+    # keyset 페이지네이션: 커서 (created_at, id) 이후 항목만 조회
+    if cursor:
         try:
-            send_consultation_matched_email(
-                user.email,
-                matched_consultant.office_name,
-                consultation_data.consultation_type,
+            cursor_created_at, cursor_id = decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor"
             )
-        except Exception as e:
-            # 이메일 발송 실패해도 상담 신청은 유지
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.error(f"Failed to send consultation matched email: {e}")
+        query = query.filter(
+            tuple_(Consultation.created_at, Consultation.id) < (cursor_created_at, cursor_id)
+        )
 
-    return new_consultation
+    # 응답에 포함되는 의뢰인 정보는 페이지 단위로 한 번에 조회 (행마다 지연 로딩 방지)
+    return query.options(
+        selectinload(Consultation.user)
+    ).order_by(
+        Consultation.created_at.desc(), Consultation.id.desc()
+    ).limit(limit).all()
 
 
 def get_incoming_consultations(
     user: User,
     db: Session,
-    status: Optional[str] = None
+    status: Optional[str] = None,
+    limit: int = 20,
+    cursor: Optional[str] = None,
 ) -> List[Consultation]:
     """전문가에게 들어온 상담 요청 목록 조회
 
@@ -82,9 +131,14 @@ def get_incoming_consultations(
         user: 현재 사용자 (전문가)
         db: 데이터베이스 세션
         status: 상태 필터 (optional)
+        limit: 조회할 최대 개수 (기본값: 20)
+        cursor: 이전 페이지의 다음 페이지 커서 (optional)
 
     Returns:
-        List[Consultation]: 상담 목록
+        List[Consultation]: 상담 목록 (최신순)
+
+    Raises:
+        HTTPException: 커서가 유효하지 않은 경우 400 에러
     """
     # 사용자의 consultant 정보 조회
     consultant = db.query(Consultant).filter(
@@ -95,10 +149,8 @@ def get_incoming_consultations(
     if not consultant:
         return []
 
-    # 기본 쿼리: 해당 전문가에게 매칭된 상담 (user 관계 eager loading)
-    query = db.query(Consultation).options(
-        joinedload(Consultation.user)
-    ).filter(
+    # 기본 쿼리: 해당 전문가에게 매칭된 상담
+    query = db.query(Consultation).filter(
         Consultation.consultant_id == consultant.id
     )
 
@@ -106,10 +158,7 @@ def get_incoming_consultations(
     if status:
         query = query.filter(Consultation.status == status)
 
-    # 최신순 정렬
-    consultations = query.order_by(Consultation.created_at.desc()).all()
-
-    return consultations
+    return _paginate_consultations(query, limit, cursor)
 
 
 def accept_consultation(
@@ -154,24 +203,21 @@ def accept_consultation(
 
     # 상태 업데이트
     consultation.status = "scheduled"
-    db.commit()
-    db.refresh(consultation)
 
-    # 이메일 알림 발송 (수락 시)
+    # 이메일 알림 발송 대기열 추가 (수락 시)
     from ..models.user import User as UserModel
     client = db.query(UserModel).filter(UserModel.id == consultation.user_id).first()
     if client and client.email:
         from .email_service import send_consultation_accepted_email
-        try:
-            send_consultation_accepted_email(
-                client.email,
-                consultant.office_name,
-                None,  # scheduled_at은 나중에 추가 가능
-            )
-        except Exception as e:
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.error(f"Failed to send consultation accepted email: {e}")
+        send_consultation_accepted_email(
+            client.email,
+            consultant.office_name,
+            None,  # scheduled_at은 나중에 추가 가능
+            db,
+        )
+
+    db.commit()
+    db.refresh(consultation)
 
     return consultation
 
@@ -181,7 +227,7 @@ def reject_consultation(
     user: User,
     db: Session
 ) -> Consultation:
-    """전문가가 상담 요청 거절
+    """전문가가 상담 요청 거절 (다른 전문가에게 재매칭 대기)
 
     Args:
         consultation_id: 상담 ID
@@ -192,7 +238,7 @@ def reject_consultation(
         Consultation: 거절된 상담 객체
 
     Raises:
-        HTTPException: 상담을 찾을 수 없거나 권한이 없는 경우
+        HTTPException: 상담을 찾을 수 없거나 권한이 없는 경우, 매칭 상태가 아닌 경우 400 에러
     """
     from fastapi import HTTPException
 
@@ -216,33 +262,44 @@ def reject_consultation(
             detail="You are not authorized to reject this consultation"
         )
 
-    # 상태 업데이트 및 전문가 매칭 해제
-    consultation.status = "cancelled"
+    # 수락 전(matched) 상담만 거절 가능 (예약/진행/완료된 상담은 재매칭 대상이 아님)
+    if consultation.status != "matched":
+        raise HTTPException(
+            status_code=400,
+            detail=f"Only matched consultations can be rejected (current status: {consultation.status})"
+        )
+
+    # 거절 기록 (재매칭 시 제외) 후 매칭 대기 상태로 되돌림
+    db.add(ConsultationDecline(consultation_id=consultation.id, consultant_id=consultant.id))
+    consultation.status = "requested"
     consultation.consultant_id = None
-    db.commit()
-    db.refresh(consultation)
+    consultation.matched_at = None
+
+    # 거절한 전문가는 더 이상 참여자가 아니므로 읽지 않은 메시지 카운터도 같은 트랜잭션에서 삭제
+    delete_unread_counter(user.id, consultation.id, db)
 
-    # 이메일 알림 발송 (거절 시)
+    # 이메일 알림 발송 대기열 추가 (거절 시)
     from ..models.user import User as UserModel
     client = db.query(UserModel).filter(UserModel.id == consultation.user_id).first()
     if client and client.email:
         from .email_service import send_consultation_rejected_email
-        try:
-            send_consultation_rejected_email(
-                client.email,
-                consultant.office_name,
-            )
-        except Exception as e:
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.error(f"Failed to send consultation rejected email: {e}")
-
-    # TODO: 다른 전문가 자동 재매칭
-    # new_consultant = find_matching_consultant(db, consultation.consultation_type, exclude_id=consultant.id)
-    # if new_consultant:
-    #     consultation.consultant_id = new_consultant.id
-    #     consultation.status = "matched"
-    #     db.commit()
+        send_consultation_rejected_email(
+            client.email,
+            consultant.office_name,
+            db,
+        )
+
+    # 다른 전문가 자동 재매칭 (커밋 후 RematchWorker가 요청 경로 밖에서 처리)
+    request_rematch(db)
+
+    db.commit()
+    db.refresh(consultation)
+
+    # 거절한 전문가의 실시간 구독(WebSocket/SSE) 종료
+    message_broker.publish(str(consultation.id), {
+        "type": PARTICIPANT_REMOVED_EVENT_TYPE,
+        "user_id": str(user.id),
+    })
 
     return consultation
 
@@ -250,7 +307,9 @@ def reject_consultation(
 def get_user_consultations(
     user: User,
     db: Session,
-    status: Optional[str] = None
+    status: Optional[str] = None,
+    limit: int = 20,
+    cursor: Optional[str] = None,
 ) -> List[Consultation]:
     """사용자가 신청한 상담 목록 조회
 
@@ -258,9 +317,14 @@ def get_user_consultations(
         user: 현재 사용자
         db: 데이터베이스 세션
         status: 상태 필터 (optional)
+        limit: 조회할 최대 개수 (기본값: 20)
+        cursor: 이전 페이지의 다음 페이지 커서 (optional)
 
     Returns:
-        List[Consultation]: 상담 목록
+        List[Consultation]: 상담 목록 (최신순)
+
+    Raises:
+        HTTPException: 커서가 유효하지 않은 경우 400 에러
     """
     # 기본 쿼리: 해당 사용자가 신청한 상담
     query = db.query(Consultation).filter(
@@ -271,10 +335,7 @@ def get_user_consultations(
     if status:
         query = query.filter(Consultation.status == status)
 
-    # 최신순 정렬
-    consultations = query.order_by(Consultation.created_at.desc()).all()
-
-    return consultations
+    return _paginate_consultations(query, limit, cursor)
 
 
 def get_consultation_by_id(
@@ -320,3 +381,71 @@ def get_consultation_by_id(
         )
 
     return consultation
+
+
+# 전문가 대시보드에 노출되는 상담 상태
+DASHBOARD_STATUSES = ("requested", "matched", "scheduled", "completed", "cancelled")
+
+
+def get_consultant_dashboard_stats(user: User, db: Session) -> dict:
+    """전문가 대시보드 통계 조회
+
+    상태별 상담 수와 수익은 한 번의 GROUP BY 쿼리로 집계하고,
+    평점/후기 수는 review_service가 후기 작성 시 증분 갱신하는
+    Consultant.average_rating / total_reviews 컬럼 값을 사용합니다.
+
+    Args:
+        user: 현재 사용자 (전문가)
+        db: 데이터베이스 세션
+
+    Returns:
+        dict: 통계 데이터 (상담 수, 수익, 평점 등)
+    """
+    stats = {
+        "total_consultations": 0,
+        **{status: 0 for status in DASHBOARD_STATUSES},
+        "total_revenue": 0,
+        "average_rating": 0,
+        "total_reviews": 0,
+    }
+
+    consultant = db.query(Consultant).filter(
+        Consultant.user_id == user.id
+    ).first()
+
+    if not consultant:
+        return stats
+
+    # 상태별 상담 수 + 총 수익 (완료 상담 중 결제 완료된 것만)
+    revenue = func.sum(
+        case(
+            (
+                and_(
+                    Consultation.status == "completed",
+                    Consultation.payment_status == "completed",
+                ),
+                Consultation.amount,
+            ),
+            else_=0,
+        )
+    )
+    rows = db.query(
+        Consultation.status,
+        func.count(Consultation.id),
+        revenue,
+    ).filter(
+        Consultation.consultant_id == consultant.id
+    ).group_by(Consultation.status).all()
+
+    total_revenue = 0
+    for status, count, status_revenue in rows:
+        stats["total_consultations"] += count
+        if status in DASHBOARD_STATUSES:
+            stats[status] = count
+        total_revenue += status_revenue or 0
+
+    stats["total_revenue"] = float(total_revenue)
+    stats["average_rating"] = round(float(consultant.average_rating or 0), 1)
+    stats["total_reviews"] = consultant.total_reviews or 0
+
+    return stats
@@ -1,6 +1,8 @@
 """Document Template Service"""
 
 from typing import List, Optional
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from uuid import UUID
 
@@ -10,6 +12,34 @@ from ..schemas.document_template import (
     DocumentTemplateUpdate,
     DocumentTemplateResponse,
 )
+from ..utils.response_cache import DOCUMENT_TEMPLATES_CACHE, invalidate_on_commit
+
+
+# 템플릿 생성/수정/삭제 커밋 시 목록 응답 캐시 무효화
+invalidate_on_commit(DocumentTemplate, DOCUMENT_TEMPLATES_CACHE)
+
+
+def _build_document_templates_query(
+    category: Optional[str] = None,
+    language: str = "ko"
+) -> Select:
+    """서류 템플릿 목록 조회 쿼리 생성 (동기/비동기 조회 공용)
+
+    Args:
+        category: 카테고리 필터 (job_application, support_application)
+        language: 언어 필터 (기본값: ko)
+
+    Returns:
+        Select: 템플릿 목록 조회 쿼리
+    """
+    query = select(DocumentTemplate).where(
+        DocumentTemplate.language == language
+    )
+
+    if category:
+        query = query.where(DocumentTemplate.category == category)
+
+    return query.order_by(DocumentTemplate.name)
 
 
 def get_document_templates(
@@ -27,15 +57,27 @@ def get_document_templates(
     Returns:
         List[DocumentTemplate]: 템플릿 목록
     """
-    query = db.query(DocumentTemplate).filter(
-        DocumentTemplate.language == language
-    )
+    query = _build_document_templates_query(category, language)
+    return list(db.execute(query).scalars().all())
 
-    if category:
-        query = query.filter(DocumentTemplate.category == category)
 
-    templates = query.order_by(DocumentTemplate.name).all()
-    return templates
+async def get_document_templates_async(
+    db: AsyncSession,
+    category: Optional[str] = None,
+    language: str = "ko"
+) -> List[DocumentTemplate]:
+    """서류 템플릿 목록 조회 (비동기 세션용)
+
+    Args:
+        db: 비동기 데이터베이스 세션
+        category: 카테고리 필터 (job_application, support_application)
+        language: 언어 필터 (기본값: ko)
+
+    Returns:
+        List[DocumentTemplate]: 템플릿 목록
+    """
+    result = await db.execute(_build_document_templates_query(category, language))
+    return list(result.scalars().all())
 
 
 def get_document_template_by_id(
@@ -56,6 +98,25 @@ def get_document_template_by_id(
     ).first()
 
 
+async def get_document_template_by_id_async(
+    template_id: UUID,
+    db: AsyncSession
+) -> Optional[DocumentTemplate]:
+    """서류 템플릿 상세 조회 (비동기 세션용)
+
+    Args:
+        template_id: 템플릿 ID
+        db: 비동기 데이터베이스 세션
+
+    Returns:
+        Optional[DocumentTemplate]: 템플릿 정보
+    """
+    result = await db.execute(
+        select(DocumentTemplate).where(DocumentTemplate.id == template_id)
+    )
+    return result.scalar_one_or_none()
+
+
 def create_document_template(
     template_data: DocumentTemplateCreate,
     db: Session
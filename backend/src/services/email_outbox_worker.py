@@ -0,0 +1,227 @@
+"""Email Outbox Delivery Worker"""
+
+import asyncio
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+from smtplib import (
+    SMTP,
+    SMTPException,
+    SMTPRecipientsRefused,
+    SMTPResponseException,
+    SMTPServerDisconnected,
+)
+from typing import Callable, Optional
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+
+from ..config import settings
+from ..database import SessionLocal
+from ..models.email_outbox import EmailOutbox
+from .email_service import EmailService, email_service
+
+
+logger = logging.getLogger(__name__)
+
+
+class EmailOutboxWorker:
+    """이메일 발송 대기열 워커
+
+    email_outbox 테이블의 발송 대상을 배치로 가져와 하나의 SMTP 연결
+    (STARTTLS/로그인 1회)로 발송합니다. 연결은 SMTP_IDLE_TIMEOUT_SECONDS 동안
+    재사용되며, 일시적 오류는 지수 백오프로 재시도합니다.
+    여러 uvicorn 워커에서 동시에 실행되어도 PostgreSQL에서는
+    FOR UPDATE SKIP LOCKED로 같은 항목을 중복 발송하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        service: Optional[EmailService] = None,
+        batch_size: Optional[int] = None,
+        poll_seconds: Optional[float] = None,
+        max_attempts: Optional[int] = None,
+        retry_backoff_seconds: Optional[float] = None,
+        idle_timeout_seconds: Optional[float] = None,
+    ):
+        """
+        Args:
+            session_factory: 데이터베이스 세션 생성 함수
+            service: SMTP 연결에 사용할 이메일 서비스 (기본값: email_service)
+            batch_size: 한 번에 발송할 최대 개수 (기본값: settings.EMAIL_OUTBOX_BATCH_SIZE)
+            poll_seconds: 대기열 확인 주기 (기본값: settings.EMAIL_OUTBOX_POLL_SECONDS)
+            max_attempts: 최대 발송 시도 횟수 (기본값: settings.EMAIL_OUTBOX_MAX_ATTEMPTS)
+            retry_backoff_seconds: 재시도 기본 대기 시간 (기본값: settings.EMAIL_OUTBOX_RETRY_BACKOFF_SECONDS)
+            idle_timeout_seconds: SMTP 연결 유휴 종료 시간 (기본값: settings.SMTP_IDLE_TIMEOUT_SECONDS)
+        """
+        self.session_factory = session_factory
+        self.service = service or email_service
+        self.batch_size = batch_size or settings.EMAIL_OUTBOX_BATCH_SIZE
+        self.poll_seconds = settings.EMAIL_OUTBOX_POLL_SECONDS if poll_seconds is None else poll_seconds
+        self.max_attempts = max_attempts or settings.EMAIL_OUTBOX_MAX_ATTEMPTS
+        self.retry_backoff_seconds = (
+            settings.EMAIL_OUTBOX_RETRY_BACKOFF_SECONDS
+            if retry_backoff_seconds is None
+            else retry_backoff_seconds
+        )
+        self.idle_timeout_seconds = (
+            settings.SMTP_IDLE_TIMEOUT_SECONDS
+            if idle_timeout_seconds is None
+            else idle_timeout_seconds
+        )
+        self._connection: Optional[SMTP] = None
+        self._last_used_at = 0.0
+        self._lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    def _get_connection(self) -> SMTP:
+        """재사용 가능한 SMTP 연결 조회 (없거나 유휴 시간이 지났으면 새로 연결)"""
+        if self._connection is not None and time.monotonic() - self._last_used_at > self.idle_timeout_seconds:
+            self._close_connection()
+        if self._connection is None:
+            self._connection = self.service.connect()
+        self._last_used_at = time.monotonic()
+        return self._connection
+
+    def _close_connection(self) -> None:
+        """SMTP 연결 종료"""
+        connection, self._connection = self._connection, None
+        if connection is None:
+            return
+        try:
+            connection.quit()
+        except (SMTPException, OSError):
+            connection.close()
+
+    def _send(self, item: EmailOutbox) -> None:
+        """
+        대기열 항목 발송 (서버가 연결을 끊었으면 한 번 재연결)
+
+        Raises:
+            SMTPException: 발송 실패 시
+            OSError: 네트워크 오류 시
+        """
+        message = self.service.build_message(item.to_email, item.subject, item.body_text, item.body_html)
+        try:
+            self._get_connection().send_message(message)
+        except SMTPServerDisconnected:
+            self._close_connection()
+            self._get_connection().send_message(message)
+
+    def _record_failure(self, item: EmailOutbox, error: Exception, now: datetime) -> None:
+        """발송 실패 기록 (영구 오류이거나 최대 시도 횟수 초과 시 failed)"""
+        item.attempts += 1
+        item.last_error = str(error)[:1000]
+
+        permanent = isinstance(error, SMTPRecipientsRefused) or (
+            isinstance(error, SMTPResponseException) and 500 <= error.smtp_code < 600
+        )
+        if permanent or item.attempts >= self.max_attempts:
+            item.status = "failed"
+            logger.error(f"[EMAIL] 이메일 발송 실패 (재시도 중단): {item.to_email} - {error}")
+            return
+
+        delay = self.retry_backoff_seconds * (2 ** (item.attempts - 1))
+        item.next_attempt_at = now + timedelta(seconds=delay)
+        logger.warning(f"[EMAIL] 이메일 발송 실패 (재시도 예정): {item.to_email} - {error}")
+
+    def deliver_batch(self, db: Session) -> int:
+        """
+        발송 대상 한 배치 발송
+
+        Args:
+            db: 데이터베이스 세션
+
+        Returns:
+            int: 처리한 대기열 항목 수 (성공/실패 포함)
+        """
+        now = datetime.utcnow()
+        items = db.query(EmailOutbox).filter(
+            EmailOutbox.status == "pending",
+            EmailOutbox.next_attempt_at <= now,
+        ).order_by(
+            EmailOutbox.next_attempt_at.asc()
+        ).limit(self.batch_size).with_for_update(skip_locked=True).all()
+
+        processed = 0
+        for item in items:
+            try:
+                self._get_connection()
+            except (SMTPException, OSError) as e:
+                # 서버 연결/인증 실패는 항목의 문제가 아니므로 시도 횟수를 늘리지 않음
+                logger.error(f"[EMAIL] SMTP 연결 실패: {e}")
+                break
+
+            processed += 1
+            try:
+                self._send(item)
+            except (SMTPResponseException, SMTPRecipientsRefused) as e:
+                self._record_failure(item, e, now)
+                continue
+            except (SMTPException, OSError) as e:
+                # 연결이 끊긴 경우: 남은 항목은 다음 주기에 발송
+                self._record_failure(item, e, now)
+                self._close_connection()
+                break
+
+            item.status = "sent"
+            item.sent_at = datetime.utcnow()
+            item.last_error = None
+
+        db.commit()
+        return processed
+
+    def drain(self) -> int:
+        """
+        발송 대상이 없을 때까지 배치 발송
+
+        Returns:
+            int: 처리한 대기열 항목 수
+        """
+        total = 0
+        with self._lock:
+            db = self.session_factory()
+            try:
+                while True:
+                    processed = self.deliver_batch(db)
+                    total += processed
+                    if processed < self.batch_size:
+                        break
+            finally:
+                db.close()
+        return total
+
+    async def _run(self) -> None:
+        """주기적으로 대기열 발송"""
+        while True:
+            try:
+                await run_in_threadpool(self.drain)
+            except Exception as e:
+                logger.error(f"[EMAIL] 발송 대기열 처리 실패: {e}")
+            await asyncio.sleep(self.poll_seconds)
+
+    async def start(self) -> None:
+        """워커 시작 (애플리케이션 시작 시 호출)"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """워커 종료 및 SMTP 연결 종료 (애플리케이션 종료 시 호출)"""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+        def close() -> None:
+            with self._lock:
+                self._close_connection()
+
+        await run_in_threadpool(close)
+
+
+# 싱글톤 인스턴스
+email_outbox_worker = EmailOutboxWorker()
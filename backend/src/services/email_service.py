@@ -5,8 +5,10 @@ from typing import Optional
 from smtplib import SMTP, SMTPException
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
+from sqlalchemy.orm import Session
 
 from ..config import settings
+from ..models.email_outbox import EmailOutbox
 
 logger = logging.getLogger(__name__)
 
@@ -19,9 +21,68 @@ class EmailService:
         self.smtp_port = getattr(settings, 'SMTP_PORT', 587)
         self.smtp_user = getattr(settings, 'SMTP_USER', None)
         self.smtp_password = getattr(settings, 'SMTP_PASSWORD', None)
+        self.use_tls = getattr(settings, 'SMTP_USE_TLS', True)
         self.from_email = getattr(settings, 'FROM_EMAIL', 'noreply@easyk.com')
         self.enabled = getattr(settings, 'EMAIL_ENABLED', False)
 
+    def build_message(
+        self,
+        to_email: str,
+        subject: str,
+        body_text: str,
+        body_html: Optional[str] = None,
+    ) -> MIMEMultipart:
+        """
+        이메일 메시지 생성
+
+        Args:
+            to_email: 수신자 이메일
+            subject: 제목
+            body_text: 본문 (텍스트)
+            body_html: 본문 (HTML, optional)
+
+        Returns:
+            MIMEMultipart: 이메일 메시지
+        """
+        message = MIMEMultipart("alternative")
+        message["Subject"] = subject
+        message["From"] = self.from_email
+        message["To"] = to_email
+
+        # 텍스트 파트 추가
+        message.attach(MIMEText(body_text, "plain", "utf-8"))
+
+        # HTML 파트 추가 (있는 경우)
+        if body_html:
+            message.attach(MIMEText(body_html, "html", "utf-8"))
+
+        return message
+
+    def connect(self) -> SMTP:
+        """
+        SMTP 서버 연결 (STARTTLS 및 로그인 완료 상태)
+
+        SMTP_USE_TLS가 False이면 STARTTLS를 생략하고, SMTP_USER가 비어 있으면
+        로그인을 생략합니다 (로컬 디버깅 SMTP 서버용).
+
+        Returns:
+            SMTP: 연결된 SMTP 클라이언트 (사용 후 quit() 호출)
+
+        Raises:
+            SMTPException: 연결/인증 실패 시
+            OSError: 네트워크 오류 시
+        """
+        server = SMTP(self.smtp_host, self.smtp_port, timeout=settings.SMTP_TIMEOUT_SECONDS)
+        try:
+            if self.use_tls:
+                server.starttls()
+            if self.smtp_user:
+                server.login(self.smtp_user, self.smtp_password)
+        except Exception:
+            server.close()
+            raise
+        return server
+
     def send_email(
         self,
         to_email: str,
@@ -30,7 +91,9 @@ class EmailService:
         body_html: Optional[str] = None,
     ) -> bool:
         """
-        이메일 발송
+        이메일 즉시 발송 (연결을 새로 맺음)
+
+        요청 처리 중에는 enqueue_email()로 발송 대기열에 추가하세요.
 
         Args:
             to_email: 수신자 이메일
@@ -45,31 +108,15 @@ class EmailService:
             logger.info(f"[EMAIL] 이메일 발송 비활성화됨: {to_email} - {subject}")
             return False
 
-        if not self.smtp_user or not self.smtp_password:
-            logger.warning("[EMAIL] SMTP 인증 정보가 설정되지 않음")
-            return False
-
         try:
-            # 이메일 메시지 생성
-            message = MIMEMultipart("alternative")
-            message["Subject"] = subject
-            message["From"] = self.from_email
-            message["To"] = to_email
-
-            # 텍스트 파트 추가
-            text_part = MIMEText(body_text, "plain", "utf-8")
-            message.attach(text_part)
-
-            # HTML 파트 추가 (있는 경우)
-            if body_html:
-                html_part = MIMEText(body_html, "html", "utf-8")
-                message.attach(html_part)
+            message = self.build_message(to_email, subject, body_text, body_html)
 
             # SMTP 서버 연결 및 발송
-            with SMTP(self.smtp_host, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.smtp_user, self.smtp_password)
+            server = self.connect()
+            try:
                 server.send_message(message)
+            finally:
+                server.quit()
 
             logger.info(f"[EMAIL] 이메일 발송 성공: {to_email} - {subject}")
             return True
@@ -86,8 +133,45 @@ class EmailService:
 email_service = EmailService()
 
 
-def send_consultation_matched_email(user_email: str, consultant_name: str, consultation_type: str):
-    """상담 매칭 완료 알림"""
+def enqueue_email(
+    to_email: str,
+    subject: str,
+    body_text: str,
+    body_html: Optional[str] = None,
+    db: Session = None,
+) -> Optional[EmailOutbox]:
+    """
+    이메일 발송 대기열에 추가 (커밋은 호출자가 수행)
+
+    업무 데이터 변경과 같은 트랜잭션에서 커밋되므로, 롤백되면 이메일도 발송되지 않습니다.
+    실제 발송은 EmailOutboxWorker가 수행합니다.
+
+    Args:
+        to_email: 수신자 이메일
+        subject: 제목
+        body_text: 본문 (텍스트)
+        body_html: 본문 (HTML, optional)
+        db: 데이터베이스 세션
+
+    Returns:
+        Optional[EmailOutbox]: 추가된 대기열 항목 (이메일 기능 비활성화 시 None)
+    """
+    if not email_service.enabled:
+        logger.info(f"[EMAIL] 이메일 발송 비활성화됨: {to_email} - {subject}")
+        return None
+
+    outbox = EmailOutbox(
+        to_email=to_email,
+        subject=subject,
+        body_text=body_text,
+        body_html=body_html,
+    )
+    db.add(outbox)
+    return outbox
+
+
+def send_consultation_matched_email(user_email: str, consultant_name: str, consultation_type: str, db: Session):
+    """상담 매칭 완료 알림 (발송 대기열에 추가)"""
     subject = "[easyK] 전문가 매칭 완료"
     body_text = f"""
 안녕하세요,
@@ -113,11 +197,13 @@ easyK 팀
     </body>
     </html>
     """
-    return email_service.send_email(user_email, subject, body_text, body_html)
+    return enqueue_email(user_email, subject, body_text, body_html, db)
 
 
-def send_consultation_accepted_email(user_email: str, consultant_name: str, scheduled_at: Optional[str] = None):
-    """상담 수락 알림"""
+def send_consultation_accepted_email(
+    user_email: str, consultant_name: str, scheduled_at: Optional[str] = None, db: Session = None
+):
+    """상담 수락 알림 (발송 대기열에 추가)"""
     subject = "[easyK] 상담 요청 수락"
     scheduled_info = f"\n예약 일시: {scheduled_at}" if scheduled_at else ""
     body_text = f"""
@@ -142,11 +228,11 @@ easyK 팀
     </body>
     </html>
     """
-    return email_service.send_email(user_email, subject, body_text, body_html)
+    return enqueue_email(user_email, subject, body_text, body_html, db)
 
 
-def send_consultation_rejected_email(user_email: str, consultant_name: str):
-    """상담 거절 알림 (다른 전문가 재추천)"""
+def send_consultation_rejected_email(user_email: str, consultant_name: str, db: Session):
+    """상담 거절 알림 (다른 전문가 재추천, 발송 대기열에 추가)"""
     subject = "[easyK] 상담 요청 처리 안내"
     body_text = f"""
 안녕하세요,
@@ -169,11 +255,11 @@ easyK 팀
     </body>
     </html>
     """
-    return email_service.send_email(user_email, subject, body_text, body_html)
+    return enqueue_email(user_email, subject, body_text, body_html, db)
 
 
-def send_payment_confirmation_email(user_email: str, amount: float, consultation_type: str):
-    """결제 완료 알림"""
+def send_payment_confirmation_email(user_email: str, amount: float, consultation_type: str, db: Session):
+    """결제 완료 알림 (발송 대기열에 추가)"""
     subject = "[easyK] 결제 완료"
     body_text = f"""
 안녕하세요,
@@ -199,7 +285,7 @@ easyK 팀
     </body>
     </html>
     """
-    return email_service.send_email(user_email, subject, body_text, body_html)
+    return enqueue_email(user_email, subject, body_text, body_html, db)
 
 
 def send_job_application_status_email(
@@ -208,8 +294,9 @@ def send_job_application_status_email(
     company_name: str,
     status: str,
     reviewer_comment: Optional[str] = None,
+    db: Session = None,
 ):
-    """일자리 지원 상태 변경 알림"""
+    """일자리 지원 상태 변경 알림 (발송 대기열에 추가)"""
     status_labels = {
         "accepted": "채용 확정",
         "rejected": "불합격",
@@ -244,4 +331,4 @@ easyK 팀
     </body>
     </html>
     """
-    return email_service.send_email(user_email, subject, body_text, body_html)
+    return enqueue_email(user_email, subject, body_text, body_html, db)
@@ -1,14 +1,32 @@
 """Government Support Service"""
 
-from typing import List, Optional
+from bisect import bisect_left, bisect_right
+from datetime import date
+from typing import Dict, FrozenSet, Iterable, List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import or_, and_
+from sqlalchemy import Select, or_, and_, func, select
 from uuid import UUID
 import json
+import threading
 
+from ..config import settings
 from ..models.government_support import GovernmentSupport
 from ..models.user import User
-from ..schemas.government_support import GovernmentSupportCreate, GovernmentSupportUpdate
+from ..schemas.government_support import (
+    GovernmentSupportCreate,
+    GovernmentSupportResponse,
+    GovernmentSupportUpdate,
+)
+from ..utils.cache import TTLCache
+from ..utils.response_cache import SUPPORTS_CACHE, catalog_cache, invalidate_on_commit
+
+
+# 지원 프로그램 생성/수정/삭제 커밋 시 목록 응답 캐시 무효화
+invalidate_on_commit(GovernmentSupport, SUPPORTS_CACHE)
+
+# 자격 확인 사유 (단건/일괄 확인 공용)
+ELIGIBILITY_CHECKED_REASON = "자격 확인 완료"
 
 
 def _sanitize_search_input(input_str: Optional[str], max_length: int = 100) -> Optional[str]:
@@ -35,57 +53,108 @@ def _sanitize_search_input(input_str: Optional[str], max_length: int = 100) -> O
     return sanitized
 
 
-def get_supports(
-    db: Session,
+def _build_supports_query(
     category: Optional[str] = None,
     keyword: Optional[str] = None,
-    limit: int = 20,
-    offset: int = 0,
-) -> tuple[List[GovernmentSupport], int]:
+) -> Select:
     """
-    정부 지원 프로그램 목록 조회
+    정부 지원 프로그램 목록 필터 쿼리 생성 (동기/비동기 조회 공용)
 
     Args:
-        db: 데이터베이스 세션
         category: 카테고리 필터 (optional)
         keyword: 검색 키워드 (optional)
-        limit: 조회할 최대 개수
-        offset: 조회 시작 위치 (pagination)
 
     Returns:
-        tuple[List[GovernmentSupport], int]: (지원 목록, 전체 개수)
+        Select: 필터가 적용된 쿼리 (정렬/페이지네이션 미적용)
     """
     # MEDIUM FIX: 입력 값 sanitization
     category = _sanitize_search_input(category, max_length=50)
     keyword = _sanitize_search_input(keyword)
 
     # 기본 필터: active 상태만 조회
-    query = db.query(GovernmentSupport).filter(GovernmentSupport.status == "active")
+    query = select(GovernmentSupport).where(GovernmentSupport.status == "active")
 
     # 카테고리 필터
     if category:
-        query = query.filter(GovernmentSupport.category == category)
+        query = query.where(GovernmentSupport.category == category)
 
     # 키워드 검색 (title 또는 description)
     if keyword:
         search_pattern = f"%{keyword}%"
-        query = query.filter(
+        query = query.where(
             or_(
                 GovernmentSupport.title.ilike(search_pattern),
                 GovernmentSupport.description.ilike(search_pattern),
             )
         )
 
-    # 전체 개수 (pagination 전)
-    total = query.count()
+    return query
+
+
+def _paginate_supports_query(query: Select, limit: int, offset: int) -> Select:
+    """최신순 정렬 및 페이지네이션 적용"""
+    return query.order_by(GovernmentSupport.created_at.desc()).offset(offset).limit(limit)
+
+
+def _count_query(query: Select) -> Select:
+    """필터 쿼리의 전체 개수 조회 쿼리 생성 (pagination 전)"""
+    return select(func.count()).select_from(query.order_by(None).subquery())
+
+
+def get_supports(
+    db: Session,
+    category: Optional[str] = None,
+    keyword: Optional[str] = None,
+    limit: int = 20,
+    offset: int = 0,
+) -> tuple[List[GovernmentSupport], int]:
+    """
+    정부 지원 프로그램 목록 조회
+
+    Args:
+        db: 데이터베이스 세션
+        category: 카테고리 필터 (optional)
+        keyword: 검색 키워드 (optional)
+        limit: 조회할 최대 개수
+        offset: 조회 시작 위치 (pagination)
 
-    # 정렬 (최신 순)
-    query = query.order_by(GovernmentSupport.created_at.desc())
+    Returns:
+        tuple[List[GovernmentSupport], int]: (지원 목록, 전체 개수)
+    """
+    query = _build_supports_query(category, keyword)
+
+    total = db.execute(_count_query(query)).scalar_one()
+    supports = db.execute(_paginate_supports_query(query, limit, offset)).scalars().all()
+
+    return list(supports), total
+
+
+async def get_supports_async(
+    db: AsyncSession,
+    category: Optional[str] = None,
+    keyword: Optional[str] = None,
+    limit: int = 20,
+    offset: int = 0,
+) -> tuple[List[GovernmentSupport], int]:
+    """
+    정부 지원 프로그램 목록 조회 (비동기 세션용, 동작은 get_supports와 동일)
+
+    Args:
+        db: 비동기 데이터베이스 세션
+        category: 카테고리 필터 (optional)
+        keyword: 검색 키워드 (optional)
+        limit: 조회할 최대 개수
+        offset: 조회 시작 위치 (pagination)
+
+    Returns:
+        tuple[List[GovernmentSupport], int]: (지원 목록, 전체 개수)
+    """
+    query = _build_supports_query(category, keyword)
 
-    # 페이지네이션
-    supports = query.offset(offset).limit(limit).all()
+    total = (await db.execute(_count_query(query))).scalar_one()
+    result = await db.execute(_paginate_supports_query(query, limit, offset))
 
-    return supports, total
+    return list(result.scalars().all()), total
 
 
 def get_support_by_id(db: Session, support_id: UUID) -> Optional[GovernmentSupport]:
@@ -102,6 +171,23 @@ def get_support_by_id(db: Session, support_id: UUID) -> Optional[GovernmentSuppo
     return db.query(GovernmentSupport).filter(GovernmentSupport.id == support_id).first()
 
 
+async def get_support_by_id_async(db: AsyncSession, support_id: UUID) -> Optional[GovernmentSupport]:
+    """
+    ID로 정부 지원 프로그램 조회 (비동기 세션용)
+
+    Args:
+        db: 비동기 데이터베이스 세션
+        support_id: 지원 프로그램 ID
+
+    Returns:
+        GovernmentSupport or None
+    """
+    result = await db.execute(
+        select(GovernmentSupport).where(GovernmentSupport.id == support_id)
+    )
+    return result.scalar_one_or_none()
+
+
 def create_support(
     support_data: GovernmentSupportCreate,
     db: Session,
@@ -248,11 +334,10 @@ def check_eligibility(
     eligible = True
 
     # 1. 비자 유형 확인 (가장 중요)
-    if eligible_visas and visa_type not in eligible_visas:
-        eligible = False
-        reasons.append(f"비자 종류 '{visa_type}'는 지원 대상이 아닙니다 (지원 가능 비자: {', '.join(eligible_visas)})")
-    elif eligible_visas and visa_type in eligible_visas:
-        reasons.append(f"비자 종류 '{visa_type}'는 지원 가능합니다")
+    if eligible_visas:
+        visa_eligible = visa_type in eligible_visas
+        eligible = visa_eligible
+        reasons.append(_visa_reason(visa_type, eligible_visas, visa_eligible))
 
     # 2. 나이 조건 확인 (eligibility 문자열에서 파싱)
     # TODO: eligibility 텍스트에서 나이 조건을 파싱하는 로직 추가 가능
@@ -267,17 +352,14 @@ def check_eligibility(
         reasons.append(f"현재 지원이 불가능한 상태입니다 (상태: {support.status})")
 
     # 5. 신청 기간 확인
-    if support.application_period_start or support.application_period_end:
-        from datetime import date
-        today = date.today()
-
-        if support.application_period_start and today < support.application_period_start:
-            eligible = False
-            reasons.append(f"신청 시작일({support.application_period_start})이 아직 도래하지 않았습니다")
+    today = date.today()
+    if support.application_period_start and today < support.application_period_start:
+        eligible = False
+        reasons.append(_not_started_reason(support.application_period_start))
 
-        if support.application_period_end and today > support.application_period_end:
-            eligible = False
-            reasons.append(f"신청 마감일({support.application_period_end})이 지났습니다")
+    if support.application_period_end and today > support.application_period_end:
+        eligible = False
+        reasons.append(_ended_reason(support.application_period_end))
 
     # 결과 메시지 생성
     if eligible:
@@ -288,8 +370,195 @@ def check_eligibility(
     return {
         "eligible": eligible,
         "message": message,
-        "reasons": reasons if reasons else ["자격 확인 완료"],
+        "reasons": reasons if reasons else [ELIGIBILITY_CHECKED_REASON],
         "support": support,
     }
 
 
+def _visa_reason(visa_type: str, eligible_visas: Iterable[str], eligible: bool) -> str:
+    """비자 유형 확인 사유"""
+    if eligible:
+        return f"비자 종류 '{visa_type}'는 지원 가능합니다"
+    return f"비자 종류 '{visa_type}'는 지원 대상이 아닙니다 (지원 가능 비자: {', '.join(eligible_visas)})"
+
+
+def _not_started_reason(start: date) -> str:
+    """신청 시작 전 사유"""
+    return f"신청 시작일({start})이 아직 도래하지 않았습니다"
+
+
+def _ended_reason(end: date) -> str:
+    """신청 마감 사유"""
+    return f"신청 마감일({end})이 지났습니다"
+
+
+class EligibilityMatrix:
+    """활성 지원 프로그램의 자격 조건을 미리 컴파일한 매트릭스
+
+    - 비자 유형 → 프로그램 ID 집합 (비자 제한이 없는 프로그램은 별도 집합)
+    - 신청 시작일/마감일 → 날짜순 정렬 목록 (기준일의 신청 전/마감 프로그램을 이진 탐색으로 조회)
+
+    eligible_visa_types JSON은 구성 시 한 번만 파싱합니다. 구성 후에는 변경하지 않으므로
+    여러 요청(스레드)에서 잠금 없이 공유합니다.
+    """
+
+    def __init__(self, supports: Iterable[GovernmentSupportResponse]):
+        """
+        Args:
+            supports: 활성 지원 프로그램 (응답 정렬 순서, 최신순)
+        """
+        self.supports: Dict[UUID, GovernmentSupportResponse] = {support.id: support for support in supports}
+        self.order: List[UUID] = list(self.supports)
+
+        visa_programs: Dict[str, set] = {}
+        open_to_all_visas = set()
+        starts, ends = [], []
+        for support in self.supports.values():
+            if support.eligible_visa_types:
+                for visa_type in support.eligible_visa_types:
+                    visa_programs.setdefault(visa_type, set()).add(support.id)
+            else:
+                open_to_all_visas.add(support.id)
+            if support.application_period_start:
+                starts.append((support.application_period_start, support.id))
+            if support.application_period_end:
+                ends.append((support.application_period_end, support.id))
+
+        self.visa_programs: Dict[str, FrozenSet[UUID]] = {
+            visa_type: frozenset(ids) for visa_type, ids in visa_programs.items()
+        }
+        self.open_to_all_visas: FrozenSet[UUID] = frozenset(open_to_all_visas)
+        starts.sort(key=lambda item: item[0])
+        ends.sort(key=lambda item: item[0])
+        self._start_dates = [start for start, _ in starts]
+        self._start_ids = [support_id for _, support_id in starts]
+        self._end_dates = [end for end, _ in ends]
+        self._end_ids = [support_id for _, support_id in ends]
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def visa_eligible(self, visa_type: str) -> FrozenSet[UUID]:
+        """비자 유형으로 신청 가능한 프로그램"""
+        return self.visa_programs.get(visa_type, frozenset()) | self.open_to_all_visas
+
+    def not_started(self, today: date) -> FrozenSet[UUID]:
+        """기준일에 신청 시작 전인 프로그램 (시작일 > 기준일)"""
+        return frozenset(self._start_ids[bisect_right(self._start_dates, today):])
+
+    def ended(self, today: date) -> FrozenSet[UUID]:
+        """기준일에 신청이 마감된 프로그램 (마감일 < 기준일)"""
+        return frozenset(self._end_ids[:bisect_left(self._end_dates, today)])
+
+    def evaluate(self, visa_type: str, today: date, eligible_only: bool = False) -> List[dict]:
+        """
+        모든 프로그램의 자격 확인 (check_eligibility와 같은 기준, 같은 사유 문구)
+
+        Args:
+            visa_type: 비자 종류
+            today: 기준일
+            eligible_only: 신청 가능한 프로그램만 반환
+
+        Returns:
+            List[dict]: 프로그램별 결과 (support, eligible, reasons), 신청 가능한 프로그램 먼저
+        """
+        visa_eligible = self.visa_eligible(visa_type)
+        not_started = self.not_started(today)
+        ended = self.ended(today)
+        blocked = not_started | ended
+
+        eligible_results, ineligible_results = [], []
+        for support_id in self.order:
+            eligible = support_id in visa_eligible and support_id not in blocked
+            if eligible_only and not eligible:
+                continue
+
+            support = self.supports[support_id]
+            reasons = []
+            if support.eligible_visa_types:
+                reasons.append(_visa_reason(visa_type, support.eligible_visa_types, support_id in visa_eligible))
+            if support_id in not_started:
+                reasons.append(_not_started_reason(support.application_period_start))
+            if support_id in ended:
+                reasons.append(_ended_reason(support.application_period_end))
+
+            result = {"support": support, "eligible": eligible, "reasons": reasons or [ELIGIBILITY_CHECKED_REASON]}
+            (eligible_results if eligible else ineligible_results).append(result)
+
+        return eligible_results + ineligible_results
+
+
+# 자격 매트릭스 캐시: (지원 프로그램 캐시 버전, 매트릭스)
+# 지원 프로그램 변경 커밋 시 버전이 올라가 다음 요청에서 재구성됩니다 (invalidate_on_commit).
+# ORM을 거치지 않은 변경(대량 시딩 등)은 TTL 만료 후 반영됩니다.
+_eligibility_matrix_cache = TTLCache(max_size=1, ttl_seconds=settings.ELIGIBILITY_MATRIX_TTL_SECONDS)
+_eligibility_matrix_lock = threading.Lock()
+
+
+def get_eligibility_matrix(db: Session) -> EligibilityMatrix:
+    """
+    현재 활성 지원 프로그램의 자격 매트릭스 조회 (변경되었으면 재구성)
+
+    Args:
+        db: 데이터베이스 세션
+
+    Returns:
+        EligibilityMatrix: 자격 매트릭스
+    """
+    # 버전은 DB 조회 전에 읽음 (조회 중 변경되면 다음 요청에서 다시 구성)
+    version = catalog_cache.backend.get_version(SUPPORTS_CACHE)
+    cached = _eligibility_matrix_cache.get("matrix")
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    # 동시에 들어온 요청이 각자 재구성하지 않도록 잠금
+    with _eligibility_matrix_lock:
+        cached = _eligibility_matrix_cache.get("matrix")
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        supports = db.execute(
+            select(GovernmentSupport)
+            .where(GovernmentSupport.status == "active")
+            .order_by(GovernmentSupport.created_at.desc())
+        ).scalars().all()
+        matrix = EligibilityMatrix(GovernmentSupportResponse.model_validate(support) for support in supports)
+        _eligibility_matrix_cache.set("matrix", (version, matrix))
+        return matrix
+
+
+def check_eligibility_batch(
+    visa_type: str,
+    age: Optional[int],
+    residence_location: Optional[str],
+    employment_status: Optional[str],
+    db: Session,
+    eligible_only: bool = False,
+) -> dict:
+    """
+    모든 활성 정부 지원 프로그램의 자격 일괄 확인
+
+    check_eligibility와 같은 기준(비자 유형, 신청 기간)으로 확인합니다.
+    나이/거주 지역/고용 상태는 단건 확인과 마찬가지로 아직 구조화된 조건이 없어 평가하지 않습니다.
+
+    Args:
+        visa_type: 비자 종류
+        age: 나이 (optional)
+        residence_location: 거주 지역 (optional)
+        employment_status: 고용 상태 (optional)
+        db: 데이터베이스 세션
+        eligible_only: 신청 가능한 프로그램만 반환
+
+    Returns:
+        dict: 확인한 프로그램 수(total), 신청 가능 수(eligible_count), 프로그램별 결과(results)
+    """
+    matrix = get_eligibility_matrix(db)
+    results = matrix.evaluate(visa_type, date.today(), eligible_only=eligible_only)
+
+    return {
+        "total": len(matrix),
+        "eligible_count": sum(1 for result in results if result["eligible"]),
+        "results": results,
+    }
+
+
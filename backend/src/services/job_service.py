@@ -1,12 +1,27 @@
 """Job Service"""
 
-from typing import List, Optional
+import re
+from typing import Collection, List, Optional, Set, Tuple
 from uuid import UUID
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import or_, func
+from sqlalchemy import Select, exists, or_, func, column, literal_column, select, table, tuple_
 
-from ..models.job import Job
+from ..models.job import Job, JOB_SEARCH_COLUMNS
 from ..models.job_application import JobApplication
+from ..models.saved_job import SavedJob
+from ..schemas.user import Principal
+from ..utils.response_cache import JOBS_CACHE, invalidate_on_commit
+
+
+# 검색어 토큰 추출 (한글 포함 단어 문자만 허용 → tsquery/FTS5 구문 주입 방지)
+_SEARCH_TOKEN_PATTERN = re.compile(r"\w+")
+
+# SQLite FTS5 가상 테이블 (models/job.py에서 생성)
+_jobs_fts = table("jobs_fts", column("job_id"))
+
+# 일자리 생성/수정/삭제 커밋 시 목록 응답 캐시 무효화
+invalidate_on_commit(Job, JOBS_CACHE)
 
 
 def _sanitize_search_input(input_str: Optional[str], max_length: int = 100) -> Optional[str]:
@@ -33,57 +48,254 @@ def _sanitize_search_input(input_str: Optional[str], max_length: int = 100) -> O
     return sanitized
 
 
-def get_jobs(
-    db: Session,
+def _extract_search_tokens(keyword: str, max_tokens: int = 10) -> List[str]:
+    """
+    검색어를 전문 검색용 토큰 목록으로 변환
+
+    Args:
+        keyword: 정제된 검색어
+        max_tokens: 최대 토큰 수
+
+    Returns:
+        List[str]: 토큰 목록
+    """
+    return _SEARCH_TOKEN_PATTERN.findall(keyword)[:max_tokens]
+
+
+def _apply_keyword_search(query: Select, keyword: str, dialect_name: str) -> Select:
+    """
+    키워드 전문 검색 필터 및 관련도 정렬 적용
+
+    검색 대상: position, company_name, description, requirements, benefits
+    - PostgreSQL: search_vector(tsvector, GIN 인덱스) + ts_rank_cd 관련도 정렬
+    - SQLite: FTS5 가상 테이블(jobs_fts) + bm25 관련도 정렬
+    - 그 외: LIKE 검색 (관련도 정렬 없음)
+
+    각 토큰은 접두어 검색으로 처리되며, 모든 토큰이 포함된 일자리만 반환합니다.
+
+    Args:
+        query: 기본 쿼리
+        keyword: 정제된 검색어
+        dialect_name: 데이터베이스 dialect 이름
+
+    Returns:
+        Select: 검색 필터와 관련도 정렬이 적용된 쿼리
+    """
+    tokens = _extract_search_tokens(keyword)
+    if not tokens:
+        return query
+
+    if dialect_name == "postgresql":
+        ts_query = func.to_tsquery("simple", " & ".join(f"{token}:*" for token in tokens))
+        search_vector = literal_column("jobs.search_vector")
+        return query.filter(search_vector.op("@@")(ts_query)).order_by(
+            func.ts_rank_cd(search_vector, ts_query).desc()
+        )
+
+    if dialect_name == "sqlite":
+        match_expression = " ".join(f'"{token}"*' for token in tokens)
+        fts_table = literal_column("jobs_fts")
+        # bm25 가중치: job_id(미색인), position, company_name, description, requirements, benefits
+        rank = func.bm25(fts_table, 0.0, 10.0, 10.0, 4.0, 2.0, 2.0)
+        return query.join(_jobs_fts, _jobs_fts.c.job_id == Job.id).filter(
+            fts_table.op("MATCH")(match_expression)
+        ).order_by(rank)
+
+    # Fallback: 전문 검색 미지원 데이터베이스
+    search_columns = [getattr(Job, column_name) for column_name in JOB_SEARCH_COLUMNS]
+    for token in tokens:
+        query = query.filter(or_(*(search_column.contains(token) for search_column in search_columns)))
+    return query
+
+
+def _build_jobs_query(
+    dialect_name: str,
     location: Optional[str] = None,
     employment_type: Optional[str] = None,
     keyword: Optional[str] = None,
     limit: int = 20,
     offset: int = 0,
-) -> List[Job]:
+    cursor: Optional[str] = None,
+) -> Select:
     """
-    일자리 목록 조회 (필터링, 검색, 페이지네이션)
+    일자리 목록 조회 쿼리 생성 (동기/비동기 조회 공용)
 
     Args:
-        db: 데이터베이스 세션
+        dialect_name: 데이터베이스 dialect 이름 (전문 검색 방식 선택)
         location: 지역 필터 (optional)
         employment_type: 고용 형태 필터 (optional)
-        keyword: 키워드 검색 (position, company_name) (optional)
-        limit: 조회할 최대 개수 (기본값: 20)
-        offset: 건너뛸 개수 (기본값: 0)
+        keyword: 키워드 전문 검색 (optional)
+        limit: 조회할 최대 개수
+        offset: 건너뛸 개수
+        cursor: 이전 페이지의 다음 페이지 커서 (optional)
 
     Returns:
-        List[Job]: 일자리 목록 (active 상태만, 최신순 정렬)
+        Select: 일자리 목록 조회 쿼리
+
+    Raises:
+        HTTPException: 커서가 유효하지 않거나 키워드 검색과 함께 사용된 경우 400 에러
     """
+    from fastapi import HTTPException, status
+    from ..utils.pagination import decode_cursor
+
     # MEDIUM FIX: 입력 값 sanitization
     location = _sanitize_search_input(location)
     employment_type = _sanitize_search_input(employment_type, max_length=50)
     keyword = _sanitize_search_input(keyword)
 
     # 기본 쿼리: active 상태만 조회
-    query = db.query(Job).filter(Job.status == "active")
+    query = select(Job).where(Job.status == "active")
 
     # 지역 필터
     if location:
-        query = query.filter(Job.location.contains(location))
+        query = query.where(Job.location.contains(location))
 
     # 고용 형태 필터
     if employment_type:
-        query = query.filter(Job.employment_type == employment_type)
+        query = query.where(Job.employment_type == employment_type)
 
-    # 키워드 검색 (position, company_name)
+    # 키워드 전문 검색 (관련도순 정렬)
     if keyword:
-        query = query.filter(
-            or_(
-                Job.position.contains(keyword),
-                Job.company_name.contains(keyword),
+        if cursor:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Cursor pagination is not supported with keyword search"
             )
-        )
+        query = _apply_keyword_search(query, keyword, dialect_name)
+
+    # keyset 페이지네이션: 커서 (created_at, id) 이후 항목만 조회
+    if cursor:
+        try:
+            cursor_created_at, cursor_id = decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor"
+            )
+        query = query.where(tuple_(Job.created_at, Job.id) < (cursor_created_at, cursor_id))
+        offset = 0
+
+    # 최신순 정렬 (키워드 검색 시 동일 관련도 내 정렬, id로 순서 고정) 및 페이지네이션
+    return query.order_by(Job.created_at.desc(), Job.id.desc()).offset(offset).limit(limit)
+
+
+def get_jobs(
+    db: Session,
+    location: Optional[str] = None,
+    employment_type: Optional[str] = None,
+    keyword: Optional[str] = None,
+    limit: int = 20,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+) -> List[Job]:
+    """
+    일자리 목록 조회 (필터링, 검색, 페이지네이션)
+
+    cursor가 주어지면 (created_at, id) 기준 keyset 페이지네이션을 사용하여
+    offset 없이 상수 시간에 다음 페이지를 조회합니다 (offset은 무시됨).
+    키워드 검색은 관련도순 정렬이므로 offset 페이지네이션만 지원합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        location: 지역 필터 (optional)
+        employment_type: 고용 형태 필터 (optional)
+        keyword: 키워드 전문 검색 (position, company_name, description, requirements, benefits) (optional)
+        limit: 조회할 최대 개수 (기본값: 20)
+        offset: 건너뛸 개수 (기본값: 0)
+        cursor: 이전 페이지의 다음 페이지 커서 (optional)
+
+    Returns:
+        List[Job]: 일자리 목록 (active 상태만, 키워드 검색 시 관련도순, 그 외 최신순 정렬)
+
+    Raises:
+        HTTPException: 커서가 유효하지 않거나 키워드 검색과 함께 사용된 경우 400 에러
+    """
+    query = _build_jobs_query(
+        db.get_bind().dialect.name, location, employment_type, keyword, limit, offset, cursor
+    )
+    return list(db.execute(query).scalars().all())
+
+
+async def get_jobs_async(
+    db: AsyncSession,
+    location: Optional[str] = None,
+    employment_type: Optional[str] = None,
+    keyword: Optional[str] = None,
+    limit: int = 20,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+) -> List[Job]:
+    """
+    일자리 목록 조회 (비동기 세션용, 동작은 get_jobs와 동일)
+
+    Args:
+        db: 비동기 데이터베이스 세션
+        location: 지역 필터 (optional)
+        employment_type: 고용 형태 필터 (optional)
+        keyword: 키워드 전문 검색 (optional)
+        limit: 조회할 최대 개수 (기본값: 20)
+        offset: 건너뛸 개수 (기본값: 0)
+        cursor: 이전 페이지의 다음 페이지 커서 (optional)
+
+    Returns:
+        List[Job]: 일자리 목록
 
-    # 최신순 정렬 및 페이지네이션
-    jobs = query.order_by(Job.created_at.desc()).offset(offset).limit(limit).all()
+    Raises:
+        HTTPException: 커서가 유효하지 않거나 키워드 검색과 함께 사용된 경우 400 에러
+    """
+    query = _build_jobs_query(
+        db.get_bind().dialect.name, location, employment_type, keyword, limit, offset, cursor
+    )
+    result = await db.execute(query)
+    return list(result.scalars().all())
 
-    return jobs
+
+def _job_user_flags_queries(job_ids: Collection[UUID], user_id: UUID) -> Tuple[Select, Select]:
+    """일자리 목록의 저장/지원 여부 조회 쿼리 생성 (페이지 전체에 대해 IN 쿼리 각 1회)"""
+    saved_query = select(SavedJob.job_id).where(
+        SavedJob.user_id == user_id,
+        SavedJob.job_id.in_(job_ids),
+    )
+    applied_query = select(JobApplication.job_id).where(
+        JobApplication.user_id == user_id,
+        JobApplication.job_id.in_(job_ids),
+    )
+    return saved_query, applied_query
+
+
+async def get_job_user_flags_async(
+    job_ids: Collection[UUID],
+    user_id: UUID,
+    db: AsyncSession,
+) -> Tuple[Set[UUID], Set[UUID]]:
+    """
+    일자리 목록에 대한 사용자의 저장/지원 여부 일괄 조회
+
+    Args:
+        job_ids: 일자리 ID 목록 (현재 페이지)
+        user_id: 현재 사용자 ID
+        db: 비동기 데이터베이스 세션
+
+    Returns:
+        Tuple[Set[UUID], Set[UUID]]: (저장한 일자리 ID, 지원한 일자리 ID)
+    """
+    if not job_ids:
+        return set(), set()
+
+    saved_query, applied_query = _job_user_flags_queries(job_ids, user_id)
+    saved_ids = set((await db.execute(saved_query)).scalars())
+    applied_ids = set((await db.execute(applied_query)).scalars())
+    return saved_ids, applied_ids
+
+
+def _has_applied_query(job_id: UUID, user_id: UUID) -> Select:
+    """사용자의 일자리 지원 여부 조회 쿼리 생성"""
+    return select(
+        exists().where(
+            JobApplication.job_id == job_id,
+            JobApplication.user_id == user_id,
+        )
+    )
 
 
 def get_job_detail(
@@ -108,7 +320,7 @@ def get_job_detail(
     from fastapi import HTTPException, status
 
     # 일자리 조회
-    job = db.query(Job).filter(Job.id == job_id).first()
+    job = db.execute(select(Job).where(Job.id == job_id)).scalar_one_or_none()
 
     if not job:
         raise HTTPException(
@@ -119,10 +331,46 @@ def get_job_detail(
     # 지원 여부 확인 (비로그인 사용자는 False)
     has_applied = False
     if user_id:
-        has_applied = db.query(JobApplication).filter(
-            JobApplication.job_id == job_id,
-            JobApplication.user_id == user_id,
-        ).first() is not None
+        has_applied = bool(db.execute(_has_applied_query(job_id, user_id)).scalar())
+
+    return job, has_applied
+
+
+async def get_job_detail_async(
+    job_id: UUID,
+    user_id: Optional[UUID],
+    db: AsyncSession,
+) -> tuple[Job, bool]:
+    """
+    일자리 상세 조회 (비동기 세션용, 동작은 get_job_detail과 동일)
+
+    Args:
+        job_id: 일자리 ID
+        user_id: 현재 사용자 ID (None이면 비로그인 사용자)
+        db: 비동기 데이터베이스 세션
+
+    Returns:
+        tuple[Job, bool]: (일자리 객체, 지원 여부)
+
+    Raises:
+        HTTPException: 일자리를 찾을 수 없을 때 404 에러
+    """
+    from fastapi import HTTPException, status
+
+    # 일자리 조회
+    result = await db.execute(select(Job).where(Job.id == job_id))
+    job = result.scalar_one_or_none()
+
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found"
+        )
+
+    # 지원 여부 확인 (비로그인 사용자는 False)
+    has_applied = False
+    if user_id:
+        has_applied = bool((await db.execute(_has_applied_query(job_id, user_id))).scalar())
 
     return job, has_applied
 
@@ -208,7 +456,7 @@ def apply_to_job(
 
 def create_job(
     job_data: "JobCreate",
-    user_id: UUID,
+    principal: Principal,
     db: Session,
 ) -> Job:
     """
@@ -216,23 +464,22 @@ def create_job(
 
     Args:
         job_data: 일자리 생성 데이터
-        user_id: 생성하는 사용자 ID (admin)
+        principal: 생성하는 인증 주체 (admin/agency)
         db: 데이터베이스 세션
 
     Returns:
         Job: 생성된 일자리
 
     Raises:
-        HTTPException: 권한이 없을 때 403 에러
+        HTTPException: 권한이 없을 때 403 에러, 토큰의 사용자가 삭제되었을 때 401 에러
     """
     from fastapi import HTTPException, status
+    from sqlalchemy.exc import IntegrityError
     from ..models.user import User
     import json
 
-    # 사용자 조회 및 권한 검증
-    user = db.query(User).filter(User.id == user_id).first()
-
-    if not user or user.role not in ["admin", "agency"]:
+    # 권한 검증 (토큰 클레임 기준, 사용자 조회 없음)
+    if principal.role not in ["admin", "agency"]:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin or Agency access required"
@@ -243,7 +490,7 @@ def create_job(
 
     # 일자리 생성
     new_job = Job(
-        posted_by=user_id,
+        posted_by=principal.id,
         position=job_data.position,
         company_name=job_data.company_name,
         company_phone=job_data.company_phone,
@@ -265,6 +512,16 @@ def create_job(
     try:
         db.commit()
         db.refresh(new_job)
+    except IntegrityError:
+        db.rollback()
+        # 클레임만으로 인증했으므로 삭제된 사용자의 토큰은 posted_by 외래 키 위반으로 드러남
+        if db.get(User, principal.id) is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="User not found",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        raise
     except Exception as e:
         db.rollback()
         import logging
@@ -281,7 +538,7 @@ def create_job(
 def update_job(
     job_id: UUID,
     job_data: "JobUpdate",
-    user_id: UUID,
+    principal: Principal,
     db: Session,
 ) -> Job:
     """
@@ -290,7 +547,7 @@ def update_job(
     Args:
         job_id: 일자리 ID
         job_data: 수정할 데이터
-        user_id: 수정하는 사용자 ID (admin)
+        principal: 수정하는 인증 주체 (admin/agency)
         db: 데이터베이스 세션
 
     Returns:
@@ -300,13 +557,10 @@ def update_job(
         HTTPException: 일자리를 찾을 수 없거나 권한이 없을 때 에러
     """
     from fastapi import HTTPException, status
-    from ..models.user import User
     import json
 
-    # 사용자 조회 및 권한 검증
-    user = db.query(User).filter(User.id == user_id).first()
-
-    if not user or user.role not in ["admin", "agency"]:
+    # 권한 검증 (토큰 클레임 기준, 사용자 조회 없음)
+    if principal.role not in ["admin", "agency"]:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin or Agency access required"
@@ -341,7 +595,7 @@ def update_job(
 
 def delete_job(
     job_id: UUID,
-    user_id: UUID,
+    principal: Principal,
     db: Session,
 ) -> None:
     """
@@ -349,19 +603,16 @@ def delete_job(
 
     Args:
         job_id: 일자리 ID
-        user_id: 삭제하는 사용자 ID (admin)
+        principal: 삭제하는 인증 주체 (admin/agency)
         db: 데이터베이스 세션
 
     Raises:
         HTTPException: 일자리를 찾을 수 없거나 권한이 없을 때 에러
     """
     from fastapi import HTTPException, status
-    from ..models.user import User
-
-    # 사용자 조회 및 권한 검증
-    user = db.query(User).filter(User.id == user_id).first()
 
-    if not user or user.role not in ["admin", "agency"]:
+    # 권한 검증 (토큰 클레임 기준, 사용자 조회 없음)
+    if principal.role not in ["admin", "agency"]:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin or Agency access required"
@@ -383,7 +634,7 @@ def delete_job(
 
 def get_job_applications(
     job_id: UUID,
-    user_id: UUID,
+    principal: Principal,
     status: Optional[str],
     db: Session,
 ) -> list[tuple["JobApplication", "User"]]:
@@ -392,7 +643,7 @@ def get_job_applications(
 
     Args:
         job_id: 일자리 ID
-        user_id: 조회하는 사용자 ID (admin)
+        principal: 조회하는 인증 주체 (admin/agency)
         status: 지원 상태 필터 (optional)
         db: 데이터베이스 세션
 
@@ -406,10 +657,8 @@ def get_job_applications(
     from ..models.user import User
     from sqlalchemy.orm import joinedload
 
-    # 사용자 조회 및 권한 검증
-    user = db.query(User).filter(User.id == user_id).first()
-
-    if not user or user.role not in ["admin", "agency"]:
+    # 권한 검증 (토큰 클레임 기준, 사용자 조회 없음)
+    if principal.role not in ["admin", "agency"]:
         raise HTTPException(
             status_code=http_status.HTTP_403_FORBIDDEN,
             detail="Admin or Agency access required"
@@ -442,7 +691,7 @@ def get_job_applications(
 def update_job_application_status(
     application_id: UUID,
     status_update: "JobApplicationStatusUpdate",
-    user_id: UUID,
+    principal: Principal,
     db: Session,
 ) -> "JobApplication":
     """
@@ -451,7 +700,7 @@ def update_job_application_status(
     Args:
         application_id: 지원 내역 ID
         status_update: 상태 업데이트 데이터
-        user_id: 업데이트하는 사용자 ID (admin)
+        principal: 업데이트하는 인증 주체 (admin/agency)
         db: 데이터베이스 세션
 
     Returns:
@@ -461,13 +710,10 @@ def update_job_application_status(
         HTTPException: 지원 내역을 찾을 수 없거나 권한이 없을 때 에러
     """
     from fastapi import HTTPException, status as http_status
-    from ..models.user import User
     from datetime import datetime
 
-    # 사용자 조회 및 권한 검증
-    user = db.query(User).filter(User.id == user_id).first()
-
-    if not user or user.role not in ["admin", "agency"]:
+    # 권한 검증 (토큰 클레임 기준, 사용자 조회 없음)
+    if principal.role not in ["admin", "agency"]:
         raise HTTPException(
             status_code=http_status.HTTP_403_FORBIDDEN,
             detail="Admin or Agency access required"
@@ -497,10 +743,7 @@ def update_job_application_status(
     application.reviewer_comment = status_update.reviewer_comment
     application.reviewed_at = datetime.utcnow()
 
-    db.commit()
-    db.refresh(application)
-
-    # 이메일 알림 발송 (accepted/rejected 시)
+    # 이메일 알림 발송 대기열 추가 (accepted/rejected 시, 상태 변경과 같은 트랜잭션)
     if status_update.status in ["accepted", "rejected"]:
         from ..models.user import User
         applicant = db.query(User).filter(User.id == application.user_id).first()
@@ -508,18 +751,17 @@ def update_job_application_status(
 
         if applicant and applicant.email and job:
             from .email_service import send_job_application_status_email
-            try:
-                send_job_application_status_email(
-                    applicant.email,
-                    job.position,
-                    job.company_name,
-                    status_update.status,
-                    status_update.reviewer_comment,
-                )
-            except Exception as e:
-                import logging
-                logger = logging.getLogger(__name__)
-                logger.error(f"Failed to send job application status email: {e}")
+            send_job_application_status_email(
+                applicant.email,
+                job.position,
+                job.company_name,
+                status_update.status,
+                status_update.reviewer_comment,
+                db,
+            )
+
+    db.commit()
+    db.refresh(application)
 
     return application
 
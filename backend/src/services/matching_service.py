@@ -2,70 +2,227 @@
 
 import json
 import logging
-from typing import Optional
+from datetime import datetime, time, timedelta, timezone
+from typing import Collection, Dict, List, Optional, Tuple
+from uuid import UUID
+from zoneinfo import ZoneInfo
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, cast, Text
+from sqlalchemy import func
 
+from ..config import settings
 from ..models.consultant import Consultant
+from ..models.consultant_specialty import ConsultantSpecialty
+from ..models.consultation import Consultation
 
 logger = logging.getLogger(__name__)
 
+# 오늘의 상담 부하로 집계하는 상태
+OPEN_CONSULTATION_STATUSES = ["matched", "scheduled"]
 
-def find_matching_consultant(db: Session, consultation_type: str) -> Optional[Consultant]:
+# 점수 가중치 (평점 / 남은 수용량 / 가용 시간)
+RATING_WEIGHT = 0.5
+CAPACITY_WEIGHT = 0.3
+AVAILABILITY_WEIGHT = 0.2
+
+# 가용 시간 점수: 지금 상담 가능 / 오늘 근무(현재 시간 외) 또는 정보 없음 / 오늘 휴무
+AVAILABLE_NOW_SCORE = 1.0
+AVAILABLE_TODAY_SCORE = 0.5
+UNAVAILABLE_TODAY_SCORE = 0.0
+
+WEEKDAY_KEYS = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
+
+# 기본 최대 상담 수 (max_consultations_per_day가 비어 있는 경우)
+DEFAULT_MAX_CONSULTATIONS_PER_DAY = 5
+
+
+def parse_availability(availability: Optional[str]) -> Optional[Dict[int, List[Tuple[time, time]]]]:
+    """
+    가용 시간 JSON 파싱
+
+    형식: {"mon": "09:00-18:00", "tue": "09:00-12:00,13:00-18:00", "sat": ["10:00-14:00"]}
+    명시되지 않은 요일은 휴무로 간주합니다.
+
+    Args:
+        availability: 가용 시간 JSON 문자열
+
+    Returns:
+        Optional[Dict[int, List[Tuple[time, time]]]]: 요일(월=0) -> 시간대 목록
+            비어 있거나 JSON 형식이 아니면 None (가용 시간 정보 없음)
+    """
+    if not availability:
+        return None
+
+    try:
+        data = json.loads(availability)
+    except (json.JSONDecodeError, TypeError):
+        return None
+    if not isinstance(data, dict):
+        return None
+
+    windows: Dict[int, List[Tuple[time, time]]] = {}
+    try:
+        for day, ranges in data.items():
+            weekday = WEEKDAY_KEYS.index(day.strip().lower()[:3])
+            if isinstance(ranges, str):
+                ranges = ranges.split(",")
+            for time_range in ranges:
+                start, end = time_range.split("-")
+                windows.setdefault(weekday, []).append(
+                    (time.fromisoformat(start.strip()), time.fromisoformat(end.strip()))
+                )
+    except (ValueError, AttributeError, TypeError):
+        logger.warning(f"Invalid consultant availability: {availability}")
+        return None
+
+    return windows
+
+
+def get_availability_score(
+    windows: Optional[Dict[int, List[Tuple[time, time]]]],
+    now: datetime,
+) -> float:
+    """
+    가용 시간 점수 계산
+
+    Args:
+        windows: parse_availability() 결과
+        now: 현재 시각 (서비스 시간대)
+
+    Returns:
+        float: 지금 상담 가능 1.0, 오늘 근무하지만 현재 시간 외이거나 정보 없음 0.5, 오늘 휴무 0.0
+    """
+    if windows is None:
+        return AVAILABLE_TODAY_SCORE
+
+    today_windows = windows.get(now.weekday())
+    if not today_windows:
+        return UNAVAILABLE_TODAY_SCORE
+
+    current = now.time()
+    if any(start <= current < end for start, end in today_windows):
+        return AVAILABLE_NOW_SCORE
+    return AVAILABLE_TODAY_SCORE
+
+
+def get_max_consultations_per_day(consultant: Consultant) -> int:
+    """전문가의 하루 최대 상담 수 (비어 있으면 기본값)"""
+    if consultant.max_consultations_per_day is None:
+        return DEFAULT_MAX_CONSULTATIONS_PER_DAY
+    return consultant.max_consultations_per_day
+
+
+def _get_today_range(now: datetime) -> Tuple[datetime, datetime]:
+    """서비스 시간대 기준 오늘의 시작/끝 (UTC)"""
+    start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    end = start + timedelta(days=1)
+    return start.astimezone(timezone.utc), end.astimezone(timezone.utc)
+
+
+def rank_consultants(
+    db: Session,
+    consultation_type: str,
+    exclude_consultant_ids: Optional[Collection[UUID]] = None,
+    now: Optional[datetime] = None,
+) -> List[Tuple[Consultant, float, int]]:
+    """
+    상담 유형에 맞는 전문가 후보를 점수 순으로 조회 (쿼리 1회)
+
+    후보별 오늘의 상담 부하(matched + scheduled)는 집계 서브쿼리로 함께 조회하므로
+    후보 수와 관계없이 쿼리 수가 일정합니다.
+
+    점수 = 평점(0~5 정규화) * 0.5 + 남은 수용량 비율 * 0.3 + 가용 시간 점수 * 0.2
+
+    Args:
+        db: 데이터베이스 세션
+        consultation_type: 상담 유형 (visa, labor, contract, business, other)
+        exclude_consultant_ids: 제외할 전문가 ID 목록 (optional)
+        now: 기준 시각 (기본값: 현재 시각, 서비스 시간대)
+
+    Returns:
+        List[Tuple[Consultant, float, int]]: (전문가, 점수, 오늘의 상담 수) 목록 (점수 높은 순)
+            오늘 최대 상담 수에 도달한 전문가는 제외
+    """
+    tz = ZoneInfo(settings.SERVICE_TIMEZONE)
+    now = now.astimezone(tz) if now else datetime.now(tz)
+    today_start, today_end = _get_today_range(now)
+
+    # 오늘의 상담 부하: 오늘 예약된 상담 + (예약 전) 오늘 매칭된 상담
+    # 재매칭된 상담은 신청일(created_at)이 과거이므로 매칭 시각 기준으로 집계
+    # (matched_at이 없는 마이그레이션 이전 행만 신청일 사용)
+    load_date = func.coalesce(Consultation.scheduled_at, Consultation.matched_at, Consultation.created_at)
+    open_load = db.query(
+        Consultation.consultant_id.label("consultant_id"),
+        func.count(Consultation.id).label("open_count"),
+    ).filter(
+        Consultation.consultant_id.isnot(None),
+        Consultation.status.in_(OPEN_CONSULTATION_STATUSES),
+        load_date >= today_start,
+        load_date < today_end,
+    ).group_by(
+        Consultation.consultant_id
+    ).subquery()
+
+    # 전문 분야 인덱스(consultant_specialties)로 후보만 조회
+    query = db.query(
+        Consultant,
+        func.coalesce(open_load.c.open_count, 0),
+    ).join(
+        ConsultantSpecialty, ConsultantSpecialty.consultant_id == Consultant.id
+    ).outerjoin(
+        open_load, open_load.c.consultant_id == Consultant.id
+    ).filter(
+        ConsultantSpecialty.specialty == consultation_type,
+        Consultant.is_active == True,
+        Consultant.is_verified == True,
+    )
+    if exclude_consultant_ids:
+        query = query.filter(Consultant.id.notin_(list(exclude_consultant_ids)))
+
+    ranked = []
+    for position, (consultant, open_count) in enumerate(query.order_by(Consultant.created_at, Consultant.id)):
+        max_per_day = get_max_consultations_per_day(consultant)
+        if open_count >= max_per_day:
+            continue
+
+        rating = float(consultant.average_rating or 0) / 5
+        remaining_capacity = 1 - open_count / max_per_day
+        availability = get_availability_score(parse_availability(consultant.availability), now)
+        score = (
+            RATING_WEIGHT * rating
+            + CAPACITY_WEIGHT * remaining_capacity
+            + AVAILABILITY_WEIGHT * availability
+        )
+        ranked.append((consultant, score, open_count, position))
+
+    # 점수가 같으면 부하가 적은 전문가, 그다음 먼저 등록된 전문가
+    ranked.sort(key=lambda item: (-item[1], item[2], item[3]))
+    return [(consultant, score, open_count) for consultant, score, open_count, _ in ranked]
+
+
+def find_matching_consultant(
+    db: Session,
+    consultation_type: str,
+    exclude_consultant_ids: Optional[Collection[UUID]] = None,
+    now: Optional[datetime] = None,
+) -> Optional[Consultant]:
     """
     상담 유형에 맞는 전문가를 찾아 반환
 
     Args:
         db: 데이터베이스 세션
         consultation_type: 상담 유형 (visa, labor, contract, business, other)
+        exclude_consultant_ids: 제외할 전문가 ID 목록 (optional)
+        now: 기준 시각 (기본값: 현재 시각)
 
     Returns:
         Optional[Consultant]: 매칭된 전문가 (없으면 None)
 
     매칭 로직:
         1. is_active=True, is_verified=True인 전문가만 대상
-        2. specialties 배열에 consultation_type이 포함된 전문가 필터링
-        3. average_rating 높은 순으로 정렬
-        4. 첫 번째 전문가 반환
+        2. 전문 분야 인덱스(consultant_specialties)로 consultation_type 전문가 조회
+        3. 오늘 상담 수가 max_consultations_per_day에 도달한 전문가 제외
+        4. 평점, 남은 수용량, 가용 시간(availability)으로 점수를 매겨
+           가장 높은 전문가 반환 (부하가 분산됨)
     """
-    # HIGH FIX: N+1 쿼리 최적화 - SQL 레벨에서 필터링
-    # PostgreSQL/SQLite 모두 지원하는 LIKE 검색 사용
-    # JSON 배열 내 검색: specialties LIKE '%"consultation_type"%'
-    search_pattern = f'%"{consultation_type}"%'
-
-    try:
-        # 데이터베이스에서 직접 필터링 (N+1 해결)
-        consultant = db.query(Consultant).filter(
-            Consultant.is_active == True,
-            Consultant.is_verified == True,
-            cast(Consultant.specialties, Text).like(search_pattern)
-        ).order_by(
-            desc(Consultant.average_rating)
-        ).first()
-
-        return consultant
-
-    except Exception as e:
-        # 데이터베이스 특화 기능 사용 실패 시 fallback
-        logger.warning(f"Database-level JSON filtering failed, using fallback: {e}")
-
-        # Fallback: 기존 Python 필터링 방식 (호환성 보장)
-        consultants = db.query(Consultant).filter(
-            Consultant.is_active == True,
-            Consultant.is_verified == True
-        ).all()
-
-        matching_consultants = []
-        for consultant in consultants:
-            try:
-                specialties = json.loads(consultant.specialties)
-                if consultation_type in specialties:
-                    matching_consultants.append(consultant)
-            except (json.JSONDecodeError, TypeError):
-                continue
-
-        if not matching_consultants:
-            return None
-
-        matching_consultants.sort(key=lambda c: c.average_rating, reverse=True)
-        return matching_consultants[0]
+    ranked = rank_consultants(db, consultation_type, exclude_consultant_ids, now)
+    return ranked[0][0] if ranked else None
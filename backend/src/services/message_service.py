@@ -1,43 +1,272 @@
 """Message Service"""
 
-from typing import List, Optional
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import case, func
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
 from uuid import UUID
 
 from ..models.message import Message
 from ..models.consultation import Consultation
-from ..models.user import User
-from ..schemas.message import (
-    MessageCreate,
-    MessageUpdate,
-    MessageResponse,
-)
+from ..models.consultant import Consultant
+from ..models.message_unread_counter import MessageUnreadCounter
+from ..schemas.message import MessageResponse
+from ..utils.message_broker import message_broker
 
 
-def get_consultation_messages(
+# 메시지 목록 한 번에 조회할 수 있는 최대 개수
+MAX_MESSAGES_PER_PAGE = 200
+
+
+def _get_participants(
+    consultation_id: UUID,
+    user_id: UUID,
+    db: Session
+) -> Tuple[Consultation, Optional[UUID]]:
+    """상담 참여자 확인 후 상담과 매칭된 전문가의 사용자 ID 조회
+
+    Args:
+        consultation_id: 상담 ID
+        user_id: 현재 사용자 ID
+        db: 데이터베이스 세션
+
+    Returns:
+        Tuple[Consultation, Optional[UUID]]: (상담, 전문가 사용자 ID 또는 None)
+
+    Raises:
+        HTTPException: 상담을 찾을 수 없으면 404, 참여자가 아니면 403 에러
+    """
+    from fastapi import HTTPException, status
+
+    row = db.query(Consultation, Consultant.user_id).outerjoin(
+        Consultant, Consultation.consultant_id == Consultant.id
+    ).filter(
+        Consultation.id == consultation_id
+    ).first()
+
+    if not row:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Consultation not found"
+        )
+
+    consultation, consultant_user_id = row
+    if user_id not in (consultation.user_id, consultant_user_id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You are not a participant of this consultation"
+        )
+
+    return consultation, consultant_user_id
+
+
+def get_consultation_for_participant(
     consultation_id: UUID,
+    user_id: UUID,
     db: Session
+) -> Consultation:
+    """상담 참여자(신청자 또는 매칭된 전문가) 확인 후 상담 조회
+
+    Args:
+        consultation_id: 상담 ID
+        user_id: 현재 사용자 ID
+        db: 데이터베이스 세션
+
+    Returns:
+        Consultation: 상담 정보
+
+    Raises:
+        HTTPException: 상담을 찾을 수 없으면 404, 참여자가 아니면 403 에러
+    """
+    consultation, _ = _get_participants(consultation_id, user_id, db)
+    return consultation
+
+
+def _increment_unread_counter(user_id: UUID, consultation_id: UUID, db: Session) -> None:
+    """받는 사람의 읽지 않은 메시지 수 1 증가 (없으면 생성, 커밋은 호출자가 수행)
+
+    동시에 첫 메시지가 전송되어도 충돌하지 않도록 upsert를 사용합니다.
+
+    Args:
+        user_id: 받는 사람 ID
+        consultation_id: 상담 ID
+        db: 데이터베이스 세션
+    """
+    dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+    table = MessageUnreadCounter.__table__
+    statement = dialect.insert(table).values(
+        user_id=user_id,
+        consultation_id=consultation_id,
+        unread_count=1,
+        updated_at=datetime.utcnow(),
+    )
+    statement = statement.on_conflict_do_update(
+        index_elements=[table.c.user_id, table.c.consultation_id],
+        set_={
+            "unread_count": table.c.unread_count + 1,
+            "updated_at": statement.excluded.updated_at,
+        },
+    )
+    db.execute(statement)
+
+
+def _unread_counter_query(user_id: UUID, consultation_id: UUID, db: Session):
+    """사용자·상담의 읽지 않은 메시지 카운터 조회 쿼리"""
+    return db.query(MessageUnreadCounter).filter(
+        MessageUnreadCounter.user_id == user_id,
+        MessageUnreadCounter.consultation_id == consultation_id,
+    )
+
+
+def _decrement_unread_counter(user_id: UUID, consultation_id: UUID, count: int, db: Session) -> None:
+    """읽음 처리한 메시지 수만큼 카운터 감소 (0 미만으로 내려가지 않음)
+
+    0으로 초기화하지 않고 실제로 읽음 처리된 행 수(UPDATE rowcount)만큼만 줄이므로
+    동시에 커밋된 새 메시지의 증가분이나 중복 읽음 요청에 영향받지 않습니다.
+    """
+    _unread_counter_query(user_id, consultation_id, db).update(
+        {
+            MessageUnreadCounter.unread_count: case(
+                (MessageUnreadCounter.unread_count > count, MessageUnreadCounter.unread_count - count),
+                else_=0,
+            ),
+            MessageUnreadCounter.updated_at: datetime.utcnow(),
+        },
+        synchronize_session=False,
+    )
+
+
+def delete_unread_counter(user_id: UUID, consultation_id: UUID, db: Session) -> None:
+    """상담 참여자에서 빠진 사용자의 카운터 삭제 (커밋은 호출자가 수행)
+
+    Args:
+        user_id: 참여자에서 빠진 사용자 ID
+        consultation_id: 상담 ID
+        db: 데이터베이스 세션
+    """
+    _unread_counter_query(user_id, consultation_id, db).delete(synchronize_session=False)
+
+
+def backfill_unread_counters(recipients: Dict[UUID, UUID], db: Session) -> None:
+    """새로 매칭된 전문가의 카운터를 신청자가 보낸 읽지 않은 메시지 수로 설정 (커밋은 호출자가 수행)
+
+    재매칭된 상담에는 이전 전문가가 읽지 않은 신청자 메시지가 남아 있을 수 있으므로
+    0부터 시작하지 않고 실제 읽지 않은 메시지 수로 카운터를 맞춥니다.
+
+    Args:
+        recipients: 상담 ID -> 새로 매칭된 전문가의 사용자 ID
+        db: 데이터베이스 세션
+    """
+    if not recipients:
+        return
+
+    counts = dict(db.query(
+        Message.consultation_id, func.count(Message.id)
+    ).join(
+        Consultation, Consultation.id == Message.consultation_id
+    ).filter(
+        Message.consultation_id.in_(list(recipients)),
+        Message.sender_id == Consultation.user_id,
+        Message.is_read == False,
+    ).group_by(Message.consultation_id).all())
+
+    now = datetime.utcnow()
+    rows = [
+        {"user_id": user_id, "consultation_id": consultation_id, "unread_count": counts[consultation_id], "updated_at": now}
+        for consultation_id, user_id in recipients.items()
+        if counts.get(consultation_id)
+    ]
+    if not rows:
+        return
+
+    dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+    table = MessageUnreadCounter.__table__
+    statement = dialect.insert(table).values(rows)
+    statement = statement.on_conflict_do_update(
+        index_elements=[table.c.user_id, table.c.consultation_id],
+        set_={
+            "unread_count": statement.excluded.unread_count,
+            "updated_at": statement.excluded.updated_at,
+        },
+    )
+    db.execute(statement)
+
+
+def _publish_event(consultation_id: UUID, event: dict) -> None:
+    """상담 채널 구독자(WebSocket/SSE)에게 이벤트 발행
+
+    Args:
+        consultation_id: 상담 ID (채널 키)
+        event: 발행할 이벤트
+    """
+    message_broker.publish(str(consultation_id), event)
+
+
+def get_consultation_messages(
+    consultation_id: UUID,
+    user_id: UUID,
+    db: Session,
+    since: Optional[datetime] = None,
+    before: Optional[datetime] = None,
+    limit: int = 100,
 ) -> List[Message]:
-    """상담 메시지 목록 조회
+    """상담 메시지 목록 조회 (상대방 메시지 일괄 읽음 처리)
+
+    상대방이 보낸 읽지 않은 메시지는 한 번의 UPDATE로 읽음 처리합니다.
+
+    - since: 해당 시각 이후 메시지 (폴링 시 새 메시지만 조회)
+    - before: 해당 시각 이전 메시지 (이전 대화 불러오기)
+    - 둘 다 없으면 최근 메시지
 
     Args:
         consultation_id: 상담 ID
+        user_id: 현재 사용자 ID (읽는 사람)
         db: 데이터베이스 세션
+        since: 이 시각 이후 메시지만 조회 (optional)
+        before: 이 시각 이전 메시지만 조회 (optional)
+        limit: 조회할 최대 개수
 
     Returns:
-        List[Message]: 메시지 목록
+        List[Message]: 메시지 목록 (오래된 순)
+
+    Raises:
+        HTTPException: 상담을 찾을 수 없거나 참여자가 아닌 경우
     """
-    messages = db.query(Message).filter(
-        Message.consultation_id == consultation_id
-    ).order_by(Message.created_at.asc()).all()
-
-    # 읽음 상태 업데이트 (상담 메시지는 조회 시 자동 읽음 처리)
-    for message in messages:
-        if not message.is_read:
-            message.is_read = True
-            db.add(message)
-    
+    get_consultation_for_participant(consultation_id, user_id, db)
+
+    # 읽음 상태 일괄 업데이트 (상대방이 보낸 메시지만) + 읽음 처리한 수만큼 카운터 감소
+    # (0으로 초기화하면 두 문장 사이에 커밋된 새 메시지의 증가분까지 지워짐)
+    marked_count = db.query(Message).filter(
+        Message.consultation_id == consultation_id,
+        Message.sender_id != user_id,
+        Message.is_read == False,
+    ).update({Message.is_read: True}, synchronize_session=False)
+    if marked_count:
+        _decrement_unread_counter(user_id, consultation_id, marked_count, db)
     db.commit()
+
+    if marked_count:
+        # 상대방 화면의 읽음 표시 갱신
+        _publish_event(consultation_id, {"type": "messages.read", "reader_id": str(user_id)})
+
+    limit = max(1, min(limit, MAX_MESSAGES_PER_PAGE))
+    query = db.query(Message).filter(Message.consultation_id == consultation_id)
+
+    if before:
+        query = query.filter(Message.created_at < before)
+
+    if since:
+        # 새 메시지 폴링: since 이후 메시지를 오래된 순으로
+        return query.filter(Message.created_at > since).order_by(
+            Message.created_at.asc(), Message.id.asc()
+        ).limit(limit).all()
+
+    # 최근(또는 before 이전) 메시지를 최신순으로 limit개 조회 후 오래된 순으로 반환
+    messages = query.order_by(
+        Message.created_at.desc(), Message.id.desc()
+    ).limit(limit).all()
+    messages.reverse()
     return messages
 
 
@@ -45,7 +274,7 @@ def get_unread_message_count(
     user_id: UUID,
     db: Session
 ) -> int:
-    """사용자의 읽지 않은 메시지 수 조회
+    """사용자의 읽지 않은 메시지 수 조회 (카운터 합계)
 
     Args:
         user_id: 사용자 ID
@@ -54,10 +283,35 @@ def get_unread_message_count(
     Returns:
         int: 읽지 않은 메시지 수
     """
-    return db.query(Message).filter(
-        Message.sender_id != user_id,  # 상대방이 보낸 메시지만 카운트
-        Message.is_read == False
-    ).count()
+    return db.query(
+        func.coalesce(func.sum(MessageUnreadCounter.unread_count), 0)
+    ).filter(
+        MessageUnreadCounter.user_id == user_id
+    ).scalar()
+
+
+def get_unread_counts_by_consultation(
+    user_id: UUID,
+    db: Session
+) -> Dict[UUID, int]:
+    """사용자의 상담별 읽지 않은 메시지 수 조회 (한 번의 쿼리)
+
+    Args:
+        user_id: 사용자 ID
+        db: 데이터베이스 세션
+
+    Returns:
+        Dict[UUID, int]: 상담 ID -> 읽지 않은 메시지 수 (0인 상담은 제외)
+    """
+    rows = db.query(
+        MessageUnreadCounter.consultation_id,
+        MessageUnreadCounter.unread_count,
+    ).filter(
+        MessageUnreadCounter.user_id == user_id,
+        MessageUnreadCounter.unread_count > 0,
+    ).all()
+
+    return {consultation_id: unread_count for consultation_id, unread_count in rows}
 
 
 def send_message(
@@ -78,7 +332,12 @@ def send_message(
 
     Returns:
         Message: 생성된 메시지
+
+    Raises:
+        HTTPException: 상담을 찾을 수 없거나 참여자가 아닌 경우
     """
+    consultation, consultant_user_id = _get_participants(consultation_id, sender_id, db)
+
     new_message = Message(
         consultation_id=consultation_id,
         sender_id=sender_id,
@@ -88,11 +347,21 @@ def send_message(
     )
 
     db.add(new_message)
+
+    # 받는 사람의 읽지 않은 메시지 수 증가 (메시지와 같은 트랜잭션)
+    # 전문가가 아직 매칭되지 않은 상담은 받는 사람이 없으므로 건너뜀
+    recipient_id = consultant_user_id if sender_id == consultation.user_id else consultation.user_id
+    if recipient_id is not None:
+        _increment_unread_counter(recipient_id, consultation_id, db)
+
     db.commit()
     db.refresh(new_message)
 
-    # TODO: 실시간 알림 발송 (WebSocket 또는 SSE)
-    # 현재는 이메일 알림만 구현되어 있음
+    # 실시간 알림 발송 (WebSocket/SSE 구독자)
+    _publish_event(consultation_id, {
+        "type": "message.created",
+        "message": MessageResponse.model_validate(new_message).model_dump(mode="json"),
+    })
 
     return new_message
 
@@ -111,6 +380,9 @@ def mark_message_as_read(
 
     Returns:
         Optional[Message]: 업데이트된 메시지
+
+    Raises:
+        HTTPException: 상담 참여자가 아닌 경우 403 에러
     """
     message = db.query(Message).filter(
         Message.id == message_id
@@ -119,17 +391,28 @@ def mark_message_as_read(
     if not message:
         return None
 
+    get_consultation_for_participant(message.consultation_id, user_id, db)
+
     # 자신의 메시지만 상대방 메시지일 때만 읽음 처리 가능
     if message.sender_id == user_id:
         return None
 
-    message.is_read = True
-    db.add(message)
+    # 읽지 않은 경우에만 읽음 처리하고, 실제로 바뀐 행 수만큼 카운터 감소
+    # (Python에서 is_read를 확인하면 동시 요청이 둘 다 감소시킴)
+    marked_count = db.query(Message).filter(
+        Message.id == message.id,
+        Message.is_read == False,
+    ).update({Message.is_read: True}, synchronize_session=False)
+    if marked_count:
+        _decrement_unread_counter(user_id, message.consultation_id, marked_count, db)
+
     db.commit()
     db.refresh(message)
 
-    return message
-
-
-
+    _publish_event(message.consultation_id, {
+        "type": "messages.read",
+        "reader_id": str(user_id),
+        "message_id": str(message.id),
+    })
 
+    return message
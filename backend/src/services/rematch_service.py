@@ -0,0 +1,282 @@
+"""Consultation Re-matching Service"""
+
+import asyncio
+import logging
+import threading
+from collections import Counter, defaultdict
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from uuid import UUID
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import event, inspect, tuple_
+from sqlalchemy.orm import Session
+
+from ..config import settings
+from ..database import SessionLocal
+from ..models.consultant import Consultant
+from ..models.consultation import Consultation
+from ..models.consultation_decline import ConsultationDecline
+from ..models.user import User
+from .matching_service import CAPACITY_WEIGHT, get_max_consultations_per_day, rank_consultants
+from .message_service import backfill_unread_counters
+
+
+logger = logging.getLogger(__name__)
+
+# 세션 커밋 후 재매칭 워커를 깨우기 위한 session.info 키
+REMATCH_REQUESTED_KEY = "rematch_requested"
+
+
+def request_rematch(db: Session) -> None:
+    """
+    현재 트랜잭션이 커밋되면 재매칭 워커 실행 요청
+
+    Args:
+        db: 데이터베이스 세션
+    """
+    db.info[REMATCH_REQUESTED_KEY] = True
+
+
+def _select_candidate(
+    ranked: List[Tuple[Consultant, float, int]],
+    declined_ids: Set[UUID],
+    assigned: Counter,
+) -> Optional[Consultant]:
+    """
+    배치 내 배정 수를 반영하여 가장 점수가 높은 후보 선택
+
+    Args:
+        ranked: rank_consultants() 결과
+        declined_ids: 이 상담을 거절한 전문가 ID
+        assigned: 이번 배치에서 전문가별로 배정한 상담 수
+
+    Returns:
+        Optional[Consultant]: 선택된 전문가 (없으면 None)
+    """
+    best, best_score = None, None
+    for consultant, score, open_count in ranked:
+        if consultant.id in declined_ids:
+            continue
+        max_per_day = get_max_consultations_per_day(consultant)
+        if open_count + assigned[consultant.id] >= max_per_day:
+            continue
+        # 이번 배치 배정분만큼 남은 수용량 점수 차감
+        adjusted = score - CAPACITY_WEIGHT * assigned[consultant.id] / max_per_day
+        if best_score is None or adjusted > best_score:
+            best, best_score = consultant, adjusted
+    return best
+
+
+def rematch_requested_batch(
+    db: Session,
+    batch_size: int,
+    after: Optional[Tuple[datetime, UUID]] = None,
+    now: Optional[datetime] = None,
+) -> Tuple[int, int, Optional[Tuple[datetime, UUID]]]:
+    """
+    매칭 대기(status='requested') 상담 한 배치 재매칭 (오래된 순)
+
+    거절 이력과 후보 전문가는 배치 단위로 조회하므로(상담 유형별 1회)
+    상담 수만큼 쿼리가 늘어나지 않습니다.
+    다른 워커가 잠근 행은 건너뛰므로(SKIP LOCKED) 다음 배치는 offset이 아닌
+    마지막 상담의 (created_at, id) 이후부터 조회합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        batch_size: 배치 크기
+        after: 이전 배치의 마지막 상담 (created_at, id) (optional)
+        now: 매칭 기준 시각 (기본값: 현재 시각)
+
+    Returns:
+        Tuple[int, int, Optional[Tuple[datetime, UUID]]]:
+            (조회한 상담 수, 매칭된 상담 수, 이 배치의 마지막 상담 (created_at, id))
+    """
+    query = db.query(Consultation).filter(
+        Consultation.status == "requested",
+        Consultation.consultant_id.is_(None),
+    )
+    if after is not None:
+        query = query.filter(tuple_(Consultation.created_at, Consultation.id) > after)
+    consultations = query.order_by(
+        Consultation.created_at.asc(), Consultation.id.asc()
+    ).limit(batch_size).with_for_update(skip_locked=True).all()
+
+    if not consultations:
+        db.commit()
+        return 0, 0, after
+
+    last_key = (consultations[-1].created_at, consultations[-1].id)
+    matched_at = now or datetime.now(timezone.utc)
+
+    # 거절 이력 일괄 조회
+    declined: Dict[UUID, Set[UUID]] = defaultdict(set)
+    for consultation_id, consultant_id in db.query(
+        ConsultationDecline.consultation_id, ConsultationDecline.consultant_id
+    ).filter(
+        ConsultationDecline.consultation_id.in_([c.id for c in consultations])
+    ):
+        declined[consultation_id].add(consultant_id)
+
+    # 상담 유형별 후보 전문가 (유형별 1회)
+    ranked_by_type = {
+        consultation_type: rank_consultants(db, consultation_type, now=now)
+        for consultation_type in {c.consultation_type for c in consultations}
+    }
+
+    assigned: Counter = Counter()
+    matches: List[Tuple[Consultation, Consultant]] = []
+    for consultation in consultations:
+        consultant = _select_candidate(
+            ranked_by_type[consultation.consultation_type],
+            declined[consultation.id],
+            assigned,
+        )
+        if consultant is None:
+            continue
+        assigned[consultant.id] += 1
+        consultation.consultant_id = consultant.id
+        consultation.status = "matched"
+        # 신청일이 아닌 매칭 시각으로 오늘의 부하에 집계 (다음 배치/워커가 수용량을 다시 보지 않도록)
+        consultation.matched_at = matched_at
+        matches.append((consultation, consultant))
+
+    # 이전 전문가가 읽지 않은 신청자 메시지를 새 전문가의 카운터로 이어받음
+    backfill_unread_counters(
+        {consultation.id: consultant.user_id for consultation, consultant in matches}, db
+    )
+
+    # 매칭 완료 이메일 발송 대기열 추가
+    if matches:
+        from .email_service import send_consultation_matched_email
+
+        emails = dict(db.query(User.id, User.email).filter(
+            User.id.in_({consultation.user_id for consultation, _ in matches})
+        ).all())
+        for consultation, consultant in matches:
+            if emails.get(consultation.user_id):
+                send_consultation_matched_email(
+                    emails[consultation.user_id],
+                    consultant.office_name,
+                    consultation.consultation_type,
+                    db,
+                )
+
+    db.commit()
+
+    logger.info(f"Re-matched {len(matches)}/{len(consultations)} requested consultations")
+    return len(consultations), len(matches), last_key
+
+
+class RematchWorker:
+    """매칭 대기 상담 재매칭 워커
+
+    상담 거절, 전문가 검증/활성화 시 커밋 직후 깨어나며,
+    그 외에는 REMATCH_POLL_SECONDS 주기로 대기 중인 상담을 배치 처리합니다.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        batch_size: Optional[int] = None,
+        poll_seconds: Optional[float] = None,
+    ):
+        """
+        Args:
+            session_factory: 데이터베이스 세션 생성 함수
+            batch_size: 배치 크기 (기본값: settings.REMATCH_BATCH_SIZE)
+            poll_seconds: 대기 상담 확인 주기 (기본값: settings.REMATCH_POLL_SECONDS)
+        """
+        self.session_factory = session_factory
+        self.batch_size = batch_size or settings.REMATCH_BATCH_SIZE
+        self.poll_seconds = settings.REMATCH_POLL_SECONDS if poll_seconds is None else poll_seconds
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def drain(self) -> int:
+        """
+        매칭 대기 상담 전체를 배치로 재매칭
+
+        Returns:
+            int: 매칭된 상담 수
+        """
+        matched_total = 0
+        with self._lock:
+            db = self.session_factory()
+            try:
+                # keyset 페이지네이션: 다른 워커가 잠근 행이 있어도 건너뛰는 행이 없음
+                after = None
+                while True:
+                    fetched, matched, after = rematch_requested_batch(db, self.batch_size, after=after)
+                    matched_total += matched
+                    if fetched < self.batch_size:
+                        break
+            finally:
+                db.close()
+        return matched_total
+
+    def notify(self) -> None:
+        """재매칭 요청 (임의 스레드에서 호출 가능, 워커 미실행 시 무시)"""
+        if self._loop is not None and self._wakeup is not None:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    async def _run(self) -> None:
+        """요청 또는 주기마다 재매칭"""
+        while True:
+            self._wakeup.clear()
+            try:
+                await run_in_threadpool(self.drain)
+            except Exception as e:
+                logger.error(f"Consultation re-matching failed: {e}")
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+    async def start(self) -> None:
+        """워커 시작 (애플리케이션 시작 시 호출)"""
+        if self._task is None:
+            self._loop = asyncio.get_running_loop()
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """워커 종료 (애플리케이션 종료 시 호출)"""
+        task, self._task = self._task, None
+        self._loop = None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+
+# 싱글톤 인스턴스
+rematch_worker = RematchWorker()
+
+
+@event.listens_for(Consultant, "after_insert")
+@event.listens_for(Consultant, "after_update")
+def _request_rematch_on_consultant_available(mapper, connection, target: Consultant) -> None:
+    """전문가가 검증/활성화되면 커밋 후 재매칭 요청"""
+    if not (target.is_active and target.is_verified):
+        return
+    state = inspect(target)
+    if state.attrs.is_verified.history.has_changes() or state.attrs.is_active.history.has_changes():
+        if state.session is not None:
+            request_rematch(state.session)
+
+
+@event.listens_for(Session, "after_commit")
+def _notify_rematch_worker(session: Session) -> None:
+    """재매칭 요청이 있는 트랜잭션 커밋 후 워커 깨우기"""
+    if session.info.pop(REMATCH_REQUESTED_KEY, False):
+        rematch_worker.notify()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rematch_request(session: Session) -> None:
+    """롤백된 트랜잭션의 재매칭 요청 취소"""
+    session.info.pop(REMATCH_REQUESTED_KEY, None)
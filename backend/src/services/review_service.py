@@ -1,11 +1,19 @@
 """Review Service"""
 
-from decimal import Decimal
+import asyncio
+import logging
+import threading
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Callable, Optional
 from uuid import UUID
+from sqlalchemy import func, literal_column, or_
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 
+from ..config import settings
+from ..database import SessionLocal
 from ..models.user import User
 from ..models.consultation import Consultation
 from ..models.consultant import Consultant
@@ -13,6 +21,9 @@ from ..models.review import Review
 from ..schemas.review import ReviewCreate
 
 
+logger = logging.getLogger(__name__)
+
+
 def create_review(
     review_data: ReviewCreate,
     user: User,
@@ -70,8 +81,7 @@ def create_review(
 
     try:
         db.add(new_review)
-        db.commit()
-        db.refresh(new_review)
+        db.flush()
     except IntegrityError:
         db.rollback()
         raise HTTPException(
@@ -79,54 +89,174 @@ def create_review(
             detail="Review for this consultation already exists"
         )
 
-    # 전문가 평점 업데이트
-    update_consultant_rating(consultation.consultant_id, db)
+    # 전문가 평점 증분 갱신 (후기 저장과 같은 트랜잭션)
+    apply_review_to_consultant_rating(consultation.consultant_id, new_review.rating, db)
+
+    db.commit()
+    db.refresh(new_review)
 
     return new_review
 
 
-def update_consultant_rating(consultant_id: UUID, db: Session) -> None:
+def apply_review_to_consultant_rating(consultant_id: UUID, rating: int, db: Session) -> None:
     """
-    전문가의 평균 평점 및 총 후기 수 업데이트
+    새 후기를 전문가의 별점 합계/후기 수/평균 평점에 반영 (커밋하지 않음)
+
+    전체 후기를 다시 집계하지 않고 원자적 UPDATE 1회로 갱신하므로
+    동시에 작성된 후기도 누락되지 않습니다. SET 절의 컬럼은 갱신 전 값을 참조합니다.
 
     Args:
         consultant_id: 전문가 ID
+        rating: 새 후기의 별점
         db: 데이터베이스 세션
     """
-    consultant = db.query(Consultant).filter(
+    total_reviews = func.coalesce(Consultant.total_reviews, 0) + 1
+    rating_sum = Consultant.rating_sum + rating
+
+    db.query(Consultant).filter(
         Consultant.id == consultant_id
-    ).first()
+    ).update(
+        {
+            Consultant.total_reviews: total_reviews,
+            Consultant.rating_sum: rating_sum,
+            Consultant.average_rating: func.round(rating_sum * literal_column("1.0") / total_reviews, 2),
+        },
+        synchronize_session=False,
+    )
 
-    if not consultant:
-        return
 
-    # HIGH FIX: SQL 집계 함수 사용 - N+1 쿼리 최적화
-    from sqlalchemy import func
+def _get_average_rating(rating_sum: int, total_reviews: int) -> Decimal:
+    """별점 합계와 후기 수로 평균 평점 계산 (소수점 둘째 자리 반올림)"""
+    if not total_reviews:
+        return Decimal("0.00")
+    return (Decimal(rating_sum) / total_reviews).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
 
-    # COUNT()와 AVG()를 한 번의 쿼리로 조회
-    result = db.query(
-        func.count(Review.id).label('total_reviews'),
-        func.avg(Review.rating).label('average_rating')
-    ).filter(
-        Review.consultant_id == consultant_id
-    ).first()
 
-    total_reviews = result.total_reviews if result else 0
-    average_rating = result.average_rating if result and result.average_rating else 0
+def reconcile_consultant_ratings(db: Session) -> int:
+    """
+    후기 테이블 전체를 다시 집계하여 전문가 평점 보정
 
-    if total_reviews == 0:
-        # 후기가 없으면 기본값으로 설정
-        consultant.total_reviews = 0
-        consultant.average_rating = Decimal("0.00")
-    else:
-        # 총 후기 수
-        consultant.total_reviews = total_reviews
+    증분 갱신 값이 실제 후기와 어긋난 경우(후기 직접 삭제/수정 등)를 바로잡습니다.
+    어긋난 전문가는 행 잠금 후 다시 집계하므로 동시에 작성 중인 후기의
+    증분 갱신과 충돌하지 않습니다.
+
+    Args:
+        db: 데이터베이스 세션
 
-        # 평균 평점 계산 (이미 집계됨)
-        consultant.average_rating = Decimal(str(average_rating)).quantize(Decimal("0.01"))
+    Returns:
+        int: 보정된 전문가 수
+    """
+    aggregates = db.query(
+        Review.consultant_id.label("consultant_id"),
+        func.count(Review.id).label("total_reviews"),
+        func.sum(Review.rating).label("rating_sum"),
+    ).group_by(
+        Review.consultant_id
+    ).subquery()
+
+    actual_total = func.coalesce(aggregates.c.total_reviews, 0)
+    actual_sum = func.coalesce(aggregates.c.rating_sum, 0)
+
+    # 1. 어긋난 전문가 조회 (잠금 없이)
+    drifted_ids = [
+        consultant_id for (consultant_id,) in db.query(Consultant.id).outerjoin(
+            aggregates, aggregates.c.consultant_id == Consultant.id
+        ).filter(or_(
+            func.coalesce(Consultant.total_reviews, 0) != actual_total,
+            Consultant.rating_sum != actual_sum,
+        ))
+    ]
+    if not drifted_ids:
+        db.commit()
+        return 0
+
+    # 2. 행 잠금 후 해당 전문가만 다시 집계하여 갱신
+    consultants = db.query(Consultant).filter(
+        Consultant.id.in_(drifted_ids)
+    ).with_for_update().all()
+
+    totals = {
+        consultant_id: (total_reviews, rating_sum)
+        for consultant_id, total_reviews, rating_sum in db.query(
+            Review.consultant_id, func.count(Review.id), func.sum(Review.rating)
+        ).filter(
+            Review.consultant_id.in_(drifted_ids)
+        ).group_by(Review.consultant_id)
+    }
+
+    for consultant in consultants:
+        total_reviews, rating_sum = totals.get(consultant.id, (0, 0))
+        consultant.total_reviews = total_reviews
+        consultant.rating_sum = rating_sum
+        consultant.average_rating = _get_average_rating(rating_sum, total_reviews)
 
     db.commit()
-    db.refresh(consultant)
+
+    logger.warning(f"Reconciled ratings of {len(consultants)} consultants")
+    return len(consultants)
+
+
+class RatingReconciliationWorker:
+    """전문가 평점 주기적 재집계 워커 (RATING_RECONCILE_INTERVAL_SECONDS 주기)"""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        interval_seconds: Optional[float] = None,
+    ):
+        """
+        Args:
+            session_factory: 데이터베이스 세션 생성 함수
+            interval_seconds: 재집계 주기 (기본값: settings.RATING_RECONCILE_INTERVAL_SECONDS)
+        """
+        self.session_factory = session_factory
+        self.interval_seconds = (
+            settings.RATING_RECONCILE_INTERVAL_SECONDS if interval_seconds is None else interval_seconds
+        )
+        self._lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    def drain(self) -> int:
+        """
+        전문가 평점 재집계 1회 실행
+
+        Returns:
+            int: 보정된 전문가 수
+        """
+        with self._lock:
+            db = self.session_factory()
+            try:
+                return reconcile_consultant_ratings(db)
+            finally:
+                db.close()
+
+    async def _run(self) -> None:
+        """주기마다 재집계"""
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            try:
+                await run_in_threadpool(self.drain)
+            except Exception as e:
+                logger.error(f"Consultant rating reconciliation failed: {e}")
+
+    async def start(self) -> None:
+        """워커 시작 (애플리케이션 시작 시 호출)"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """워커 종료 (애플리케이션 종료 시 호출)"""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+
+# 싱글톤 인스턴스
+rating_reconciliation_worker = RatingReconciliationWorker()
 
 
 def get_consultant_reviews(
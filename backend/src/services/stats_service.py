@@ -0,0 +1,157 @@
+"""Statistics Service"""
+
+from datetime import datetime, timedelta
+from sqlalchemy.orm import Session
+from sqlalchemy import func, literal, select, union_all
+
+from ..config import settings
+from ..models.user import User
+from ..models.consultation import Consultation
+from ..models.job import Job
+from ..models.job_application import JobApplication
+from ..models.government_support import GovernmentSupport
+from ..utils.cache import TTLCache
+
+
+# 관리자 대시보드 통계 캐시 (대시보드 폴링 시 매번 전체 테이블 집계 방지)
+_stats_cache = TTLCache(max_size=16, ttl_seconds=settings.STATS_CACHE_TTL_SECONDS)
+
+
+def _count_by(metric: str, column):
+    """
+    (metric, bucket, count) 형태의 GROUP BY 집계 쿼리 생성
+
+    Args:
+        metric: 통계 구분 이름
+        column: 그룹화할 컬럼
+
+    Returns:
+        Select: 집계 쿼리
+    """
+    return select(
+        literal(metric).label("metric"),
+        column.label("bucket"),
+        func.count().label("count"),
+    ).group_by(column)
+
+
+def get_dashboard_stats(db: Session) -> dict:
+    """
+    관리자 대시보드 통계 조회
+
+    사용자(역할별), 상담/지원(상태별), 일자리/정부 지원(상태별) 집계를
+    UNION ALL로 묶어 한 번의 쿼리로 조회하고, 결과를
+    STATS_CACHE_TTL_SECONDS 동안 캐시합니다.
+
+    Args:
+        db: 데이터베이스 세션
+
+    Returns:
+        dict: 통계 데이터
+    """
+    cached = _stats_cache.get("dashboard")
+    if cached is not None:
+        return cached
+
+    query = union_all(
+        _count_by("users", User.role),
+        _count_by("consultations", Consultation.status),
+        _count_by("jobs", Job.status),
+        _count_by("applications", JobApplication.status),
+        _count_by("supports", GovernmentSupport.status),
+    )
+
+    counts: dict[str, dict[str, int]] = {
+        "users": {},
+        "consultations": {},
+        "jobs": {},
+        "applications": {},
+        "supports": {},
+    }
+    for metric, bucket, count in db.execute(query).all():
+        counts[metric][bucket] = count
+
+    users = counts["users"]
+    total_users = sum(users.values())
+    foreign_users = users.get("foreign", 0)
+    consultant_users = users.get("consultant", 0)
+
+    stats = {
+        "users": {
+            "total": total_users,
+            "foreign": foreign_users,
+            "consultants": consultant_users,
+            "admins": total_users - foreign_users - consultant_users,
+        },
+        "consultations": {
+            "total": sum(counts["consultations"].values()),
+            "by_status": counts["consultations"],
+        },
+        "jobs": {
+            "total": sum(counts["jobs"].values()),
+            "active": counts["jobs"].get("active", 0),
+        },
+        "applications": {
+            "total": sum(counts["applications"].values()),
+            "by_status": counts["applications"],
+        },
+        "supports": {
+            "total": sum(counts["supports"].values()),
+            "active": counts["supports"].get("active", 0),
+        },
+    }
+
+    _stats_cache.set("dashboard", stats)
+    return stats
+
+
+def get_overview_stats(db: Session) -> dict:
+    """
+    최근 7일 활동 개요 통계 조회
+
+    세 개의 COUNT를 스칼라 서브쿼리로 묶어 한 번의 쿼리로 조회하고,
+    결과를 STATS_CACHE_TTL_SECONDS 동안 캐시합니다.
+
+    Args:
+        db: 데이터베이스 세션
+
+    Returns:
+        dict: 개요 통계
+    """
+    cached = _stats_cache.get("overview")
+    if cached is not None:
+        return cached
+
+    seven_days_ago = datetime.utcnow() - timedelta(days=7)
+
+    query = select(
+        select(func.count(User.id))
+        .where(User.created_at >= seven_days_ago)
+        .scalar_subquery()
+        .label("new_users_7d"),
+        select(func.count(Consultation.id))
+        .where(Consultation.created_at >= seven_days_ago)
+        .scalar_subquery()
+        .label("new_consultations_7d"),
+        select(func.count(JobApplication.id))
+        .where(JobApplication.applied_at >= seven_days_ago)
+        .scalar_subquery()
+        .label("new_applications_7d"),
+    )
+    row = db.execute(query).one()
+
+    stats = {
+        "recent_activity": {
+            "new_users_7d": row.new_users_7d,
+            "new_consultations_7d": row.new_consultations_7d,
+            "new_applications_7d": row.new_applications_7d,
+        }
+    }
+
+    _stats_cache.set("overview", stats)
+    return stats
+
+
+def clear_stats_cache() -> None:
+    """통계 캐시 초기화"""
+    _stats_cache.clear()
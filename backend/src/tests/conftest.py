@@ -1,19 +1,27 @@
 """Common test fixtures and configuration"""
 
+from contextlib import contextmanager
+
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool, StaticPool
 
 from ..main import app
-from ..database import Base, get_db
+from ..database import Base, get_db, get_async_db
 from ..models.user import User
 from ..utils.auth import hash_password, create_access_token
+from ..utils.cache import clear_all_caches
+from ..utils.query_diagnostics import QueryCapture
 
 
 # 테스트용 인메모리 SQLite 데이터베이스 설정
-SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
+# 동기/비동기 엔진이 같은 DB를 보도록 공유 캐시 인메모리 DB 사용
+# (StaticPool의 동기 연결이 유지되는 동안 DB가 유지됨)
+SQLALCHEMY_DATABASE_URL = "sqlite:///file:easyk_test?mode=memory&cache=shared&uri=true"
+ASYNC_SQLALCHEMY_DATABASE_URL = "sqlite+aiosqlite:///file:easyk_test?mode=memory&cache=shared&uri=true"
 
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
@@ -22,6 +30,15 @@ engine = create_engine(
 )
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# TestClient는 요청마다 이벤트 루프가 달라질 수 있으므로 연결을 재사용하지 않음
+async_engine = create_async_engine(ASYNC_SQLALCHEMY_DATABASE_URL, poolclass=NullPool)
+TestingAsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
 
 def override_get_db():
     """테스트용 DB 세션 오버라이드"""
@@ -32,11 +49,26 @@ def override_get_db():
         db.close()
 
 
+async def override_get_async_db():
+    """테스트용 비동기 DB 세션 오버라이드"""
+    async with TestingAsyncSessionLocal() as db:
+        yield db
+
+
+@pytest.fixture(autouse=True)
+def reset_caches():
+    """테스트 간 인메모리 캐시 초기화 (테스트마다 DB가 새로 생성되므로)"""
+    clear_all_caches()
+    yield
+    clear_all_caches()
+
+
 @pytest.fixture(scope="function")
 def setup_database():
     """데이터베이스 설정 및 정리"""
     Base.metadata.create_all(bind=engine)
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
     yield
     Base.metadata.drop_all(bind=engine)
     app.dependency_overrides.clear()
@@ -80,3 +112,33 @@ def test_user_token(test_user: User):
     """테스트용 사용자 토큰 생성"""
     return create_access_token(data={"sub": test_user.email, "user_id": str(test_user.id)})
 
+
+
+@pytest.fixture
+def assert_max_queries():
+    """블록 안에서 실행된 SQL 수가 상한을 넘으면 실패 (동기/비동기 엔진 모두 집계)
+
+    사용 예:
+        with assert_max_queries(3):
+            client.get("/api/jobs")
+    """
+    @contextmanager
+    def _assert_max_queries(limit: int):
+        capture = QueryCapture()
+
+        def after_cursor_execute(conn, cursor, statement, *args):
+            capture.record(statement, 0.0)
+
+        targets = (engine, async_engine.sync_engine)
+        for target in targets:
+            event.listen(target, "after_cursor_execute", after_cursor_execute)
+        try:
+            yield capture
+        finally:
+            for target in targets:
+                event.remove(target, "after_cursor_execute", after_cursor_execute)
+        assert capture.total <= limit, (
+            f"Expected at most {limit} queries, got {capture.total}:\n{capture.summary()}"
+        )
+
+    return _assert_max_queries
@@ -0,0 +1,119 @@
+"""SMTP 스텁 서버 (테스트/로컬 개발용)
+
+수신한 메일을 메모리에 저장하는 최소한의 SMTP 서버입니다 (STARTTLS 미지원).
+아래처럼 실행한 뒤 SMTP_HOST=127.0.0.1, SMTP_PORT=1025, SMTP_USE_TLS=false 로
+설정하여 로컬에서 이메일 발송 대기열을 확인할 수 있습니다.
+
+    python -m src.tests.smtp_stub
+"""
+
+import socketserver
+import threading
+from typing import List, Optional, Tuple
+
+
+class SMTPStubServer:
+    """메일을 메모리에 저장하고 연결/로그인 횟수를 기록하는 스텁 서버"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, echo: bool = False):
+        self.echo = echo  # 수신한 메일을 표준 출력에 표시
+        self.messages: List[Tuple[str, List[str], bytes]] = []
+        self.connections = 0
+        self.logins = 0
+        self._failures: List[int] = []
+        self._server = socketserver.ThreadingTCPServer((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def host(self) -> str:
+        return self._server.server_address[0]
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    def fail_next(self, *reply_codes: int) -> None:
+        """
+        다음 메일들의 DATA 응답을 지정한 코드로 실패시킴
+
+        Args:
+            *reply_codes: 순서대로 반환할 SMTP 오류 코드 (예: 451 일시 오류, 550 영구 오류)
+        """
+        self._failures.extend(reply_codes)
+
+    def start(self) -> None:
+        """백그라운드 스레드에서 서버 시작"""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """서버 종료"""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _make_handler(self):
+        """SMTP 명령 처리기 생성"""
+        stub = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def reply(self, line: str) -> None:
+                self.wfile.write(f"{line}\r\n".encode("ascii"))
+
+            def handle(self) -> None:
+                stub.connections += 1
+                self.reply("220 smtp-stub ESMTP")
+                mail_from, recipients = "", []
+
+                while True:
+                    line = self.rfile.readline()
+                    if not line:
+                        return
+                    command = line.decode("utf-8", "replace").strip()
+                    verb = command.split(" ", 1)[0].upper()
+
+                    if verb == "EHLO":
+                        self.reply("250-smtp-stub")
+                        self.reply("250-AUTH PLAIN LOGIN")
+                        self.reply("250 8BITMIME")
+                    elif verb == "HELO":
+                        self.reply("250 smtp-stub")
+                    elif verb == "AUTH":
+                        stub.logins += 1
+                        self.reply("235 Authentication successful")
+                    elif verb == "MAIL":
+                        mail_from, recipients = command[10:].strip("<> "), []
+                        self.reply("250 OK")
+                    elif verb == "RCPT":
+                        recipients.append(command[8:].strip("<> "))
+                        self.reply("250 OK")
+                    elif verb == "DATA":
+                        self.reply("354 End data with <CR><LF>.<CR><LF>")
+                        data = b""
+                        while True:
+                            chunk = self.rfile.readline()
+                            if not chunk or chunk == b".\r\n":
+                                break
+                            data += chunk
+                        if stub._failures:
+                            self.reply(f"{stub._failures.pop(0)} Injected failure")
+                        else:
+                            stub.messages.append((mail_from, recipients, data))
+                            if stub.echo:
+                                print(data.decode("utf-8", "replace"), flush=True)
+                            self.reply("250 OK")
+                    elif verb in ("RSET", "NOOP"):
+                        self.reply("250 OK")
+                    elif verb == "QUIT":
+                        self.reply("221 Bye")
+                        return
+                    else:
+                        self.reply("502 Command not implemented")
+
+        return Handler
+
+
+if __name__ == "__main__":
+    server = SMTPStubServer(port=1025, echo=True)
+    print(f"SMTP stub listening on {server.host}:{server.port}")
+    server._server.serve_forever()
@@ -142,3 +142,67 @@ class TestSignup:
             },
         )
         assert response.status_code == 422  # Validation Error
+
+    def test_signup_password_pool_busy(self, client, monkeypatch):
+        """비밀번호 해싱 대기열이 가득 찬 경우 503 에러 + Retry-After"""
+        from ..utils.auth import password_hash_pool
+        monkeypatch.setattr(password_hash_pool, "max_pending", 0)
+
+        response = client.post(
+            "/api/auth/signup",
+            json={
+                "email": "busy@example.com",
+                "password": "SecurePass123!",
+                "first_name": "John",
+                "last_name": "Doe",
+            },
+        )
+        assert response.status_code == 503
+        assert "Retry-After" in response.headers
+
+
+class TestPasswordHashPool:
+    """비밀번호 해싱 워커 풀 테스트"""
+
+    def test_hash_and_verify_in_thread_pool(self):
+        """스레드 모드에서 해싱/검증 결과가 동기 함수와 동일"""
+        import asyncio
+        from ..utils.auth import PasswordHashPool, hash_password, verify_password
+
+        pool = PasswordHashPool(mode="thread", max_workers=1, max_pending=2)
+
+        async def run():
+            hashed = await pool.run(hash_password, "SecurePass123!")
+            return hashed, await pool.run(verify_password, "SecurePass123!", hashed)
+
+        try:
+            hashed, is_valid = asyncio.run(run())
+        finally:
+            pool.shutdown()
+
+        assert is_valid is True
+        assert verify_password("SecurePass123!", hashed)
+
+    def test_rejects_when_queue_full(self):
+        """대기 작업 수가 max_pending에 도달하면 PasswordHashBusyError"""
+        import asyncio
+        import threading
+        from ..utils.auth import PasswordHashPool, PasswordHashBusyError
+
+        pool = PasswordHashPool(mode="thread", max_workers=1, max_pending=1)
+        release = threading.Event()
+
+        async def run():
+            blocking = asyncio.ensure_future(pool.run(release.wait))
+            await asyncio.sleep(0)
+            try:
+                with pytest.raises(PasswordHashBusyError):
+                    await pool.run(release.wait)
+            finally:
+                release.set()
+                await blocking
+
+        try:
+            asyncio.run(run())
+        finally:
+            pool.shutdown()
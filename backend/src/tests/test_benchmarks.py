@@ -0,0 +1,135 @@
+"""Benchmark Suite Tests"""
+
+from datetime import datetime, timezone
+
+import httpx
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from benchmarks.data_generator import (
+    ADMIN_EMAIL,
+    BulkWriter,
+    generate,
+    generate_consultations,
+    make_id,
+    reset_tables,
+)
+from benchmarks.runner import compare_reports, load_fixtures, percentile, run_endpoint, run_service
+
+from ..main import app
+from ..models.consultant_specialty import ConsultantSpecialty
+from ..models.consultant import Consultant
+from ..models.message import Message
+from ..models.review import Review
+from ..models.user import User
+from ..services.review_service import reconcile_consultant_ratings
+from .conftest import TestingSessionLocal, engine
+
+
+COUNTS = {
+    "users": 30, "consultants": 5, "jobs": 40, "supports": 10,
+    "consultations": 20, "reviews": 5, "messages": 100,
+}
+
+
+def _generate() -> dict:
+    with engine.begin() as connection:
+        return generate(connection, COUNTS, seed=7)
+
+
+class TestDataGenerator:
+    """합성 데이터 생성 테스트"""
+
+    def test_generates_requested_rows_with_derived_tables(self, db: Session):
+        """요청한 건수와 파생 테이블(전문 분야 인덱스)이 함께 생성됨"""
+        counts = _generate()
+
+        assert counts["users"] == 1 + 1 + COUNTS["consultants"] + COUNTS["users"]
+        assert counts["jobs"] == COUNTS["jobs"]
+        assert db.execute(select(func.count()).select_from(ConsultantSpecialty)).scalar() == counts["consultant_specialties"]
+        assert 0 < counts["messages"] <= COUNTS["messages"]
+        assert db.get(User, make_id("admin", 0)).email == ADMIN_EMAIL
+
+    def test_same_seed_generates_same_data(self, db: Session):
+        """같은 시드로 다시 생성하면 같은 메시지 (ID, 발신자, 내용)"""
+        _generate()
+        first = db.execute(select(Message.sender_id, Message.content).order_by(Message.id)).all()
+        db.query(Message).delete()
+        db.commit()
+
+        with engine.begin() as connection:
+            writer = BulkWriter(connection)
+            now = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+            for table, row in generate_consultations(COUNTS, 7, now):
+                if table is Message.__table__:
+                    writer.add(table, row)
+            writer.flush()
+
+        assert db.execute(select(Message.sender_id, Message.content).order_by(Message.id)).all() == first
+
+
+    def test_rating_aggregates_match_reviews(self, db: Session):
+        """대량 삽입한 후기와 전문가 평점 집계가 일치 (재집계 대상 없음)"""
+        counts = _generate()
+
+        assert counts["reviews"] == COUNTS["reviews"]
+        assert db.execute(select(func.sum(Consultant.total_reviews))).scalar() == COUNTS["reviews"]
+        assert reconcile_consultant_ratings(db) == 0
+
+    def test_reset_tables(self, db: Session):
+        """초기화 후 다시 생성 가능"""
+        _generate()
+        with engine.begin() as connection:
+            reset_tables(connection)
+
+        assert db.execute(select(func.count()).select_from(User)).scalar() == 0
+        assert db.execute(select(func.count()).select_from(Review)).scalar() == 0
+        assert _generate()["users"] > 0
+
+
+class TestBenchmarkRunner:
+    """벤치마크 러너 테스트"""
+
+    def test_percentile_nearest_rank(self):
+        """nearest-rank 백분위수"""
+        values = [float(value) for value in range(1, 101)]
+
+        assert percentile(values, 50) == 50.0
+        assert percentile(values, 95) == 95.0
+        assert percentile(values, 99) == 99.0
+        assert percentile([], 50) is None
+
+    async def test_endpoint_and_service_results(self, client):
+        """엔드포인트/서비스 측정 결과에 백분위수, 처리량, SQL 수가 포함됨"""
+        _generate()
+        with TestingSessionLocal() as db:
+            fixtures = load_fixtures(db)
+
+        # 테스트 DB는 연결 하나(StaticPool)를 공유하므로 동시 요청 없이 측정
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as http:
+            result = await run_endpoint(http, "messages_list", fixtures, requests=10, concurrency=1, warmup=1)
+        service = run_service("find_matching_consultant", TestingSessionLocal, iterations=5)
+
+        assert result["requests"] == 10
+        assert result["errors"] == 0
+        assert result["statuses"] == {"200": 10}
+        assert result["p50_ms"] <= result["p95_ms"] <= result["p99_ms"]
+        assert result["throughput_rps"] > 0
+        assert result["queries_mean"] >= 1
+        assert service["requests"] == 5 and service["errors"] == 0
+
+    def test_compare_reports(self):
+        """이전 결과 대비 p95/처리량 변화율"""
+        baseline = {"results": [{"name": "jobs_list", "p95_ms": 10.0, "throughput_rps": 100.0}]}
+        current = {"results": [
+            {"name": "jobs_list", "p95_ms": 12.0, "throughput_rps": 90.0},
+            {"name": "job_detail", "p95_ms": 5.0, "throughput_rps": 200.0},
+        ]}
+
+        assert compare_reports(baseline, current) == [{
+            "name": "jobs_list",
+            "p95_ms": 12.0,
+            "baseline_p95_ms": 10.0,
+            "p95_change_pct": 20.0,
+            "throughput_change_pct": -10.0,
+        }]
@@ -281,11 +281,122 @@ class TestGetIncomingConsultations:
         assert response.status_code == 403
 
 
+class TestConsultationListPagination:
+    """상담 목록 페이지네이션 테스트"""
+
+    def test_user_consultations_cursor_pagination(
+        self, client: TestClient, db: Session, test_user: User, test_user_token: str
+    ):
+        """커서(keyset) 페이지네이션 테스트 (생성 시각이 같은 상담 포함)"""
+        from datetime import datetime, timedelta
+        from ..models.consultation import Consultation
+
+        base_time = datetime(2026, 1, 1, 9, 0, 0)
+        for index, hours in enumerate([0, 1, 1, 2, 3]):
+            db.add(Consultation(
+                user_id=test_user.id,
+                consultation_type="visa",
+                content=f"상담 내용 {index}",
+                consultation_method="email",
+                amount=50000.00,
+                status="requested",
+                payment_status="pending",
+                created_at=base_time + timedelta(hours=hours),
+            ))
+        db.commit()
+
+        headers = {"Authorization": f"Bearer {test_user_token}"}
+        seen_ids = []
+        cursor = None
+        for _ in range(3):
+            params = {"limit": 2}
+            if cursor:
+                params["cursor"] = cursor
+            response = client.get("/api/consultations", headers=headers, params=params)
+            assert response.status_code == 200
+            seen_ids.extend(item["id"] for item in response.json())
+            cursor = response.headers.get("X-Next-Cursor")
+            if not cursor:
+                break
+
+        # 마지막 페이지(1건)에는 커서가 없어야 함
+        assert cursor is None
+        assert len(set(seen_ids)) == 5
+
+        response = client.get("/api/consultations", headers=headers, params={"limit": 5})
+        assert [item["id"] for item in response.json()] == seen_ids
+
+    def test_invalid_cursor(self, client: TestClient, test_user_token: str):
+        """잘못된 커서는 400 에러"""
+        response = client.get(
+            "/api/consultations",
+            headers={"Authorization": f"Bearer {test_user_token}"},
+            params={"cursor": "not-a-cursor"},
+        )
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Invalid cursor"
+
+    def test_incoming_consultations_load_clients_in_one_query(
+        self, client: TestClient, db: Session, test_user: User, test_consultant: Consultant
+    ):
+        """의뢰인 정보는 상담 수와 관계없이 한 번의 쿼리로 조회"""
+        from sqlalchemy import event
+        from ..models.consultation import Consultation
+        from ..utils.auth import create_access_token
+        from .conftest import engine
+
+        for i in range(4):
+            requester = User(
+                email=f"client{i}@example.com",
+                password_hash="hashed",
+                role="foreign",
+                first_name="Client",
+                last_name=str(i),
+            )
+            db.add(requester)
+            db.flush()
+            db.add(Consultation(
+                user_id=requester.id,
+                consultant_id=test_consultant.id,
+                consultation_type="visa",
+                content=f"상담 내용 {i}",
+                consultation_method="email",
+                amount=50000.00,
+                status="matched",
+                payment_status="pending",
+            ))
+        db.commit()
+
+        statements = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", _record)
+        try:
+            response = client.get(
+                "/api/consultations/incoming",
+                headers={"Authorization": f"Bearer {create_access_token({'sub': test_user.email})}"},
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", _record)
+
+        assert response.status_code == 200
+        assert {item["user"]["email"] for item in response.json()} == {
+            f"client{i}@example.com" for i in range(4)
+        }
+        # 의뢰인은 IN 쿼리 1회로 일괄 조회 (상담별 지연 로딩 없음)
+        client_selects = [s for s in statements if "FROM users" in s and "users.id IN" in s]
+        assert len(client_selects) == 1
+        assert len([s for s in statements if "FROM users" in s]) < 4
+
+
 class TestConsultationAcceptReject:
     """전문가의 상담 수락/거절 API 테스트"""
 
     def test_accept_consultation_success(
-        self, client: TestClient, db: Session, test_user: User, test_consultant: Consultant
+        self, client: TestClient, db: Session, test_user: User, test_consultant: Consultant, assert_max_queries
     ):
         """전문가가 상담 수락 성공"""
         from ..utils.auth import create_access_token
@@ -308,10 +419,12 @@ class TestConsultationAcceptReject:
         db.commit()
         db.refresh(consultation)
 
-        response = client.post(
-            f"/api/consultations/{consultation.id}/accept",
-            headers={"Authorization": f"Bearer {consultant_token}"},
-        )
+        # 인증 사용자(캐시 미스 시), 상담, 전문가, 신청자 조회 + 상태 변경 + 갱신 조회 2
+        with assert_max_queries(7):
+            response = client.post(
+                f"/api/consultations/{consultation.id}/accept",
+                headers={"Authorization": f"Bearer {consultant_token}"},
+            )
 
         assert response.status_code == 200
         data = response.json()
@@ -349,9 +462,45 @@ class TestConsultationAcceptReject:
 
         assert response.status_code == 200
         data = response.json()
-        assert data["status"] == "cancelled"
+        assert data["status"] == "requested"
         assert data["consultant_id"] is None
 
+    def test_reject_completed_consultation(
+        self, client: TestClient, db: Session, test_user: User, test_consultant: Consultant
+    ):
+        """완료(결제 완료)된 상담은 거절할 수 없고 변경되지 않음"""
+        from ..utils.auth import create_access_token
+        from ..models.consultation import Consultation
+        from ..models.consultation_decline import ConsultationDecline
+
+        consultant_token = create_access_token({"sub": test_user.email})
+
+        consultation = Consultation(
+            user_id=test_user.id,
+            consultant_id=test_consultant.id,
+            consultation_type="visa",
+            content="상담 내용",
+            consultation_method="email",
+            amount=50000.00,
+            status="completed",
+            payment_status="completed",
+        )
+        db.add(consultation)
+        db.commit()
+        db.refresh(consultation)
+
+        response = client.post(
+            f"/api/consultations/{consultation.id}/reject",
+            headers={"Authorization": f"Bearer {consultant_token}"},
+        )
+
+        assert response.status_code == 400
+        db.expire_all()
+        assert consultation.status == "completed"
+        assert consultation.consultant_id == test_consultant.id
+        assert consultation.payment_status == "completed"
+        assert db.query(ConsultationDecline).filter_by(consultation_id=consultation.id).count() == 0
+
     def test_accept_consultation_not_assigned(
         self, client: TestClient, db: Session, test_user: User, test_consultant: Consultant
     ):
@@ -433,3 +582,67 @@ class TestConsultationAcceptReject:
         response = client.post(f"/api/consultations/{fake_id}/accept")
 
         assert response.status_code == 403
+
+
+class TestConsultantDashboardStats:
+    """전문가 대시보드 통계 API 테스트"""
+
+    def test_dashboard_stats_success(
+        self, client: TestClient, db: Session, test_user: User, test_consultant: Consultant
+    ):
+        """상태별 상담 수, 수익, 평점 집계 확인"""
+        from ..utils.auth import create_access_token
+        from ..models.consultation import Consultation
+        consultant_token = create_access_token({"sub": test_user.email})
+
+        test_consultant.total_reviews = 4
+        test_consultant.average_rating = 4.25
+        for status, payment_status in [
+            ("requested", "pending"),
+            ("matched", "pending"),
+            ("completed", "completed"),
+            ("completed", "completed"),
+            ("completed", "pending"),
+            ("cancelled", "refunded"),
+        ]:
+            db.add(Consultation(
+                user_id=test_user.id,
+                consultant_id=test_consultant.id,
+                consultation_type="visa",
+                content="상담 내용",
+                consultation_method="email",
+                amount=50000.00,
+                status=status,
+                payment_status=payment_status,
+            ))
+        db.commit()
+
+        response = client.get(
+            "/api/consultations/dashboard/stats",
+            headers={"Authorization": f"Bearer {consultant_token}"},
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "total_consultations": 6,
+            "requested": 1,
+            "matched": 1,
+            "scheduled": 0,
+            "completed": 3,
+            "cancelled": 1,
+            "total_revenue": 100000.0,
+            "average_rating": 4.2,
+            "total_reviews": 4,
+        }
+
+    def test_dashboard_stats_not_consultant(self, client: TestClient, test_user_token: str):
+        """전문가 정보가 없는 경우 0으로 채운 통계 반환"""
+        response = client.get(
+            "/api/consultations/dashboard/stats",
+            headers={"Authorization": f"Bearer {test_user_token}"},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_consultations"] == 0
+        assert data["total_reviews"] == 0
@@ -0,0 +1,134 @@
+"""Email Outbox Tests"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.orm import Session
+
+from ..models.email_outbox import EmailOutbox
+from ..services import email_service as email_service_module
+from ..services.email_outbox_worker import EmailOutboxWorker
+from ..services.email_service import EmailService, send_consultation_matched_email
+from .conftest import TestingSessionLocal
+from .smtp_stub import SMTPStubServer
+
+
+@pytest.fixture
+def smtp_stub():
+    """SMTP 스텁 서버"""
+    server = SMTPStubServer()
+    server.start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def email_enabled(monkeypatch):
+    """이메일 기능 활성화"""
+    monkeypatch.setattr(email_service_module.email_service, "enabled", True)
+
+
+@pytest.fixture
+def worker(smtp_stub: SMTPStubServer, setup_database):
+    """스텁 서버로 발송하는 대기열 워커"""
+    service = EmailService()
+    service.smtp_host = smtp_stub.host
+    service.smtp_port = smtp_stub.port
+    service.smtp_user = "mailer"
+    service.smtp_password = "secret"
+    service.use_tls = False
+
+    outbox_worker = EmailOutboxWorker(
+        session_factory=TestingSessionLocal,
+        service=service,
+        batch_size=2,
+        retry_backoff_seconds=0,
+    )
+    yield outbox_worker
+    outbox_worker._close_connection()
+
+
+def _enqueue(db: Session, count: int) -> None:
+    """매칭 완료 알림을 count개 대기열에 추가"""
+    for i in range(count):
+        send_consultation_matched_email(f"user{i}@example.com", "법률사무소 ABC", "visa", db)
+    db.commit()
+
+
+class TestEnqueue:
+    """발송 대기열 추가 테스트"""
+
+    def test_helper_only_enqueues(self, db: Session, email_enabled, smtp_stub: SMTPStubServer):
+        """알림 함수는 SMTP 연결 없이 대기열에만 추가"""
+        _enqueue(db, 1)
+
+        item = db.query(EmailOutbox).one()
+        assert item.to_email == "user0@example.com"
+        assert item.status == "pending"
+        assert smtp_stub.connections == 0
+
+    def test_disabled_email_is_not_enqueued(self, db: Session):
+        """이메일 기능 비활성화 시 대기열에 추가하지 않음"""
+        _enqueue(db, 1)
+
+        assert db.query(EmailOutbox).count() == 0
+
+
+class TestEmailOutboxWorker:
+    """발송 워커 테스트"""
+
+    def test_drain_reuses_single_connection(
+        self, db: Session, email_enabled, worker: EmailOutboxWorker, smtp_stub: SMTPStubServer
+    ):
+        """여러 배치를 하나의 연결·로그인으로 발송"""
+        _enqueue(db, 3)
+
+        assert worker.drain() == 3
+        _enqueue(db, 1)
+        assert worker.drain() == 1
+
+        assert len(smtp_stub.messages) == 4
+        assert smtp_stub.connections == 1
+        assert smtp_stub.logins == 1
+        db.expire_all()
+        assert {item.status for item in db.query(EmailOutbox).all()} == {"sent"}
+
+    def test_transient_failure_is_retried(
+        self, db: Session, email_enabled, worker: EmailOutboxWorker, smtp_stub: SMTPStubServer
+    ):
+        """일시 오류(4xx)는 다음 시도 시각까지 대기 후 재발송"""
+        worker.retry_backoff_seconds = 60
+        _enqueue(db, 1)
+        smtp_stub.fail_next(451)
+
+        worker.drain()
+        db.expire_all()
+        item = db.query(EmailOutbox).one()
+        assert item.status == "pending"
+        assert item.attempts == 1
+        assert item.next_attempt_at > datetime.utcnow()
+
+        # 아직 재시도 시각 전이면 발송하지 않음
+        assert worker.drain() == 0
+
+        item.next_attempt_at = datetime.utcnow() - timedelta(seconds=1)
+        db.commit()
+        worker.drain()
+
+        db.expire_all()
+        assert db.query(EmailOutbox).one().status == "sent"
+        assert len(smtp_stub.messages) == 1
+
+    def test_permanent_failure_stops_retrying(
+        self, db: Session, email_enabled, worker: EmailOutboxWorker, smtp_stub: SMTPStubServer
+    ):
+        """영구 오류(5xx)는 failed 처리하고 나머지는 계속 발송"""
+        _enqueue(db, 2)
+        smtp_stub.fail_next(550)
+
+        worker.drain()
+
+        db.expire_all()
+        statuses = sorted(item.status for item in db.query(EmailOutbox).all())
+        assert statuses == ["failed", "sent"]
+        assert len(smtp_stub.messages) == 1
@@ -197,6 +197,122 @@ class TestGetJobs:
         assert "마케팅" in data[0]["company_name"]
         assert data[0]["status"] == "active"
 
+    def test_get_jobs_keyword_search_covers_description_and_requirements(
+        self,
+        client: TestClient,
+        test_user_token: str,
+        test_jobs: list[Job],
+    ):
+        """키워드 전문 검색이 업무 설명, 요구사항까지 포함하는지 테스트"""
+        # requirements 검색
+        response = client.get(
+            "/api/jobs",
+            headers={"Authorization": f"Bearer {test_user_token}"},
+            params={"keyword": "Python"},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) == 1
+        assert data[0]["position"] == "웹 개발자"
+
+        # description 검색 (접두어 일치)
+        response = client.get(
+            "/api/jobs",
+            headers={"Authorization": f"Bearer {test_user_token}"},
+            params={"keyword": "디지"},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) == 1
+        assert data[0]["position"] == "마케팅 담당자"
+
+        # 여러 토큰은 모두 포함해야 함
+        response = client.get(
+            "/api/jobs",
+            headers={"Authorization": f"Bearer {test_user_token}"},
+            params={"keyword": "웹 마케팅"},
+        )
+
+        assert response.status_code == 200
+        assert response.json() == []
+
+    def test_get_jobs_keyword_search_ranked_by_relevance(
+        self,
+        client: TestClient,
+        db: Session,
+        test_user_token: str,
+        test_admin_user: User,
+    ):
+        """직종 일치가 복리후생 일치보다 먼저 정렬되는지 테스트"""
+        deadline = datetime.now(timezone.utc) + timedelta(days=30)
+        benefit_match = Job(
+            posted_by=test_admin_user.id,
+            position="물류 관리자",
+            company_name="물류 회사",
+            location="인천시",
+            employment_type="full-time",
+            description="창고 관리",
+            benefits="통역 지원",
+            status="active",
+            deadline=deadline,
+        )
+        db.add(benefit_match)
+        db.commit()
+
+        position_match = Job(
+            posted_by=test_admin_user.id,
+            position="통역 담당자",
+            company_name="번역 회사",
+            location="서울시",
+            employment_type="full-time",
+            description="통역 업무",
+            status="active",
+            deadline=deadline,
+        )
+        db.add(position_match)
+        db.commit()
+
+        response = client.get(
+            "/api/jobs",
+            headers={"Authorization": f"Bearer {test_user_token}"},
+            params={"keyword": "통역"},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [job["position"] for job in data] == ["통역 담당자", "물류 관리자"]
+
+    def test_get_jobs_keyword_search_reflects_updates(
+        self,
+        client: TestClient,
+        db: Session,
+        test_user_token: str,
+        test_jobs: list[Job],
+    ):
+        """일자리 수정/삭제 시 검색 인덱스가 갱신되는지 테스트"""
+        job = test_jobs[1]
+        job.position = "그래픽 디자이너"
+        db.commit()
+
+        response = client.get(
+            "/api/jobs",
+            headers={"Authorization": f"Bearer {test_user_token}"},
+            params={"keyword": "디자이너"},
+        )
+        assert [item["id"] for item in response.json()] == [str(job.id)]
+
+        db.delete(job)
+        db.commit()
+
+        response = client.get(
+            "/api/jobs",
+            headers={"Authorization": f"Bearer {test_user_token}"},
+            params={"keyword": "디자이너"},
+        )
+        assert response.json() == []
+
     def test_get_jobs_with_multiple_filters(
         self,
         client: TestClient,
@@ -249,6 +365,117 @@ class TestGetJobs:
         data = response.json()
         assert len(data) == 1
 
+    def test_get_jobs_with_cursor_pagination(
+        self,
+        client: TestClient,
+        db: Session,
+        test_user_token: str,
+        test_admin_user: User,
+    ):
+        """커서(keyset) 페이지네이션 테스트 (생성 시각이 같은 일자리 포함)"""
+        base_time = datetime(2026, 1, 1, 9, 0, 0)
+        created_times = [
+            base_time,
+            base_time + timedelta(hours=1),
+            base_time + timedelta(hours=1),
+            base_time + timedelta(hours=2),
+            base_time + timedelta(hours=3),
+        ]
+        for index, created_at in enumerate(created_times):
+            db.add(Job(
+                posted_by=test_admin_user.id,
+                position=f"직종 {index}",
+                company_name="회사",
+                location="서울시",
+                employment_type="full-time",
+                description="업무 설명",
+                status="active",
+                created_at=created_at,
+                deadline=created_at + timedelta(days=30),
+            ))
+        db.commit()
+
+        headers = {"Authorization": f"Bearer {test_user_token}"}
+        seen_ids = []
+        cursor = None
+        for _ in range(3):
+            params = {"limit": 2}
+            if cursor:
+                params["cursor"] = cursor
+            response = client.get("/api/jobs", headers=headers, params=params)
+            assert response.status_code == 200
+            seen_ids.extend(job["id"] for job in response.json())
+            cursor = response.headers.get("X-Next-Cursor")
+            if not cursor:
+                break
+
+        # 마지막 페이지(1건)에는 커서가 없어야 함
+        assert cursor is None
+        assert len(seen_ids) == 5
+        assert len(set(seen_ids)) == 5
+
+        # offset 페이지네이션과 동일한 순서
+        response = client.get("/api/jobs", headers=headers, params={"limit": 5})
+        assert [job["id"] for job in response.json()] == seen_ids
+
+    def test_get_jobs_with_invalid_cursor(
+        self,
+        client: TestClient,
+        test_user_token: str,
+    ):
+        """유효하지 않은 커서는 400 에러"""
+        response = client.get(
+            "/api/jobs",
+            headers={"Authorization": f"Bearer {test_user_token}"},
+            params={"cursor": "not-a-cursor"},
+        )
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Invalid cursor"
+
+    def test_get_jobs_with_user_flags(
+        self,
+        client: TestClient,
+        db: Session,
+        test_user: User,
+        test_user_token: str,
+        test_jobs: list,
+    ):
+        """로그인 사용자는 저장/지원 여부를 페이지 단위 IN 쿼리 2회로 함께 조회"""
+        from sqlalchemy import event
+        from ..models.saved_job import SavedJob
+        from .conftest import async_engine
+
+        saved_job, applied_job = test_jobs[0], test_jobs[1]
+        db.add(SavedJob(user_id=test_user.id, job_id=saved_job.id))
+        db.add(JobApplication(user_id=test_user.id, job_id=applied_job.id, status="applied"))
+        db.commit()
+
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            response = client.get("/api/jobs", headers={"Authorization": f"Bearer {test_user_token}"})
+        finally:
+            event.remove(async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+
+        assert response.status_code == 200
+        flags = {job["id"]: (job["is_saved"], job["has_applied"]) for job in response.json()}
+        assert flags == {
+            str(saved_job.id): (True, False),
+            str(applied_job.id): (False, True),
+        }
+        assert len([s for s in statements if "FROM saved_jobs" in s]) == 1
+        assert len([s for s in statements if "FROM job_applications" in s]) == 1
+
+        # 비로그인 사용자는 모두 False
+        response = client.get("/api/jobs")
+        assert response.status_code == 200
+        assert all(not job["is_saved"] and not job["has_applied"] for job in response.json())
+
     def test_get_jobs_empty(
         self,
         client: TestClient,
@@ -542,6 +769,112 @@ class TestCreateJob:
         assert data["status"] == "active"
         assert data["posted_by"] == str(test_admin_user.id)
 
+    def test_create_job_with_role_claim_skips_user_lookup(
+        self,
+        client: TestClient,
+        test_admin_user: User,
+    ):
+        """role 클레임이 있는 토큰은 사용자 조회 없이 권한 확인"""
+        from sqlalchemy import event
+        from .conftest import engine
+
+        token = create_access_token(data={
+            "sub": test_admin_user.email,
+            "user_id": str(test_admin_user.id),
+            "role": "admin",
+        })
+        deadline = (datetime.now(timezone.utc) + timedelta(days=30)).isoformat()
+
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            response = client.post(
+                "/api/jobs",
+                headers={"Authorization": f"Bearer {token}"},
+                json={
+                    "position": "백엔드 개발자",
+                    "company_name": "테크 스타트업",
+                    "location": "서울시 강남구",
+                    "employment_type": "full-time",
+                    "description": "API 서버 개발",
+                    "deadline": deadline,
+                },
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+        assert response.status_code == 201
+        assert response.json()["posted_by"] == str(test_admin_user.id)
+        assert not any("FROM users" in statement for statement in statements)
+
+    def test_create_job_with_non_admin_role_claim(
+        self,
+        client: TestClient,
+        test_user: User,
+    ):
+        """role 클레임이 관리자/기관이 아니면 403 에러"""
+        token = create_access_token(data={
+            "sub": test_user.email,
+            "user_id": str(test_user.id),
+            "role": "foreign",
+        })
+
+        response = client.post(
+            "/api/jobs",
+            headers={"Authorization": f"Bearer {token}"},
+            json={
+                "position": "백엔드 개발자",
+                "company_name": "테크 스타트업",
+                "location": "서울시 강남구",
+                "employment_type": "full-time",
+                "description": "API 서버 개발",
+                "deadline": (datetime.now(timezone.utc) + timedelta(days=30)).isoformat(),
+            },
+        )
+
+        assert response.status_code == 403
+
+    def test_create_job_with_deleted_user_claim(
+        self,
+        client: TestClient,
+    ):
+        """삭제된 사용자의 role 클레임 토큰으로 작성 시 401 에러 (외래 키 위반을 500으로 내지 않음)"""
+        from uuid import uuid4
+        from .conftest import engine
+
+        token = create_access_token(data={
+            "sub": "deleted-admin@example.com",
+            "user_id": str(uuid4()),
+            "role": "admin",
+        })
+
+        # 테스트 SQLite는 기본적으로 외래 키를 검사하지 않으므로 이 테스트에서만 켬
+        with engine.connect() as connection:
+            connection.exec_driver_sql("PRAGMA foreign_keys=ON")
+        try:
+            response = client.post(
+                "/api/jobs",
+                headers={"Authorization": f"Bearer {token}"},
+                json={
+                    "position": "백엔드 개발자",
+                    "company_name": "테크 스타트업",
+                    "location": "서울시 강남구",
+                    "employment_type": "full-time",
+                    "description": "API 서버 개발",
+                    "deadline": (datetime.now(timezone.utc) + timedelta(days=30)).isoformat(),
+                },
+            )
+        finally:
+            with engine.connect() as connection:
+                connection.exec_driver_sql("PRAGMA foreign_keys=OFF")
+
+        assert response.status_code == 401
+        assert response.json()["detail"] == "User not found"
+
     def test_create_job_unauthorized(
         self,
         client: TestClient,
@@ -83,6 +83,12 @@ class TestLogin:
         assert isinstance(data["access_token"], str)
         assert len(data["access_token"]) > 0
 
+        # 권한 확인용 클레임 포함
+        from ..utils.auth import verify_access_token
+        payload = verify_access_token(data["access_token"])
+        assert payload["user_id"] == data["user"]["id"]
+        assert payload["role"] == data["user"]["role"]
+
     def test_login_invalid_password(self, client, test_user):
         """잘못된 비밀번호로 로그인 시도"""
         response = client.post(
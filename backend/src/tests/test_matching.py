@@ -2,11 +2,26 @@
 
 import json
 import pytest
+from datetime import datetime, timezone
+from decimal import Decimal
+from zoneinfo import ZoneInfo
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 
 from ..models.consultant import Consultant
+from ..models.consultation import Consultation
+from ..models.consultant_specialty import ConsultantSpecialty, parse_specialties
 from ..models.user import User
-from ..services.matching_service import find_matching_consultant
+from ..services.matching_service import (
+    find_matching_consultant,
+    get_availability_score,
+    parse_availability,
+)
+from .conftest import engine
+
+
+# 2026-10-14 (수) 10:00 KST
+WEDNESDAY_MORNING = datetime(2026, 10, 14, 10, 0, tzinfo=ZoneInfo("Asia/Seoul"))
 
 
 @pytest.fixture
@@ -282,3 +297,141 @@ class TestFindMatchingConsultant:
         # 평점이 같으므로 첫 번째로 생성된 전문가 반환 (ID 순)
         assert matched is not None
         assert matched.average_rating == 4.5
+
+
+def _add_open_consultations(db: Session, consultant: Consultant, user: User, count: int) -> None:
+    """전문가에게 오늘 매칭된 상담 count개 추가"""
+    for _ in range(count):
+        db.add(Consultation(
+            user_id=user.id,
+            consultant_id=consultant.id,
+            consultation_type="visa",
+            content="상담 요청",
+            consultation_method="email",
+            amount=Decimal("50000.00"),
+            status="matched",
+            created_at=WEDNESDAY_MORNING.astimezone(timezone.utc),
+        ))
+    db.commit()
+
+
+class TestLoadAwareMatching:
+    """부하·가용 시간 기반 매칭 테스트"""
+
+    def test_busy_consultant_yields_to_less_loaded(
+        self, db: Session, test_consultants: dict, test_user: User
+    ):
+        """평점이 높아도 오늘 상담이 많으면 여유 있는 전문가에게 배정"""
+        _add_open_consultations(db, test_consultants["visa"], test_user, 4)
+
+        matched = find_matching_consultant(db, "visa", now=WEDNESDAY_MORNING)
+
+        assert matched.office_name == "종합 법률사무소"
+
+    def test_consultant_at_daily_limit_is_excluded(
+        self, db: Session, test_consultants: dict, test_user: User
+    ):
+        """max_consultations_per_day에 도달한 전문가는 제외"""
+        _add_open_consultations(db, test_consultants["labor"], test_user, 3)
+        _add_open_consultations(db, test_consultants["multi"], test_user, 10)
+
+        assert find_matching_consultant(db, "labor", now=WEDNESDAY_MORNING) is None
+
+    def test_exclude_consultant_ids(self, db: Session, test_consultants: dict):
+        """제외 목록의 전문가는 매칭하지 않음"""
+        matched = find_matching_consultant(
+            db, "labor", exclude_consultant_ids=[test_consultants["labor"].id], now=WEDNESDAY_MORNING
+        )
+
+        assert matched.office_name == "종합 법률사무소"
+
+    def test_available_consultant_preferred(self, db: Session, test_consultants: dict):
+        """오늘 휴무인 전문가보다 지금 상담 가능한 전문가 우선"""
+        test_consultants["visa"].availability = json.dumps({"sat": "10:00-14:00"})
+        test_consultants["multi"].availability = json.dumps({"wed": "09:00-12:00,13:00-18:00"})
+        db.commit()
+
+        matched = find_matching_consultant(db, "visa", now=WEDNESDAY_MORNING)
+
+        assert matched.office_name == "종합 법률사무소"
+
+    def test_query_count_is_constant(self, db: Session, test_consultants: dict, test_user: User):
+        """후보 수와 관계없이 쿼리 1회"""
+        _add_open_consultations(db, test_consultants["visa"], test_user, 2)
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            find_matching_consultant(db, "visa", now=WEDNESDAY_MORNING)
+        finally:
+            event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+        assert len(statements) == 1
+
+
+class TestAvailability:
+    """가용 시간 파싱 테스트"""
+
+    def test_parse_and_score(self):
+        """요일별 시간대 파싱 및 점수 계산"""
+        windows = parse_availability(json.dumps({"wed": "09:00-12:00,13:00-18:00", "thu": ["10:00-11:00"]}))
+
+        assert get_availability_score(windows, WEDNESDAY_MORNING) == 1.0
+        assert get_availability_score(windows, WEDNESDAY_MORNING.replace(hour=12, minute=30)) == 0.5
+        assert get_availability_score(windows, WEDNESDAY_MORNING.replace(day=17)) == 0.0
+
+    def test_unparseable_availability_is_neutral(self):
+        """JSON이 아닌 가용 시간은 정보 없음으로 처리"""
+        windows = parse_availability("월-금 9:00-18:00")
+
+        assert windows is None
+        assert get_availability_score(windows, WEDNESDAY_MORNING) == 0.5
+
+
+class TestSpecialtyIndex:
+    """전문 분야 인덱스 테스트"""
+
+    def test_index_follows_specialties_updates(self, db: Session, test_consultants: dict):
+        """specialties 변경 시 인덱스가 함께 갱신되어 매칭에 반영"""
+        multi = test_consultants["multi"]
+        multi.specialties = json.dumps(["business", "business"])
+        db.commit()
+
+        rows = db.query(ConsultantSpecialty.specialty).filter(
+            ConsultantSpecialty.consultant_id == multi.id
+        ).all()
+        assert rows == [("business",)]
+        assert find_matching_consultant(db, "business", now=WEDNESDAY_MORNING).id == multi.id
+        assert find_matching_consultant(db, "contract", now=WEDNESDAY_MORNING) is None
+
+    def test_lookup_does_not_scan_specialties_json(self, db: Session, test_consultants: dict):
+        """후보 조회는 LIKE 검색 대신 인덱스 조인 사용"""
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            find_matching_consultant(db, "visa", now=WEDNESDAY_MORNING)
+        finally:
+            event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+        assert "LIKE" not in statements[0].upper()
+        assert "consultant_specialties" in statements[0]
+
+    def test_parse_specialties_accepts_array_values(self):
+        """ARRAY 컬럼에서 읽은 리스트도 JSON 문자열과 같이 파싱"""
+        assert parse_specialties(["visa", "labor", "visa", ""]) == ["visa", "labor"]
+        assert parse_specialties('["visa", "labor"]') == ["visa", "labor"]
+
+    def test_parse_specialties_logs_invalid_values(self, caplog):
+        """형식이 잘못된 값은 빈 목록으로 처리하고 경고 로그"""
+        with caplog.at_level("WARNING"):
+            assert parse_specialties('{"visa": true}') == []
+            assert parse_specialties("visa, labor") == []
+
+        assert len(caplog.records) == 2
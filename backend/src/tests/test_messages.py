@@ -0,0 +1,506 @@
+"""Message Service Tests"""
+
+import asyncio
+import json
+import pytest
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from starlette.websockets import WebSocketDisconnect
+
+from ..models.user import User
+from ..models.consultant import Consultant
+from ..models.consultation import Consultation
+from ..models.message import Message
+from ..services.message_service import (
+    get_consultation_messages,
+    get_unread_counts_by_consultation,
+    get_unread_message_count,
+    mark_message_as_read,
+    send_message,
+)
+from ..routers.messages import _sse_events
+from ..utils.auth import create_access_token
+from ..utils.message_broker import RESYNC_EVENT, InMemoryBroker, PostgresNotifyBroker
+from .conftest import TestingSessionLocal, engine
+
+
+@pytest.fixture
+def consultant_user(db: Session):
+    """테스트용 전문가 사용자 생성"""
+    user = User(
+        email="consultant@example.com",
+        password_hash="hashed",
+        first_name="Jane",
+        last_name="Kim",
+        role="consultant",
+    )
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+    return user
+
+
+@pytest.fixture
+def consultation(db: Session, test_user: User, consultant_user: User):
+    """전문가가 매칭된 테스트용 상담 생성"""
+    consultant = Consultant(
+        user_id=consultant_user.id,
+        office_name="법률사무소 ABC",
+        specialties="[\"visa\"]",
+        hourly_rate=100000.00,
+        is_active=True,
+        is_verified=True,
+    )
+    db.add(consultant)
+    db.commit()
+
+    consultation = Consultation(
+        user_id=test_user.id,
+        consultant_id=consultant.id,
+        consultation_type="visa",
+        content="비자 상담",
+        consultation_method="email",
+        amount=Decimal("50000.00"),
+        status="matched",
+        payment_status="pending",
+    )
+    db.add(consultation)
+    db.commit()
+    db.refresh(consultation)
+    return consultation
+
+
+@pytest.fixture
+def thread(db: Session, consultation: Consultation, test_user: User, consultant_user: User):
+    """번갈아 주고받은 메시지 6개 생성 (1초 간격)"""
+    base_time = datetime(2026, 1, 1, 9, 0, 0)
+    messages = []
+    for i in range(6):
+        sender = consultant_user if i % 2 == 0 else test_user
+        message = Message(
+            consultation_id=consultation.id,
+            sender_id=sender.id,
+            content=f"메시지 {i}",
+            is_read=False,
+            created_at=base_time + timedelta(seconds=i),
+        )
+        db.add(message)
+        messages.append(message)
+    db.commit()
+    return messages
+
+
+class TestGetConsultationMessages:
+    """상담 메시지 조회 테스트"""
+
+    def test_marks_only_counterpart_messages_read(
+        self, db: Session, consultation: Consultation, test_user: User, thread
+    ):
+        """상대방 메시지만 읽음 처리되고 본인 메시지는 유지"""
+        messages = get_consultation_messages(consultation.id, test_user.id, db)
+
+        assert [m.content for m in messages] == [f"메시지 {i}" for i in range(6)]
+        db.expire_all()
+        for message in db.query(Message).all():
+            assert message.is_read == (message.sender_id != test_user.id)
+
+    def test_mark_read_uses_single_update(
+        self, db: Session, consultation: Consultation, test_user: User, thread
+    ):
+        """메시지 읽음 처리는 메시지 수와 관계없이 UPDATE 한 번"""
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            get_consultation_messages(consultation.id, test_user.id, db)
+        finally:
+            event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+        updates = [s for s in statements if s.lstrip().upper().startswith("UPDATE MESSAGES")]
+        assert len(updates) == 1
+
+    def test_since_returns_only_newer_messages(
+        self, db: Session, consultation: Consultation, test_user: User, thread
+    ):
+        """since 이후 메시지만 오래된 순으로 반환"""
+        since = thread[3].created_at
+
+        messages = get_consultation_messages(consultation.id, test_user.id, db, since=since)
+
+        assert [m.content for m in messages] == ["메시지 4", "메시지 5"]
+
+    def test_before_returns_latest_page_before_cursor(
+        self, db: Session, consultation: Consultation, test_user: User, thread
+    ):
+        """before 이전 메시지 중 최근 limit개를 오래된 순으로 반환"""
+        before = thread[4].created_at
+
+        messages = get_consultation_messages(
+            consultation.id, test_user.id, db, before=before, limit=2
+        )
+
+        assert [m.content for m in messages] == ["메시지 2", "메시지 3"]
+
+    def test_non_participant_forbidden(self, db: Session, consultation: Consultation, thread):
+        """상담 참여자가 아닌 경우 403 에러"""
+        outsider = User(
+            email="outsider@example.com",
+            password_hash="hashed",
+            first_name="Out",
+            last_name="Sider",
+        )
+        db.add(outsider)
+        db.commit()
+
+        with pytest.raises(HTTPException) as exc_info:
+            get_consultation_messages(consultation.id, outsider.id, db)
+
+        assert exc_info.value.status_code == 403
+
+
+class TestSendMessage:
+    """메시지 전송 테스트"""
+
+    def test_send_and_mark_read(
+        self, db: Session, consultation: Consultation, test_user: User, consultant_user: User
+    ):
+        """메시지 전송 후 상대방만 읽음 처리 가능"""
+        message = send_message(consultation.id, test_user.id, "안녕하세요", db=db)
+
+        assert message.id is not None
+        assert message.is_read is False
+        assert mark_message_as_read(message.id, test_user.id, db) is None
+
+        updated = mark_message_as_read(message.id, consultant_user.id, db)
+        assert updated.is_read is True
+
+
+class TestUnreadCounters:
+    """읽지 않은 메시지 카운터 테스트"""
+
+    def test_send_increments_recipient_counter(
+        self, db: Session, consultation: Consultation, test_user: User, consultant_user: User
+    ):
+        """메시지 전송 시 받는 사람의 카운터만 증가"""
+        send_message(consultation.id, consultant_user.id, "첫 번째", db=db)
+        send_message(consultation.id, consultant_user.id, "두 번째", db=db)
+        send_message(consultation.id, test_user.id, "답장", db=db)
+
+        assert get_unread_message_count(test_user.id, db) == 2
+        assert get_unread_message_count(consultant_user.id, db) == 1
+        assert get_unread_counts_by_consultation(test_user.id, db) == {consultation.id: 2}
+
+    def test_read_paths_update_counter(
+        self, db: Session, consultation: Consultation, test_user: User, consultant_user: User
+    ):
+        """개별 읽음 처리는 1 감소, 목록 조회는 읽음 처리한 수만큼 감소"""
+        first = send_message(consultation.id, consultant_user.id, "첫 번째", db=db)
+        for content in ("두 번째", "세 번째"):
+            send_message(consultation.id, consultant_user.id, content, db=db)
+
+        mark_message_as_read(first.id, test_user.id, db)
+        mark_message_as_read(first.id, test_user.id, db)  # 이미 읽은 메시지는 다시 감소하지 않음
+        assert get_unread_message_count(test_user.id, db) == 2
+
+        get_consultation_messages(consultation.id, test_user.id, db)
+        assert get_unread_message_count(test_user.id, db) == 0
+        assert get_unread_counts_by_consultation(test_user.id, db) == {}
+
+    def test_stale_read_does_not_decrement_twice(
+        self, db: Session, consultation: Consultation, test_user: User, consultant_user: User
+    ):
+        """다른 요청이 이미 읽음 처리한 메시지는 카운터를 다시 줄이지 않음"""
+        first = send_message(consultation.id, consultant_user.id, "첫 번째", db=db)
+        send_message(consultation.id, consultant_user.id, "두 번째", db=db)
+
+        # 동시 요청: 두 요청 모두 is_read == False인 메시지를 읽어 둔 상태
+        other_db = TestingSessionLocal()
+        try:
+            stale_message = other_db.get(Message, first.id)
+            assert stale_message.is_read is False
+            mark_message_as_read(first.id, test_user.id, db)
+            mark_message_as_read(first.id, test_user.id, other_db)
+        finally:
+            other_db.close()
+
+        assert get_unread_message_count(test_user.id, db) == 1
+
+    def test_list_read_keeps_concurrent_increment(
+        self, db: Session, consultation: Consultation, test_user: User, consultant_user: User
+    ):
+        """목록 조회 중 커밋된 새 메시지의 카운터 증가분은 유지"""
+        from ..models.message_unread_counter import MessageUnreadCounter
+
+        send_message(consultation.id, consultant_user.id, "첫 번째", db=db)
+        send_message(consultation.id, consultant_user.id, "두 번째", db=db)
+
+        # 일괄 읽음 UPDATE 이후 커밋된 메시지: 카운터만 증가했고 행은 아직 읽지 않음
+        db.query(MessageUnreadCounter).filter(MessageUnreadCounter.user_id == test_user.id).update(
+            {MessageUnreadCounter.unread_count: MessageUnreadCounter.unread_count + 1},
+            synchronize_session=False,
+        )
+        db.commit()
+
+        get_consultation_messages(consultation.id, test_user.id, db)
+        assert get_unread_message_count(test_user.id, db) == 1
+
+    def test_unread_by_consultation_endpoint(
+        self,
+        client: TestClient,
+        db: Session,
+        consultation: Consultation,
+        test_user_token: str,
+        consultant_user: User,
+    ):
+        """상담별 읽지 않은 메시지 수를 한 번에 조회"""
+        send_message(consultation.id, consultant_user.id, "확인 부탁드립니다", db=db)
+
+        response = client.get(
+            "/api/messages/unread/by-consultation",
+            headers={"Authorization": f"Bearer {test_user_token}"},
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "total": 1,
+            "consultations": [{"consultation_id": str(consultation.id), "count": 1}],
+        }
+
+
+class _ConnectedRequest:
+    """연결이 유지되는 요청 대역 (SSE 제너레이터 테스트용)"""
+
+    async def is_disconnected(self) -> bool:
+        return False
+
+
+class TestRealtimeDelivery:
+    """실시간 메시지 전달 테스트"""
+
+    def test_websocket_receives_sent_message(
+        self,
+        client: TestClient,
+        consultation: Consultation,
+        test_user_token: str,
+        consultant_user: User,
+    ):
+        """상대방이 보낸 메시지를 WebSocket으로 수신"""
+        consultant_token = create_access_token(
+            data={"sub": consultant_user.email, "user_id": str(consultant_user.id)}
+        )
+        url = f"/api/messages/consultations/{consultation.id}/ws?token={test_user_token}"
+
+        with client.websocket_connect(url) as websocket:
+            response = client.post(
+                f"/api/messages/consultations/{consultation.id}",
+                json={"content": "자료 확인 부탁드립니다"},
+                headers={"Authorization": f"Bearer {consultant_token}"},
+            )
+            assert response.status_code == 201
+
+            event_data = websocket.receive_json()
+
+        assert event_data["type"] == "message.created"
+        assert event_data["message"]["id"] == response.json()["id"]
+        assert event_data["message"]["content"] == "자료 확인 부탁드립니다"
+
+    def test_websocket_rejects_non_participant(
+        self, client: TestClient, db: Session, consultation: Consultation
+    ):
+        """상담 참여자가 아니면 연결 거부"""
+        outsider = User(
+            email="outsider@example.com",
+            password_hash="hashed",
+            first_name="Out",
+            last_name="Sider",
+        )
+        db.add(outsider)
+        db.commit()
+        token = create_access_token(data={"sub": outsider.email, "user_id": str(outsider.id)})
+
+        with pytest.raises(WebSocketDisconnect) as exc_info:
+            with client.websocket_connect(
+                f"/api/messages/consultations/{consultation.id}/ws?token={token}"
+            ):
+                pass
+
+        assert exc_info.value.code == 1008
+
+    def test_stream_requires_authentication(self, client: TestClient, consultation: Consultation):
+        """토큰 없이 SSE 구독 시 401 에러"""
+        response = client.get(f"/api/messages/consultations/{consultation.id}/stream")
+
+        assert response.status_code == 401
+
+    async def test_sse_events_format_published_events(self):
+        """발행된 이벤트를 SSE 형식으로 전달하고 종료 시 구독 해제"""
+        broker = InMemoryBroker()
+        subscription = broker.subscribe("consultation-1")
+        events = _sse_events(subscription, _ConnectedRequest())
+
+        assert await events.__anext__() == "retry: 3000\n\n"
+        broker.publish("consultation-1", {"type": "message.created", "message": {"content": "안녕"}})
+        chunk = await events.__anext__()
+        await events.aclose()
+
+        event_line, data_line = chunk.strip().split("\n")
+        assert event_line == "event: message.created"
+        assert json.loads(data_line[len("data: "):])["message"]["content"] == "안녕"
+        assert broker.subscriber_count("consultation-1") == 0
+
+    def test_websocket_closed_when_consultant_rejects(
+        self,
+        client: TestClient,
+        consultation: Consultation,
+        consultant_user: User,
+    ):
+        """상담을 거절한 전문가의 WebSocket 구독은 종료되어 이후 메시지를 받지 않음"""
+        consultant_token = create_access_token(
+            data={"sub": consultant_user.email, "user_id": str(consultant_user.id)}
+        )
+        url = f"/api/messages/consultations/{consultation.id}/ws?token={consultant_token}"
+
+        with pytest.raises(WebSocketDisconnect) as exc_info:
+            with client.websocket_connect(url) as websocket:
+                response = client.post(
+                    f"/api/consultations/{consultation.id}/reject",
+                    headers={"Authorization": f"Bearer {consultant_token}"},
+                )
+                assert response.status_code == 200
+                websocket.receive_json()
+
+        assert exc_info.value.code == 1008
+
+    async def test_sse_events_stop_for_removed_participant(self):
+        """참여자에서 제외된 사용자의 SSE 스트림은 종료되고 다른 참여자는 이벤트를 받음"""
+        from uuid import uuid4
+        from ..schemas.user import Principal
+
+        removed = Principal(id=uuid4(), email="consultant@example.com", role="consultant")
+        client_user = Principal(id=uuid4(), email="client@example.com", role="foreign")
+        broker = InMemoryBroker()
+        removed_events = _sse_events(broker.subscribe("consultation-1"), _ConnectedRequest(), removed)
+        client_events = _sse_events(broker.subscribe("consultation-1"), _ConnectedRequest(), client_user)
+        await removed_events.__anext__()
+        await client_events.__anext__()
+
+        broker.publish("consultation-1", {"type": "participant.removed", "user_id": str(removed.id)})
+
+        with pytest.raises(StopAsyncIteration):
+            await removed_events.__anext__()
+        assert (await client_events.__anext__()).startswith("event: participant.removed")
+        await client_events.aclose()
+        assert broker.subscriber_count("consultation-1") == 0
+
+    async def test_sse_events_stop_after_token_expiry(self):
+        """토큰이 만료되면 다음 이벤트/하트비트 시점에 SSE 스트림 종료"""
+        broker = InMemoryBroker()
+        expired_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+        events = _sse_events(broker.subscribe("consultation-1"), _ConnectedRequest(), expires_at=expired_at)
+        await events.__anext__()
+
+        broker.publish("consultation-1", {"type": "message.created", "message": {"content": "안녕"}})
+
+        with pytest.raises(StopAsyncIteration):
+            await events.__anext__()
+        assert broker.subscriber_count("consultation-1") == 0
+
+
+class _FakeListenConnection:
+    """LISTEN 연결 대역 (asyncpg.Connection의 리스너 API만 구현)"""
+
+    def __init__(self):
+        self.listeners = {}
+        self.termination_listeners = []
+
+    async def add_listener(self, channel, callback):
+        self.listeners[channel] = callback
+
+    def add_termination_listener(self, callback):
+        self.termination_listeners.append(callback)
+
+    def drop(self):
+        """서버 측 연결 종료"""
+        for callback in self.termination_listeners:
+            callback(self)
+
+    async def close(self):
+        self.drop()
+
+
+class _FakeNotifyPool:
+    """NOTIFY 연결 풀 대역 (발행된 페이로드 기록)"""
+
+    def __init__(self):
+        self.payloads = []
+
+    async def execute(self, query, channel, payload):
+        await asyncio.sleep(0)
+        self.payloads.append(payload)
+
+    async def close(self):
+        pass
+
+
+class TestPostgresNotifyBroker:
+    """PostgreSQL LISTEN/NOTIFY 브로커 테스트 (asyncpg 연결 대역 사용)"""
+
+    @pytest.fixture
+    def fake_asyncpg(self, monkeypatch):
+        import asyncpg
+
+        connections = []
+        pool = _FakeNotifyPool()
+
+        async def connect(dsn):
+            connections.append(_FakeListenConnection())
+            return connections[-1]
+
+        async def create_pool(dsn, **kwargs):
+            return pool
+
+        monkeypatch.setattr(asyncpg, "connect", connect)
+        monkeypatch.setattr(asyncpg, "create_pool", create_pool)
+        return connections, pool
+
+    async def test_concurrent_publishes_use_notify_pool(self, fake_asyncpg):
+        """동시 발행은 LISTEN 연결이 아닌 NOTIFY 연결 풀로 모두 전달"""
+        connections, pool = fake_asyncpg
+        broker = PostgresNotifyBroker("postgresql://test")
+        await broker.start()
+
+        futures = [
+            asyncio.wrap_future(asyncio.run_coroutine_threadsafe(broker._notify(str(index)), broker._loop))
+            for index in range(5)
+        ]
+        await asyncio.gather(*futures)
+        await broker.stop()
+
+        assert sorted(pool.payloads) == ["0", "1", "2", "3", "4"]
+        assert len(connections) == 1
+
+    async def test_reconnects_listener_and_resyncs_after_connection_loss(self, fake_asyncpg):
+        """LISTEN 연결이 끊기면 리스너를 다시 등록하고 구독자에게 resync 전달"""
+        connections, _ = fake_asyncpg
+        broker = PostgresNotifyBroker("postgresql://test")
+        await broker.start()
+        subscription = broker.subscribe("consultation-1")
+
+        connections[0].drop()
+        assert await asyncio.wait_for(subscription.get(), timeout=1) == RESYNC_EVENT
+
+        assert len(connections) == 2
+        payload = json.dumps({"channel": "consultation-1", "event": {"type": "message.created"}})
+        connections[1].listeners[PostgresNotifyBroker.NOTIFY_CHANNEL](connections[1], 1, "easyk_realtime", payload)
+        assert await asyncio.wait_for(subscription.get(), timeout=1) == {"type": "message.created"}
+
+        subscription.close()
+        await broker.stop()
+        assert len(connections) == 2  # stop()으로 닫은 연결은 재연결하지 않음
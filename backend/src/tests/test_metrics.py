@@ -0,0 +1,75 @@
+"""Request Metrics Middleware Tests"""
+
+import re
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from ..config import settings
+from ..routers import metrics
+from ..utils.metrics import RequestStats, request_metrics
+
+
+@pytest.fixture
+def metrics_client():
+    """/metrics 라우터만 등록한 테스트 클라이언트 (METRICS_ENABLED 설정 시 main.py와 같은 구성)"""
+    metrics_app = FastAPI()
+    metrics_app.include_router(metrics.router)
+    return TestClient(metrics_app)
+
+
+class TestRequestMetrics:
+    """요청별 성능 계측 테스트"""
+
+    def test_server_timing_header_reports_db_statements(self, client: TestClient, test_user_token: str):
+        """응답에 전체/DB 처리 시간과 SQL 실행 수가 Server-Timing 헤더로 포함됨"""
+        response = client.get("/api/users/me", headers={"Authorization": f"Bearer {test_user_token}"})
+
+        assert response.status_code == 200
+        server_timing = response.headers["Server-Timing"]
+        assert re.match(r"app;dur=\d+\.\d, db;dur=\d+\.\d;desc=\"(\d+) queries, \d+ rows\"", server_timing)
+        assert int(re.search(r"(\d+) queries", server_timing).group(1)) >= 1
+
+    def test_metrics_endpoint_groups_by_route_template(self, client: TestClient, metrics_client: TestClient):
+        """지표는 실제 경로가 아닌 라우트 템플릿별로 집계됨"""
+        labels = ("GET", "/api/jobs/{job_id}")
+        before = request_metrics.latency.get_count(labels)
+
+        client.get("/api/jobs/00000000-0000-0000-0000-000000000001")
+        client.get("/api/jobs/00000000-0000-0000-0000-000000000002")
+
+        assert request_metrics.latency.get_count(labels) == before + 2
+        body = metrics_client.get("/metrics").text
+        assert 'easyk_http_requests_total{method="GET",route="/api/jobs/{job_id}",status="404"}' in body
+        assert 'easyk_http_request_duration_seconds_bucket{method="GET",route="/api/jobs/{job_id}",le="+Inf"}' in body
+        assert "/api/jobs/00000000" not in body
+
+    def test_statement_histogram_buckets(self):
+        """SQL 실행 수 히스토그램은 누적 버킷으로 기록됨"""
+        stats = RequestStats()
+        for _ in range(3):
+            stats.record_statement(0.001, 2)
+        labels = ("GET", "/test/histogram")
+
+        request_metrics.observe(*labels, 200, stats)
+
+        body = request_metrics.render()
+        assert 'easyk_http_request_db_statements_bucket{method="GET",route="/test/histogram",le="2"} 0' in body
+        assert 'easyk_http_request_db_statements_bucket{method="GET",route="/test/histogram",le="5"} 1' in body
+        assert 'easyk_http_request_db_rows_total{method="GET",route="/test/histogram"} 6' in body
+
+    def test_metrics_endpoint_not_registered_by_default(self, client: TestClient):
+        """METRICS_ENABLED가 꺼져 있으면(기본값) /metrics를 노출하지 않음"""
+        assert settings.METRICS_ENABLED is False
+        assert client.get("/metrics").status_code == 404
+
+    def test_metrics_endpoint_requires_configured_token(self, metrics_client: TestClient, monkeypatch):
+        """METRICS_TOKEN 설정 시 Bearer 토큰이 일치해야 조회 가능"""
+        monkeypatch.setattr(settings, "METRICS_TOKEN", "scrape-secret")
+
+        assert metrics_client.get("/metrics").status_code == 401
+        assert metrics_client.get("/metrics", headers={"Authorization": "Bearer wrong"}).status_code == 401
+        response = metrics_client.get("/metrics", headers={"Authorization": "Bearer scrape-secret"})
+        assert response.status_code == 200
+        assert "easyk_http_requests_total" in response.text
@@ -96,3 +96,26 @@ def test_update_profile_empty_fields(db: Session, test_user: User, test_user_tok
     # 여기서는 허용한다고 가정
     assert response.status_code in [200, 422]
 
+
+
+def test_profile_update_invalidates_user_cache(db: Session, test_user: User, test_user_token: str):
+    """프로필 수정 후 캐시된 사용자 정보가 아닌 최신 정보 반환"""
+    headers = {"Authorization": f"Bearer {test_user_token}"}
+    assert client.get("/api/users/me", headers=headers).json()["nationality"] == "US"
+
+    client.put("/api/users/me", json={"nationality": "UK"}, headers=headers)
+
+    response = client.get("/api/users/me", headers=headers)
+    assert response.json()["nationality"] == "UK"
+
+
+def test_role_change_invalidates_user_cache(db: Session, test_user: User, test_user_token: str):
+    """역할 변경 커밋 시 사용자 캐시 무효화"""
+    headers = {"Authorization": f"Bearer {test_user_token}"}
+    assert client.get("/api/users/me", headers=headers).json()["role"] == "foreign"
+
+    test_user.role = "consultant"
+    db.commit()
+
+    response = client.get("/api/users/me", headers=headers)
+    assert response.json()["role"] == "consultant"
@@ -0,0 +1,164 @@
+"""Query Diagnostics Tests"""
+
+import logging
+from datetime import datetime, timedelta, timezone
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from ..config import settings
+from ..middleware.metrics import QueryDiagnosticsMiddleware
+from ..models.job import Job
+from ..models.user import User
+from ..utils.query_diagnostics import QueryCapture, current_query_capture, explain_statement, normalize_sql
+from .conftest import engine
+
+
+class TestNormalizeSql:
+    """SQL 정규화 테스트"""
+
+    def test_literals_and_parameters_are_removed(self):
+        """리터럴/바인드 값이 달라도 같은 형태로 정규화됨"""
+        first = normalize_sql("SELECT users.id FROM users WHERE users.id = ? AND users.role = 'admin' LIMIT 1")
+        second = normalize_sql("SELECT users.id\n  FROM users WHERE users.id = %(id_1)s AND users.role = 'agency' LIMIT 10")
+
+        assert first == second == "SELECT users.id FROM users WHERE users.id = ? AND users.role = ? LIMIT ?"
+
+    def test_in_lists_collapse(self):
+        """IN 목록은 길이와 상관없이 같은 형태"""
+        assert normalize_sql("SELECT * FROM jobs WHERE id IN (?, ?, ?)") == normalize_sql(
+            "SELECT * FROM jobs WHERE id IN ($1, $2)"
+        ) == "SELECT * FROM jobs WHERE id IN (...)"
+
+    def test_postgres_casts_are_kept(self):
+        """PostgreSQL 타입 캐스트(::)는 바인드 파라미터로 취급하지 않음"""
+        assert normalize_sql("SELECT $1::VARCHAR") == "SELECT ?::VARCHAR"
+
+
+class _FakeCursor:
+    """실행한 SQL을 기록하는 DBAPI 커서 (EXPLAIN 실패 재현용)"""
+
+    def __init__(self, executed: list, fail_explain: bool):
+        self.executed = executed
+        self.fail_explain = fail_explain
+
+    def execute(self, statement, parameters=None):
+        self.executed.append(statement)
+        if statement.startswith("EXPLAIN") and self.fail_explain:
+            raise RuntimeError("permission denied")
+
+    def fetchall(self):
+        return [("Seq Scan on users",)]
+
+    def close(self):
+        pass
+
+
+class _FakePostgresConnection:
+    """PostgreSQL 방언의 SQLAlchemy Connection 대역"""
+
+    def __init__(self, fail_explain: bool = False):
+        self.executed: list = []
+        self.dialect = type("Dialect", (), {"name": "postgresql"})()
+        cursor = _FakeCursor(self.executed, fail_explain)
+        self.connection = type("DBAPIConnection", (), {"cursor": lambda _self: cursor})()
+
+
+class TestQueryDiagnostics:
+    """N+1 / 느린 쿼리 감지 테스트"""
+
+    def test_repeated_statements_logged_as_n_plus_one(self, setup_database, caplog):
+        """같은 형태의 SQL이 임계값 이상 반복되면 라우트 템플릿과 함께 경고"""
+        app = FastAPI()
+
+        @app.get("/items/{item_id}")
+        def read_item(item_id: int):
+            with engine.connect() as connection:
+                for user_id in range(item_id):
+                    connection.execute(text("SELECT id FROM users WHERE id = :id"), {"id": str(user_id)})
+            return {}
+
+        app.add_middleware(QueryDiagnosticsMiddleware, threshold=3)
+        client = TestClient(app)
+
+        with caplog.at_level(logging.WARNING, logger="src.utils.query_diagnostics"):
+            client.get("/items/2")
+            assert "Possible N+1" not in caplog.text
+            client.get("/items/3")
+
+        assert "Possible N+1 in GET /items/{item_id}: 3x SELECT id FROM users WHERE id = ?" in caplog.text
+
+    def test_slow_query_logged_with_plan(self, setup_database, caplog, monkeypatch):
+        """임계값보다 느린 SELECT는 실행 계획과 함께 경고"""
+        monkeypatch.setattr(settings, "SLOW_QUERY_THRESHOLD_MS", 0.0)
+        capture = QueryCapture()
+        token = current_query_capture.set(capture)
+        try:
+            with caplog.at_level(logging.WARNING, logger="src.utils.query_diagnostics"):
+                with engine.connect() as connection:
+                    connection.execute(text("SELECT id FROM users WHERE email = :email"), {"email": "a@example.com"})
+        finally:
+            current_query_capture.reset(token)
+
+        assert capture.slow_queries[0][0] == "SELECT id FROM users WHERE email = ?"
+        assert "Slow query" in caplog.text
+        # SQLite EXPLAIN QUERY PLAN: email 유니크 인덱스 사용
+        assert "USING" in caplog.text and "INDEX" in caplog.text
+
+    def test_postgres_explain_runs_inside_savepoint(self):
+        """PostgreSQL EXPLAIN은 SAVEPOINT 안에서 실행 후 해제"""
+        connection = _FakePostgresConnection()
+
+        plan = explain_statement(connection, "SELECT id FROM users", ())
+
+        assert plan == "Seq Scan on users"
+        assert connection.executed == [
+            "SAVEPOINT query_diagnostics_explain",
+            "EXPLAIN SELECT id FROM users",
+            "RELEASE SAVEPOINT query_diagnostics_explain",
+        ]
+
+    def test_failed_postgres_explain_rolls_back_to_savepoint(self):
+        """EXPLAIN이 실패하면 SAVEPOINT로 되돌려 요청 트랜잭션을 중단시키지 않음"""
+        connection = _FakePostgresConnection(fail_explain=True)
+
+        assert explain_statement(connection, "SELECT id FROM users", ()) is None
+        assert connection.executed == [
+            "SAVEPOINT query_diagnostics_explain",
+            "EXPLAIN SELECT id FROM users",
+            "ROLLBACK TO SAVEPOINT query_diagnostics_explain",
+        ]
+
+
+class TestQueryBudgets:
+    """엔드포인트별 SQL 실행 수 상한 (N+1 회귀 방지)"""
+
+    def test_job_list_query_budget(
+        self, client: TestClient, db: Session, test_user: User, test_user_token: str, assert_max_queries
+    ):
+        """일자리 목록은 건수와 상관없이 일정한 쿼리 수"""
+        for index in range(10):
+            db.add(Job(
+                posted_by=test_user.id,
+                position=f"개발자 {index}",
+                company_name="테크 회사",
+                location="서울시",
+                employment_type="full-time",
+                description="웹 개발",
+                status="active",
+                deadline=datetime.now(timezone.utc) + timedelta(days=30),
+            ))
+        db.commit()
+
+        # 사용자 조회 1 + 목록 1 + 저장/지원 여부 2
+        with assert_max_queries(4):
+            response = client.get("/api/jobs", headers={"Authorization": f"Bearer {test_user_token}"})
+        assert len(response.json()) == 10
+
+    def test_current_user_query_budget(self, client: TestClient, test_user_token: str, assert_max_queries):
+        """내 정보 조회는 사용자 조회 1회"""
+        with assert_max_queries(1):
+            response = client.get("/api/users/me", headers={"Authorization": f"Bearer {test_user_token}"})
+        assert response.status_code == 200
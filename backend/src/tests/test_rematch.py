@@ -0,0 +1,248 @@
+"""Consultation Re-matching Tests"""
+
+import json
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from ..models.consultant import Consultant
+from ..models.consultation import Consultation
+from ..models.consultation_decline import ConsultationDecline
+from ..models.user import User
+from ..services import rematch_service
+from ..services.rematch_service import RematchWorker
+from ..utils.auth import create_access_token
+from .conftest import TestingSessionLocal
+
+
+def _create_consultant(db: Session, email: str, office_name: str, **kwargs) -> Consultant:
+    """테스트용 비자 전문가 생성"""
+    user = User(
+        email=email,
+        password_hash="hashed",
+        role="consultant",
+        first_name="Expert",
+        last_name="Kim",
+    )
+    db.add(user)
+    db.commit()
+
+    consultant = Consultant(
+        user_id=user.id,
+        office_name=office_name,
+        specialties=json.dumps(["visa"]),
+        hourly_rate=100000.00,
+        average_rating=kwargs.pop("average_rating", 4.0),
+        max_consultations_per_day=kwargs.pop("max_consultations_per_day", 5),
+        is_active=True,
+        is_verified=kwargs.pop("is_verified", True),
+    )
+    db.add(consultant)
+    db.commit()
+    db.refresh(consultant)
+    return consultant
+
+
+def _create_requested(db: Session, user: User, count: int = 1, days_ago: int = 0) -> list:
+    """매칭 대기 상담 count개 생성 (신청 시각은 1초 간격, 오래된 순)"""
+    base_time = datetime.now(timezone.utc) - timedelta(days=days_ago, minutes=1)
+    consultations = []
+    for i in range(count):
+        consultation = Consultation(
+            user_id=user.id,
+            consultation_type="visa",
+            content=f"비자 상담 {i}",
+            consultation_method="email",
+            amount=Decimal("50000.00"),
+            status="requested",
+            payment_status="pending",
+            created_at=base_time + timedelta(seconds=i),
+        )
+        db.add(consultation)
+        consultations.append(consultation)
+    db.commit()
+    return consultations
+
+
+@pytest.fixture
+def worker(setup_database):
+    """테스트 DB를 사용하는 재매칭 워커"""
+    return RematchWorker(session_factory=TestingSessionLocal, batch_size=2)
+
+
+@pytest.fixture
+def notifications(monkeypatch):
+    """워커 깨우기 호출 기록"""
+    calls = []
+    monkeypatch.setattr(rematch_service.rematch_worker, "notify", lambda: calls.append(True))
+    return calls
+
+
+class TestRejectAndRematch:
+    """거절 후 재매칭 테스트"""
+
+    def test_rejected_consultation_goes_to_another_consultant(
+        self,
+        client: TestClient,
+        db: Session,
+        test_user: User,
+        worker: RematchWorker,
+        notifications: list,
+    ):
+        """거절한 전문가를 제외하고 다른 전문가에게 재매칭"""
+        decliner = _create_consultant(db, "decliner@example.com", "거절 사무소", average_rating=5.0)
+        other = _create_consultant(db, "other@example.com", "다른 사무소", average_rating=3.0)
+        consultation = Consultation(
+            user_id=test_user.id,
+            consultant_id=decliner.id,
+            consultation_type="visa",
+            content="비자 상담",
+            consultation_method="email",
+            amount=Decimal("50000.00"),
+            status="matched",
+            payment_status="pending",
+        )
+        db.add(consultation)
+        db.commit()
+        notifications.clear()
+
+        decliner_token = create_access_token({"sub": "decliner@example.com"})
+        response = client.post(
+            f"/api/consultations/{consultation.id}/reject",
+            headers={"Authorization": f"Bearer {decliner_token}"},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "requested"
+        assert notifications == [True]
+        assert db.query(ConsultationDecline).filter_by(consultation_id=consultation.id).count() == 1
+
+        assert worker.drain() == 1
+        db.expire_all()
+        assert consultation.status == "matched"
+        assert consultation.consultant_id == other.id
+
+    def test_reject_moves_unread_count_to_new_consultant(
+        self,
+        client: TestClient,
+        db: Session,
+        test_user: User,
+        test_user_token: str,
+        worker: RematchWorker,
+        notifications: list,
+    ):
+        """거절한 전문가의 읽지 않은 메시지 수는 0, 새 전문가는 신청자 메시지 수를 이어받음"""
+        decliner = _create_consultant(db, "decliner@example.com", "거절 사무소", average_rating=5.0)
+        _create_consultant(db, "other@example.com", "다른 사무소", average_rating=3.0)
+        consultation = Consultation(
+            user_id=test_user.id,
+            consultant_id=decliner.id,
+            consultation_type="visa",
+            content="비자 상담",
+            consultation_method="email",
+            amount=Decimal("50000.00"),
+            status="matched",
+            payment_status="pending",
+        )
+        db.add(consultation)
+        db.commit()
+
+        client_headers = {"Authorization": f"Bearer {test_user_token}"}
+        for content in ("안녕하세요", "답변 부탁드립니다"):
+            response = client.post(
+                f"/api/messages/consultations/{consultation.id}",
+                json={"content": content},
+                headers=client_headers,
+            )
+            assert response.status_code == 201
+
+        decliner_headers = {"Authorization": f"Bearer {create_access_token({'sub': 'decliner@example.com'})}"}
+        assert client.get("/api/messages/unread/count", headers=decliner_headers).json()["count"] == 2
+
+        response = client.post(f"/api/consultations/{consultation.id}/reject", headers=decliner_headers)
+        assert response.status_code == 200
+
+        assert client.get("/api/messages/unread/count", headers=decliner_headers).json()["count"] == 0
+        assert client.get("/api/messages/unread/by-consultation", headers=decliner_headers).json()["consultations"] == []
+
+        assert worker.drain() == 1
+        other_headers = {"Authorization": f"Bearer {create_access_token({'sub': 'other@example.com'})}"}
+        assert client.get("/api/messages/unread/count", headers=other_headers).json()["count"] == 2
+
+    def test_only_decliner_available_stays_requested(
+        self, db: Session, test_user: User, worker: RematchWorker
+    ):
+        """거절한 전문가밖에 없으면 매칭 대기 유지"""
+        decliner = _create_consultant(db, "decliner@example.com", "거절 사무소")
+        (consultation,) = _create_requested(db, test_user)
+        db.add(ConsultationDecline(consultation_id=consultation.id, consultant_id=decliner.id))
+        db.commit()
+
+        assert worker.drain() == 0
+        db.expire_all()
+        assert consultation.status == "requested"
+
+
+class TestBacklogRematch:
+    """매칭 대기 상담 일괄 재매칭 테스트"""
+
+    def test_verifying_consultant_wakes_worker(
+        self, db: Session, test_user: User, notifications: list
+    ):
+        """전문가 검증 완료 커밋 시 워커 깨우기"""
+        consultant = _create_consultant(db, "new@example.com", "신규 사무소", is_verified=False)
+        assert notifications == []
+
+        consultant.is_verified = True
+        db.commit()
+
+        assert notifications == [True]
+
+    def test_backlog_is_processed_in_batches_within_capacity(
+        self, db: Session, test_user: User, worker: RematchWorker
+    ):
+        """배치로 처리하되 전문가의 하루 최대 상담 수를 넘지 않음"""
+        consultations = _create_requested(db, test_user, count=5)
+        consultant = _create_consultant(db, "new@example.com", "신규 사무소", max_consultations_per_day=3)
+
+        assert worker.drain() == 3
+
+        db.expire_all()
+        statuses = [c.status for c in consultations]
+        assert statuses.count("matched") == 3
+        assert statuses.count("requested") == 2
+        assert {c.consultant_id for c in consultations if c.status == "matched"} == {consultant.id}
+
+    def test_old_requests_count_toward_capacity_across_batches_and_drains(
+        self, db: Session, test_user: User, worker: RematchWorker
+    ):
+        """오래전 신청한 상담도 매칭 시각 기준으로 오늘의 부하에 집계 (배치/실행이 바뀌어도 수용량 유지)"""
+        consultations = _create_requested(db, test_user, count=6, days_ago=3)
+        consultant = _create_consultant(db, "new@example.com", "신규 사무소", max_consultations_per_day=2)
+
+        assert worker.drain() == 2
+        assert worker.drain() == 0
+
+        db.expire_all()
+        matched = [c for c in consultations if c.status == "matched"]
+        assert len(matched) == 2
+        assert {c.consultant_id for c in matched} == {consultant.id}
+        assert all(c.matched_at is not None for c in matched)
+
+    def test_drain_pages_past_unmatched_requests(
+        self, db: Session, test_user: User, worker: RematchWorker
+    ):
+        """매칭되지 않고 남은 상담 뒤의 배치도 빠짐없이 처리"""
+        decliner = _create_consultant(db, "decliner@example.com", "거절 사무소")
+        consultations = _create_requested(db, test_user, count=5)
+        for consultation in consultations[:3]:
+            db.add(ConsultationDecline(consultation_id=consultation.id, consultant_id=decliner.id))
+        db.commit()
+
+        assert worker.drain() == 2
+
+        db.expire_all()
+        assert [c.status for c in consultations] == ["requested"] * 3 + ["matched"] * 2
@@ -0,0 +1,178 @@
+"""Catalog Response Cache Tests"""
+
+import json
+from datetime import date, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from ..models.government_support import GovernmentSupport
+from ..models.user import User
+from ..utils.auth import create_access_token, hash_password
+from ..utils.cache import MemoryCacheBackend
+from ..utils.response_cache import ResponseCache
+from .conftest import async_engine
+
+
+def _create_support(db: Session, title: str) -> GovernmentSupport:
+    """테스트용 정부 지원 프로그램 생성"""
+    support = GovernmentSupport(
+        title=title,
+        category="subsidy",
+        description="테스트용 장려금",
+        eligibility="재외동포 90일 이상",
+        eligible_visa_types=json.dumps(["E-1"]),
+        support_content="월 30만원 지급",
+        department="고용노동부",
+        application_period_start=date.today(),
+        application_period_end=date.today() + timedelta(days=1),
+        status="active",
+    )
+    db.add(support)
+    db.commit()
+    return support
+
+
+@pytest.fixture
+def catalog_queries():
+    """비동기 엔진에서 실행된 정부 지원 조회 쿼리 기록"""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        if "FROM government_supports" in statement:
+            statements.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+
+
+class TestResponseCache:
+    """응답 캐시 키/무효화 테스트"""
+
+    def test_equivalent_params_share_key(self):
+        """파라미터 순서, 앞뒤 공백, 빈 값은 캐시 키에 영향 없음"""
+        cache = ResponseCache(MemoryCacheBackend(), ttl_seconds=60)
+
+        assert cache.key("jobs", {"keyword": " 개발 ", "limit": 20, "location": None}) == cache.key(
+            "jobs", {"limit": 20, "keyword": "개발", "location": ""}
+        )
+        assert cache.key("jobs", {"limit": 20}) != cache.key("jobs", {"limit": 10})
+
+    def test_invalidate_changes_namespace_keys_only(self):
+        """무효화는 해당 엔티티의 키만 변경"""
+        cache = ResponseCache(MemoryCacheBackend(), ttl_seconds=60)
+        jobs_key = cache.key("jobs", {"limit": 20})
+        supports_key = cache.key("government_supports", {"limit": 20})
+        cache.set(jobs_key, "[]")
+
+        cache.invalidate("jobs")
+
+        assert cache.key("jobs", {"limit": 20}) != jobs_key
+        assert cache.key("government_supports", {"limit": 20}) == supports_key
+        assert cache.get(cache.key("jobs", {"limit": 20})) is None
+
+
+class TestCatalogEndpointCaching:
+    """공개 목록 API 캐시 / 조건부 요청 테스트"""
+
+    def test_repeated_request_served_from_cache_with_304(
+        self, client: TestClient, db: Session, test_user_token: str, catalog_queries: list
+    ):
+        """같은 조건의 반복 요청은 DB 조회 없이 응답하고, ETag 일치 시 304"""
+        _create_support(db, "외국인 장려금")
+        headers = {"Authorization": f"Bearer {test_user_token}"}
+
+        first = client.get("/api/supports", headers=headers, params={"category": "subsidy"})
+        assert first.status_code == 200
+        assert first.json()["total"] == 1
+        etag = first.headers["ETag"]
+        query_count = len(catalog_queries)
+        assert query_count > 0
+
+        second = client.get("/api/supports", headers=headers, params={"category": "subsidy"})
+        assert second.json() == first.json()
+        assert second.headers["ETag"] == etag
+
+        not_modified = client.get(
+            "/api/supports",
+            headers={**headers, "If-None-Match": etag},
+            params={"category": "subsidy"},
+        )
+        assert not_modified.status_code == 304
+        assert not_modified.content == b""
+        assert len(catalog_queries) == query_count
+
+    def test_admin_change_invalidates_cache(
+        self, client: TestClient, db: Session, test_user_token: str
+    ):
+        """관리자가 지원 프로그램을 추가하면 캐시된 목록이 무효화됨"""
+        _create_support(db, "외국인 장려금")
+        headers = {"Authorization": f"Bearer {test_user_token}"}
+        first = client.get("/api/supports", headers=headers)
+        etag = first.headers["ETag"]
+
+        admin = User(
+            email="admin@example.com",
+            password_hash=hash_password("Admin123!@#"),
+            first_name="Admin",
+            last_name="User",
+            role="admin",
+        )
+        db.add(admin)
+        db.commit()
+        response = client.post(
+            "/api/supports",
+            headers={"Authorization": f"Bearer {create_access_token({'sub': admin.email})}"},
+            json={
+                "title": "신규 장려금",
+                "category": "subsidy",
+                "description": "신규 장려금 프로그램",
+                "eligibility": "재외동포 90일 이상 체류자",
+                "support_content": "월 50만원 지급",
+                "department": "고용노동부",
+                "status": "active",
+            },
+        )
+        assert response.status_code == 201
+
+        refreshed = client.get("/api/supports", headers={**headers, "If-None-Match": etag})
+        assert refreshed.status_code == 200
+        assert refreshed.json()["total"] == 2
+        assert refreshed.headers["ETag"] != etag
+
+    def test_job_list_cache_keeps_per_user_flags(
+        self, client: TestClient, db: Session, test_user: User, test_user_token: str
+    ):
+        """비로그인 요청으로 캐시된 일자리 목록에도 로그인 사용자의 저장 여부가 반영됨"""
+        from datetime import datetime, timezone
+        from ..models.job import Job
+        from ..models.saved_job import SavedJob
+
+        job = Job(
+            posted_by=test_user.id,
+            position="웹 개발자",
+            company_name="테크 회사",
+            location="서울시",
+            employment_type="full-time",
+            description="웹 개발",
+            status="active",
+            deadline=datetime.now(timezone.utc) + timedelta(days=30),
+        )
+        db.add(job)
+        db.commit()
+        db.add(SavedJob(user_id=test_user.id, job_id=job.id))
+        db.commit()
+
+        anonymous = client.get("/api/jobs")
+        assert anonymous.headers["Vary"] == "Authorization"
+        assert anonymous.json()[0]["is_saved"] is False
+
+        authenticated = client.get(
+            "/api/jobs",
+            headers={"Authorization": f"Bearer {test_user_token}", "If-None-Match": anonymous.headers["ETag"]},
+        )
+        assert authenticated.status_code == 200
+        assert authenticated.json()[0]["is_saved"] is True
@@ -403,3 +403,113 @@ class TestGetConsultantReviews:
         assert response.status_code == 403
         assert "Not authenticated" in response.json()["detail"]
 
+
+
+def _create_completed_consultation(db: Session, user: User, consultant: Consultant) -> Consultation:
+    """후기 작성 가능한 완료 상담 추가 생성"""
+    consultation = Consultation(
+        user_id=user.id,
+        consultant_id=consultant.id,
+        consultation_type="visa",
+        content="추가 상담",
+        consultation_method="email",
+        amount=Decimal("50000.00"),
+        status="completed",
+        payment_status="completed",
+    )
+    db.add(consultation)
+    db.commit()
+    return consultation
+
+
+class TestConsultantRatingAggregation:
+    """전문가 평점 증분 갱신 / 재집계 테스트"""
+
+    def test_review_updates_rating_incrementally(
+        self,
+        client: TestClient,
+        test_user: User,
+        test_user_token: str,
+        test_consultant: Consultant,
+        test_completed_consultation: Consultation,
+        db: Session,
+    ):
+        """후기 작성 시 전체 재집계 없이 합계/개수/평균을 UPDATE 1회로 갱신"""
+        from sqlalchemy import event
+        from .conftest import engine
+
+        second = _create_completed_consultation(db, test_user, test_consultant)
+        statements = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement.upper())
+
+        event.listen(engine, "before_cursor_execute", _record)
+        try:
+            for consultation, rating in [(test_completed_consultation, 5), (second, 4)]:
+                response = client.post(
+                    "/api/reviews",
+                    headers={"Authorization": f"Bearer {test_user_token}"},
+                    json={"consultation_id": str(consultation.id), "rating": rating},
+                )
+                assert response.status_code == 201
+        finally:
+            event.remove(engine, "before_cursor_execute", _record)
+
+        assert not any("AVG(" in s or "COUNT(" in s for s in statements)
+        assert len([s for s in statements if s.startswith("UPDATE CONSULTANTS")]) == 2
+
+        db.refresh(test_consultant)
+        assert test_consultant.total_reviews == 2
+        assert test_consultant.rating_sum == 9
+        assert test_consultant.average_rating == Decimal("4.50")
+
+    def test_duplicate_review_does_not_change_rating(
+        self,
+        client: TestClient,
+        test_user_token: str,
+        test_consultant: Consultant,
+        test_completed_consultation: Consultation,
+        db: Session,
+    ):
+        """중복 후기는 롤백되어 평점에 반영되지 않음"""
+        payload = {"consultation_id": str(test_completed_consultation.id), "rating": 5}
+        headers = {"Authorization": f"Bearer {test_user_token}"}
+        assert client.post("/api/reviews", headers=headers, json=payload).status_code == 201
+        assert client.post("/api/reviews", headers=headers, json=payload).status_code == 400
+
+        db.refresh(test_consultant)
+        assert test_consultant.total_reviews == 1
+        assert test_consultant.rating_sum == 5
+
+    def test_reconciliation_fixes_drift(
+        self,
+        test_user: User,
+        test_consultant: Consultant,
+        test_completed_consultation: Consultation,
+        db: Session,
+    ):
+        """직접 추가/삭제된 후기로 어긋난 평점을 재집계로 보정"""
+        from ..services.review_service import RatingReconciliationWorker
+        from .conftest import TestingSessionLocal
+
+        second = _create_completed_consultation(db, test_user, test_consultant)
+        for consultation, rating in [(test_completed_consultation, 5), (second, 2)]:
+            db.add(Review(
+                consultation_id=consultation.id,
+                reviewer_id=test_user.id,
+                consultant_id=test_consultant.id,
+                rating=rating,
+            ))
+        db.commit()
+
+        worker = RatingReconciliationWorker(session_factory=TestingSessionLocal)
+        assert worker.drain() == 1
+
+        db.refresh(test_consultant)
+        assert test_consultant.total_reviews == 2
+        assert test_consultant.rating_sum == 7
+        assert test_consultant.average_rating == Decimal("3.50")
+
+        # 어긋남이 없으면 갱신하지 않음
+        assert worker.drain() == 0
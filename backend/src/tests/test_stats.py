@@ -0,0 +1,146 @@
+"""Statistics API Tests"""
+
+import pytest
+from decimal import Decimal
+from datetime import datetime, timedelta, timezone
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from ..models.user import User
+from ..models.consultation import Consultation
+from ..models.job import Job
+from ..utils.auth import hash_password, create_access_token
+from .conftest import engine
+
+
+@pytest.fixture
+def admin_user(db: Session):
+    """테스트용 관리자 생성"""
+    user = User(
+        email="admin@example.com",
+        password_hash=hash_password("Admin123!@#"),
+        first_name="Admin",
+        last_name="User",
+        role="admin",
+    )
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+    return user
+
+
+@pytest.fixture
+def admin_token(admin_user: User) -> str:
+    """테스트용 관리자 토큰"""
+    return create_access_token(data={"sub": admin_user.email, "user_id": str(admin_user.id)})
+
+
+@pytest.fixture
+def stats_data(db: Session, test_user: User, admin_user: User):
+    """통계 집계용 데이터 생성"""
+    consultant_user = User(
+        email="consultant@example.com",
+        password_hash="hashed",
+        first_name="Consultant",
+        last_name="User",
+        role="consultant",
+    )
+    db.add(consultant_user)
+
+    for status in ["requested", "matched", "matched"]:
+        db.add(Consultation(
+            user_id=test_user.id,
+            consultation_type="visa",
+            content="상담 내용입니다.",
+            consultation_method="email",
+            amount=Decimal("50000.00"),
+            status=status,
+            payment_status="pending",
+        ))
+
+    deadline = datetime.now(timezone.utc) + timedelta(days=30)
+    for status in ["active", "active", "closed"]:
+        db.add(Job(
+            posted_by=admin_user.id,
+            position="개발자",
+            company_name="회사",
+            location="서울시",
+            employment_type="full-time",
+            description="업무 설명",
+            status=status,
+            deadline=deadline,
+        ))
+    db.commit()
+
+
+def count_statements(func):
+    """func 실행 중 실행된 SQL 문 수 반환"""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        func()
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    return len(statements)
+
+
+class TestDashboardStats:
+    """관리자 대시보드 통계 API 테스트"""
+
+    def test_dashboard_stats_success(self, client: TestClient, admin_token: str, stats_data):
+        """대시보드 통계 집계 결과 확인"""
+        response = client.get(
+            "/api/stats/dashboard",
+            headers={"Authorization": f"Bearer {admin_token}"},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["users"] == {"total": 3, "foreign": 1, "consultants": 1, "admins": 1}
+        assert data["consultations"] == {"total": 3, "by_status": {"requested": 1, "matched": 2}}
+        assert data["jobs"] == {"total": 3, "active": 2}
+        assert data["applications"] == {"total": 0, "by_status": {}}
+        assert data["supports"] == {"total": 0, "active": 0}
+
+    def test_dashboard_stats_single_query_and_cached(
+        self, client: TestClient, admin_token: str, stats_data
+    ):
+        """통계는 한 번의 집계 쿼리로 계산되고 이후 요청은 캐시 사용"""
+        headers = {"Authorization": f"Bearer {admin_token}"}
+
+        # 인증(사용자 조회) 1회 + 통계 집계 1회
+        assert count_statements(lambda: client.get("/api/stats/dashboard", headers=headers)) <= 2
+        # 캐시 적중: 사용자/통계 모두 캐시에서 조회
+        assert count_statements(lambda: client.get("/api/stats/dashboard", headers=headers)) == 0
+
+    def test_dashboard_stats_forbidden_for_non_admin(self, client: TestClient, test_user_token: str):
+        """관리자가 아닌 경우 403 에러"""
+        response = client.get(
+            "/api/stats/dashboard",
+            headers={"Authorization": f"Bearer {test_user_token}"},
+        )
+
+        assert response.status_code == 403
+
+
+class TestOverviewStats:
+    """개요 통계 API 테스트"""
+
+    def test_overview_stats_success(self, client: TestClient, admin_token: str, stats_data):
+        """최근 7일 활동 통계 확인"""
+        response = client.get(
+            "/api/stats/overview",
+            headers={"Authorization": f"Bearer {admin_token}"},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["recent_activity"] == {
+            "new_users_7d": 3,
+            "new_consultations_7d": 3,
+            "new_applications_7d": 0,
+        }
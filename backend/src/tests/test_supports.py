@@ -585,3 +585,127 @@ class TestAdminSupportManagement:
         response = client.post("/api/supports", json=payload, headers=headers)
         
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+class TestEligibilityBatch:
+    """정부 지원 자격 일괄 확인 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def setup_supports(self, db: Session):
+        """비자/신청 기간 조합별 정부 지원 데이터 생성"""
+        today = date.today()
+
+        def make_support(title, visa_types, start, end, support_status="active"):
+            return GovernmentSupport(
+                title=title,
+                category="subsidy",
+                description=f"{title} 설명",
+                eligible_visa_types=json.dumps(visa_types),
+                department="고용노동부",
+                application_period_start=start,
+                application_period_end=end,
+                status=support_status,
+            )
+
+        db.add_all([
+            make_support("E-9 장려금", ["E-9"], today - timedelta(days=1), today + timedelta(days=1)),
+            make_support("비자 제한 없음", [], None, None),
+            make_support("F-2 주거 지원", ["F-2"], today, today),
+            make_support("신청 예정 교육", ["E-9"], today + timedelta(days=10), today + timedelta(days=20)),
+            make_support("마감된 훈련", ["E-9"], today - timedelta(days=20), today - timedelta(days=1)),
+            make_support("종료된 프로그램", ["E-9"], None, None, support_status="inactive"),
+        ])
+        db.commit()
+
+    def _check(self, client, token, **payload):
+        headers = {"Authorization": f"Bearer {token}"}
+        return client.post("/api/supports/eligibility-check/batch", json=payload, headers=headers)
+
+    def test_batch_evaluates_visa_and_application_period(self, client, test_user_token):
+        """비자 유형과 신청 기간을 단건 확인과 같은 기준으로 평가"""
+        response = self._check(client, test_user_token, visa_type="E-9", age=30)
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["total"] == 5  # 비활성 프로그램 제외
+        assert data["eligible_count"] == 2
+
+        results = {result["support"]["title"]: result for result in data["results"]}
+        assert results["E-9 장려금"]["eligible"] is True
+        assert results["E-9 장려금"]["reasons"] == ["비자 종류 'E-9'는 지원 가능합니다"]
+        assert results["비자 제한 없음"]["eligible"] is True
+        assert results["비자 제한 없음"]["reasons"] == ["자격 확인 완료"]
+        assert results["F-2 주거 지원"]["eligible"] is False
+        assert "지원 대상이 아닙니다" in results["F-2 주거 지원"]["reasons"][0]
+        assert results["신청 예정 교육"]["eligible"] is False
+        assert "아직 도래하지 않았습니다" in results["신청 예정 교육"]["reasons"][-1]
+        assert results["마감된 훈련"]["eligible"] is False
+        assert "지났습니다" in results["마감된 훈련"]["reasons"][-1]
+
+        # 신청 가능한 프로그램이 먼저
+        eligibility = [result["eligible"] for result in data["results"]]
+        assert eligibility == sorted(eligibility, reverse=True)
+
+    def test_batch_matches_single_check(self, client, test_user_token, db: Session):
+        """일괄 확인 결과가 프로그램별 단건 확인 결과와 일치"""
+        headers = {"Authorization": f"Bearer {test_user_token}"}
+        data = self._check(client, test_user_token, visa_type="F-2").json()
+
+        for result in data["results"]:
+            single = client.post(
+                "/api/supports/eligibility-check",
+                json={"support_id": result["support"]["id"], "visa_type": "F-2"},
+                headers=headers,
+            ).json()
+            assert single["eligible"] == result["eligible"]
+            assert single["reasons"] == result["reasons"]
+
+    def test_visa_type_whitespace_is_normalized_for_both_checks(self, client, test_user_token):
+        """앞뒤 공백이 있는 비자 값도 단건/일괄 확인이 같은 결과"""
+        headers = {"Authorization": f"Bearer {test_user_token}"}
+        data = self._check(client, test_user_token, visa_type=" E-9 ").json()
+        results = {result["support"]["title"]: result for result in data["results"]}
+
+        single = client.post(
+            "/api/supports/eligibility-check",
+            json={"support_id": results["E-9 장려금"]["support"]["id"], "visa_type": " E-9 "},
+            headers=headers,
+        ).json()
+        assert single["eligible"] is results["E-9 장려금"]["eligible"] is True
+        assert single["reasons"] == results["E-9 장려금"]["reasons"] == ["비자 종류 'E-9'는 지원 가능합니다"]
+
+        assert self._check(client, test_user_token, visa_type="   ").status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    def test_batch_eligible_only(self, client, test_user_token):
+        """eligible_only 요청 시 신청 가능한 프로그램만 반환"""
+        data = self._check(client, test_user_token, visa_type="F-2", eligible_only=True).json()
+
+        assert data["total"] == 5
+        assert data["eligible_count"] == 2
+        assert {result["support"]["title"] for result in data["results"]} == {"비자 제한 없음", "F-2 주거 지원"}
+
+    def test_batch_reflects_support_changes(self, client, test_user_token, db: Session):
+        """지원 프로그램 변경 후 매트릭스 재구성"""
+        assert self._check(client, test_user_token, visa_type="D-2").json()["eligible_count"] == 1
+
+        support = db.query(GovernmentSupport).filter(GovernmentSupport.title == "F-2 주거 지원").first()
+        support.eligible_visa_types = json.dumps(["F-2", "D-2"])
+        db.add(GovernmentSupport(
+            title="유학생 지원",
+            category="education",
+            description="유학생 지원 설명",
+            eligible_visa_types=json.dumps(["D-2"]),
+            department="교육부",
+            status="active",
+        ))
+        db.commit()
+
+        data = self._check(client, test_user_token, visa_type="D-2").json()
+        assert data["total"] == 6
+        assert data["eligible_count"] == 3
+
+    def test_batch_unauthorized(self, client):
+        """인증 없이 일괄 확인 시 403"""
+        response = client.post("/api/supports/eligibility-check/batch", json={"visa_type": "E-9"})
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
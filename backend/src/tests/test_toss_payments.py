@@ -0,0 +1,99 @@
+"""Toss Payments Client Tests"""
+
+import httpx
+import pytest
+
+from ..utils.toss_payments import TossPaymentsClient
+from .toss_stub import TossStubServer
+
+
+@pytest.fixture
+def toss_stub():
+    """토스페이먼츠 스텁 서버"""
+    return TossStubServer()
+
+
+@pytest.fixture
+async def toss_client(toss_stub: TossStubServer):
+    """스텁 서버에 연결된 토스페이먼츠 클라이언트"""
+    client = TossPaymentsClient(
+        secret_key="test_sk",
+        base_url="http://toss.test/v1",
+        transport=httpx.ASGITransport(app=toss_stub.app),
+        max_retries=2,
+        retry_backoff_seconds=0,
+    )
+    await client.startup()
+    yield client
+    await client.aclose()
+
+
+class TestTossPaymentsClient:
+    """토스페이먼츠 클라이언트 테스트"""
+
+    async def test_confirm_and_get_payment(self, toss_client: TossPaymentsClient):
+        """결제 승인 후 조회 성공 (같은 연결 풀 재사용)"""
+        pooled_client = toss_client._get_client()
+
+        confirmed = await toss_client.confirm_payment("pk_1", "order_1", 50000)
+        payment = await toss_client.get_payment("pk_1")
+
+        assert confirmed["status"] == "DONE"
+        assert payment["totalAmount"] == 50000
+        assert toss_client._get_client() is pooled_client
+
+    async def test_get_payment_retries_on_server_error(
+        self, toss_client: TossPaymentsClient, toss_stub: TossStubServer
+    ):
+        """5xx/429 응답 시 재시도 후 성공"""
+        await toss_client.confirm_payment("pk_1", "order_1", 50000)
+        toss_stub.requests.clear()
+        toss_stub.fail_next(503, 429)
+
+        payment = await toss_client.get_payment("pk_1")
+
+        assert payment["status"] == "DONE"
+        assert len(toss_stub.requests) == 3
+
+    async def test_retry_gives_up_after_max_retries(
+        self, toss_client: TossPaymentsClient, toss_stub: TossStubServer
+    ):
+        """최대 재시도 횟수 초과 시 HTTPStatusError"""
+        toss_stub.fail_next(500, 500, 500)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await toss_client.get_payment("pk_1")
+
+        assert len(toss_stub.requests) == 3
+
+    async def test_confirm_retry_uses_same_idempotency_key(
+        self, toss_client: TossPaymentsClient, toss_stub: TossStubServer
+    ):
+        """결제 승인 재시도 시 동일한 Idempotency-Key 사용"""
+        toss_stub.fail_next(502)
+
+        await toss_client.confirm_payment("pk_1", "order_1", 50000)
+
+        keys = [request.headers.get("Idempotency-Key") for request in toss_stub.requests]
+        assert len(keys) == 2
+        assert keys[0] is not None
+        assert keys[0] == keys[1]
+
+    async def test_client_error_is_not_retried(
+        self, toss_client: TossPaymentsClient, toss_stub: TossStubServer
+    ):
+        """4xx 응답(429 제외)은 재시도하지 않음"""
+        with pytest.raises(httpx.HTTPStatusError) as exc_info:
+            await toss_client.get_payment("unknown")
+
+        assert exc_info.value.response.status_code == 404
+        assert len(toss_stub.requests) == 1
+
+    async def test_cancel_payment(self, toss_client: TossPaymentsClient):
+        """부분 취소 성공"""
+        await toss_client.confirm_payment("pk_1", "order_1", 50000)
+
+        canceled = await toss_client.cancel_payment("pk_1", "고객 요청", 20000)
+
+        assert canceled["status"] == "PARTIAL_CANCELED"
+        assert canceled["balanceAmount"] == 30000
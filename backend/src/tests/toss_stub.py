@@ -0,0 +1,111 @@
+"""토스페이먼츠 API 스텁 서버 (테스트/로컬 개발용)
+
+httpx.ASGITransport로 TossPaymentsClient에 주입하거나, 아래처럼 실행한 뒤
+TOSS_API_BASE_URL=http://127.0.0.1:8787/v1 로 설정하여 로컬에서 사용합니다.
+
+    python -m src.tests.toss_stub
+"""
+
+from typing import Any, Dict, List, Optional
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+
+class TossStubServer:
+    """결제 승인/조회/취소 API를 흉내 내는 인메모리 스텁 서버"""
+
+    def __init__(self):
+        self.app = FastAPI()
+        self.payments: Dict[str, Dict[str, Any]] = {}
+        self.requests: List[Request] = []
+        self.idempotent_responses: Dict[str, Dict[str, Any]] = {}
+        self._failures: List[int] = []
+        self._register_routes()
+
+    def fail_next(self, *status_codes: int) -> None:
+        """
+        다음 요청들을 지정한 상태 코드로 실패시킴
+
+        Args:
+            *status_codes: 순서대로 반환할 오류 상태 코드
+        """
+        self._failures.extend(status_codes)
+
+    def _pop_failure(self) -> Optional[JSONResponse]:
+        """예약된 실패 응답 반환"""
+        if not self._failures:
+            return None
+        status_code = self._failures.pop(0)
+        return JSONResponse(
+            status_code=status_code,
+            content={"code": "STUB_FAILURE", "message": "Injected failure"},
+        )
+
+    def _register_routes(self) -> None:
+        """API 라우트 등록"""
+        app = self.app
+
+        @app.middleware("http")
+        async def record_request(request: Request, call_next):
+            self.requests.append(request)
+            failure = self._pop_failure()
+            if failure is not None:
+                return failure
+            return await call_next(request)
+
+        @app.post("/v1/payments/confirm")
+        async def confirm(request: Request):
+            idempotency_key = request.headers.get("Idempotency-Key")
+            if idempotency_key in self.idempotent_responses:
+                return self.idempotent_responses[idempotency_key]
+
+            body = await request.json()
+            payment = {
+                "paymentKey": body["paymentKey"],
+                "orderId": body["orderId"],
+                "totalAmount": body["amount"],
+                "balanceAmount": body["amount"],
+                "status": "DONE",
+            }
+            self.payments[body["paymentKey"]] = payment
+            if idempotency_key:
+                self.idempotent_responses[idempotency_key] = payment
+            return payment
+
+        @app.get("/v1/payments/{payment_key}")
+        async def get_payment(payment_key: str):
+            payment = self.payments.get(payment_key)
+            if payment is None:
+                return JSONResponse(
+                    status_code=404,
+                    content={"code": "NOT_FOUND_PAYMENT", "message": "Payment not found"},
+                )
+            return payment
+
+        @app.post("/v1/payments/{payment_key}/cancel")
+        async def cancel(payment_key: str, request: Request):
+            idempotency_key = request.headers.get("Idempotency-Key")
+            if idempotency_key in self.idempotent_responses:
+                return self.idempotent_responses[idempotency_key]
+
+            payment = self.payments.get(payment_key)
+            if payment is None:
+                return JSONResponse(
+                    status_code=404,
+                    content={"code": "NOT_FOUND_PAYMENT", "message": "Payment not found"},
+                )
+
+            body = await request.json()
+            cancel_amount = body.get("cancelAmount", payment["balanceAmount"])
+            payment["balanceAmount"] -= cancel_amount
+            payment["status"] = "CANCELED" if payment["balanceAmount"] == 0 else "PARTIAL_CANCELED"
+            if idempotency_key:
+                self.idempotent_responses[idempotency_key] = dict(payment)
+            return payment
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run(TossStubServer().app, host="127.0.0.1", port=8787)
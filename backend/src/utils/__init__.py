@@ -1,16 +1,31 @@
 """Utility Functions"""
 
-from .auth import hash_password, verify_password, create_access_token, verify_access_token
+from .auth import (
+    hash_password,
+    verify_password,
+    hash_password_async,
+    verify_password_async,
+    PasswordHashBusyError,
+    create_access_token,
+    verify_access_token,
+)
 from .toss_payments import TossPaymentsClient, toss_payments_client
 from .i18n import get_language_from_request, get_error_message
+from .pagination import encode_cursor, decode_cursor, build_next_cursor
 
 __all__ = [
     "hash_password",
     "verify_password",
+    "hash_password_async",
+    "verify_password_async",
+    "PasswordHashBusyError",
     "create_access_token",
     "verify_access_token",
     "TossPaymentsClient",
     "toss_payments_client",
     "get_language_from_request",
     "get_error_message",
+    "encode_cursor",
+    "decode_cursor",
+    "build_next_cursor",
 ]
@@ -1,7 +1,12 @@
 """Authentication Utility Functions"""
 
+import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Any, Callable, Optional
 
 import bcrypt
 from jose import jwt
@@ -43,6 +48,139 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return bcrypt.checkpw(password_bytes, hashed_bytes)
 
 
+class PasswordHashBusyError(Exception):
+    """비밀번호 해싱 대기열이 가득 찬 경우 발생하는 예외"""
+
+
+class PasswordHashPool:
+    """bcrypt 해싱/검증 전용 제한 워커 풀
+
+    bcrypt는 요청당 수백 ms의 CPU를 사용하므로, 다른 동기 엔드포인트가
+    공유하는 스레드풀 대신 별도 풀에서 실행합니다. 대기 중인 작업 수가
+    max_pending에 도달하면 즉시 PasswordHashBusyError를 발생시킵니다.
+    """
+
+    def __init__(self, mode: str = "process", max_workers: int = 2, max_pending: int = 32):
+        """
+        워커 풀 초기화 (실행기는 첫 사용 시 생성)
+
+        Args:
+            mode: "process"(GIL 회피) 또는 "thread"
+            max_workers: 워커 수
+            max_pending: 실행 중 + 대기 중 작업 최대 수
+        """
+        if mode not in ("process", "thread"):
+            raise ValueError("mode must be 'process' or 'thread'")
+
+        self.mode = mode
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor: Optional[Executor] = None
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> Executor:
+        """실행기 조회 (없으면 생성)"""
+        with self._lock:
+            if self._executor is None:
+                if self.mode == "process":
+                    # 스레드가 있는 서버 프로세스의 fork를 피하기 위해 spawn 사용
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.max_workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
+                else:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="password-hash",
+                    )
+            return self._executor
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        워커 풀에서 함수 실행
+
+        Args:
+            func: 실행할 함수 (process 모드에서는 모듈 최상위 함수)
+            *args: 함수 인자
+
+        Returns:
+            Any: 함수 반환값
+
+        Raises:
+            PasswordHashBusyError: 대기열이 가득 찬 경우
+        """
+        with self._lock:
+            if self._pending >= self.max_pending:
+                raise PasswordHashBusyError("Password hashing queue is full")
+            self._pending += 1
+
+        try:
+            executor = self._get_executor()
+            loop = asyncio.get_running_loop()
+            try:
+                return await loop.run_in_executor(executor, func, *args)
+            except BrokenProcessPool:
+                # 워커 프로세스가 비정상 종료된 경우 다음 호출에서 풀 재생성
+                with self._lock:
+                    if self._executor is executor:
+                        self._executor = None
+                raise
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        워커 풀 종료
+
+        Args:
+            wait: 실행 중인 작업 완료 대기 여부
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+
+password_hash_pool = PasswordHashPool(
+    mode=settings.PASSWORD_HASH_POOL_MODE,
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+)
+
+
+async def hash_password_async(password: str) -> str:
+    """비밀번호 해싱 (전용 워커 풀에서 실행)
+
+    Args:
+        password: 해싱할 비밀번호
+
+    Returns:
+        str: 해싱된 비밀번호
+
+    Raises:
+        PasswordHashBusyError: 해싱 대기열이 가득 찬 경우
+    """
+    return await password_hash_pool.run(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """비밀번호 검증 (전용 워커 풀에서 실행)
+
+    Args:
+        plain_password: 평문 비밀번호
+        hashed_password: 해싱된 비밀번호
+
+    Returns:
+        bool: 비밀번호 일치 여부
+
+    Raises:
+        PasswordHashBusyError: 해싱 대기열이 가득 찬 경우
+    """
+    return await password_hash_pool.run(verify_password, plain_password, hashed_password)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """JWT 액세스 토큰 생성
 
@@ -0,0 +1,242 @@
+"""In-Process Cache Utility"""
+
+import logging
+import math
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+from ..config import settings
+
+
+logger = logging.getLogger(__name__)
+
+
+# 생성된 모든 캐시 인스턴스 (테스트/운영 중 일괄 초기화용)
+_registry: "weakref.WeakSet[TTLCache]" = weakref.WeakSet()
+
+
+class TTLCache:
+    """TTL 만료 + 최대 크기(LRU) 제한이 있는 스레드 안전 인메모리 캐시
+
+    워커 프로세스마다 독립적으로 유지되므로, 짧은 TTL로 다른 워커의
+    변경 사항이 일정 시간 내에 반영되도록 사용합니다.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl_seconds: float = 60.0):
+        """
+        캐시 초기화
+
+        Args:
+            max_size: 최대 항목 수 (초과 시 가장 오래 사용되지 않은 항목 제거)
+            ttl_seconds: 기본 만료 시간 (0 이하이면 캐시 비활성화)
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        _registry.add(self)
+
+    @property
+    def enabled(self) -> bool:
+        """캐시 활성화 여부"""
+        return self.ttl_seconds > 0 and self.max_size > 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        캐시 조회
+
+        Args:
+            key: 캐시 키
+            default: 항목이 없거나 만료된 경우 반환할 값
+
+        Returns:
+            Any: 캐시된 값 또는 default
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """
+        캐시 저장
+
+        Args:
+            key: 캐시 키
+            value: 저장할 값
+            ttl_seconds: 항목별 만료 시간 (기본값: 캐시 기본 TTL)
+        """
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        if ttl <= 0 or self.max_size <= 0:
+            return
+
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        """
+        캐시 항목 삭제
+
+        Args:
+            key: 캐시 키
+        """
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """모든 캐시 항목 삭제"""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+
+def clear_all_caches() -> None:
+    """생성된 모든 TTLCache 인스턴스 초기화"""
+    for cache in list(_registry):
+        cache.clear()
+
+
+class CacheBackend:
+    """캐시 저장소 인터페이스 (문자열 키/값)
+
+    응답 캐시가 사용하는 최소 연산만 정의합니다. 버전 카운터는 만료되지 않으며,
+    엔티티별 캐시 무효화(버전 증가)에 사용합니다.
+    """
+
+    # 여러 워커 간 공유되는 원격 저장소 여부 (True면 이벤트 루프 밖에서 호출)
+    shared = False
+
+    def get(self, key: str) -> Optional[str]:
+        """캐시 조회 (없거나 만료되면 None)"""
+        raise NotImplementedError
+
+    def set(self, key: str, value: str, ttl_seconds: float) -> None:
+        """캐시 저장"""
+        raise NotImplementedError
+
+    def get_version(self, name: str) -> int:
+        """버전 카운터 조회 (없으면 0)"""
+        raise NotImplementedError
+
+    def bump_version(self, name: str) -> int:
+        """버전 카운터 증가 후 새 값 반환"""
+        raise NotImplementedError
+
+
+class MemoryCacheBackend(CacheBackend):
+    """워커 프로세스 내 LRU + TTL 캐시 저장소"""
+
+    def __init__(self, max_size: int = 1024, ttl_seconds: float = 60.0):
+        """
+        Args:
+            max_size: 최대 항목 수
+            ttl_seconds: 기본 만료 시간 (0 이하이면 캐시 비활성화)
+        """
+        self._entries = TTLCache(max_size=max_size, ttl_seconds=ttl_seconds)
+        self._versions: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        return self._entries.get(key)
+
+    def set(self, key: str, value: str, ttl_seconds: float) -> None:
+        self._entries.set(key, value, ttl_seconds)
+
+    def get_version(self, name: str) -> int:
+        with self._lock:
+            return self._versions.get(name, 0)
+
+    def bump_version(self, name: str) -> int:
+        with self._lock:
+            self._versions[name] = self._versions.get(name, 0) + 1
+            return self._versions[name]
+
+
+class RedisCacheBackend(CacheBackend):
+    """Redis 캐시 저장소 (여러 워커 간 공유, redis 패키지 필요)
+
+    Redis 장애 시 요청이 실패하지 않도록 조회/저장 오류는 캐시 미스로 처리합니다.
+    """
+
+    shared = True
+
+    KEY_PREFIX = "easyk:cache:"
+
+    def __init__(self, url: str, timeout_seconds: float = 0.5):
+        """
+        Args:
+            url: Redis 연결 URL (예: redis://localhost:6379/0)
+            timeout_seconds: 소켓 타임아웃
+        """
+        import redis
+
+        self._errors = redis.RedisError
+        self._client = redis.Redis.from_url(
+            url,
+            socket_timeout=timeout_seconds,
+            socket_connect_timeout=timeout_seconds,
+            decode_responses=True,
+        )
+
+    def get(self, key: str) -> Optional[str]:
+        try:
+            return self._client.get(self.KEY_PREFIX + key)
+        except self._errors as e:
+            logger.warning(f"Redis cache get failed: {e}")
+            return None
+
+    def set(self, key: str, value: str, ttl_seconds: float) -> None:
+        if ttl_seconds <= 0:
+            return
+        try:
+            self._client.set(self.KEY_PREFIX + key, value, ex=max(1, math.ceil(ttl_seconds)))
+        except self._errors as e:
+            logger.warning(f"Redis cache set failed: {e}")
+
+    def get_version(self, name: str) -> int:
+        try:
+            return int(self._client.get(f"{self.KEY_PREFIX}version:{name}") or 0)
+        except self._errors as e:
+            logger.warning(f"Redis cache version lookup failed: {e}")
+            return 0
+
+    def bump_version(self, name: str) -> int:
+        try:
+            return int(self._client.incr(f"{self.KEY_PREFIX}version:{name}"))
+        except self._errors as e:
+            # 무효화 실패 시 기존 항목은 TTL 만료까지 유지됨
+            logger.error(f"Redis cache invalidation failed for {name}: {e}")
+            return 0
+
+
+def create_cache_backend(max_size: int, ttl_seconds: float) -> CacheBackend:
+    """
+    설정(CACHE_BACKEND)에 따른 캐시 저장소 생성
+
+    Args:
+        max_size: 인메모리 저장소 최대 항목 수
+        ttl_seconds: 인메모리 저장소 기본 만료 시간
+
+    Returns:
+        CacheBackend: memory 또는 redis 저장소
+    """
+    if settings.CACHE_BACKEND == "redis":
+        return RedisCacheBackend(settings.REDIS_URL)
+    return MemoryCacheBackend(max_size=max_size, ttl_seconds=ttl_seconds)
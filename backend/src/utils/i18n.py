@@ -56,6 +56,7 @@ ERROR_MESSAGES: Dict[str, Dict[str, str]] = {
         "internal_server_error": "서버 오류가 발생했습니다. 잠시 후 다시 시도해주세요.",
         "validation_error": "입력 정보를 확인해주세요.",
         "network_error": "네트워크 오류가 발생했습니다.",
+        "server_busy": "요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요.",
     },
     "en": {
         # Authentication related
@@ -110,6 +111,7 @@ ERROR_MESSAGES: Dict[str, Dict[str, str]] = {
         "internal_server_error": "An internal server error occurred. Please try again later.",
         "validation_error": "Please check your input.",
         "network_error": "A network error occurred.",
+        "server_busy": "The server is busy. Please try again shortly.",
     },
 }
 
@@ -0,0 +1,289 @@
+"""Realtime Message Broker (Pub/Sub) Utility"""
+
+import asyncio
+import json
+import logging
+import threading
+from typing import Any, Dict, Optional, Set
+
+from ..config import settings
+
+
+logger = logging.getLogger(__name__)
+
+# 구독자별 대기 이벤트 최대 수 (초과 시 resync 이벤트로 대체)
+SUBSCRIPTION_QUEUE_SIZE = 100
+
+# 클라이언트가 since 조회로 다시 동기화해야 함을 알리는 이벤트
+RESYNC_EVENT: Dict[str, Any] = {"type": "resync"}
+
+# 상담 참여자에서 제외된 사용자(거절한 전문가)의 구독을 종료시키는 이벤트 유형 ({"type", "user_id"})
+PARTICIPANT_REMOVED_EVENT_TYPE = "participant.removed"
+
+
+class Subscription:
+    """채널 구독 (구독한 이벤트 루프의 큐로 이벤트 전달)"""
+
+    def __init__(self, broker: "InMemoryBroker", channel: str):
+        self.broker = broker
+        self.channel = channel
+        self.loop = asyncio.get_running_loop()
+        self.queue: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue(maxsize=SUBSCRIPTION_QUEUE_SIZE)
+
+    def _put(self, event: Dict[str, Any]) -> None:
+        """이벤트 적재 (구독 이벤트 루프에서 실행)"""
+        if self.queue.full():
+            # 느린 구독자: 밀린 이벤트를 버리고 재동기화 요청
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            event = RESYNC_EVENT
+        self.queue.put_nowait(event)
+
+    def deliver(self, event: Dict[str, Any]) -> None:
+        """
+        이벤트 전달 (임의 스레드에서 호출 가능)
+
+        Args:
+            event: 전달할 이벤트
+        """
+        try:
+            self.loop.call_soon_threadsafe(self._put, event)
+        except RuntimeError:
+            # 이벤트 루프가 이미 종료된 구독
+            self.close()
+
+    async def get(self) -> Dict[str, Any]:
+        """다음 이벤트 대기"""
+        return await self.queue.get()
+
+    def close(self) -> None:
+        """구독 해제"""
+        self.broker._unsubscribe(self)
+
+    def __enter__(self) -> "Subscription":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class InMemoryBroker:
+    """프로세스 내 pub/sub 브로커 (채널 = consultation_id)
+
+    publish()는 동기 서비스 코드(스레드풀)에서도 호출할 수 있으며,
+    구독자 이벤트 루프로 스레드 안전하게 전달합니다.
+    단일 워커 또는 개발 환경용이며, 여러 워커 간 공유가 필요하면
+    PostgresNotifyBroker를 사용합니다.
+    """
+
+    def __init__(self):
+        self._subscriptions: Dict[str, Set[Subscription]] = {}
+        self._lock = threading.Lock()
+
+    async def start(self) -> None:
+        """브로커 시작 (애플리케이션 시작 시 호출)"""
+
+    async def stop(self) -> None:
+        """브로커 종료 (애플리케이션 종료 시 호출)"""
+
+    def subscribe(self, channel: str) -> Subscription:
+        """
+        채널 구독 (이벤트 루프 안에서 호출)
+
+        Args:
+            channel: 채널 이름
+
+        Returns:
+            Subscription: 구독 (사용 후 close() 또는 with 문으로 해제)
+        """
+        subscription = Subscription(self, channel)
+        with self._lock:
+            self._subscriptions.setdefault(channel, set()).add(subscription)
+        return subscription
+
+    def _unsubscribe(self, subscription: Subscription) -> None:
+        """구독 해제"""
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.channel)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscriptions[subscription.channel]
+
+    def subscriber_count(self, channel: str) -> int:
+        """채널 구독자 수"""
+        with self._lock:
+            return len(self._subscriptions.get(channel, ()))
+
+    def _fan_out(self, channel: str, event: Dict[str, Any]) -> None:
+        """현재 프로세스의 구독자에게 이벤트 전달"""
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(channel, ()))
+        for subscription in subscriptions:
+            subscription.deliver(event)
+
+    def publish(self, channel: str, event: Dict[str, Any]) -> None:
+        """
+        이벤트 발행
+
+        Args:
+            channel: 채널 이름
+            event: JSON 직렬화 가능한 이벤트
+        """
+        self._fan_out(channel, event)
+
+
+class PostgresNotifyBroker(InMemoryBroker):
+    """PostgreSQL LISTEN/NOTIFY 기반 브로커 (여러 uvicorn 워커 간 공유)
+
+    별도 인프라 없이 기존 PostgreSQL을 사용합니다. 각 워커는 하나의
+    LISTEN 연결로 이벤트를 받아 자신의 구독자에게 전달합니다.
+    asyncpg 연결은 동시에 한 작업만 실행할 수 있으므로 NOTIFY는 LISTEN 연결이 아닌
+    별도의 작은 연결 풀로 발행합니다.
+    LISTEN 연결이 끊기면 재연결 후 구독자에게 resync 이벤트를 보냅니다 (끊긴 동안의 이벤트는 유실).
+    NOTIFY 페이로드 크기 제한(8000 bytes)을 넘는 이벤트는 resync 이벤트로 대체됩니다.
+    """
+
+    NOTIFY_CHANNEL = "easyk_realtime"
+    MAX_PAYLOAD_BYTES = 7900
+    RECONNECT_INITIAL_DELAY_SECONDS = 0.5
+    RECONNECT_MAX_DELAY_SECONDS = 30.0
+
+    def __init__(self, dsn: str):
+        """
+        Args:
+            dsn: PostgreSQL 접속 DSN (postgresql://...)
+        """
+        super().__init__()
+        self.dsn = dsn
+        self._connection = None
+        self._notify_pool = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._reconnect_task: Optional[asyncio.Task] = None
+        self._stopping = False
+
+    async def start(self) -> None:
+        """NOTIFY 연결 풀과 LISTEN 연결 생성"""
+        import asyncpg
+
+        self._loop = asyncio.get_running_loop()
+        self._stopping = False
+        self._notify_pool = await asyncpg.create_pool(
+            self.dsn,
+            min_size=1,
+            max_size=settings.REALTIME_NOTIFY_POOL_SIZE,
+        )
+        await self._listen()
+
+    async def stop(self) -> None:
+        """LISTEN 연결과 NOTIFY 연결 풀 종료"""
+        self._stopping = True
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+            self._reconnect_task = None
+
+        connection, self._connection = self._connection, None
+        if connection is not None:
+            await connection.close()
+
+        pool, self._notify_pool = self._notify_pool, None
+        if pool is not None:
+            await pool.close()
+
+    async def _listen(self) -> None:
+        """LISTEN 연결 생성 및 리스너 등록"""
+        import asyncpg
+
+        connection = await asyncpg.connect(self.dsn)
+        connection.add_termination_listener(self._on_connection_lost)
+        await connection.add_listener(self.NOTIFY_CHANNEL, self._on_notify)
+        self._connection = connection
+
+    def _on_connection_lost(self, connection) -> None:
+        """LISTEN 연결 종료 시 재연결 예약 (stop()으로 닫은 경우 제외)"""
+        if self._stopping or connection is not self._connection:
+            return
+        self._connection = None
+        logger.warning("Realtime LISTEN connection lost, reconnecting")
+        self._reconnect_task = self._loop.create_task(self._reconnect())
+
+    async def _reconnect(self) -> None:
+        """LISTEN 연결 재생성 (지수 백오프)"""
+        delay = self.RECONNECT_INITIAL_DELAY_SECONDS
+        while not self._stopping:
+            try:
+                await self._listen()
+            except Exception as e:
+                logger.warning(f"Realtime LISTEN reconnect failed, retrying in {delay:.1f}s: {e!r}")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.RECONNECT_MAX_DELAY_SECONDS)
+                continue
+
+            logger.info("Realtime LISTEN connection restored")
+            self._resync_all()
+            break
+        self._reconnect_task = None
+
+    def _resync_all(self) -> None:
+        """현재 프로세스의 모든 구독자에게 resync 이벤트 전달"""
+        with self._lock:
+            channels = list(self._subscriptions)
+        for channel in channels:
+            self._fan_out(channel, RESYNC_EVENT)
+
+    def _on_notify(self, connection, pid, channel, payload: str) -> None:
+        """NOTIFY 수신 시 로컬 구독자에게 전달"""
+        try:
+            message = json.loads(payload)
+            self._fan_out(message["channel"], message["event"])
+        except (ValueError, KeyError) as e:
+            logger.warning(f"Invalid realtime notification payload: {e}")
+
+    async def _notify(self, payload: str) -> None:
+        """NOTIFY 발행 (연결 풀 사용, 동시 발행 가능)"""
+        if self._notify_pool is None:
+            return
+        await self._notify_pool.execute("SELECT pg_notify($1, $2)", self.NOTIFY_CHANNEL, payload)
+
+    def publish(self, channel: str, event: Dict[str, Any]) -> None:
+        """
+        이벤트 발행 (모든 워커의 구독자에게 전달)
+
+        Args:
+            channel: 채널 이름
+            event: JSON 직렬화 가능한 이벤트
+        """
+        if self._loop is None:
+            # start() 전에는 현재 프로세스에만 전달
+            self._fan_out(channel, event)
+            return
+
+        payload = json.dumps({"channel": channel, "event": event}, default=str)
+        if len(payload.encode("utf-8")) > self.MAX_PAYLOAD_BYTES:
+            payload = json.dumps({"channel": channel, "event": RESYNC_EVENT})
+
+        future = asyncio.run_coroutine_threadsafe(self._notify(payload), self._loop)
+        future.add_done_callback(_log_publish_error)
+
+
+def _log_publish_error(future) -> None:
+    """비동기 발행 실패 로깅"""
+    if not future.cancelled() and future.exception() is not None:
+        logger.error(f"Failed to publish realtime event: {future.exception()}")
+
+
+def create_message_broker() -> InMemoryBroker:
+    """
+    설정(REALTIME_BROKER)에 따른 브로커 생성
+
+    Returns:
+        InMemoryBroker: memory 또는 postgres 브로커
+    """
+    if settings.REALTIME_BROKER == "postgres":
+        dsn = settings.DATABASE_URL.replace("postgresql+psycopg2://", "postgresql://", 1)
+        return PostgresNotifyBroker(dsn)
+    return InMemoryBroker()
+
+
+# 싱글톤 인스턴스
+message_broker = create_message_broker()
@@ -0,0 +1,203 @@
+"""Request Metrics Utility
+
+요청별 처리 시간과 SQL 실행 통계를 수집하고 Prometheus 텍스트 형식으로 노출합니다.
+
+- 요청 단위 통계(RequestStats)는 ContextVar로 전달되므로, 스레드풀에서 실행되는
+  동기 엔드포인트와 비동기 세션(greenlet) 모두에서 SQLAlchemy 이벤트가 같은 요청에 기록됩니다.
+- 집계는 워커 프로세스별로 유지됩니다 (Prometheus가 워커별로 수집).
+"""
+
+import math
+import threading
+import time
+from contextvars import ContextVar
+from typing import Dict, Optional, Sequence, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+# 지연 시간 히스토그램 버킷 (초)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# 요청당 SQL 실행 수 히스토그램 버킷 (N+1 회귀 탐지용)
+STATEMENT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+
+LabelValues = Tuple[str, ...]
+
+
+class RequestStats:
+    """요청 하나의 SQL 실행 통계"""
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.db_seconds = 0.0
+        self.statements = 0
+        self.rows = 0
+        self._lock = threading.Lock()
+
+    def record_statement(self, seconds: float, rows: int) -> None:
+        """SQL 1회 실행 기록 (동시에 실행되는 쿼리가 있을 수 있어 잠금 사용)"""
+        with self._lock:
+            self.db_seconds += seconds
+            self.statements += 1
+            self.rows += max(rows, 0)
+
+    @property
+    def elapsed_seconds(self) -> float:
+        """요청 시작 후 경과 시간"""
+        return time.perf_counter() - self.started_at
+
+
+# 현재 요청의 통계 (요청 밖에서 실행되는 쿼리는 None)
+current_request_stats: ContextVar[Optional[RequestStats]] = ContextVar("current_request_stats", default=None)
+
+
+def _escape_label(value: str) -> str:
+    """Prometheus 라벨 값 이스케이프"""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: LabelValues, extra: str = "") -> str:
+    """라벨 문자열 생성 ({name="value",...})"""
+    pairs = [f'{name}="{_escape_label(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_number(value: float) -> str:
+    """Prometheus 숫자 표기"""
+    if math.isinf(value):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Counter:
+    """라벨별 누적 카운터"""
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str]):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._values: Dict[LabelValues, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, label_values: LabelValues, amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0.0) + amount
+
+    def get(self, label_values: LabelValues) -> float:
+        with self._lock:
+            return self._values.get(label_values, 0.0)
+
+    def collect(self) -> str:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for label_values, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_format_labels(self.label_names, label_values)} {_format_number(value)}")
+        return "\n".join(lines)
+
+
+class Histogram:
+    """라벨별 누적 히스토그램"""
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str], buckets: Sequence[float]):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        # 라벨 값 -> (버킷별 누적 횟수, 합계, 횟수)
+        self._values: Dict[LabelValues, Tuple[list, float, int]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, label_values: LabelValues, value: float) -> None:
+        with self._lock:
+            counts, total, count = self._values.get(label_values) or ([0] * len(self.buckets), 0.0, 0)
+            for index, upper_bound in enumerate(self.buckets):
+                if value <= upper_bound:
+                    counts[index] += 1
+            self._values[label_values] = (counts, total + value, count + 1)
+
+    def get_count(self, label_values: LabelValues) -> int:
+        with self._lock:
+            entry = self._values.get(label_values)
+            return entry[2] if entry else 0
+
+    def collect(self) -> str:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for label_values, (counts, total, count) in sorted(self._values.items()):
+                for upper_bound, bucket_count in zip(self.buckets, counts):
+                    labels = _format_labels(self.label_names, label_values, f'le="{_format_number(upper_bound)}"')
+                    lines.append(f"{self.name}_bucket{labels} {bucket_count}")
+                labels = _format_labels(self.label_names, label_values)
+                lines.append(f"{self.name}_sum{labels} {_format_number(total)}")
+                lines.append(f"{self.name}_count{labels} {count}")
+        return "\n".join(lines)
+
+
+class RequestMetrics:
+    """라우트 템플릿별 요청 지표 모음"""
+
+    def __init__(self):
+        route_labels = ("method", "route")
+        self.requests = Counter(
+            "easyk_http_requests_total", "Total HTTP requests.", route_labels + ("status",)
+        )
+        self.latency = Histogram(
+            "easyk_http_request_duration_seconds", "HTTP request wall time.", route_labels, LATENCY_BUCKETS
+        )
+        self.db_latency = Histogram(
+            "easyk_http_request_db_duration_seconds", "Time spent executing SQL per request.", route_labels, LATENCY_BUCKETS
+        )
+        self.db_statements = Histogram(
+            "easyk_http_request_db_statements", "SQL statements executed per request.", route_labels, STATEMENT_BUCKETS
+        )
+        self.db_rows = Counter(
+            "easyk_http_request_db_rows_total",
+            "Rows returned or affected by SQL statements (as reported by the driver).",
+            route_labels,
+        )
+
+    def observe(self, method: str, route: str, status_code: int, stats: RequestStats) -> None:
+        """
+        완료된 요청 기록
+
+        Args:
+            method: HTTP 메서드
+            route: 라우트 템플릿 (예: /api/jobs/{job_id})
+            status_code: 응답 상태 코드
+            stats: 요청 통계
+        """
+        labels = (method, route)
+        self.requests.inc(labels + (str(status_code),))
+        self.latency.observe(labels, stats.elapsed_seconds)
+        self.db_latency.observe(labels, stats.db_seconds)
+        self.db_statements.observe(labels, stats.statements)
+        self.db_rows.inc(labels, stats.rows)
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식(0.0.4)으로 출력"""
+        metrics = (self.requests, self.latency, self.db_latency, self.db_statements, self.db_rows)
+        return "\n".join(metric.collect() for metric in metrics) + "\n"
+
+
+# 싱글톤 인스턴스
+request_metrics = RequestMetrics()
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_statement_timer(conn, cursor, statement, parameters, context, executemany) -> None:
+    """SQL 실행 시작 시각 기록 (요청 처리 중인 경우만)"""
+    if context is not None and current_request_stats.get() is not None:
+        context._metrics_started_at = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _record_statement(conn, cursor, statement, parameters, context, executemany) -> None:
+    """SQL 실행 시간/행 수를 현재 요청 통계에 기록"""
+    stats = current_request_stats.get()
+    started_at = getattr(context, "_metrics_started_at", None)
+    if stats is None or started_at is None:
+        return
+    stats.record_statement(time.perf_counter() - started_at, cursor.rowcount)
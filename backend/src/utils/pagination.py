@@ -0,0 +1,67 @@
+"""Keyset (Cursor) Pagination Utility Functions"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, Optional, Sequence, Tuple
+from uuid import UUID
+
+
+# 다음 페이지 커서를 전달하는 응답 헤더 (목록 응답 본문 형식은 유지)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(created_at: datetime, item_id: UUID) -> str:
+    """(created_at, id) 기준 불투명 커서 생성
+
+    Args:
+        created_at: 마지막 항목의 생성 시각
+        item_id: 마지막 항목의 ID
+
+    Returns:
+        str: URL-safe base64 인코딩된 커서
+    """
+    payload = json.dumps(
+        {"created_at": created_at.isoformat(), "id": str(item_id)},
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """불투명 커서 디코딩
+
+    Args:
+        cursor: encode_cursor로 생성된 커서
+
+    Returns:
+        Tuple[datetime, UUID]: (created_at, id)
+
+    Raises:
+        ValueError: 커서 형식이 올바르지 않은 경우
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(payload["created_at"]), UUID(payload["id"])
+    except (ValueError, KeyError, TypeError, UnicodeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def build_next_cursor(items: Sequence[Any], limit: int) -> Optional[str]:
+    """다음 페이지 커서 생성
+
+    조회 결과가 limit만큼 채워진 경우에만 마지막 항목 기준 커서를 반환합니다.
+
+    Args:
+        items: 현재 페이지 항목 (created_at, id 속성 필요)
+        limit: 페이지 크기
+
+    Returns:
+        Optional[str]: 다음 페이지 커서 (마지막 페이지면 None)
+    """
+    if not items or len(items) < limit:
+        return None
+
+    last = items[-1]
+    return encode_cursor(last.created_at, last.id)
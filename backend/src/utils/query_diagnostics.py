@@ -0,0 +1,189 @@
+"""Query Diagnostics Utility
+
+개발/스테이징 환경에서 요청별 SQL을 정규화해 수집하고 다음을 로그로 남깁니다.
+
+- N+1 의심: 같은 형태(리터럴/바인드 값 제외)의 SQL이 한 요청에서 임계값 이상 반복된 경우
+- 느린 쿼리: 실행 시간이 임계값 이상인 SQL과 그 실행 계획(EXPLAIN)
+
+요청 단위 수집 객체(QueryCapture)는 ContextVar로 전달되므로 동기/비동기 세션 모두에서 동작합니다.
+"""
+
+import logging
+import re
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from ..config import settings
+
+
+logger = logging.getLogger(__name__)
+
+# 방언별 실행 계획 조회 구문 (실제 실행 없이 계획만 조회)
+EXPLAIN_PREFIXES = {
+    "postgresql": "EXPLAIN ",
+    "sqlite": "EXPLAIN QUERY PLAN ",
+}
+
+# 실패한 SQL이 진행 중인 트랜잭션 전체를 중단시키는 방언 (EXPLAIN을 SAVEPOINT 안에서 실행)
+SAVEPOINT_DIALECTS = {"postgresql"}
+EXPLAIN_SAVEPOINT = "query_diagnostics_explain"
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_BIND_PARAMETER = re.compile(r"%\(\w+\)s|%s|\$\d+|(?<!:):\w+|\?")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_sql(statement: str) -> str:
+    """
+    SQL을 형태만 남도록 정규화 (리터럴/바인드 값 → ?, IN 목록 → (...), 공백 정리)
+
+    Args:
+        statement: 실행된 SQL
+
+    Returns:
+        str: 정규화된 SQL
+    """
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _BIND_PARAMETER.sub("?", normalized)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _PLACEHOLDER_LIST.sub("(...)", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+
+class QueryCapture:
+    """요청 하나에서 실행된 SQL 형태별 횟수와 느린 쿼리 기록"""
+
+    def __init__(self):
+        self.shapes: Counter = Counter()
+        self.slow_queries: List[Tuple[str, float]] = []
+        self._lock = threading.Lock()
+
+    @property
+    def total(self) -> int:
+        """실행된 SQL 수"""
+        return sum(self.shapes.values())
+
+    def record(self, statement: str, seconds: float, slow: bool = False) -> None:
+        """SQL 1회 실행 기록"""
+        shape = normalize_sql(statement)
+        with self._lock:
+            self.shapes[shape] += 1
+            if slow:
+                self.slow_queries.append((shape, seconds))
+
+    def repeated_shapes(self, threshold: int) -> Dict[str, int]:
+        """
+        임계값 이상 반복된 SQL 형태 조회 (N+1 의심)
+
+        Args:
+            threshold: 반복 횟수 임계값
+
+        Returns:
+            Dict[str, int]: 정규화된 SQL → 실행 횟수 (많은 순)
+        """
+        with self._lock:
+            return {shape: count for shape, count in self.shapes.most_common() if count >= threshold}
+
+    def summary(self) -> str:
+        """실행 횟수 순 SQL 형태 목록 (테스트 실패 메시지용)"""
+        with self._lock:
+            return "\n".join(f"{count:>4}x {shape}" for shape, count in self.shapes.most_common())
+
+
+# 현재 요청의 SQL 수집 객체 (진단 비활성화 또는 요청 밖이면 None)
+current_query_capture: ContextVar[Optional[QueryCapture]] = ContextVar("current_query_capture", default=None)
+
+
+def report_repeated_queries(capture: QueryCapture, method: str, route: str, threshold: int) -> Dict[str, int]:
+    """
+    N+1 의심 SQL 형태를 경고 로그로 기록
+
+    Args:
+        capture: 요청의 SQL 수집 객체
+        method: HTTP 메서드
+        route: 라우트 템플릿
+        threshold: 반복 횟수 임계값
+
+    Returns:
+        Dict[str, int]: 임계값 이상 반복된 SQL 형태
+    """
+    repeated = capture.repeated_shapes(threshold)
+    for shape, count in repeated.items():
+        logger.warning(f"[QUERY] Possible N+1 in {method} {route}: {count}x {shape}")
+    return repeated
+
+
+def explain_statement(connection, statement: str, parameters) -> Optional[str]:
+    """
+    SQL 실행 계획 조회 (SELECT만, 실패 시 None)
+
+    SQLAlchemy 이벤트가 다시 발생하지 않도록 DBAPI 커서를 직접 사용합니다.
+    요청의 트랜잭션 안에서 실행되므로 PostgreSQL에서는 SAVEPOINT로 감싸
+    EXPLAIN이 실패해도 트랜잭션이 중단(InFailedSqlTransaction)되지 않도록 되돌립니다.
+
+    Args:
+        connection: SQL이 실행된 SQLAlchemy Connection
+        statement: 실행된 SQL
+        parameters: 바인드 파라미터
+
+    Returns:
+        Optional[str]: 실행 계획 (줄 단위)
+    """
+    prefix = EXPLAIN_PREFIXES.get(connection.dialect.name)
+    if prefix is None or not statement.lstrip().upper().startswith("SELECT"):
+        return None
+    use_savepoint = connection.dialect.name in SAVEPOINT_DIALECTS
+    try:
+        cursor = connection.connection.cursor()
+        try:
+            if use_savepoint:
+                cursor.execute(f"SAVEPOINT {EXPLAIN_SAVEPOINT}")
+            try:
+                cursor.execute(prefix + statement, parameters)
+                plan = "\n".join(" ".join(str(column) for column in row) for row in cursor.fetchall())
+            except Exception:
+                if use_savepoint:
+                    cursor.execute(f"ROLLBACK TO SAVEPOINT {EXPLAIN_SAVEPOINT}")
+                raise
+            if use_savepoint:
+                cursor.execute(f"RELEASE SAVEPOINT {EXPLAIN_SAVEPOINT}")
+            return plan
+        finally:
+            cursor.close()
+    except Exception as e:
+        logger.debug(f"EXPLAIN failed: {e!r}")
+        return None
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_capture_timer(conn, cursor, statement, parameters, context, executemany) -> None:
+    """SQL 실행 시작 시각 기록 (진단 중인 요청만)"""
+    if context is not None and current_query_capture.get() is not None:
+        context._diagnostics_started_at = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _capture_statement(conn, cursor, statement, parameters, context, executemany) -> None:
+    """SQL 형태를 기록하고 느린 쿼리는 실행 계획과 함께 로그로 남김"""
+    capture = current_query_capture.get()
+    started_at = getattr(context, "_diagnostics_started_at", None)
+    if capture is None or started_at is None:
+        return
+
+    seconds = time.perf_counter() - started_at
+    slow = seconds * 1000 >= settings.SLOW_QUERY_THRESHOLD_MS
+    capture.record(statement, seconds, slow=slow)
+    if slow:
+        plan = None if executemany else explain_statement(conn, statement, parameters)
+        logger.warning(
+            f"[QUERY] Slow query ({seconds * 1000:.1f}ms): {_WHITESPACE.sub(' ', statement).strip()}"
+            + (f"\n{plan}" if plan else "")
+        )
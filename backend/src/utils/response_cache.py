@@ -0,0 +1,236 @@
+"""Catalog Response Cache Utility
+
+공개 목록 API(일자리, 정부 지원, 서류 템플릿)의 직렬화된 응답을 캐시하고
+ETag / If-None-Match 조건부 요청(304)을 처리합니다.
+
+캐시 키에는 엔티티별 버전 카운터가 포함됩니다. 서비스 모듈이 invalidate_on_commit()으로
+등록한 모델의 행이 추가/수정/삭제된 트랜잭션이 커밋되면 버전이 올라가
+해당 엔티티의 모든 목록 캐시가 무효화됩니다. 버전은 DB 조회 전에 읽으므로,
+변경 전 데이터는 이전 버전 키에만 저장됩니다.
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, Mapping, Optional
+from urllib.parse import urlencode
+
+from fastapi import Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+
+from ..config import settings
+from .cache import CacheBackend, create_cache_backend
+
+
+# 캐시 네임스페이스 (엔티티 단위 무효화)
+JOBS_CACHE = "jobs"
+SUPPORTS_CACHE = "government_supports"
+DOCUMENT_TEMPLATES_CACHE = "document_templates"
+
+# 커밋 후 무효화할 네임스페이스를 모아두는 session.info 키
+PENDING_INVALIDATIONS_KEY = "catalog_cache_invalidations"
+
+
+def compute_etag(body: str) -> str:
+    """응답 본문의 강한 ETag 생성"""
+    return '"' + hashlib.sha256(body.encode("utf-8")).hexdigest()[:32] + '"'
+
+
+def serialize_body(content: Any) -> str:
+    """응답 내용을 JSON 문자열로 직렬화 (JSONResponse와 동일한 형식)"""
+    return json.dumps(
+        jsonable_encoder(content),
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+    )
+
+
+class CachedResponse:
+    """캐시된 JSON 응답 (본문, ETag, 추가 응답 헤더)"""
+
+    def __init__(self, body: str, headers: Optional[Dict[str, str]] = None, etag: Optional[str] = None):
+        self.body = body
+        self.headers = headers or {}
+        self.etag = etag or compute_etag(body)
+
+    def dumps(self) -> str:
+        """캐시 저장용 문자열로 변환"""
+        return json.dumps({"body": self.body, "headers": self.headers, "etag": self.etag})
+
+    @classmethod
+    def loads(cls, raw: str) -> "CachedResponse":
+        """캐시 저장 문자열에서 복원"""
+        data = json.loads(raw)
+        return cls(data["body"], data["headers"], data["etag"])
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더가 ETag와 일치하는지 확인 (약한 비교)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag in candidates
+
+
+def build_cached_response(request: Request, cached: CachedResponse) -> Response:
+    """
+    캐시된 응답을 HTTP 응답으로 변환
+
+    If-None-Match가 ETag와 일치하면 본문 없이 304를 반환합니다.
+
+    Args:
+        request: 요청 객체 (If-None-Match 확인용)
+        cached: 캐시된 응답
+
+    Returns:
+        Response: 200 JSON 응답 또는 304 응답
+    """
+    headers = {**cached.headers, "ETag": cached.etag}
+    if _etag_matches(request.headers.get("if-none-match"), cached.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=cached.body, media_type="application/json", headers=headers)
+
+
+class ResponseCache:
+    """엔티티 버전 기반 무효화를 지원하는 응답 캐시"""
+
+    def __init__(self, backend: CacheBackend, ttl_seconds: float):
+        """
+        Args:
+            backend: 캐시 저장소 (memory 또는 redis)
+            ttl_seconds: 응답 캐시 만료 시간 (0 이하이면 캐시 비활성화)
+        """
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def normalize_params(params: Mapping[str, Any]) -> str:
+        """
+        쿼리 파라미터 정규화 (None/빈 값 제외, 앞뒤 공백 제거, 이름순 정렬)
+
+        Args:
+            params: 쿼리 파라미터
+
+        Returns:
+            str: 정규화된 쿼리 문자열
+        """
+        normalized = []
+        for name in sorted(params):
+            value = params[name]
+            if value is None:
+                continue
+            value = str(value).strip()
+            if value:
+                normalized.append((name, value))
+        return urlencode(normalized)
+
+    def key(self, namespace: str, params: Mapping[str, Any]) -> str:
+        """
+        현재 엔티티 버전이 포함된 캐시 키 생성 (DB 조회 전에 호출)
+
+        Args:
+            namespace: 캐시 네임스페이스 (엔티티)
+            params: 쿼리 파라미터
+
+        Returns:
+            str: 캐시 키
+        """
+        version = self.backend.get_version(namespace)
+        digest = hashlib.sha256(self.normalize_params(params).encode("utf-8")).hexdigest()[:32]
+        return f"{namespace}:v{version}:{digest}"
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """캐시된 응답 조회 (없으면 None)"""
+        if self.ttl_seconds <= 0:
+            return None
+        raw = self.backend.get(key)
+        return CachedResponse.loads(raw) if raw is not None else None
+
+    def set(self, key: str, body: str, headers: Optional[Dict[str, str]] = None) -> CachedResponse:
+        """
+        응답 캐시 저장
+
+        Args:
+            key: key()로 생성한 캐시 키
+            body: 직렬화된 응답 본문
+            headers: 함께 반환할 응답 헤더 (optional)
+
+        Returns:
+            CachedResponse: 저장된 응답 (ETag 포함)
+        """
+        cached = CachedResponse(body, headers)
+        if self.ttl_seconds > 0:
+            self.backend.set(key, cached.dumps(), self.ttl_seconds)
+        return cached
+
+    def invalidate(self, namespace: str) -> None:
+        """
+        엔티티의 모든 캐시 무효화 (데이터 변경 커밋 후 호출)
+
+        Args:
+            namespace: 캐시 네임스페이스 (엔티티)
+        """
+        self.backend.bump_version(namespace)
+
+    async def akey(self, namespace: str, params: Mapping[str, Any]) -> str:
+        """key()의 비동기 버전 (공유 저장소는 스레드풀에서 조회)"""
+        if self.backend.shared:
+            return await run_in_threadpool(self.key, namespace, params)
+        return self.key(namespace, params)
+
+    async def aget(self, key: str) -> Optional[CachedResponse]:
+        """get()의 비동기 버전"""
+        if self.backend.shared:
+            return await run_in_threadpool(self.get, key)
+        return self.get(key)
+
+    async def aset(self, key: str, body: str, headers: Optional[Dict[str, str]] = None) -> CachedResponse:
+        """set()의 비동기 버전"""
+        if self.backend.shared:
+            return await run_in_threadpool(self.set, key, body, headers)
+        return self.set(key, body, headers)
+
+
+# 공개 목록 응답 캐시 (싱글톤)
+catalog_cache = ResponseCache(
+    create_cache_backend(
+        max_size=settings.CATALOG_CACHE_MAX_SIZE,
+        ttl_seconds=settings.CATALOG_CACHE_TTL_SECONDS,
+    ),
+    ttl_seconds=settings.CATALOG_CACHE_TTL_SECONDS,
+)
+
+
+def invalidate_on_commit(model: type, namespace: str) -> None:
+    """
+    모델의 행이 추가/수정/삭제된 트랜잭션이 커밋되면 네임스페이스 캐시 무효화
+
+    Args:
+        model: ORM 모델 클래스
+        namespace: 무효화할 캐시 네임스페이스
+    """
+    def _mark_changed(mapper, connection, target) -> None:
+        session = object_session(target)
+        if session is not None:
+            session.info.setdefault(PENDING_INVALIDATIONS_KEY, set()).add(namespace)
+
+    for identifier in ("after_insert", "after_update", "after_delete"):
+        event.listen(model, identifier, _mark_changed)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_changes(session: Session) -> None:
+    """변경이 커밋된 엔티티의 목록 캐시 무효화"""
+    for namespace in session.info.pop(PENDING_INVALIDATIONS_KEY, ()):
+        catalog_cache.invalidate(namespace)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_invalidations(session: Session) -> None:
+    """롤백된 트랜잭션의 무효화 요청 취소"""
+    session.info.pop(PENDING_INVALIDATIONS_KEY, None)
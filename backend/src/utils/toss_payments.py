@@ -1,34 +1,108 @@
 """토스페이먼츠 API 클라이언트 유틸리티"""
 
+import asyncio
+import base64
+import importlib.util
+import logging
+import random
+import uuid
 import httpx
 from typing import Optional, Dict, Any
 from ..config import settings
 
 
+logger = logging.getLogger(__name__)
+
+# h2 패키지가 설치된 경우에만 HTTP/2 사용 (httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# 재시도 대상 HTTP 상태 코드 (Rate Limit + 서버 오류)
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
 class TossPaymentsClient:
-    """토스페이먼츠 API 클라이언트"""
+    """토스페이먼츠 API 클라이언트
+
+    keep-alive 연결 풀을 가진 httpx.AsyncClient 하나를 재사용하여
+    결제 검증마다 TCP/TLS 핸드셰이크가 반복되지 않도록 합니다.
+    연결 풀은 애플리케이션 lifespan에서 startup()/aclose()로 관리하며,
+    startup() 전에 호출되면 첫 요청 시 생성됩니다.
+    """
 
     BASE_URL = "https://api.tosspayments.com/v1"
     # 참고: 토스페이먼츠는 샌드박스와 프로덕션 모두 동일한 엔드포인트를 사용합니다.
     # 구분은 client_key와 secret_key로 이루어집니다.
     SANDBOX_URL = "https://api.tosspayments.com/v1"
 
-    def __init__(self, client_key: Optional[str] = None, secret_key: Optional[str] = None):
+    def __init__(
+        self,
+        client_key: Optional[str] = None,
+        secret_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        max_retries: Optional[int] = None,
+        retry_backoff_seconds: Optional[float] = None,
+    ):
         """
         토스페이먼츠 클라이언트 초기화
 
         Args:
             client_key: 클라이언트 키 (기본값: settings.TOSS_CLIENT_KEY)
             secret_key: 시크릿 키 (기본값: settings.TOSS_SECRET_KEY)
+            base_url: API 기본 URL (기본값: settings.TOSS_API_BASE_URL 또는 공식 엔드포인트)
+            transport: httpx 전송 계층 (테스트용 스텁 서버 주입)
+            max_retries: 최대 재시도 횟수 (기본값: settings.TOSS_MAX_RETRIES)
+            retry_backoff_seconds: 재시도 기본 대기 시간 (기본값: settings.TOSS_RETRY_BACKOFF_SECONDS)
         """
         self.client_key = client_key or settings.TOSS_CLIENT_KEY
         self.secret_key = secret_key or settings.TOSS_SECRET_KEY
-        self.base_url = self.SANDBOX_URL if settings.DEBUG else self.BASE_URL
+        self.base_url = (
+            base_url
+            or settings.TOSS_API_BASE_URL
+            or (self.SANDBOX_URL if settings.DEBUG else self.BASE_URL)
+        )
+        self.max_retries = settings.TOSS_MAX_RETRIES if max_retries is None else max_retries
+        self.retry_backoff_seconds = (
+            settings.TOSS_RETRY_BACKOFF_SECONDS
+            if retry_backoff_seconds is None
+            else retry_backoff_seconds
+        )
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _create_client(self) -> httpx.AsyncClient:
+        """연결 풀 설정이 적용된 httpx.AsyncClient 생성"""
+        limits = httpx.Limits(
+            max_connections=settings.TOSS_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.TOSS_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.TOSS_KEEPALIVE_EXPIRY_SECONDS,
+        )
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            limits=limits,
+            timeout=settings.TOSS_API_TIMEOUT_SECONDS,
+            http2=HTTP2_AVAILABLE and self._transport is None,
+            transport=self._transport,
+        )
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """공유 httpx.AsyncClient 조회 (없거나 닫혔으면 생성)"""
+        if self._client is None or self._client.is_closed:
+            self._client = self._create_client()
+        return self._client
+
+    async def startup(self) -> None:
+        """연결 풀 생성 (애플리케이션 시작 시 호출)"""
+        self._get_client()
+
+    async def aclose(self) -> None:
+        """연결 풀 종료 (애플리케이션 종료 시 호출)"""
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
 
     def _get_headers(self) -> Dict[str, str]:
         """API 요청 헤더 생성"""
-        import base64
-
         if not self.secret_key:
             raise ValueError("TOSS_SECRET_KEY가 설정되지 않았습니다.")
 
@@ -42,6 +116,72 @@ class TossPaymentsClient:
             "Content-Type": "application/json",
         }
 
+    def _get_retry_delay(self, attempt: int) -> float:
+        """
+        재시도 대기 시간 계산 (full jitter 지수 백오프)
+
+        Args:
+            attempt: 재시도 횟수 (0부터 시작)
+
+        Returns:
+            float: 대기 시간 (초)
+        """
+        return random.uniform(0, self.retry_backoff_seconds * (2 ** attempt))
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        json: Optional[Dict[str, Any]] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        API 요청 (일시적 오류 시 재시도)
+
+        GET 요청과 Idempotency-Key가 지정된 요청만 재시도합니다.
+        전송 오류, 429, 5xx 응답이 재시도 대상입니다.
+
+        Args:
+            method: HTTP 메서드
+            path: base_url 기준 경로
+            json: 요청 본문 (optional)
+            idempotency_key: 멱등성 키 (재시도 간 동일 값 사용)
+
+        Returns:
+            Dict[str, Any]: 응답 JSON
+
+        Raises:
+            httpx.HTTPStatusError: API 요청 실패 시
+            httpx.TransportError: 재시도 후에도 연결 실패 시
+        """
+        headers = self._get_headers()
+        if idempotency_key:
+            headers["Idempotency-Key"] = idempotency_key
+
+        retryable = method == "GET" or idempotency_key is not None
+        client = self._get_client()
+        attempt = 0
+
+        while True:
+            can_retry = retryable and attempt < self.max_retries
+            try:
+                response = await client.request(method, path, headers=headers, json=json)
+            except httpx.TransportError as e:
+                if not can_retry:
+                    raise
+                logger.warning(f"Toss Payments request failed ({method} {path}): {e!r}, retrying")
+            else:
+                if response.status_code not in RETRYABLE_STATUS_CODES or not can_retry:
+                    response.raise_for_status()
+                    return response.json()
+                logger.warning(
+                    f"Toss Payments request failed ({method} {path}): "
+                    f"{response.status_code}, retrying"
+                )
+
+            await asyncio.sleep(self._get_retry_delay(attempt))
+            attempt += 1
+
     async def confirm_payment(
         self,
         payment_key: str,
@@ -62,22 +202,18 @@ class TossPaymentsClient:
         Raises:
             httpx.HTTPStatusError: API 요청 실패 시
         """
-        url = f"{self.base_url}/payments/confirm"
         data = {
             "paymentKey": payment_key,
             "orderId": order_id,
             "amount": amount,
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                url,
-                headers=self._get_headers(),
-                json=data,
-                timeout=30.0,
-            )
-            response.raise_for_status()
-            return response.json()
+        return await self._request(
+            "POST",
+            "/payments/confirm",
+            json=data,
+            idempotency_key=str(uuid.uuid4()),
+        )
 
     async def cancel_payment(
         self,
@@ -99,22 +235,18 @@ class TossPaymentsClient:
         Raises:
             httpx.HTTPStatusError: API 요청 실패 시
         """
-        url = f"{self.base_url}/payments/{payment_key}/cancel"
         data = {
             "cancelReason": cancel_reason,
         }
         if cancel_amount:
             data["cancelAmount"] = cancel_amount
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                url,
-                headers=self._get_headers(),
-                json=data,
-                timeout=30.0,
-            )
-            response.raise_for_status()
-            return response.json()
+        return await self._request(
+            "POST",
+            f"/payments/{payment_key}/cancel",
+            json=data,
+            idempotency_key=str(uuid.uuid4()),
+        )
 
     async def get_payment(self, payment_key: str) -> Dict[str, Any]:
         """
@@ -129,18 +261,8 @@ class TossPaymentsClient:
         Raises:
             httpx.HTTPStatusError: API 요청 실패 시
         """
-        url = f"{self.base_url}/payments/{payment_key}"
-
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                url,
-                headers=self._get_headers(),
-                timeout=30.0,
-            )
-            response.raise_for_status()
-            return response.json()
+        return await self._request("GET", f"/payments/{payment_key}")
 
 
 # 싱글톤 인스턴스
 toss_payments_client = TossPaymentsClient()
-